@@ -1,4 +1,6 @@
 """Connected components."""
+from itertools import islice
+
 import networkx as nx
 from networkx.utils.decorators import not_implemented_for
 from ...utils import arbitrary_element
@@ -8,6 +10,7 @@ __all__ = [
     "connected_components",
     "is_connected",
     "node_connected_component",
+    "connected_component_labels",
 ]
 
 
@@ -172,6 +175,75 @@ def node_connected_component(G, n):
     return _plain_bfs(G, n)
 
 
+@not_implemented_for("directed")
+def connected_component_labels(G, nodelist=None, chunk_size=2 ** 20):
+    """Returns the connected component of every node as an integer array.
+
+    Instead of a search from every node, the edges of `G` are merged into
+    an :class:`~networkx.utils.union_find.ArrayUnionFind` with bulk unions,
+    one chunk of edges at a time. This avoids building a set per component
+    and is much faster for graphs with many nodes.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+       An undirected graph.
+
+    nodelist : list, optional
+       The order of the nodes in the returned array. It must contain every
+       node of `G` once. If None, the ordering is produced by G.nodes().
+
+    chunk_size : integer, optional (default=2**20)
+       The number of edges merged at once.
+
+    Returns
+    -------
+    labels : NumPy array
+       ``labels[i]`` is the component of the `i`-th node of `nodelist`.
+       Components are numbered from 0, in the order of their first node.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is directed.
+
+    NetworkXError
+        If `nodelist` is not an ordering of the nodes of `G`.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.add_path(G, [10, 11, 12])
+    >>> nx.connected_component_labels(G)
+    array([0, 0, 0, 0, 1, 1, 1])
+
+    See Also
+    --------
+    connected_components
+
+    Notes
+    -----
+    For undirected graphs only.
+
+    """
+    import numpy as np
+
+    uf = nx.utils.ArrayUnionFind(G if nodelist is None else nodelist)
+    if len(uf) != len(G) or any(n not in G for n in uf):
+        raise nx.NetworkXError("nodelist must contain every node of G once")
+    edges = iter(G.edges())
+    while True:
+        chunk = list(islice(edges, chunk_size))
+        if not chunk:
+            break
+        uf.union_many(
+            uf.positions(u for u, v in chunk), uf.positions(v for u, v in chunk)
+        )
+    roots = uf.find_many(np.arange(len(uf)))
+    _, first, labels = np.unique(roots, return_index=True, return_inverse=True)
+    return np.argsort(np.argsort(first))[labels]
+
+
 def _plain_bfs(G, source):
     """A fast BFS node generator"""
     G_adj = G.adj
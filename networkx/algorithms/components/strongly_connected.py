@@ -1,4 +1,6 @@
 """Strongly connected components."""
+from array import array
+
 import networkx as nx
 from networkx.utils.decorators import not_implemented_for
 
@@ -9,6 +11,8 @@ __all__ = [
     "strongly_connected_components_recursive",
     "kosaraju_strongly_connected_components",
     "condensation",
+    "strongly_connected_component_labels",
+    "sparse_condensation",
 ]
 
 
@@ -396,3 +400,233 @@ def condensation(G, scc=None):
     # Add a list of members (ie original nodes) to each node (ie scc) in C.
     nx.set_node_attributes(C, members, "members")
     return C
+
+
+def _csr_snapshot(G, nodelist):
+    """Returns the successors of the nodes of `G` in CSR format.
+
+    `indptr` and `indices` are compact arrays of the :mod:`array` module,
+    so that the search loops read Python ints without NumPy overhead.
+    """
+    if nodelist is None:
+        nodelist = list(G)
+    index = {n: i for i, n in enumerate(nodelist)}
+    if len(nodelist) != len(G) or len(index) != len(G):
+        raise nx.NetworkXError("nodelist must contain every node of G once")
+    if any(n not in G for n in index):
+        raise nx.NetworkXError("nodelist must contain every node of G once")
+    succ = G._succ
+    indptr = array("q", [0])
+    indices = array("q")
+    for u in nodelist:
+        indices.extend(index[v] for v in succ[u])
+        indptr.append(len(indices))
+    return indptr, indices
+
+
+def _scc_labels(indptr, indices):
+    """Returns the strongly connected component of every node as an array.
+
+    This is Pearce's space efficient variant of Tarjan's algorithm [1]_,
+    with an explicit call stack. A single array `rindex` holds the preorder
+    numbers of the nodes on the stack and, once a component is complete,
+    its label, counted down from ``n - 1``. The labels are returned counted
+    up from 0, in the order the components are completed.
+
+    References
+    ----------
+    .. [1] D. J. Pearce,
+       A space-efficient algorithm for finding strongly connected components.
+       Information Processing Letters 116(1): 47-52, (2016).
+    """
+    n = len(indptr) - 1
+    rindex = array("q", bytes(8 * n))
+    root = bytearray(n)
+    stack = []
+    index = 1
+    c = n - 1
+    for source in range(n):
+        if rindex[source]:
+            continue
+        rindex[source] = index
+        index += 1
+        root[source] = 1
+        nodes = [source]
+        edges = [indptr[source]]
+        while nodes:
+            v = nodes[-1]
+            i = edges[-1]
+            end = indptr[v + 1]
+            while i < end:
+                w = indices[i]
+                if not rindex[w]:
+                    break
+                if rindex[w] < rindex[v]:
+                    rindex[v] = rindex[w]
+                    root[v] = 0
+                i += 1
+            if i < end:
+                # descend into w, and come back to the edge (v, w) later
+                edges[-1] = i
+                rindex[w] = index
+                index += 1
+                root[w] = 1
+                nodes.append(w)
+                edges.append(indptr[w])
+                continue
+            nodes.pop()
+            edges.pop()
+            if root[v]:
+                index -= 1
+                while stack and rindex[v] <= rindex[stack[-1]]:
+                    rindex[stack.pop()] = c
+                    index -= 1
+                rindex[v] = c
+                c -= 1
+            else:
+                stack.append(v)
+            if nodes:
+                u = nodes[-1]
+                if rindex[v] < rindex[u]:
+                    rindex[u] = rindex[v]
+                    root[u] = 0
+                edges[-1] += 1
+    for v in range(n):
+        rindex[v] = n - 1 - rindex[v]
+    return rindex
+
+
+@not_implemented_for("undirected")
+def strongly_connected_component_labels(G, nodelist=None):
+    """Returns the strongly connected component of every node as an
+    integer array.
+
+    The components are found on a compressed sparse row (CSR) snapshot of
+    the successors of `G`, with an iterative version of Tarjan's algorithm
+    that keeps all of its state in integer arrays [1]_. This uses much less
+    memory than :func:`strongly_connected_components`, which keeps several
+    dicts keyed by node and a set per component.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+       A directed graph.
+
+    nodelist : list, optional
+       The order of the nodes in the returned array. It must contain every
+       node of `G` once. If None, the ordering is produced by G.nodes().
+
+    Returns
+    -------
+    labels : NumPy array
+       ``labels[i]`` is the component of the `i`-th node of `nodelist`.
+       Components are numbered from 0 in the order Tarjan's algorithm
+       completes them, which is a reverse topological order: for every
+       edge `(u, v)`, the label of `u` is at least the label of `v`.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is undirected.
+
+    NetworkXError
+        If `nodelist` is not an ordering of the nodes of `G`.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 0), (1, 2), (2, 3), (3, 2)])
+    >>> nx.strongly_connected_component_labels(G)
+    array([1, 1, 0, 0])
+
+    See Also
+    --------
+    strongly_connected_components
+    sparse_condensation
+
+    References
+    ----------
+    .. [1] D. J. Pearce,
+       A space-efficient algorithm for finding strongly connected components.
+       Information Processing Letters 116(1): 47-52, (2016).
+    """
+    import numpy as np
+
+    labels = _scc_labels(*_csr_snapshot(G, nodelist))
+    return np.frombuffer(labels, dtype=np.int64).astype(np.intp)
+
+
+@not_implemented_for("undirected")
+def sparse_condensation(G, nodelist=None):
+    """Returns the condensation of G as a sparse matrix and the component
+    of every node.
+
+    This is a compact version of :func:`condensation` for large graphs.
+    Instead of a new DiGraph with a set of members per node, it returns
+    the adjacency matrix of the condensation and an array mapping every
+    node to its component.
+
+    Parameters
+    ----------
+    G : NetworkX DiGraph
+       A directed graph.
+
+    nodelist : list, optional
+       The order of the nodes in `labels`. It must contain every node of
+       `G` once. If None, the ordering is produced by G.nodes().
+
+    Returns
+    -------
+    C : SciPy sparse matrix
+       The adjacency matrix of the condensation in CSR format. ``C[i, j]``
+       is 1 if an edge of `G` goes from component `i` to component `j`.
+       The components are in reverse topological order, so `C` is
+       strictly lower triangular.
+
+    labels : NumPy array
+       ``labels[i]`` is the component of the `i`-th node of `nodelist`,
+       as returned by :func:`strongly_connected_component_labels`.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is undirected.
+
+    NetworkXError
+        If `nodelist` is not an ordering of the nodes of `G`.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 0), (1, 2), (2, 3), (3, 2)])
+    >>> C, labels = nx.sparse_condensation(G)
+    >>> C.toarray()
+    array([[0, 0],
+           [1, 0]], dtype=int8)
+    >>> labels
+    array([1, 1, 0, 0])
+
+    See Also
+    --------
+    condensation
+    strongly_connected_component_labels
+    """
+    import numpy as np
+    import scipy.sparse as sp
+
+    indptr, indices = _csr_snapshot(G, nodelist)
+    labels = _scc_labels(indptr, indices)
+    labels = np.frombuffer(labels, dtype=np.int64).astype(np.intp)
+    indptr = np.frombuffer(indptr, dtype=np.int64)
+    k = int(labels.max()) + 1 if len(labels) else 0
+    tail = np.repeat(labels, np.diff(indptr))
+    head = labels[np.frombuffer(indices, dtype=np.int64)]
+    keys = np.unique(tail[tail != head] * k + head[tail != head])
+    rows, cols = np.divmod(keys, k)
+    C = sp.csr_matrix(
+        (
+            np.ones(len(keys), dtype=np.int8),
+            cols,
+            np.r_[0, np.cumsum(np.bincount(rows, minlength=k))],
+        ),
+        shape=(k, k),
+    )
+    return C, labels
@@ -109,3 +109,20 @@ class TestConnected:
             assert len(seen & component) == 0
             seen.update(component)
             component.clear()
+
+    def test_connected_component_labels(self):
+        pytest.importorskip("numpy")
+        G = self.G
+        labels = nx.connected_component_labels(G, chunk_size=3)
+        components = {}
+        for n, label in zip(G, labels.tolist()):
+            components.setdefault(label, set()).add(n)
+        assert list(components) == list(range(len(components)))
+        assert list(components.values()) == list(nx.connected_components(G))
+        nodelist = sorted(G, reverse=True)
+        labels = nx.connected_component_labels(G, nodelist)
+        assert labels[0] == 0
+        assert len(set(labels.tolist())) == 3
+        pytest.raises(nx.NetworkXError, nx.connected_component_labels, G, [0, 1])
+        pytest.raises(NetworkXNotImplemented, nx.connected_component_labels, self.DG)
+        assert len(nx.connected_component_labels(nx.Graph())) == 0
@@ -204,6 +204,50 @@ class TestStronglyConnected:
             seen.update(component)
             component.clear()
 
+    def test_component_labels(self):
+        pytest.importorskip("numpy")
+        for G, C in self.gc:
+            labels = nx.strongly_connected_component_labels(G)
+            components = {}
+            for n, label in zip(G, labels.tolist()):
+                components.setdefault(label, set()).add(n)
+            assert sorted(components) == list(range(len(C)))
+            assert {frozenset(c) for c in components.values()} == C
+            for u, v in G.edges():
+                assert labels[list(G).index(u)] >= labels[list(G).index(v)]
+        G = nx.DiGraph([(0, 1), (1, 0), (2, 0)])
+        labels = nx.strongly_connected_component_labels(G, nodelist=[2, 1, 0])
+        assert labels.tolist() == [1, 0, 0]
+        pytest.raises(
+            nx.NetworkXError, nx.strongly_connected_component_labels, G, [0, 0, 1]
+        )
+        G = nx.Graph()
+        pytest.raises(NetworkXNotImplemented, nx.strongly_connected_component_labels, G)
+
+    def test_component_labels_deep(self):
+        pytest.importorskip("numpy")
+        G = nx.path_graph(100000, create_using=nx.DiGraph)
+        labels = nx.strongly_connected_component_labels(G)
+        assert labels.tolist() == list(reversed(range(100000)))
+        G.add_edge(99999, 0)
+        assert not nx.strongly_connected_component_labels(G).any()
+
+    def test_sparse_condensation(self):
+        pytest.importorskip("scipy")
+        for G, C in self.gc:
+            cG = nx.condensation(G, scc=C)
+            A, labels = nx.sparse_condensation(G)
+            assert A.shape == (len(C), len(C))
+            assert A.nnz == cG.number_of_edges()
+            mapping = cG.graph["mapping"]
+            relabel = {mapping[n]: label for n, label in zip(G, labels.tolist())}
+            for u, v in cG.edges():
+                assert A[relabel[u], relabel[v]] == 1
+                assert relabel[u] > relabel[v]
+        A, labels = nx.sparse_condensation(nx.DiGraph())
+        assert A.shape == (0, 0)
+        assert len(labels) == 0
+
 
 #    Commented out due to variability on Travis-CI hardware/operating systems
 #    def test_linear_time(self):
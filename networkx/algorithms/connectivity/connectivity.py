@@ -13,7 +13,7 @@ from networkx.algorithms.flow import boykov_kolmogorov
 from networkx.algorithms.flow import dinitz
 from networkx.algorithms.flow import edmonds_karp
 from networkx.algorithms.flow import shortest_augmenting_path
-from networkx.algorithms.flow import build_residual_network
+from networkx.algorithms.flow.flownetwork import _reusable_residual
 
 default_flow_func = edmonds_karp
 
@@ -329,7 +329,9 @@ def node_connectivity(G, s=None, t=None, flow_func=None):
 
     # Reuse the auxiliary digraph and the residual network
     H = build_auxiliary_node_connectivity(G)
-    R = build_residual_network(H, "capacity")
+    if flow_func is None:
+        flow_func = default_flow_func
+    R = _reusable_residual(H, "capacity", flow_func)
     kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
 
     # Pick a node with minimum degree
@@ -404,7 +406,9 @@ def average_node_connectivity(G, flow_func=None):
 
     # Reuse the auxiliary digraph and the residual network
     H = build_auxiliary_node_connectivity(G)
-    R = build_residual_network(H, "capacity")
+    if flow_func is None:
+        flow_func = default_flow_func
+    R = _reusable_residual(H, "capacity", flow_func)
     kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
 
     num, den = 0, 0
@@ -472,7 +476,9 @@ def all_pairs_node_connectivity(G, nbunch=None, flow_func=None):
     # Reuse auxiliary digraph and residual network
     H = build_auxiliary_node_connectivity(G)
     mapping = H.graph["mapping"]
-    R = build_residual_network(H, "capacity")
+    if flow_func is None:
+        flow_func = default_flow_func
+    R = _reusable_residual(H, "capacity", flow_func)
     kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
 
     for u, v in iter_func(nbunch, 2):
@@ -763,7 +769,9 @@ def edge_connectivity(G, s=None, t=None, flow_func=None, cutoff=None):
     # Global edge connectivity
     # reuse auxiliary digraph and residual network
     H = build_auxiliary_edge_connectivity(G)
-    R = build_residual_network(H, "capacity")
+    if flow_func is None:
+        flow_func = default_flow_func
+    R = _reusable_residual(H, "capacity", flow_func)
     kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
 
     if G.is_directed():
@@ -7,7 +7,7 @@ import networkx as nx
 # Define the default maximum flow function to use in all flow based
 # cut algorithms.
 from networkx.algorithms.flow import edmonds_karp
-from networkx.algorithms.flow import build_residual_network
+from networkx.algorithms.flow.flownetwork import _reusable_residual
 
 default_flow_func = edmonds_karp
 
@@ -413,7 +413,9 @@ def minimum_node_cut(G, s=None, t=None, flow_func=None):
 
     # Reuse the auxiliary digraph and the residual network.
     H = build_auxiliary_node_connectivity(G)
-    R = build_residual_network(H, "capacity")
+    if flow_func is None:
+        flow_func = default_flow_func
+    R = _reusable_residual(H, "capacity", flow_func)
     kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
 
     # Choose a node with minimum degree.
@@ -536,7 +538,9 @@ def minimum_edge_cut(G, s=None, t=None, flow_func=None):
 
     # reuse auxiliary digraph and residual network
     H = build_auxiliary_edge_connectivity(G)
-    R = build_residual_network(H, "capacity")
+    if flow_func is None:
+        flow_func = default_flow_func
+    R = _reusable_residual(H, "capacity", flow_func)
     kwargs = dict(flow_func=flow_func, residual=R, auxiliary=H)
 
     # Local minimum edge cut if s and t are not None
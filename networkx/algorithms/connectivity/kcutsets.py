@@ -9,10 +9,11 @@ from operator import itemgetter
 import networkx as nx
 from .utils import build_auxiliary_node_connectivity
 from networkx.algorithms.flow import (
-    build_residual_network,
+    FlowNetwork,
     edmonds_karp,
     shortest_augmenting_path,
 )
+from networkx.algorithms.flow.flownetwork import _reusable_residual
 
 default_flow_func = edmonds_karp
 
@@ -105,11 +106,11 @@ def all_node_cuts(G, k=None, flow_func=None):
     # Keep a copy of original predecessors, H will be modified later.
     # Shallow copy is enough.
     original_H_pred = copy.copy(H._pred)
-    R = build_residual_network(H, "capacity")
-    kwargs = dict(capacity="capacity", residual=R)
     # Define default flow function
     if flow_func is None:
         flow_func = default_flow_func
+    network = R = _reusable_residual(H, "capacity", flow_func)
+    kwargs = dict(capacity="capacity", residual=R)
     if flow_func is shortest_augmenting_path:
         kwargs["two_phase"] = True
     # Begin the actual algorithm
@@ -135,6 +136,9 @@ def all_node_cuts(G, k=None, flow_func=None):
             flow_value = R.graph["flow_value"]
 
             if flow_value == k:
+                if isinstance(R, FlowNetwork):
+                    # The steps below edit a residual DiGraph.
+                    R = network.residual_graph()
                 # Find the nodes incident to the flow.
                 E1 = flowed_edges = [
                     (u, w) for (u, w, d) in R.edges(data=True) if d["flow"] != 0
@@ -209,6 +213,11 @@ def all_node_cuts(G, k=None, flow_func=None):
                 # in residual graphs.
                 H.add_edge(f"{mapping[x]}B", f"{mapping[v]}A", capacity=1)
                 H.add_edge(f"{mapping[v]}B", f"{mapping[x]}A", capacity=1)
+                if isinstance(network, FlowNetwork):
+                    # Update the capacities in place.
+                    network.set_capacity(f"{mapping[x]}B", f"{mapping[v]}A", 1)
+                    network.set_capacity(f"{mapping[v]}B", f"{mapping[x]}A", 1)
+                    continue
                 # Add edges to the residual network.
                 R.add_edge(f"{mapping[x]}B", f"{mapping[v]}A", capacity=1)
                 R.add_edge(f"{mapping[v]}A", f"{mapping[x]}B", capacity=0)
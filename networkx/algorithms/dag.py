@@ -6,6 +6,8 @@ to the user to check for that.
 """
 
 from collections import deque
+from collections.abc import Sequence
+from bisect import bisect_right
 from math import gcd
 from functools import partial
 from itertools import chain
@@ -36,6 +38,8 @@ __all__ = [
     "dag_longest_path",
     "dag_longest_path_length",
     "dag_to_branching",
+    "DynamicTopologicalOrder",
+    "ReachabilityIndex",
 ]
 
 chaini = chain.from_iterable
@@ -905,3 +909,465 @@ def dag_to_branching(G):
     B.remove_node(root)
     B.remove_node(NIL)
     return B
+
+
+class DynamicTopologicalOrder(Sequence):
+    """A topological order of a DAG that is kept up to date as edges are
+    added.
+
+    Nodes and edges added through this object are added to `G`, and the
+    order is repaired locally with the algorithm of Pearce and Kelly [1]_.
+    When an edge `(u, v)` is added with `v` before `u` in the order, only
+    the nodes between `v` and `u` that are reachable from `v` or reach `u`
+    are moved, so the cost depends on the size of this affected region and
+    not on the size of `G`. An edge that would create a cycle is rejected
+    and `G` is left unchanged.
+
+    The order is a sequence of nodes: it can be indexed, iterated over and
+    its length is the number of nodes of `G`.
+
+    Parameters
+    ----------
+    G : NetworkX DiGraph
+        A directed acyclic graph. It must only be modified through this
+        object, or the order may become invalid.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is undirected.
+
+    NetworkXUnfeasible
+        If `G` contains a cycle.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(1, 2), (2, 3)])
+    >>> order = nx.DynamicTopologicalOrder(G)
+    >>> list(order)
+    [1, 2, 3]
+    >>> order.add_edge(3, 0)
+    >>> order.add_edge(0, 1)
+    Traceback (most recent call last):
+      ...
+    networkx.exception.NetworkXUnfeasible: Edge (0, 1) would create a cycle.
+    >>> order.add_edge(4, 1)
+    >>> list(order)
+    [4, 1, 2, 3, 0]
+    >>> order.index(2)
+    2
+
+    References
+    ----------
+    .. [1] D. J. Pearce and P. H. J. Kelly,
+       A dynamic topological sort algorithm for directed acyclic graphs.
+       ACM Journal of Experimental Algorithmics 11, (2006).
+    """
+
+    def __init__(self, G):
+        if not G.is_directed():
+            raise nx.NetworkXNotImplemented("not implemented for undirected type")
+        self.G = G
+        self._order = list(topological_sort(G))
+        self._position = {n: i for i, n in enumerate(self._order)}
+
+    def __len__(self):
+        return len(self._order)
+
+    def __getitem__(self, index):
+        return self._order[index]
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __contains__(self, n):
+        return n in self._position
+
+    def index(self, n):
+        """Returns the position of node `n` in the order."""
+        try:
+            return self._position[n]
+        except KeyError as e:
+            raise ValueError(f"{n} is not in the order") from e
+
+    def add_node(self, n, **attr):
+        """Add node `n` to `G`, at the end of the order if it is new."""
+        self.G.add_node(n, **attr)
+        if n not in self._position:
+            self._position[n] = len(self._order)
+            self._order.append(n)
+
+    def add_edge(self, u, v, **attr):
+        """Add the edge `(u, v)` to `G` and update the order.
+
+        Nodes that are not in `G` are added at the end of the order first.
+
+        Raises
+        ------
+        NetworkXUnfeasible
+            If the edge would create a cycle. `G` is not changed.
+        """
+        if u == v:
+            raise nx.NetworkXUnfeasible(f"Edge {(u, v)} would create a cycle.")
+        self.add_node(u)
+        self.add_node(v)
+        if self._position[v] < self._position[u]:
+            self._reorder(u, v)
+        return self.G.add_edge(u, v, **attr)
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        """Add all the edges in `ebunch_to_add`, one at a time.
+
+        Raises
+        ------
+        NetworkXUnfeasible
+            If an edge would create a cycle. The edges before it are added.
+        """
+        for e in ebunch_to_add:
+            u, v, *dd = e
+            data = {**attr, **dd[-1]} if dd and isinstance(dd[-1], dict) else attr
+            self.add_edge(u, v, **data)
+
+    def remove_edge(self, u, v, *key):
+        """Remove the edge `(u, v)` from `G`. The order remains valid."""
+        self.G.remove_edge(u, v, *key)
+
+    def remove_node(self, n):
+        """Remove node `n` from `G` and from the order.
+
+        This shifts the positions of all later nodes.
+        """
+        self.G.remove_node(n)
+        i = self._position.pop(n)
+        del self._order[i]
+        for j in range(i, len(self._order)):
+            self._position[self._order[j]] = j
+
+    def _reorder(self, u, v):
+        """Moves the nodes affected by the new edge `(u, v)`.
+
+        `v` is before `u`. The nodes reachable from `v` and the nodes that
+        reach `u`, both bounded to the positions between `v` and `u`, are
+        placed in the positions they occupy, the ancestors of `u` first.
+        Each group keeps its relative order. If `u` is reachable from `v`,
+        nothing is moved.
+        """
+        position = self._position
+        lower, upper = position[v], position[u]
+        # only nodes placed before u can be on a path from v to u
+        forward = {v}
+        stack = [v]
+        while stack:
+            for w in self.G._succ[stack.pop()]:
+                if w == u:
+                    msg = f"Edge {(u, v)} would create a cycle."
+                    raise nx.NetworkXUnfeasible(msg)
+                if w not in forward and position[w] < upper:
+                    forward.add(w)
+                    stack.append(w)
+        backward = {u}
+        stack = [u]
+        while stack:
+            for w in self.G._pred[stack.pop()]:
+                if w not in backward and position[w] > lower:
+                    backward.add(w)
+                    stack.append(w)
+        forward = sorted(forward, key=position.__getitem__)
+        backward = sorted(backward, key=position.__getitem__)
+        slots = sorted(position[n] for n in chain(backward, forward))
+        for n, i in zip(chain(backward, forward), slots):
+            self._order[i] = n
+            position[n] = i
+
+
+class ReachabilityIndex:
+    """An index answering reachability queries on a directed graph.
+
+    The strongly connected components of `G` are contracted, and the
+    reachability between components of the resulting DAG is compressed
+    with one of three methods:
+
+    - 'bitset': the descendants of every component are stored as a NumPy
+      bitset. Queries take constant time and bulk queries are vectorized,
+      but the index takes ``k ** 2 / 8`` bytes for `k` components.
+
+    - 'interval': the components are numbered in the postorder of a
+      spanning forest of the DAG, and the descendants of every component
+      are stored as a list of intervals of postorder numbers [1]_. A query
+      is a binary search in these intervals. The index is usually much
+      smaller than the bitsets.
+
+    - '2hop': every component stores the hubs it reaches and the hubs that
+      reach it, computed by pruned searches from the hubs in decreasing
+      order of degree [2]_. `v` is reachable from `u` if a hub of `u`
+      reaches a hub of `v`. This is the most compact index on large sparse
+      graphs.
+
+    The index is a snapshot: it does not follow later changes of `G`.
+
+    Parameters
+    ----------
+    G : NetworkX DiGraph
+        A directed graph.
+
+    method : string, optional (default='bitset')
+        One of 'bitset', 'interval' or '2hop'.
+
+    Attributes
+    ----------
+    nodelist : list
+        The nodes of `G`.
+
+    labels : NumPy array
+        The strongly connected component of every node of `nodelist`,
+        as returned by :func:`strongly_connected_component_labels`.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is undirected.
+
+    ValueError
+        If `method` is unknown.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2), (2, 1), (3, 2)])
+    >>> index = nx.ReachabilityIndex(G, method="interval")
+    >>> index.reachable(0, 2), index.reachable(2, 0)
+    (True, False)
+    >>> index.reachable_many([0, 3, 2], [1, 0, 1])
+    array([ True, False,  True])
+    >>> sorted(index.descendants(0))
+    [1, 2]
+
+    References
+    ----------
+    .. [1] R. Agrawal, A. Borgida and H. V. Jagadish,
+       Efficient management of transitive relationships in large data and
+       knowledge bases. SIGMOD Record 18(2): 253-262, (1989).
+    .. [2] Y. Yano, T. Akiba, Y. Iwata and Y. Yoshida,
+       Fast and scalable reachability queries on graphs by pruned labeling
+       with landmarks and paths. CIKM 2013: 1601-1606, (2013).
+    """
+
+    def __init__(self, G, method="bitset"):
+        import numpy as np
+        from networkx.algorithms.components.strongly_connected import (
+            _csr_snapshot,
+            _scc_labels,
+        )
+
+        if not G.is_directed():
+            raise nx.NetworkXNotImplemented("not implemented for undirected type")
+        if method not in ("bitset", "interval", "2hop"):
+            raise ValueError(f"method not supported: {method}")
+        self.method = method
+        self.nodelist = list(G)
+        self._index = {n: i for i, n in enumerate(self.nodelist)}
+        indptr, indices = _csr_snapshot(G, self.nodelist)
+        self.labels = np.frombuffer(_scc_labels(indptr, indices), np.int64)
+        self.labels = self.labels.astype(np.intp)
+        k = int(self.labels.max()) + 1 if len(self.labels) else 0
+        self._num_components = k
+        # the condensation in CSR format; successors have smaller labels
+        tail = np.repeat(self.labels, np.diff(np.frombuffer(indptr, np.int64)))
+        head = self.labels[np.frombuffer(indices, np.int64)]
+        keys = np.unique(tail[tail != head] * k + head[tail != head])
+        self._succ_indptr = np.r_[0, np.cumsum(np.bincount(keys // k, minlength=k))]
+        self._succ = keys % k
+        getattr(self, f"_build_{method}")()
+
+    def _successors(self):
+        """Returns the successors of every component as lists."""
+        indptr, succ = self._succ_indptr.tolist(), self._succ.tolist()
+        return [succ[indptr[c] : indptr[c + 1]] for c in range(self._num_components)]
+
+    def _build_bitset(self):
+        import numpy as np
+
+        k = self._num_components
+        bits = np.zeros((k, (k + 63) // 64), dtype=np.uint64)
+        succ = self._successors()
+        # successors have smaller labels, so they are complete first
+        for c in range(k):
+            row = bits[c]
+            row[c >> 6] |= np.uint64(1 << (c & 63))
+            for d in succ[c]:
+                np.bitwise_or(row, bits[d], out=row)
+        self._bits = bits
+
+    def _build_interval(self):
+        import numpy as np
+
+        k = self._num_components
+        succ = self._successors()
+        # postorder of a spanning forest of the condensation, from the
+        # components without predecessors (the largest labels)
+        has_pred = np.zeros(k, dtype=bool)
+        has_pred[self._succ] = True
+        post = [-1] * k
+        low = [0] * k
+        seen = bytearray(k)
+        count = 0
+        for root in reversed(np.flatnonzero(~has_pred).tolist()):
+            seen[root] = 1
+            stack = [(root, iter(succ[root]), count)]
+            while stack:
+                c, children, first = stack[-1]
+                for d in children:
+                    if not seen[d]:
+                        seen[d] = 1
+                        stack.append((d, iter(succ[d]), count))
+                        break
+                else:
+                    stack.pop()
+                    low[c] = first
+                    post[c] = count
+                    count += 1
+        # merge the intervals of the successors, which are complete first
+        starts, ends = [], []
+        for c in range(k):
+            intervals = [(low[c], post[c])]
+            for d in succ[c]:
+                intervals.extend(zip(starts[d], ends[d]))
+            intervals.sort()
+            merged_starts, merged_ends = [], []
+            for a, b in intervals:
+                if merged_ends and a <= merged_ends[-1] + 1:
+                    if b > merged_ends[-1]:
+                        merged_ends[-1] = b
+                else:
+                    merged_starts.append(a)
+                    merged_ends.append(b)
+            starts.append(merged_starts)
+            ends.append(merged_ends)
+        self._post = post
+        self._at_post = np.empty(k, dtype=np.intp)
+        self._at_post[post] = np.arange(k)
+        self._starts = starts
+        self._ends = ends
+
+    def _build_2hop(self):
+        import numpy as np
+
+        k = self._num_components
+        succ = self._successors()
+        pred = [[] for _ in range(k)]
+        for c in range(k):
+            for d in succ[c]:
+                pred[d].append(c)
+        degree = [(len(succ[c]) + 1) * (len(pred[c]) + 1) for c in range(k)]
+        hubs = np.argsort(degree, kind="stable")[::-1].tolist()
+        out_hubs = [set() for _ in range(k)]
+        in_hubs = [set() for _ in range(k)]
+        for rank, h in enumerate(hubs):
+            searches = ((succ, in_hubs, out_hubs[h]), (pred, out_hubs, in_hubs[h]))
+            for adj, labels, other in searches:
+                stack = [h]
+                seen = {h}
+                while stack:
+                    c = stack.pop()
+                    # prune the search where earlier hubs already answer
+                    if c != h and not other.isdisjoint(labels[c]):
+                        continue
+                    labels[c].add(rank)
+                    for d in adj[c]:
+                        if d not in seen:
+                            seen.add(d)
+                            stack.append(d)
+        self._out_hubs = out_hubs
+        self._in_hubs = in_hubs
+
+    def _component(self, n):
+        try:
+            return int(self.labels[self._index[n]])
+        except KeyError as e:
+            raise nx.NodeNotFound(f"Node {n} is not in G") from e
+
+    def _reachable(self, a, b):
+        """Returns True if component `b` is reachable from component `a`."""
+        if a == b:
+            return True
+        if a < b:
+            return False
+        if self.method == "bitset":
+            return bool(int(self._bits[a, b >> 6]) >> (b & 63) & 1)
+        if self.method == "interval":
+            p = self._post[b]
+            i = bisect_right(self._starts[a], p) - 1
+            return i >= 0 and self._ends[a][i] >= p
+        return not self._out_hubs[a].isdisjoint(self._in_hubs[b])
+
+    def reachable(self, u, v):
+        """Returns True if there is a path from `u` to `v` in `G`.
+
+        Raises
+        ------
+        NodeNotFound
+            If `u` or `v` is not in `G`.
+        """
+        return self._reachable(self._component(u), self._component(v))
+
+    def reachable_many(self, sources, targets):
+        """Returns a boolean array telling for every pair of `sources` and
+        `targets` if there is a path from the source to the target.
+
+        With the 'bitset' method the queries are answered by vectorized
+        array lookups.
+
+        Raises
+        ------
+        NodeNotFound
+            If a node is not in `G`.
+        """
+        import numpy as np
+
+        a = np.array([self._component(u) for u in sources], dtype=np.intp)
+        b = np.array([self._component(v) for v in targets], dtype=np.intp)
+        if self.method == "bitset":
+            if not len(a):
+                return np.zeros(0, dtype=bool)
+            words = self._bits[a, b >> 6] >> (b & 63).astype(np.uint64)
+            return (words & np.uint64(1)).astype(bool)
+        return np.array(
+            [self._reachable(x, y) for x, y in zip(a.tolist(), b.tolist())],
+            dtype=bool,
+        )
+
+    def descendants(self, u):
+        """Returns the set of nodes reachable from `u`, as
+        :func:`descendants`.
+
+        Raises
+        ------
+        NodeNotFound
+            If `u` is not in `G`.
+        """
+        import numpy as np
+
+        a = self._component(u)
+        k = self._num_components
+        if self.method == "bitset":
+            # words are little-endian so bytes come in bit order on any host
+            words = self._bits[a].astype("<u8", copy=False)
+            mask = np.unpackbits(words.view(np.uint8), bitorder="little")
+            mask = mask[:k].astype(bool)
+        elif self.method == "interval":
+            mask = np.zeros(k, dtype=bool)
+            for start, end in zip(self._starts[a], self._ends[a]):
+                mask[self._at_post[start : end + 1]] = True
+        else:
+            mask = np.zeros(k, dtype=bool)
+            mask[a] = True
+            stack = [a]
+            indptr, succ = self._succ_indptr, self._succ
+            while stack:
+                c = stack.pop()
+                for d in succ[indptr[c] : indptr[c + 1]].tolist():
+                    if not mask[d]:
+                        mask[d] = True
+                        stack.append(d)
+        nodes = np.flatnonzero(mask[self.labels]).tolist()
+        nodelist = self.nodelist
+        return {nodelist[i] for i in nodes} - {u}
@@ -4,8 +4,10 @@ from .boykovkolmogorov import *
 from .dinitz_alg import *
 from .edmondskarp import *
 from .gomory_hu import *
+from .flownetwork import *
 from .preflowpush import *
 from .shortestaugmentingpath import *
 from .capacityscaling import *
 from .networksimplex import *
 from .utils import build_flow_dict, build_residual_network
+from .utils import ArrayResidualNetwork, build_array_residual_network
@@ -5,6 +5,7 @@ from collections import deque
 from operator import itemgetter
 
 import networkx as nx
+from networkx.algorithms.flow.utils import ArrayResidualNetwork
 from networkx.algorithms.flow.utils import build_residual_network
 
 __all__ = ["boykov_kolmogorov"]
@@ -43,9 +44,11 @@ def boykov_kolmogorov(
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ArrayResidualNetwork
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If an :class:`ArrayResidualNetwork`
+        is given, the algorithm runs on its arrays and returns it.
+        Default value: None.
 
     value_only : bool
         If True compute only the value of the maximum flow. This parameter
@@ -166,6 +169,9 @@ def boykov_kolmogorov_impl(G, s, t, capacity, residual, cutoff):
     if s == t:
         raise nx.NetworkXError("source and sink are the same node")
 
+    if isinstance(residual, ArrayResidualNetwork):
+        return boykov_kolmogorov_array(residual, s, t, cutoff)
+
     if residual is None:
         R = build_residual_network(G, capacity)
     else:
@@ -365,3 +371,212 @@ def boykov_kolmogorov_impl(G, s, t, capacity, residual, cutoff):
     # Add the standard flow_value graph attribute.
     R.graph["flow_value"] = flow_value
     return R
+
+
+def boykov_kolmogorov_array(R, s, t, cutoff):
+    """Implementation of the Boykov-Kolmogorov algorithm on an
+    :class:`ArrayResidualNetwork`.
+
+    The search trees map each node to the arc joining it to its parent,
+    which is the arc from the parent in the source tree and the arc to the
+    parent in the target tree, or to None for the roots and the orphans.
+    """
+    head, adj = R._arc_lists()
+    nodelist = R.nodelist
+    s = R.index[s]
+    t = R.index[t]
+
+    # Initialize/reset the residual network.
+    R.reset_flow()
+    res = R.capacity.tolist()
+
+    # Use an arbitrary high value as infinite. It is computed
+    # when building the residual network.
+    INF = R.graph["inf"]
+
+    if cutoff is None:
+        cutoff = INF
+
+    def parent(v, tree):
+        """Returns the parent of v in tree, or None."""
+        a = tree[v]
+        if a is None:
+            return None
+        return head[a ^ 1] if tree is source_tree else head[a]
+
+    def grow():
+        """Bidirectional breadth-first search for the growth stage.
+
+        Returns a connecting arc, that is an arc from a node of the source
+        search tree to a node of the target search tree.
+        """
+        while active:
+            u = active[0]
+            if u in source_tree:
+                for e in adj[u]:
+                    if res[e] > 0:
+                        v = head[e]
+                        if v not in source_tree:
+                            if v in target_tree:
+                                return e
+                            source_tree[v] = e
+                            dist[v] = dist[u] + 1
+                            timestamp[v] = timestamp[u]
+                            active.append(v)
+                        elif _is_closer(u, v):
+                            source_tree[v] = e
+                            dist[v] = dist[u] + 1
+                            timestamp[v] = timestamp[u]
+            else:
+                for e in adj[u]:
+                    if res[e ^ 1] > 0:
+                        v = head[e]
+                        if v not in target_tree:
+                            if v in source_tree:
+                                return e ^ 1
+                            target_tree[v] = e ^ 1
+                            dist[v] = dist[u] + 1
+                            timestamp[v] = timestamp[u]
+                            active.append(v)
+                        elif _is_closer(u, v):
+                            target_tree[v] = e ^ 1
+                            dist[v] = dist[u] + 1
+                            timestamp[v] = timestamp[u]
+            _ = active.popleft()
+        return None
+
+    def augment(e):
+        """Augmentation stage.
+
+        Reconstruct the path through the connecting arc e, determine its
+        residual capacity and augment the flow along it.
+        """
+        flow = min(INF, res[e])
+        path = []
+        # Trace a path from the tail of e to s in source_tree.
+        w = head[e ^ 1]
+        while w != s:
+            a = source_tree[w]
+            flow = min(flow, res[a])
+            path.append(a)
+            w = head[a ^ 1]
+        path.reverse()
+        path.append(e)
+        # Trace a path from the head of e to t in target_tree.
+        w = head[e]
+        while w != t:
+            a = target_tree[w]
+            flow = min(flow, res[a])
+            path.append(a)
+            w = head[a]
+        # Augment flow along the path and check for saturated arcs.
+        these_orphans = []
+        for a in path:
+            res[a] -= flow
+            res[a ^ 1] += flow
+            if res[a] == 0:
+                u = head[a ^ 1]
+                v = head[a]
+                if v in source_tree:
+                    source_tree[v] = None
+                    these_orphans.append(v)
+                if u in target_tree:
+                    target_tree[u] = None
+                    these_orphans.append(u)
+        orphans.extend(sorted(these_orphans, key=dist.get))
+        return flow
+
+    def adopt():
+        """Adoption stage.
+
+        Reconstruct search trees by adopting or discarding orphans.
+        """
+        while orphans:
+            u = orphans.popleft()
+            if u in source_tree:
+                tree = source_tree
+                # Candidate parents v are joined to u by the arc e ^ 1.
+                nbrs = [(dist[head[e]], e ^ 1) for e in adj[u] if head[e] in tree]
+            else:
+                tree = target_tree
+                nbrs = [(dist[head[e]], e) for e in adj[u] if head[e] in tree]
+            nbrs.sort(key=itemgetter(0))
+            for d, a in nbrs:
+                v = head[a ^ 1] if tree is source_tree else head[a]
+                if res[a] > 0:
+                    if _has_valid_root(v, tree):
+                        tree[u] = a
+                        dist[u] = dist[v] + 1
+                        timestamp[u] = time
+                        break
+            else:
+                for d, a in nbrs:
+                    v = head[a ^ 1] if tree is source_tree else head[a]
+                    if res[a] > 0:
+                        if v not in active:
+                            active.append(v)
+                    if parent(v, tree) == u:
+                        tree[v] = None
+                        orphans.appendleft(v)
+                if u in active:
+                    active.remove(u)
+                del tree[u]
+
+    def _has_valid_root(n, tree):
+        path = []
+        v = n
+        while v is not None:
+            path.append(v)
+            if v == s or v == t:
+                base_dist = 0
+                break
+            elif timestamp[v] == time:
+                base_dist = dist[v]
+                break
+            v = parent(v, tree)
+        else:
+            return False
+        length = len(path)
+        for i, u in enumerate(path, 1):
+            dist[u] = base_dist + length - i
+            timestamp[u] = time
+        return True
+
+    def _is_closer(u, v):
+        return timestamp[v] <= timestamp[u] and dist[v] > dist[u] + 1
+
+    source_tree = {s: None}
+    target_tree = {t: None}
+    active = deque([s, t])
+    orphans = deque()
+    flow_value = 0
+    # data structures for the marking heuristic
+    time = 1
+    timestamp = {s: time, t: time}
+    dist = {s: 0, t: 0}
+    while flow_value < cutoff:
+        # Growth stage
+        e = grow()
+        if e is None:
+            break
+        time += 1
+        # Augmentation stage
+        flow_value += augment(e)
+        # Adoption stage
+        adopt()
+
+    if flow_value * 2 > INF:
+        raise nx.NetworkXUnbounded("Infinite capacity path, flow unbounded above.")
+
+    R._set_residual(res)
+    # Add source and target tree in a graph attribute, with the parents
+    # given as nodes as for the residual DiGraph.
+    R.graph["trees"] = tuple(
+        {
+            nodelist[v]: None if a is None else nodelist[parent(v, tree)]
+            for v, a in tree.items()
+        }
+        for tree in (source_tree, target_tree)
+    )
+    R.graph["flow_value"] = flow_value
+    return R
@@ -4,6 +4,7 @@ Dinitz' algorithm for maximum flow problems.
 from collections import deque
 
 import networkx as nx
+from networkx.algorithms.flow.utils import ArrayResidualNetwork
 from networkx.algorithms.flow.utils import build_residual_network
 from networkx.utils import pairwise
 
@@ -40,9 +41,11 @@ def dinitz(G, s, t, capacity="capacity", residual=None, value_only=False, cutoff
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ArrayResidualNetwork
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If an :class:`ArrayResidualNetwork`
+        is given, the algorithm runs on its arrays and returns it.
+        Default value: None.
 
     value_only : bool
         If True compute only the value of the maximum flow. This parameter
@@ -145,6 +148,9 @@ def dinitz_impl(G, s, t, capacity, residual, cutoff):
     if s == t:
         raise nx.NetworkXError("source and sink are the same node")
 
+    if isinstance(residual, ArrayResidualNetwork):
+        return dinitz_array(residual, s, t, cutoff)
+
     if residual is None:
         R = build_residual_network(G, capacity)
     else:
@@ -209,3 +215,84 @@ def dinitz_impl(G, s, t, capacity, residual, cutoff):
 
     R.graph["flow_value"] = flow_value
     return R
+
+
+def dinitz_array(R, s, t, cutoff):
+    """Implementation of Dinitz' algorithm on an :class:`ArrayResidualNetwork`.
+
+    Each phase builds the level graph with a breadth-first search and then
+    finds a blocking flow with depth-first searches that keep a current arc
+    per node, so that every arc is discarded at most once per phase.
+    """
+    head, adj = R._arc_lists()
+    INF = R.graph["inf"]
+    n = len(adj)
+    s = R.index[s]
+    t = R.index[t]
+
+    # Initialize/reset the residual network.
+    R.reset_flow()
+    res = R.capacity.tolist()
+
+    if cutoff is None:
+        cutoff = INF
+
+    flow_value = 0
+    while flow_value < cutoff:
+        # Breadth-first search for the level graph.
+        level = [-1] * n
+        level[s] = 0
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            if u == t:
+                break
+            lu = level[u] + 1
+            for e in adj[u]:
+                v = head[e]
+                if level[v] < 0 and res[e] > 0:
+                    level[v] = lu
+                    queue.append(v)
+        if level[t] < 0:
+            break
+
+        # Depth-first searches for a blocking flow.
+        curr = [0] * n
+        while flow_value < cutoff:
+            path = []
+            u = s
+            while u != t:
+                arcs = adj[u]
+                i = curr[u]
+                lu = level[u] + 1
+                while i < len(arcs):
+                    e = arcs[i]
+                    if res[e] > 0 and level[head[e]] == lu:
+                        break
+                    i += 1
+                curr[u] = i
+                if i < len(arcs):
+                    path.append(e)
+                    u = head[e]
+                elif path:
+                    # Dead end: remove u from the level graph and retreat.
+                    level[u] = -1
+                    u = head[path.pop() ^ 1]
+                    curr[u] += 1
+                else:
+                    break
+            if u != t:
+                break
+            this_flow = min(res[e] for e in path)
+            if this_flow * 2 > INF:
+                raise nx.NetworkXUnbounded(
+                    "Infinite capacity path, flow unbounded above."
+                )
+            for e in path:
+                res[e] -= this_flow
+                res[e ^ 1] += this_flow
+            flow_value += this_flow
+
+    R._set_residual(res)
+    R.graph["flow_value"] = flow_value
+    return R
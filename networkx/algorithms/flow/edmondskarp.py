@@ -3,6 +3,7 @@ Edmonds-Karp algorithm for maximum flow problems.
 """
 
 import networkx as nx
+from networkx.algorithms.flow.utils import ArrayResidualNetwork
 from networkx.algorithms.flow.utils import build_residual_network
 
 __all__ = ["edmonds_karp"]
@@ -91,6 +92,83 @@ def edmonds_karp_core(R, s, t, cutoff):
     return flow_value
 
 
+def edmonds_karp_array_core(R, s, t, cutoff):
+    """Implementation of the Edmonds-Karp algorithm on an
+    :class:`ArrayResidualNetwork`.
+    """
+    head, adj = R._arc_lists()
+    inf = R.graph["inf"]
+    s = R.index[s]
+    t = R.index[t]
+    res = R.residual_capacity().tolist()
+
+    def bidirectional_bfs():
+        """Bidirectional breadth-first search for an augmenting path. The
+        searches map each node to the arc used to reach it.
+        """
+        pred = {s: None}
+        q_s = [s]
+        succ = {t: None}
+        q_t = [t]
+        while True:
+            q = []
+            if len(q_s) <= len(q_t):
+                for u in q_s:
+                    for e in adj[u]:
+                        v = head[e]
+                        if v not in pred and res[e] > 0:
+                            pred[v] = e
+                            if v in succ:
+                                return v, pred, succ
+                            q.append(v)
+                if not q:
+                    return None, None, None
+                q_s = q
+            else:
+                for u in q_t:
+                    for e in adj[u]:
+                        v = head[e]
+                        if v not in succ and res[e ^ 1] > 0:
+                            succ[v] = e ^ 1
+                            if v in pred:
+                                return v, pred, succ
+                            q.append(v)
+                if not q:
+                    return None, None, None
+                q_t = q
+
+    # Look for shortest augmenting paths using breadth-first search.
+    flow_value = 0
+    while flow_value < cutoff:
+        v, pred, succ = bidirectional_bfs()
+        if pred is None:
+            break
+        # Trace a path from s to t through v.
+        path = []
+        u = v
+        while u != s:
+            e = pred[u]
+            path.append(e)
+            u = head[e ^ 1]
+        u = v
+        while u != t:
+            e = succ[u]
+            path.append(e)
+            u = head[e]
+        # Determine the path residual capacity.
+        flow = min(inf, min(res[e] for e in path))
+        if flow * 2 > inf:
+            raise nx.NetworkXUnbounded("Infinite capacity path, flow unbounded above.")
+        # Augment flow along the path.
+        for e in path:
+            res[e] -= flow
+            res[e ^ 1] += flow
+        flow_value += flow
+
+    R._set_residual(res)
+    return flow_value
+
+
 def edmonds_karp_impl(G, s, t, capacity, residual, cutoff):
     """Implementation of the Edmonds-Karp algorithm."""
     if s not in G:
@@ -100,6 +178,15 @@ def edmonds_karp_impl(G, s, t, capacity, residual, cutoff):
     if s == t:
         raise nx.NetworkXError("source and sink are the same node")
 
+    if cutoff is None:
+        cutoff = float("inf")
+
+    if isinstance(residual, ArrayResidualNetwork):
+        R = residual
+        R.reset_flow()
+        R.graph["flow_value"] = edmonds_karp_array_core(R, s, t, cutoff)
+        return R
+
     if residual is None:
         R = build_residual_network(G, capacity)
     else:
@@ -110,8 +197,6 @@ def edmonds_karp_impl(G, s, t, capacity, residual, cutoff):
         for e in R[u].values():
             e["flow"] = 0
 
-    if cutoff is None:
-        cutoff = float("inf")
     R.graph["flow_value"] = edmonds_karp_core(R, s, t, cutoff)
 
     return R
@@ -149,9 +234,11 @@ def edmonds_karp(
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ArrayResidualNetwork
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If an :class:`ArrayResidualNetwork`
+        is given, the algorithm runs on its arrays and returns it.
+        Default value: None.
 
     value_only : bool
         If True compute only the value of the maximum flow. This parameter
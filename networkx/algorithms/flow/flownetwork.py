@@ -0,0 +1,293 @@
+"""
+Reusable flow network for repeated maximum flow and minimum cut queries.
+"""
+import networkx as nx
+
+from .edmondskarp import edmonds_karp_array_core
+from .maxflow import default_flow_func, flow_funcs
+from .utils import ArrayResidualNetwork
+from .utils import _array_sink_side, _array_source_side
+from .utils import build_flow_dict
+from .utils import detect_unboundedness
+from .utils import build_residual_network
+
+__all__ = ["FlowNetwork"]
+
+
+class FlowNetwork(ArrayResidualNetwork):
+    """A flow network that answers repeated maximum flow and minimum cut
+    queries.
+
+    The residual network of `G` is built once, as an
+    :class:`ArrayResidualNetwork`, and kept between queries. Capacities can
+    be changed in place with :meth:`set_capacity`, without rebuilding the
+    network. When a query asks again for the same source and sink, and the
+    current flow is still a feasible flow for them, the search for
+    augmenting paths starts from that flow instead of from zero.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Edges of the graph are expected to have an attribute called
+        'capacity'. If this attribute is not present, the edge is
+        considered to have infinite capacity.
+
+    capacity : string
+        Name of the edge attribute holding the capacity of the edges.
+        Default value: 'capacity'.
+
+    flow_func : function
+        Maximum flow function used for the queries that can not be warm
+        started. It has to be one of the maximum flow functions of NetworkX,
+        which accept an :class:`ArrayResidualNetwork` as ``residual``. If
+        None, the default maximum flow function of :func:`maximum_flow` is
+        used. Default value: None.
+
+    Raises
+    ------
+    NetworkXError
+        If `G` is a multigraph or if `flow_func` can not run on an
+        :class:`ArrayResidualNetwork`.
+
+    See also
+    --------
+    :meth:`maximum_flow`
+    :meth:`minimum_cut`
+    :class:`ArrayResidualNetwork`
+
+    Notes
+    -----
+    The capacities of the network are stored in the network itself: the
+    edge attributes of `G` are only read when the network is built, and
+    :meth:`set_capacity` does not modify `G`.
+
+    Examples
+    --------
+    >>> from networkx.algorithms.flow import FlowNetwork
+    >>> G = nx.DiGraph()
+    >>> G.add_edge("x", "a", capacity=3)
+    >>> G.add_edge("a", "y", capacity=2)
+    >>> G.add_edge("x", "y", capacity=1)
+    >>> N = FlowNetwork(G)
+    >>> N.max_flow_value("x", "y")
+    3
+    >>> cut_value, (S, T) = N.min_cut("x", "y")
+    >>> cut_value, sorted(S), sorted(T)
+    (3, ['a', 'x'], ['y'])
+
+    Raising a capacity keeps the current flow, which is then augmented.
+
+    >>> N.set_capacity("a", "y", 5)
+    >>> N.max_flow_value("x", "y")
+    4
+    >>> N.set_capacity("x", "y", 4)
+    >>> N.max_flow_value("x", "y")
+    7
+
+    """
+
+    def __init__(self, G, capacity="capacity", flow_func=None):
+        if flow_func is None:
+            flow_func = default_flow_func
+        if flow_func not in flow_funcs:
+            raise nx.NetworkXError(
+                "flow_func has to be a NetworkX maximum flow function."
+            )
+        super().__init__(G, capacity)
+        self.flow_func = flow_func
+        self._G = G
+        self._directed = G.is_directed()
+        self._infinite = self.capacity == self.graph["inf"]
+        finite_sum = self.capacity[~self._infinite].sum().item()
+        self._finite_sum = finite_sum if self._directed else finite_sum / 2
+        self._terminals = None
+
+    def set_capacity(self, u, v, capacity):
+        """Set the capacity of the edge from `u` to `v`.
+
+        If the edge is not in the network it is added to it; the nodes of
+        the network are those of the graph it was built from. For undirected
+        graphs the capacity is set in both directions.
+
+        Parameters
+        ----------
+        u, v : nodes
+            Nodes of the network.
+
+        capacity : integer, float
+            Nonnegative capacity of the edge. It can be ``float("inf")``.
+
+        Raises
+        ------
+        NetworkXError
+            If `u` or `v` is not in the network, if they are the same node,
+            or if the capacity is negative.
+
+        """
+        for n in (u, v):
+            if n not in self.index:
+                raise nx.NetworkXError(f"node {str(n)} not in graph")
+        if u == v:
+            raise nx.NetworkXError("self loops have no capacity in a flow network")
+        if capacity < 0:
+            raise nx.NetworkXError("capacity must be nonnegative")
+        is_inf = capacity == float("inf")
+        if not is_inf and self.capacity.dtype.kind != "f" and capacity != int(capacity):
+            self.capacity = self.capacity.astype(float)
+            self.flow = self.flow.astype(float)
+
+        i = self.index[u]
+        j = self.index[v]
+        e = self._find_arc(i, j)
+        if e is None:
+            e = self._add_pair(i, j)
+        arcs = (e,) if self._directed else (e, e ^ 1)
+
+        # Simulate infinity with three times the sum of the finite edge
+        # capacities, as build_residual_network does.
+        old = self.capacity[e].item()
+        if not self._infinite[e]:
+            self._finite_sum -= old
+        if not is_inf:
+            self._finite_sum += capacity
+        inf = 3 * self._finite_sum or 1
+        if inf != self.graph["inf"]:
+            self.graph["inf"] = inf
+            self.capacity[self._infinite] = inf
+        for a in arcs:
+            self._infinite[a] = is_inf
+            self.capacity[a] = inf if is_inf else capacity
+
+    def _add_pair(self, i, j):
+        """Add a pair of arcs with zero capacity between nodes i and j and
+        return the id of the arc from i to j.
+        """
+        import numpy as np
+
+        e = len(self.head)
+        self._arc_keys = None
+        self.head = np.append(self.head, [j, i])
+        self.tail = np.append(self.tail, [i, j])
+        self.capacity = np.append(self.capacity, np.zeros(2, self.capacity.dtype))
+        self.flow = np.append(self.flow, np.zeros(2, self.flow.dtype))
+        self._infinite = np.append(self._infinite, [False, False])
+        # Each new arc goes at the end of the arcs leaving its tail.
+        for a, u in ((e, i), (e + 1, j)):
+            self.arcs = np.insert(self.arcs, self.indptr[u + 1], a)
+            self.indptr[u + 1 :] += 1
+        return e
+
+    def _is_feasible_flow(self, s, t):
+        """Returns True if the current flow is a feasible flow from s to t."""
+        import numpy as np
+
+        if (self.flow > self.capacity).any():
+            return False
+        excess = np.bincount(self.head, weights=self.flow, minlength=len(self))
+        excess[[self.index[s], self.index[t]]] = 0
+        return not excess.any()
+
+    def _run(self, s, t, value_only, kwargs):
+        """Compute a maximum flow from s to t, warm started from the current
+        flow if it was computed for the same terminals and is still feasible.
+        """
+        if s not in self.index:
+            raise nx.NetworkXError(f"node {str(s)} not in graph")
+        if t not in self.index:
+            raise nx.NetworkXError(f"node {str(t)} not in graph")
+        if s == t:
+            raise nx.NetworkXError("source and sink are the same node")
+
+        if self._terminals == (s, t) and self._is_feasible_flow(s, t):
+            # The flow functions check this themselves on cold starts.
+            detect_unboundedness(self, s, t)
+            i = self.index[t]
+            flow_value = self.flow[self.arcs[self.indptr[i] : self.indptr[i + 1]]]
+            flow_value = -flow_value.sum().item()
+            cutoff = kwargs.get("cutoff")
+            if cutoff is None:
+                cutoff = float("inf")
+            if flow_value < cutoff:
+                flow_value += edmonds_karp_array_core(self, s, t, cutoff - flow_value)
+            self.graph["flow_value"] = flow_value
+        else:
+            self.flow_func(
+                self._G, s, t, residual=self, value_only=value_only, **kwargs
+            )
+        self._terminals = (s, t)
+        return self.graph["flow_value"]
+
+    def max_flow_value(self, s, t, **kwargs):
+        """Returns the value of a maximum flow from `s` to `t`.
+
+        Parameters
+        ----------
+        s, t : nodes
+            Source and sink of the flow.
+
+        kwargs : any other keyword parameter is passed to the maximum flow
+            function, for instance `cutoff`.
+
+        """
+        return self._run(s, t, True, kwargs)
+
+    def max_flow(self, s, t, **kwargs):
+        """Returns the value of a maximum flow from `s` to `t` and a
+        dictionary with all flows, as :meth:`maximum_flow` does.
+        """
+        flow_value = self._run(s, t, False, kwargs)
+        return flow_value, build_flow_dict(self._G, self)
+
+    def min_cut_value(self, s, t, **kwargs):
+        """Returns the value of a minimum `s`-`t` cut."""
+        return self._run(s, t, True, kwargs)
+
+    def min_cut(self, s, t, reachable=False, **kwargs):
+        """Returns the value of a minimum `s`-`t` cut and the partition of
+        the nodes that defines it, as :meth:`minimum_cut` does.
+
+        The sink side of the partition is the set of nodes that can reach
+        `t` in the residual network, the smallest sink side of a minimum
+        cut. If `reachable` is True, the source side is instead the set of
+        nodes reachable from `s`, the smallest source side of a minimum cut.
+        """
+        if kwargs.get("cutoff") is not None:
+            raise nx.NetworkXError("cutoff should not be specified.")
+        if reachable:
+            # preflow_push only finds a preflow if value_only is True, and
+            # the nodes reachable from s then do not form a cut.
+            cut_value = self._run(s, t, False, kwargs)
+            reachable = _array_source_side(self, s)
+            return cut_value, (reachable, set(self.nodelist) - reachable)
+        cut_value = self._run(s, t, True, kwargs)
+        non_reachable = _array_sink_side(self, t)
+        return cut_value, (set(self.nodelist) - non_reachable, non_reachable)
+
+    def residual_graph(self):
+        """Returns the residual network as a DiGraph with the conventions of
+        :func:`build_residual_network`, including the current flows.
+        """
+        R = nx.DiGraph()
+        R.add_nodes_from(self.nodelist)
+        nodelist = self.nodelist
+        R.add_edges_from(
+            (nodelist[u], nodelist[v], {"capacity": c, "flow": f})
+            for u, v, c, f in zip(
+                self.tail.tolist(),
+                self.head.tolist(),
+                self.capacity.tolist(),
+                self.flow.tolist(),
+            )
+        )
+        R.graph.update(self.graph)
+        return R
+
+
+def _reusable_residual(G, capacity, flow_func):
+    """Returns a residual network of G to reuse across maximum flow
+    computations with flow_func: a :class:`FlowNetwork` if flow_func can run
+    on it, or else a residual DiGraph.
+    """
+    if flow_func in flow_funcs:
+        return FlowNetwork(G, capacity, flow_func)
+    return build_residual_network(G, capacity)
@@ -1,11 +1,14 @@
 """
 Gomory-Hu tree of undirected Graphs.
 """
+import os
+from collections import deque
+
 import networkx as nx
 from networkx.utils import not_implemented_for
 
 from .edmondskarp import edmonds_karp
-from .utils import build_residual_network
+from .flownetwork import FlowNetwork, _reusable_residual
 
 default_flow_func = edmonds_karp
 
@@ -13,7 +16,7 @@ __all__ = ["gomory_hu_tree"]
 
 
 @not_implemented_for("directed")
-def gomory_hu_tree(G, capacity="capacity", flow_func=None):
+def gomory_hu_tree(G, capacity="capacity", flow_func=None, processes=None):
     r"""Returns the Gomory-Hu tree of an undirected graph G.
 
     A Gomory-Hu tree of an undirected graph with capacities is a
@@ -52,6 +55,13 @@ def gomory_hu_tree(G, capacity="capacity", flow_func=None):
         :func:`shortest_augmenting_path` will perform better in denser
         graphs.
 
+    processes : int, optional (default=None)
+        Number of worker processes computing the minimum cuts. If None, the
+        cuts are computed in this process. Otherwise the minimum cuts of
+        upcoming nodes are computed ahead in a pool of `processes` workers
+        (all available CPUs if 0), and G and `flow_func` must be
+        picklable.
+
     Returns
     -------
     Tree : NetworkX graph
@@ -118,6 +128,18 @@ def gomory_hu_tree(G, capacity="capacity", flow_func=None):
     Comory-Hu trees, which does not require node contractions and has
     the same computational complexity than the original method.
 
+    Gusfield's method processes the nodes one by one, and the minimum cut
+    computed for a node is between that node and its neighbor in the tree
+    built so far. With `processes`, the cuts of the next nodes are computed
+    in parallel with their current tree neighbors. A cut is used only if
+    the neighbor has not changed by the time its node is processed, and
+    recomputed otherwise, so the tree does not depend on the number of
+    workers. The source sides of these cuts are the nodes reachable from
+    the source in the residual network, the smallest possible ones, which
+    keep most tree neighbors unchanged. If some nodes have several minimum
+    cuts, the tree can thus differ from the one computed without
+    `processes`, but it is also a Gomory-Hu tree of G.
+
     See also
     --------
     :func:`minimum_cut`
@@ -144,33 +166,116 @@ def gomory_hu_tree(G, capacity="capacity", flow_func=None):
     for n in iter_nodes:
         tree[n] = root
 
-    # Reuse residual network
-    R = build_residual_network(G, capacity)
-
-    # For all the leaves in the star graph tree (that is n-1 nodes).
-    for source in tree:
-        # Find neighbor in the tree
-        target = tree[source]
-        # compute minimum cut
-        cut_value, partition = nx.minimum_cut(
-            G, source, target, capacity=capacity, flow_func=flow_func, residual=R
-        )
-        labels[(source, target)] = cut_value
-        # Update the tree
-        # Source will always be in partition[0] and target in partition[1]
-        for node in partition[0]:
-            if node != source and node in tree and tree[node] == target:
-                tree[node] = source
-                labels[node, source] = labels.get((node, target), cut_value)
-        #
-        if target != root and tree[target] in partition[0]:
-            labels[source, tree[target]] = labels[target, tree[target]]
-            labels[target, source] = cut_value
-            tree[source] = tree[target]
-            tree[target] = source
+    if processes is None:
+        # Reuse residual network
+        R = _reusable_residual(G, capacity, flow_func)
+
+        # For all the leaves in the star graph tree (that is n-1 nodes).
+        for source in tree:
+            # Find neighbor in the tree
+            target = tree[source]
+            # compute minimum cut
+            if isinstance(R, FlowNetwork):
+                cut_value, partition = R.min_cut(source, target)
+            else:
+                cut_value, partition = nx.minimum_cut(
+                    G,
+                    source,
+                    target,
+                    capacity=capacity,
+                    flow_func=flow_func,
+                    residual=R,
+                )
+            _update_tree(tree, labels, root, source, target, cut_value, partition[0])
+    else:
+        _parallel_cuts(G, capacity, flow_func, processes, tree, labels, root)
 
     # Build the tree
     T = nx.Graph()
     T.add_nodes_from(G)
     T.add_weighted_edges_from(((u, v, labels[u, v]) for u, v in tree.items()))
     return T
+
+
+def _update_tree(tree, labels, root, source, target, cut_value, source_side):
+    """Update the Gomory-Hu tree with the minimum cut between source and its
+    tree neighbor target.
+    """
+    labels[(source, target)] = cut_value
+    # Update the tree
+    # Source will always be in source_side and target will not
+    for node in source_side:
+        if node != source and node in tree and tree[node] == target:
+            tree[node] = source
+            labels[node, source] = labels.get((node, target), cut_value)
+    #
+    if target != root and tree[target] in source_side:
+        labels[source, tree[target]] = labels[target, tree[target]]
+        labels[target, source] = cut_value
+        tree[source] = tree[target]
+        tree[target] = source
+
+
+# Graph, capacity, flow function and residual network of a worker process.
+_worker_state = None
+
+
+def _init_worker(G, capacity, flow_func):
+    global _worker_state
+    _worker_state = (G, capacity, flow_func, _reusable_residual(G, capacity, flow_func))
+
+
+def _worker_cut(source, target):
+    """Returns the value of a minimum cut between source and target in the
+    graph of the worker process, and the nodes reachable from source in the
+    residual network.
+
+    This is the smallest source side of a minimum cut, which changes fewer
+    tree neighbors than the cuts of :func:`minimum_cut`.
+    """
+    G, capacity, flow_func, R = _worker_state
+    if isinstance(R, FlowNetwork):
+        cut_value, partition = R.min_cut(source, target, reachable=True)
+        return cut_value, partition[0]
+    # The reachable nodes only form a cut for a flow, not for the preflow
+    # preflow_push finds with value_only=True.
+    R = flow_func(G, source, target, capacity=capacity, residual=R, value_only=False)
+    succ = R.succ
+    seen = {source}
+    q = deque(seen)
+    while q:
+        for v, attr in succ[q.popleft()].items():
+            if attr["flow"] < attr["capacity"] and v not in seen:
+                seen.add(v)
+                q.append(v)
+    return R.graph["flow_value"], seen
+
+
+def _parallel_cuts(G, capacity, flow_func, processes, tree, labels, root):
+    """Run Gusfield's method with the minimum cuts computed ahead by a pool
+    of worker processes.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if not processes:
+        processes = os.cpu_count() or 1
+    window = 4 * processes  # number of nodes whose cuts are computed ahead
+    sources = list(tree)
+    pending = {}  # (source, target) -> future of a submitted cut
+    # A worker that dies makes the executor raise BrokenProcessPool instead
+    # of waiting forever for its results.
+    with ProcessPoolExecutor(
+        processes, initializer=_init_worker, initargs=(G, capacity, flow_func)
+    ) as pool:
+        for i, source in enumerate(sources):
+            # Submit the cuts of the next nodes with their current neighbors.
+            # The cuts of nodes whose neighbor changes in the meantime are
+            # dropped.
+            for s in sources[i : i + window]:
+                if (s, tree[s]) not in pending:
+                    pending[s, tree[s]] = pool.submit(_worker_cut, s, tree[s])
+            target = tree[source]
+            cut_value, source_side = pending[source, target].result()
+            for t in [t for s, t in pending if s == source]:
+                pending.pop((source, t)).cancel()
+            _update_tree(tree, labels, root, source, target, cut_value, source_side)
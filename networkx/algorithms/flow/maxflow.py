@@ -9,6 +9,7 @@ from .edmondskarp import edmonds_karp
 from .preflowpush import preflow_push
 from .shortestaugmentingpath import shortest_augmenting_path
 from .utils import build_flow_dict
+from .utils import ArrayResidualNetwork, _array_sink_side
 
 # Define the default flow function for computing maximum flow.
 default_flow_func = preflow_push
@@ -456,6 +457,13 @@ def minimum_cut(flowG, _s, _t, capacity="capacity", flow_func=None, **kwargs):
         raise nx.NetworkXError("cutoff should not be specified.")
 
     R = flow_func(flowG, _s, _t, capacity=capacity, value_only=True, **kwargs)
+    if isinstance(R, ArrayResidualNetwork):
+        # The nodes that can reach t through unsaturated arcs form the sink
+        # side of the minimum cut.
+        non_reachable = _array_sink_side(R, _t)
+        partition = (set(flowG) - non_reachable, non_reachable)
+        return (R.graph["flow_value"], partition)
+
     # Remove saturated edges from the residual network
     cutset = [(u, v, d) for u, v, d in R.edges(data=True) if d["flow"] == d["capacity"]]
     R.remove_edges_from(cutset)
@@ -7,7 +7,22 @@ __all__ = ["min_cost_flow_cost", "min_cost_flow", "cost_of_flow", "max_flow_min_
 import networkx as nx
 
 
-def min_cost_flow_cost(G, demand="demand", capacity="capacity", weight="weight"):
+def _min_cost_flow(G, demand, capacity, weight, method, kwargs):
+    """Returns the flow cost and flow dict found by the method."""
+    if method not in ("network_simplex", "array_network_simplex", "capacity_scaling"):
+        raise ValueError(f"method not supported: {method}")
+    func = getattr(nx, method)
+    return func(G, demand=demand, capacity=capacity, weight=weight, **kwargs)
+
+
+def min_cost_flow_cost(
+    G,
+    demand="demand",
+    capacity="capacity",
+    weight="weight",
+    method="network_simplex",
+    **kwargs,
+):
     r"""Find the cost of a minimum cost flow satisfying all demands in digraph G.
 
     G is a digraph with edge costs and capacities and in which nodes
@@ -43,6 +58,15 @@ def min_cost_flow_cost(G, demand="demand", capacity="capacity", weight="weight")
         that edge. If not present, the weight is considered to be 0.
         Default value: 'weight'.
 
+    method : string, optional (default='network_simplex')
+        The algorithm used to find the flow. Supported options:
+        'network_simplex', 'array_network_simplex' and 'capacity_scaling'.
+        Other inputs produce a ValueError.
+
+    kwargs : Any other keyword parameter is passed to the function that
+        implements the method, e.g. ``tree`` for 'array_network_simplex'
+        or ``heap`` for 'capacity_scaling'.
+
     Returns
     -------
     flowCost : integer, float
@@ -66,9 +90,13 @@ def min_cost_flow_cost(G, demand="demand", capacity="capacity", weight="weight")
         negative cost and infinite capacity. Then, the cost of a flow
         satisfying all demands is unbounded below.
 
+    ValueError
+        If `method` is not among the supported options.
+
     See also
     --------
-    cost_of_flow, max_flow_min_cost, min_cost_flow, network_simplex
+    cost_of_flow, max_flow_min_cost, min_cost_flow, network_simplex,
+    array_network_simplex, capacity_scaling
 
     Notes
     -----
@@ -92,11 +120,28 @@ def min_cost_flow_cost(G, demand="demand", capacity="capacity", weight="weight")
     >>> flowCost = nx.min_cost_flow_cost(G)
     >>> flowCost
     24
+
+    Problems solved repeatedly with slightly changed costs can be warm
+    started with the array-based network simplex method.
+
+    >>> tree = nx.NetworkSimplexTree()
+    >>> nx.min_cost_flow_cost(G, method="array_network_simplex", tree=tree)
+    24
+    >>> G["a"]["c"]["weight"] = 1
+    >>> nx.min_cost_flow_cost(G, method="array_network_simplex", tree=tree)
+    15
     """
-    return nx.network_simplex(G, demand=demand, capacity=capacity, weight=weight)[0]
+    return _min_cost_flow(G, demand, capacity, weight, method, kwargs)[0]
 
 
-def min_cost_flow(G, demand="demand", capacity="capacity", weight="weight"):
+def min_cost_flow(
+    G,
+    demand="demand",
+    capacity="capacity",
+    weight="weight",
+    method="network_simplex",
+    **kwargs,
+):
     r"""Returns a minimum cost flow satisfying all demands in digraph G.
 
     G is a digraph with edge costs and capacities and in which nodes
@@ -132,6 +177,15 @@ def min_cost_flow(G, demand="demand", capacity="capacity", weight="weight"):
         that edge. If not present, the weight is considered to be 0.
         Default value: 'weight'.
 
+    method : string, optional (default='network_simplex')
+        The algorithm used to find the flow. Supported options:
+        'network_simplex', 'array_network_simplex' and 'capacity_scaling'.
+        Other inputs produce a ValueError.
+
+    kwargs : Any other keyword parameter is passed to the function that
+        implements the method, e.g. ``tree`` for 'array_network_simplex'
+        or ``heap`` for 'capacity_scaling'.
+
     Returns
     -------
     flowDict : dictionary
@@ -156,9 +210,13 @@ def min_cost_flow(G, demand="demand", capacity="capacity", weight="weight"):
         negative cost and infinite capacity. Then, the cost of a flow
         satisfying all demands is unbounded below.
 
+    ValueError
+        If `method` is not among the supported options.
+
     See also
     --------
-    cost_of_flow, max_flow_min_cost, min_cost_flow_cost, network_simplex
+    cost_of_flow, max_flow_min_cost, min_cost_flow_cost, network_simplex,
+    array_network_simplex, capacity_scaling
 
     Notes
     -----
@@ -180,8 +238,9 @@ def min_cost_flow(G, demand="demand", capacity="capacity", weight="weight"):
     >>> G.add_edge("b", "d", weight=1, capacity=9)
     >>> G.add_edge("c", "d", weight=2, capacity=5)
     >>> flowDict = nx.min_cost_flow(G)
+    >>> flowDict = nx.min_cost_flow(G, method="capacity_scaling")
     """
-    return nx.network_simplex(G, demand=demand, capacity=capacity, weight=weight)[1]
+    return _min_cost_flow(G, demand, capacity, weight, method, kwargs)[1]
 
 
 def cost_of_flow(G, flowDict, weight="weight"):
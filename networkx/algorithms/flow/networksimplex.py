@@ -2,7 +2,7 @@
 Minimum cost flow algorithms on directed connected graphs.
 """
 
-__all__ = ["network_simplex"]
+__all__ = ["network_simplex", "array_network_simplex", "NetworkSimplexTree"]
 
 from itertools import chain, islice, repeat
 from math import ceil, sqrt
@@ -173,75 +173,8 @@ def network_simplex(G, demand="demand", capacity="capacity", weight="weight"):
            optimization.
            INFOR 17(1):16--34. 1979.
     """
-    ###########################################################################
-    # Problem essentials extraction and sanity check
-    ###########################################################################
-
-    if len(G) == 0:
-        raise nx.NetworkXError("graph has no nodes")
-
-    # Number all nodes and edges and hereafter reference them using ONLY their
-    # numbers
-
-    N = list(G)  # nodes
-    I = {u: i for i, u in enumerate(N)}  # node indices
-    D = [G.nodes[u].get(demand, 0) for u in N]  # node demands
-
+    N, D, S, T, K, E, U, C = _simplex_problem(G, demand, capacity, weight)
     inf = float("inf")
-    for p, b in zip(N, D):
-        if abs(b) == inf:
-            raise nx.NetworkXError(f"node {p!r} has infinite demand")
-
-    multigraph = G.is_multigraph()
-    S = []  # edge sources
-    T = []  # edge targets
-    if multigraph:
-        K = []  # edge keys
-    E = {}  # edge indices
-    U = []  # edge capacities
-    C = []  # edge weights
-
-    if not multigraph:
-        edges = G.edges(data=True)
-    else:
-        edges = G.edges(data=True, keys=True)
-    edges = (e for e in edges if e[0] != e[1] and e[-1].get(capacity, inf) != 0)
-    for i, e in enumerate(edges):
-        S.append(I[e[0]])
-        T.append(I[e[1]])
-        if multigraph:
-            K.append(e[2])
-        E[e[:-1]] = i
-        U.append(e[-1].get(capacity, inf))
-        C.append(e[-1].get(weight, 0))
-
-    for e, c in zip(E, C):
-        if abs(c) == inf:
-            raise nx.NetworkXError(f"edge {e!r} has infinite weight")
-    if not multigraph:
-        edges = nx.selfloop_edges(G, data=True)
-    else:
-        edges = nx.selfloop_edges(G, data=True, keys=True)
-    for e in edges:
-        if abs(e[-1].get(weight, 0)) == inf:
-            raise nx.NetworkXError(f"edge {e[:-1]!r} has infinite weight")
-
-    ###########################################################################
-    # Quick infeasibility detection
-    ###########################################################################
-
-    if sum(D) != 0:
-        raise nx.NetworkXUnfeasible("total node demand is not zero")
-    for e, u in zip(E, U):
-        if u < 0:
-            raise nx.NetworkXUnfeasible(f"edge {e!r} has negative capacity")
-    if not multigraph:
-        edges = nx.selfloop_edges(G, data=True)
-    else:
-        edges = nx.selfloop_edges(G, data=True, keys=True)
-    for e in edges:
-        if e[-1].get(capacity, inf) < 0:
-            raise nx.NetworkXUnfeasible(f"edge {e[:-1]!r} has negative capacity")
 
     ###########################################################################
     # Initialization
@@ -549,6 +482,625 @@ def network_simplex(G, demand="demand", capacity="capacity", weight="weight"):
     ###########################################################################
 
     del x[e:]
+    return _simplex_flow_dict(G, N, S, T, K, C, x, capacity, weight)
+
+
+class NetworkSimplexTree:
+    """Spanning tree structure of the network simplex method, kept between
+    calls of :func:`array_network_simplex`.
+
+    Pass an instance as the ``tree`` parameter of
+    :func:`array_network_simplex`. The function stores in it the optimal
+    spanning tree and flows it finds, and starts from them when it is
+    called again with the same instance, instead of from the initial tree of
+    artificial edges.
+
+    A stored tree can be reused only for a graph with the same nodes and the
+    same edges, in the same order; the demands, capacities and weights can
+    differ. When they differ only slightly, few pivots are needed to reach
+    an optimal tree again.
+
+    See also
+    --------
+    array_network_simplex
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Forget the stored spanning tree."""
+        self._nodes = None
+        self._keys = None
+        self._state = None
+
+    def __bool__(self):
+        return self._state is not None
+
+
+@not_implemented_for("undirected")
+def array_network_simplex(
+    G, demand="demand", capacity="capacity", weight="weight", tree=None
+):
+    r"""Find a minimum cost flow satisfying all demands in digraph G.
+
+    This is the primal network simplex algorithm of :func:`network_simplex`
+    with the flows, costs and node potentials stored in NumPy arrays. The
+    reduced costs of the edges are computed for whole blocks of edges at a
+    time, and the flow and potential updates of a pivot are vectorized, which
+    makes it much faster on large networks. The spanning tree can be kept
+    between calls to warm start problems that differ only slightly.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        DiGraph on which a minimum cost flow satisfying all demands is
+        to be found.
+
+    demand : string
+        Nodes of the graph G are expected to have an attribute demand
+        that indicates how much flow a node wants to send (negative
+        demand) or receive (positive demand). Note that the sum of the
+        demands should be 0 otherwise the problem in not feasible. If
+        this attribute is not present, a node is considered to have 0
+        demand. Default value: 'demand'.
+
+    capacity : string
+        Edges of the graph G are expected to have an attribute capacity
+        that indicates how much flow the edge can support. If this
+        attribute is not present, the edge is considered to have
+        infinite capacity. Default value: 'capacity'.
+
+    weight : string
+        Edges of the graph G are expected to have an attribute weight
+        that indicates the cost incurred by sending one unit of flow on
+        that edge. If not present, the weight is considered to be 0.
+        Default value: 'weight'.
+
+    tree : NetworkSimplexTree, optional (default=None)
+        If given, the optimal spanning tree found is stored in it. If it
+        already holds the tree of a previous call on a graph with the same
+        nodes and edges, the algorithm starts from that tree, with the flows
+        updated to the current demands and capacities. If those flows are
+        not feasible, it starts from scratch instead.
+
+    Returns
+    -------
+    flowCost : integer, float
+        Cost of a minimum cost flow satisfying all demands.
+
+    flowDict : dictionary
+        Dictionary of dictionaries keyed by nodes such that
+        flowDict[u][v] is the flow edge (u, v).
+
+    Raises
+    ------
+    NetworkXError
+        This exception is raised if the input graph is not directed,
+        not connected or is a multigraph.
+
+    NetworkXUnfeasible
+        This exception is raised in the following situations:
+
+            * The sum of the demands is not zero. Then, there is no
+              flow satisfying all demands.
+            * There is no flow satisfying all demand.
+
+    NetworkXUnbounded
+        This exception is raised if the digraph G has a cycle of
+        negative cost and infinite capacity. Then, the cost of a flow
+        satisfying all demands is unbounded below.
+
+    Notes
+    -----
+    When all demands, finite capacities and weights are integers the
+    computations are done with 64-bit integers, otherwise with 64-bit
+    floating point numbers. With floating point data, reduced costs and
+    flows within a small tolerance, relative to the largest cost and
+    capacity, of zero or of the edge capacity are rounded to them; scale
+    the data to integers for exact results.
+
+    See also
+    --------
+    network_simplex, NetworkSimplexTree, min_cost_flow
+
+    Examples
+    --------
+    >>> G = nx.DiGraph()
+    >>> G.add_node("a", demand=-5)
+    >>> G.add_node("d", demand=5)
+    >>> G.add_edge("a", "b", weight=3, capacity=4)
+    >>> G.add_edge("a", "c", weight=6, capacity=10)
+    >>> G.add_edge("b", "d", weight=1, capacity=9)
+    >>> G.add_edge("c", "d", weight=2, capacity=5)
+    >>> flowCost, flowDict = nx.array_network_simplex(G)
+    >>> flowCost
+    24
+    >>> flowDict
+    {'a': {'b': 4, 'c': 1}, 'd': {}, 'b': {'d': 4}, 'c': {'d': 1}}
+
+    Keep the spanning tree to solve the problem again after the costs
+    changed.
+
+    >>> tree = nx.NetworkSimplexTree()
+    >>> flowCost, flowDict = nx.array_network_simplex(G, tree=tree)
+    >>> G["a"]["c"]["weight"] = 1
+    >>> flowCost, flowDict = nx.array_network_simplex(G, tree=tree)
+    >>> flowCost
+    15
+    >>> flowDict
+    {'a': {'b': 0, 'c': 5}, 'd': {}, 'b': {'d': 0}, 'c': {'d': 5}}
+    """
+    import numpy as np
+
+    N, D, S, T, K, E, U, C = _simplex_problem(G, demand, capacity, weight)
+    inf = float("inf")
+    n = len(N)  # number of nodes
+    e = len(E)  # number of edges
+    keys = list(E)
+
+    faux_inf = (
+        3
+        * max(
+            chain(
+                [sum(u for u in U if u < inf), sum(abs(c) for c in C)],
+                (abs(d) for d in D),
+            )
+        )
+        or 1
+    )
+    # NumPy stores the data with an integer dtype only if it is all integral.
+    data = np.array(list(chain(D, C, (u for u in U if u < inf))))
+    integral = data.dtype.kind in "iu" and faux_inf < 2 ** 60
+    dtype = np.int64 if integral else np.float64
+    # With floating point data, the reduced costs of the tree edges and the
+    # flows at their bounds are only zero up to roundoff errors, which are
+    # relative to the largest costs, potentials and capacities, all bounded
+    # by faux_inf. Smaller values are taken as zero, or else the pivots can
+    # cycle forever.
+    tol = 0 if integral else faux_inf * 2 ** -40
+
+    # Infinite capacities are replaced by the capacity of the artificial edges,
+    # which only a flow that is detected as unbounded below can reach.
+    Uarr = np.array([u if u < inf else faux_inf for u in U] + [faux_inf] * n, dtype)
+    Carr = np.array(C + [faux_inf] * n, dtype)
+    Darr = np.array(D + [0], dtype)
+
+    state = None
+    if tree is not None and tree._nodes == N and tree._keys == keys:
+        state = _simplex_warm_start(tree._state, e, n, Darr, Uarr, Carr, tol)
+    if state is None:
+        # Initial strongly feasible spanning tree made of the artificial edges
+        # between the nodes and a dummy root node -1, as in network_simplex.
+        Sa = [-1 if d > 0 else p for p, d in enumerate(D)]
+        Ta = [p if d > 0 else -1 for p, d in enumerate(D)]
+        state = (
+            list(chain(repeat(-1, n), [None])),  # parent nodes
+            list(range(e, e + n)),  # edges to parents
+            list(chain(repeat(1, n), [n + 1])),  # subtree sizes
+            list(chain(range(1, n), [-1, 0])),  # next nodes in thread
+            list(range(-1, n)),  # previous nodes in thread
+            list(chain(range(n), [n - 1])),  # last descendants in thread
+            np.array(S + Sa, dtype=np.intp),  # edge sources
+            np.array(T + Ta, dtype=np.intp),  # edge targets
+            np.array([0] * e + [abs(d) for d in D], dtype),  # edge flows
+            np.array([faux_inf if d <= 0 else -faux_inf for d in D] + [0], dtype),
+        )
+    parent, edge, size, next, prev, last, Sarr, Tarr, x, pi = state
+
+    ###########################################################################
+    # Pivot loop
+    ###########################################################################
+
+    def find_entering_edges():
+        """Yield entering edges until none can be found."""
+        if e == 0:
+            return
+
+        # Dantzig's rule is applied to blocks of consecutive edges, whose
+        # reduced costs are computed at once.
+        B = min(e, max(int(ceil(sqrt(e))), 1024))  # pivot block size
+        M = (e + B - 1) // B  # number of blocks
+        m = 0  # number of consecutive blocks without eligible entering edges
+        f = 0  # first edge in block
+        while m < M:
+            l = min(f + B, e)
+            c = Carr[f:l] - pi[Sarr[f:l]] + pi[Tarr[f:l]]
+            np.negative(c, out=c, where=x[f:l] != 0)
+            k = int(c.argmin())
+            i = f + k
+            f = l if l < e else 0
+            if c[k] >= -tol:
+                # No entering edge found in the current block.
+                m += 1
+            else:
+                if x[i] == 0:
+                    yield i, int(Sarr[i]), int(Tarr[i])
+                else:
+                    yield i, int(Tarr[i]), int(Sarr[i])
+                m = 0
+
+    def find_apex(p, q):
+        """Find the lowest common ancestor of nodes p and q in the spanning
+        tree.
+        """
+        size_p = size[p]
+        size_q = size[q]
+        while True:
+            while size_p < size_q:
+                p = parent[p]
+                size_p = size[p]
+            while size_p > size_q:
+                q = parent[q]
+                size_q = size[q]
+            if size_p == size_q:
+                if p != q:
+                    p = parent[p]
+                    size_p = size[p]
+                    q = parent[q]
+                    size_q = size[q]
+                else:
+                    return p
+
+    def trace_path(p, w):
+        """Returns the nodes and edges on the path from node p to its ancestor
+        w.
+        """
+        Wn = [p]
+        We = []
+        while p != w:
+            We.append(edge[p])
+            p = parent[p]
+            Wn.append(p)
+        return Wn, We
+
+    def find_cycle(i, p, q):
+        """Returns the nodes and edges on the cycle containing edge i == (p, q)
+        when the latter is added to the spanning tree.
+
+        The cycle is oriented in the direction from p to q.
+        """
+        w = find_apex(p, q)
+        Wn, We = trace_path(p, w)
+        Wn.reverse()
+        We.reverse()
+        if We != [i]:
+            We.append(i)
+        WnR, WeR = trace_path(q, w)
+        del WnR[-1]
+        Wn += WnR
+        We += WeR
+        return Wn, We
+
+    def trace_subtree(p):
+        """Yield the nodes in the subtree rooted at a node p."""
+        yield p
+        l = last[p]
+        while p != l:
+            p = next[p]
+            yield p
+
+    def remove_edge(s, t):
+        """Remove an edge (s, t) where parent[t] == s from the spanning tree."""
+        size_t = size[t]
+        prev_t = prev[t]
+        last_t = last[t]
+        next_last_t = next[last_t]
+        # Remove (s, t).
+        parent[t] = None
+        edge[t] = None
+        # Remove the subtree rooted at t from the depth-first thread.
+        next[prev_t] = next_last_t
+        prev[next_last_t] = prev_t
+        next[last_t] = t
+        prev[t] = last_t
+        # Update the subtree sizes and last descendants of the (old) acenstors
+        # of t.
+        while s is not None:
+            size[s] -= size_t
+            if last[s] == last_t:
+                last[s] = prev_t
+            s = parent[s]
+
+    def make_root(q):
+        """Make a node q the root of its containing subtree."""
+        ancestors = []
+        while q is not None:
+            ancestors.append(q)
+            q = parent[q]
+        ancestors.reverse()
+        for p, q in zip(ancestors, islice(ancestors, 1, None)):
+            size_p = size[p]
+            last_p = last[p]
+            prev_q = prev[q]
+            last_q = last[q]
+            next_last_q = next[last_q]
+            # Make p a child of q.
+            parent[p] = q
+            parent[q] = None
+            edge[p] = edge[q]
+            edge[q] = None
+            size[p] = size_p - size[q]
+            size[q] = size_p
+            # Remove the subtree rooted at q from the depth-first thread.
+            next[prev_q] = next_last_q
+            prev[next_last_q] = prev_q
+            next[last_q] = q
+            prev[q] = last_q
+            if last_p == last_q:
+                last[p] = prev_q
+                last_p = prev_q
+            # Add the remaining parts of the subtree rooted at p as a subtree
+            # of q in the depth-first thread.
+            prev[p] = last_q
+            next[last_q] = p
+            next[last_p] = q
+            prev[q] = last_p
+            last[q] = last_p
+
+    def add_edge(i, p, q):
+        """Add an edge (p, q) to the spanning tree where q is the root of a
+        subtree.
+        """
+        last_p = last[p]
+        next_last_p = next[last_p]
+        size_q = size[q]
+        last_q = last[q]
+        # Make q a child of p.
+        parent[q] = p
+        edge[q] = i
+        # Insert the subtree rooted at q into the depth-first thread.
+        next[last_p] = q
+        prev[q] = last_p
+        prev[next_last_p] = last_q
+        next[last_q] = next_last_p
+        # Update the subtree sizes and last descendants of the (new) ancestors
+        # of q.
+        while p is not None:
+            size[p] += size_q
+            if last[p] == last_p:
+                last[p] = last_q
+            p = parent[p]
+
+    for i, p, q in find_entering_edges():
+        Wn, We = find_cycle(i, p, q)
+        # Find the leaving edge: the last edge of the cycle with the lowest
+        # residual capacity in the direction of the cycle.
+        Wa = np.array(We)
+        forward = Sarr[Wa] == Wn[: len(We)]
+        xW = x[Wa]
+        residual = np.where(forward, Uarr[Wa] - xW, xW)
+        k = len(We) - 1 - int(residual[::-1].argmin())
+        j = We[k]
+        s = Wn[k]
+        t = int(Tarr[j] if Sarr[j] == s else Sarr[j])
+        delta = residual[k]
+        if delta:
+            xW = np.where(forward, xW + delta, xW - delta)
+            if tol:
+                xW[np.abs(xW) <= tol] = 0
+                UW = Uarr[Wa]
+                np.copyto(xW, UW, where=np.abs(UW - xW) <= tol)
+            x[Wa] = xW
+        # Do nothing more if the entering edge is the same as the leaving edge.
+        if i != j:
+            if parent[t] != s:
+                # Ensure that s is the parent of t.
+                s, t = t, s
+            if We.index(i) > k:
+                # Ensure that q is in the subtree rooted at t.
+                p, q = q, p
+            remove_edge(s, t)
+            make_root(q)
+            add_edge(i, p, q)
+            # Update the potentials of the nodes in the subtree rooted at q.
+            if q == Tarr[i]:
+                d = pi[p] - Carr[i] - pi[q]
+            else:
+                d = pi[p] + Carr[i] - pi[q]
+            pi[list(trace_subtree(q))] += d
+
+    ###########################################################################
+    # Infeasibility and unboundedness detection
+    ###########################################################################
+
+    if (np.abs(x[e:]) > tol).any():
+        raise nx.NetworkXUnfeasible("no flow satisfies all node demands")
+
+    if (x[:e] * 2 >= faux_inf).any() or any(
+        e[-1].get(capacity, inf) == inf and e[-1].get(weight, 0) < 0
+        for e in nx.selfloop_edges(G, data=True)
+    ):
+        raise nx.NetworkXUnbounded("negative cycle with infinite capacity found")
+
+    if tree is not None:
+        tree._nodes = N
+        tree._keys = keys
+        tree._state = state
+
+    ###########################################################################
+    # Flow cost calculation and flow dict construction
+    ###########################################################################
+
+    return _simplex_flow_dict(G, N, S, T, K, C, x[:e].tolist(), capacity, weight)
+
+
+def _simplex_warm_start(state, e, n, D, U, C, tol):
+    """Returns a copy of the spanning tree structure state of a previous
+    network simplex run, with the flows and potentials computed for the
+    demands D, capacities U and costs C, or None if the tree is not strongly
+    feasible for them. Flows within tol of zero or of the capacity are
+    rounded to them.
+    """
+    import numpy as np
+
+    parent, edge, size, next, prev, last, S, T, x, pi = state
+    S = S.copy()
+    T = T.copy()
+    x_old = x
+    in_tree = np.zeros(e + n, dtype=bool)
+    in_tree[edge[:n]] = True
+
+    # Edges out of the tree stay at their lower or upper bound.
+    x = np.zeros(e + n, dtype=U.dtype)
+    upper = ~in_tree & (x_old > 0)
+    upper[e:] = False
+    x[upper] = U[upper]
+
+    # The tree edge of each node carries the demand of its subtree left
+    # unsatisfied by the edges out of the tree. Nodes are visited in reverse
+    # depth-first order, so that descendants come before their ancestors.
+    excess = D.copy()
+    excess[:n] -= np.bincount(T[upper], x[upper], n + 1)[:n].astype(D.dtype)
+    excess[:n] += np.bincount(S[upper], x[upper], n + 1)[:n].astype(D.dtype)
+    order = []
+    p = next[-1]
+    while p != -1:
+        order.append(p)
+        p = next[p]
+    excess = excess.tolist()
+    flows = []
+    for p in reversed(order):
+        q = parent[p]
+        excess[q] += excess[p]
+        flows.append(excess[p])
+    tree_edges = np.array([edge[p] for p in reversed(order)], dtype=np.intp)
+    demand = np.array(flows, dtype=U.dtype)
+    nodes = np.array(order[::-1], dtype=np.intp)
+    x[tree_edges] = np.where(T[tree_edges] == nodes, demand, -demand)
+
+    # Artificial edges can be turned around: they carry flow away from the
+    # root when needed, and point to the root when they carry no flow.
+    artificial = tree_edges >= e
+    flip = artificial & (
+        (x[tree_edges] < 0) | ((x[tree_edges] == 0) & (S[tree_edges] != nodes))
+    )
+    fe = tree_edges[flip]
+    S[fe], T[fe] = T[fe], S[fe]
+    x[fe] = -x[fe]
+
+    if tol:
+        x[np.abs(x) <= tol] = 0
+        np.copyto(x, U, where=np.abs(U - x) <= tol)
+    if (x < 0).any() or (x > U).any():
+        return None
+    # In a strongly feasible tree, a positive amount of flow can be sent from
+    # any node to the root.
+    up = S[tree_edges] == nodes
+    xt = x[tree_edges]
+    if (up & (xt == U[tree_edges])).any() or (~up & (xt == 0)).any():
+        return None
+
+    # Potentials that give zero reduced costs to the tree edges.
+    pi = np.zeros(n + 1, dtype=U.dtype)
+    pil = [0] * (n + 1)
+    Sl = S.tolist()
+    Cl = C.tolist()
+    for p in order:
+        i = edge[p]
+        q = parent[p]
+        pil[p] = pil[q] - Cl[i] if Sl[i] == q else pil[q] + Cl[i]
+    pi[:] = pil
+
+    return (
+        list(parent),
+        list(edge),
+        list(size),
+        list(next),
+        list(prev),
+        list(last),
+        S,
+        T,
+        x,
+        pi,
+    )
+
+
+def _simplex_problem(G, demand, capacity, weight):
+    """Number the nodes and edges of G for the network simplex methods.
+
+    Returns the list of nodes N and their demands D, the sources S, targets
+    T, keys K (None if G is not a multigraph), capacities U and weights C of
+    the edges, and the dict E mapping the edges to their numbers. Self-loops
+    and edges with zero capacity are left out.
+    """
+    ###########################################################################
+    # Problem essentials extraction and sanity check
+    ###########################################################################
+
+    if len(G) == 0:
+        raise nx.NetworkXError("graph has no nodes")
+
+    # Number all nodes and edges and hereafter reference them using ONLY their
+    # numbers
+
+    N = list(G)  # nodes
+    I = {u: i for i, u in enumerate(N)}  # node indices
+    D = [G.nodes[u].get(demand, 0) for u in N]  # node demands
+
+    inf = float("inf")
+    for p, b in zip(N, D):
+        if abs(b) == inf:
+            raise nx.NetworkXError(f"node {p!r} has infinite demand")
+
+    multigraph = G.is_multigraph()
+    S = []  # edge sources
+    T = []  # edge targets
+    K = [] if multigraph else None  # edge keys
+    E = {}  # edge indices
+    U = []  # edge capacities
+    C = []  # edge weights
+
+    if not multigraph:
+        edges = G.edges(data=True)
+    else:
+        edges = G.edges(data=True, keys=True)
+    edges = (e for e in edges if e[0] != e[1] and e[-1].get(capacity, inf) != 0)
+    for i, e in enumerate(edges):
+        S.append(I[e[0]])
+        T.append(I[e[1]])
+        if multigraph:
+            K.append(e[2])
+        E[e[:-1]] = i
+        U.append(e[-1].get(capacity, inf))
+        C.append(e[-1].get(weight, 0))
+
+    for e, c in zip(E, C):
+        if abs(c) == inf:
+            raise nx.NetworkXError(f"edge {e!r} has infinite weight")
+    if not multigraph:
+        edges = nx.selfloop_edges(G, data=True)
+    else:
+        edges = nx.selfloop_edges(G, data=True, keys=True)
+    for e in edges:
+        if abs(e[-1].get(weight, 0)) == inf:
+            raise nx.NetworkXError(f"edge {e[:-1]!r} has infinite weight")
+
+    ###########################################################################
+    # Quick infeasibility detection
+    ###########################################################################
+
+    if sum(D) != 0:
+        raise nx.NetworkXUnfeasible("total node demand is not zero")
+    for e, u in zip(E, U):
+        if u < 0:
+            raise nx.NetworkXUnfeasible(f"edge {e!r} has negative capacity")
+    if not multigraph:
+        edges = nx.selfloop_edges(G, data=True)
+    else:
+        edges = nx.selfloop_edges(G, data=True, keys=True)
+    for e in edges:
+        if e[-1].get(capacity, inf) < 0:
+            raise nx.NetworkXUnfeasible(f"edge {e[:-1]!r} has negative capacity")
+
+    return N, D, S, T, K, E, U, C
+
+
+def _simplex_flow_dict(G, N, S, T, K, C, x, capacity, weight):
+    """Returns the cost of the flow x on the numbered edges and the flow
+    dict with the flows on all the edges of G.
+    """
+    inf = float("inf")
     flow_cost = sum(c * x for c, x in zip(C, x))
     flow_dict = {n: {} for n in N}
 
@@ -566,7 +1118,7 @@ def network_simplex(G, demand="demand", capacity="capacity", weight="weight"):
 
     S = (N[s] for s in S)  # Use original nodes.
     T = (N[t] for t in T)  # Use original nodes.
-    if not multigraph:
+    if K is None:
         for e in zip(S, T, x):
             add_entry(e)
         edges = G.edges(data=True)
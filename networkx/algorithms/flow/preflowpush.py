@@ -6,11 +6,13 @@ from collections import deque
 from itertools import islice
 import networkx as nx
 from ...utils import arbitrary_element
+from .utils import ArrayResidualNetwork
 from .utils import build_residual_network
 from .utils import CurrentEdge
 from .utils import detect_unboundedness
 from .utils import GlobalRelabelThreshold
 from .utils import Level
+from .utils import _array_reverse_bfs
 
 __all__ = ["preflow_push"]
 
@@ -29,6 +31,9 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq, value_on
     if global_relabel_freq < 0:
         raise nx.NetworkXError("global_relabel_freq must be nonnegative.")
 
+    if isinstance(residual, ArrayResidualNetwork):
+        return preflow_push_array(residual, s, t, global_relabel_freq, value_only)
+
     if residual is None:
         R = build_residual_network(G, capacity)
     else:
@@ -284,6 +289,152 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq, value_on
     return R
 
 
+def preflow_push_array(R, s, t, global_relabel_freq, value_only):
+    """Implementation of the highest-label preflow-push algorithm on an
+    :class:`ArrayResidualNetwork`.
+    """
+    detect_unboundedness(R, s, t)
+
+    head, adj = R._arc_lists()
+    n = len(adj)
+    s = R.index[s]
+    t = R.index[t]
+
+    # Initialize/reset the residual network.
+    R.reset_flow()
+    res = R.capacity.tolist()
+    excess = [0] * n
+
+    # Initialize heights of the nodes.
+    heights = _array_reverse_bfs(head, adj, res, t)
+    if heights[s] < 0:
+        # t is not reachable from s in the residual network. The maximum flow
+        # must be zero.
+        R.graph["flow_value"] = 0
+        return R
+    heights = [n + 1 if h < 0 else h for h in heights]
+    heights[s] = n
+
+    threshold = (n + len(head)) / global_relabel_freq if global_relabel_freq else None
+
+    # The maximum flow must be nonzero now. Initialize the preflow by
+    # saturating all arcs emanating from s.
+    for e in adj[s]:
+        flow = res[e]
+        if flow > 0:
+            res[e] = 0
+            res[e ^ 1] += flow
+            excess[head[e]] += flow
+            excess[s] -= flow
+
+    def discharge_all(is_phase1):
+        """Discharge the active nodes in highest-label order. During phase 1,
+        nodes whose height reaches at least n are known to be on the s side
+        of the minimum s-t cut and are left with their excess for phase 2.
+        """
+        limit = n if is_phase1 else 2 * n
+        src = t if is_phase1 else s
+
+        def global_relabel():
+            """Recompute the exact heights of all nodes and the buckets of
+            active nodes.
+            """
+            new_heights = _array_reverse_bfs(head, adj, res, src)
+            for u in range(n):
+                if new_heights[u] >= 0:
+                    heights[u] = new_heights[u]
+                elif heights[u] < limit:
+                    heights[u] = limit + 1
+            if is_phase1:
+                heights[s] = n
+            counts = [0] * (limit + 1)
+            buckets = [[] for i in range(limit)]
+            for u in range(n):
+                h = heights[u]
+                if h < limit:
+                    counts[h] += 1
+                    if excess[u] > 0 and u != s and u != t:
+                        buckets[h].append(u)
+            return counts, buckets
+
+        counts, buckets = global_relabel()
+        curr = [0] * n
+        work = 0
+        height = limit - 1
+        while height >= 0:
+            bucket = buckets[height]
+            if not bucket:
+                height -= 1
+                continue
+            u = bucket.pop()
+            if heights[u] != height or excess[u] == 0:
+                # Stale entry left behind by the gap heuristic.
+                continue
+            arcs = adj[u]
+            i = curr[u]
+            ex = excess[u]
+            while True:
+                if i == len(arcs):
+                    # There can be no more admissible arcs. Relabel the node
+                    # to create one.
+                    work += len(arcs)
+                    old_height = height
+                    height = min(heights[head[e]] for e in arcs if res[e] > 0) + 1
+                    counts[old_height] -= 1
+                    if is_phase1 and counts[old_height] == 0:
+                        # Gap heuristic: t is unreachable from the nodes above
+                        # the empty level.
+                        for v in range(n):
+                            if old_height < heights[v] < n:
+                                counts[heights[v]] -= 1
+                                heights[v] = n + 1
+                        height = n + 1
+                    heights[u] = height
+                    i = 0
+                    if height >= limit:
+                        break
+                    counts[height] += 1
+                e = arcs[i]
+                if res[e] > 0:
+                    v = head[e]
+                    if heights[v] == height - 1:
+                        flow = ex if ex < res[e] else res[e]
+                        res[e] -= flow
+                        res[e ^ 1] += flow
+                        if excess[v] == 0 and v != s and v != t:
+                            buckets[height - 1].append(v)
+                        excess[v] += flow
+                        ex -= flow
+                        if ex == 0:
+                            break
+                        continue
+                i += 1
+            excess[u] = ex
+            curr[u] = i
+            if threshold is not None and work >= threshold:
+                # Global relabeling heuristic.
+                counts, buckets = global_relabel()
+                curr = [0] * n
+                work = 0
+                height = limit - 1
+            elif height >= limit:
+                height = old_height
+
+    # Phase 1: Find the maximum preflow by pushing as much flow as possible to
+    # t.
+    discharge_all(True)
+    flow_value = excess[t]
+
+    if not value_only:
+        # Phase 2: Convert the maximum preflow into a maximum flow by returning
+        # the excess to s.
+        discharge_all(False)
+
+    R._set_residual(res)
+    R.graph["flow_value"] = flow_value
+    return R
+
+
 def preflow_push(
     G, s, t, capacity="capacity", residual=None, global_relabel_freq=1, value_only=False
 ):
@@ -317,9 +468,11 @@ def preflow_push(
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ArrayResidualNetwork
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If an :class:`ArrayResidualNetwork`
+        is given, the algorithm runs on its arrays and returns it.
+        Default value: None.
 
     global_relabel_freq : integer, float
         Relative frequency of applying the global relabeling heuristic to speed
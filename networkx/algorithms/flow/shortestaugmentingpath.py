@@ -5,7 +5,8 @@ Shortest augmenting path algorithm for maximum flow problems.
 from collections import deque
 import networkx as nx
 from .utils import build_residual_network, CurrentEdge
-from .edmondskarp import edmonds_karp_core
+from .utils import ArrayResidualNetwork, _array_reverse_bfs
+from .edmondskarp import edmonds_karp_core, edmonds_karp_array_core
 
 __all__ = ["shortest_augmenting_path"]
 
@@ -19,6 +20,9 @@ def shortest_augmenting_path_impl(G, s, t, capacity, residual, two_phase, cutoff
     if s == t:
         raise nx.NetworkXError("source and sink are the same node")
 
+    if isinstance(residual, ArrayResidualNetwork):
+        return shortest_augmenting_path_array(residual, s, t, two_phase, cutoff)
+
     if residual is None:
         R = build_residual_network(G, capacity)
     else:
@@ -161,6 +165,120 @@ def shortest_augmenting_path_impl(G, s, t, capacity, residual, two_phase, cutoff
     return R
 
 
+def shortest_augmenting_path_array(R, s, t, two_phase, cutoff):
+    """Implementation of the shortest augmenting path algorithm on an
+    :class:`ArrayResidualNetwork`.
+    """
+    head, adj = R._arc_lists()
+    inf = R.graph["inf"]
+    n = len(adj)
+    s = R.index[s]
+    t = R.index[t]
+
+    # Initialize/reset the residual network.
+    R.reset_flow()
+    res = R.capacity.tolist()
+
+    # Initialize heights of the nodes.
+    heights = [n if h < 0 else h for h in _array_reverse_bfs(head, adj, res, t)]
+    if heights[s] == n:
+        # t is not reachable from s in the residual network. The maximum flow
+        # must be zero.
+        R.graph["flow_value"] = 0
+        return R
+
+    # Initialize counts of nodes in each level and the position of the
+    # 'current arc' of the nodes.
+    counts = [0] * (2 * n - 1)
+    for h in heights:
+        counts[h] += 1
+    curr = [0] * n
+
+    if cutoff is None:
+        cutoff = float("inf")
+
+    # Phase 1: Look for shortest augmenting paths using depth-first search.
+    # The path is kept as a list of arcs.
+    m = len(head) / 2
+    d = n if not two_phase else int(min(m ** 0.5, 2 * n ** (2.0 / 3)))
+    flow_value = 0
+    path = []
+    u = s
+    done = heights[s] >= d
+    while not done:
+        height = heights[u]
+        arcs = adj[u]
+        i = curr[u]
+        # Depth-first search for the next node on the path to t.
+        while i < len(arcs):
+            e = arcs[i]
+            if res[e] > 0 and heights[head[e]] == height - 1:
+                break
+            i += 1
+        curr[u] = i
+        if i < len(arcs):
+            # Advance to the next node following an admissible arc.
+            path.append(e)
+            u = head[e]
+        else:
+            counts[height] -= 1
+            if counts[height] == 0:
+                # Gap heuristic: If relabeling causes a level to become
+                # empty, a minimum cut has been identified.
+                break
+            # Relabel the node to create an admissible arc.
+            height = n - 1
+            for e in arcs:
+                if res[e] > 0 and heights[head[e]] < height:
+                    height = heights[head[e]]
+            height += 1
+            if u == s and height >= d:
+                if not two_phase:
+                    # t is disconnected from s in the residual network. No
+                    # more augmenting paths exist.
+                    break
+                # t is at least d steps away from s. End of phase 1.
+                done = True
+                break
+            counts[height] += 1
+            heights[u] = height
+            curr[u] = 0
+            if u != s:
+                # After relabeling, the last arc on the path is no longer
+                # admissible. Retreat one step to look for an alternative.
+                u = head[path.pop() ^ 1]
+        if u == t:
+            # t is reached. Augment flow along the path and reset it for a new
+            # depth-first search.
+            flow = inf
+            for e in path:
+                if res[e] < flow:
+                    flow = res[e]
+            if flow * 2 > inf:
+                raise nx.NetworkXUnbounded(
+                    "Infinite capacity path, flow unbounded above."
+                )
+            for e in path:
+                res[e] -= flow
+                res[e ^ 1] += flow
+            flow_value += flow
+            if flow_value >= cutoff:
+                break
+            path = []
+            u = s
+
+    R._set_residual(res)
+    if done:
+        # Phase 2: Look for shortest augmenting paths using breadth-first
+        # search.
+        flow_value += edmonds_karp_array_core(
+            R, R.nodelist[s], R.nodelist[t], cutoff - flow_value
+        )
+
+    R.graph["flow_value"] = flow_value
+    return R
+
+
 def shortest_augmenting_path(
     G,
     s,
@@ -201,9 +319,11 @@ def shortest_augmenting_path(
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ArrayResidualNetwork
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If an :class:`ArrayResidualNetwork`
+        is given, the algorithm runs on its arrays and returns it.
+        Default value: None.
 
     value_only : bool
         If True compute only the value of the maximum flow. This parameter
@@ -123,3 +123,38 @@ class TestGomoryHuTree:
         with pytest.raises(nx.NetworkXError):
             G = nx.empty_graph()
             T = nx.gomory_hu_tree(G)
+
+    def test_parallel(self):
+        G = nx.karate_club_graph()
+        nx.set_edge_attributes(G, 1, "capacity")
+        for flow_func in flow_funcs:
+            T = nx.gomory_hu_tree(G, flow_func=flow_func, processes=2)
+            assert nx.is_tree(T)
+            assert set(T) == set(G)
+            for u, v in combinations(G, 2):
+                cut_value, edge = self.minimum_edge_weight(T, u, v)
+                assert nx.minimum_cut_value(G, u, v) == cut_value
+
+    def test_parallel_wikipedia_example(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from(
+            (
+                (0, 1, 1),
+                (0, 2, 7),
+                (1, 2, 1),
+                (1, 3, 3),
+                (1, 4, 2),
+                (2, 4, 4),
+                (3, 4, 1),
+                (3, 5, 6),
+                (4, 5, 2),
+            )
+        )
+        T1 = nx.gomory_hu_tree(G, capacity="weight", processes=1)
+        T2 = nx.gomory_hu_tree(G, capacity="weight", processes=3)
+        assert sorted(T1.edges(data=True)) == sorted(T2.edges(data=True))
+        for u, v in combinations(G, 2):
+            cut_value, edge = self.minimum_edge_weight(T2, u, v)
+            cutset = self.compute_cutset(G, T2, edge)
+            assert nx.minimum_cut_value(G, u, v, capacity="weight") == cut_value
+            assert sum(G.edges[e]["weight"] for e in cutset) == cut_value
@@ -4,6 +4,7 @@ import pytest
 
 import networkx as nx
 from networkx.algorithms.flow import build_flow_dict, build_residual_network
+from networkx.algorithms.flow import ArrayResidualNetwork, FlowNetwork
 from networkx.algorithms.flow import boykov_kolmogorov
 from networkx.algorithms.flow import edmonds_karp
 from networkx.algorithms.flow import preflow_push
@@ -82,6 +83,16 @@ def compare_flows_and_cuts(G, s, t, solnFlows, solnValue, capacity="capacity"):
             G, s, t, capacity=capacity, flow_func=flow_func
         )
         validate_cuts(G, s, t, solnValue, partition, capacity, flow_func)
+        # Array-based residual network
+        R = ArrayResidualNetwork(G, capacity)
+        flow_value = flow_func(G, s, t, capacity, residual=R).graph["flow_value"]
+        assert flow_value == solnValue, errmsg
+        validate_flows(G, s, t, build_flow_dict(G, R), solnValue, capacity, flow_func)
+        cut_value, partition = nx.minimum_cut(
+            G, s, t, capacity=capacity, flow_func=flow_func, residual=R
+        )
+        assert cut_value == solnValue, errmsg
+        validate_cuts(G, s, t, solnValue, partition, capacity, flow_func)
 
 
 class TestMaxflowMinCutCommon:
@@ -311,6 +322,9 @@ class TestMaxflowMinCutCommon:
 
         for flow_func in all_funcs:
             pytest.raises(nx.NetworkXUnbounded, flow_func, G, "s", "t")
+        R = ArrayResidualNetwork(G)
+        for flow_func in flow_funcs:
+            pytest.raises(nx.NetworkXUnbounded, flow_func, G, "s", "t", residual=R)
 
     def test_graph_infcap_edges(self):
         # Undirected graph with infinite capacity edges
@@ -380,6 +394,8 @@ class TestMaxflowMinCutCommon:
         G.add_edges_from([(0, 1), (1, 0)], capacity=True)
         for flow_func in all_funcs:
             pytest.raises(nx.NetworkXError, flow_func, G, 0, 0)
+        pytest.raises(nx.NetworkXError, ArrayResidualNetwork, G)
+        pytest.raises(nx.NetworkXError, ArrayResidualNetwork, M)
 
 
 class TestMaxFlowMinCutInterface:
@@ -488,6 +504,26 @@ class TestMaxFlowMinCutInterface:
                         result = result[0]
                     assert fv == result, errmsg
 
+    def test_reusing_array_residual(self):
+        G = self.G
+        R = ArrayResidualNetwork(G)
+        flow = R.flow
+        for interface_func in interface_funcs:
+            for flow_func in flow_funcs:
+                errmsg = (
+                    f"Assertion failed in function: {flow_func.__name__} "
+                    f"in interface {interface_func.__name__}"
+                )
+                for s, t, fv in [("x", "y", 3.0), ("b", "e", 2.0), ("x", "c", 4.0)]:
+                    result = interface_func(G, s, t, flow_func=flow_func, residual=R)
+                    if interface_func in max_min_funcs:
+                        result = result[0]
+                    assert fv == result, errmsg
+        # Flows are reset in place.
+        assert R.flow is flow
+        R.reset_flow()
+        assert not R.flow.any()
+
 
 # Tests specific to one algorithm
 def test_preflow_push_global_relabel_freq():
@@ -546,3 +582,203 @@ class TestCutoff:
                     G, 0, 4, flow_func=flow_func, cutoff=cutoff
                 )
                 assert cutoff == result, f"cutoff error in {flow_func.__name__}"
+
+
+class TestArrayResidualNetwork:
+    def test_arcs(self):
+        G = nx.DiGraph()
+        G.add_edge(0, 1, capacity=3)
+        G.add_edge(1, 0, capacity=2)
+        G.add_edge(1, 2)
+        G.add_edge(2, 2, capacity=5)
+        G.add_edge(0, 2, capacity=0)
+        R = ArrayResidualNetwork(G)
+        H = build_residual_network(G, "capacity")
+        assert R.graph["inf"] == H.graph["inf"] == 15
+        assert R.nodelist == [0, 1, 2]
+        assert len(R.head) == H.number_of_edges() == 4
+        for u, v, c in H.edges(data="capacity"):
+            e = R.arc(u, v)
+            assert R.capacity[e] == c
+            assert R.tail[e] == R.head[e ^ 1] == R.index[u]
+            assert R.head[e] == R.tail[e ^ 1] == R.index[v]
+            assert e in R.arcs[R.indptr[u] : R.indptr[u + 1]]
+        pytest.raises(nx.NetworkXError, R.arc, 0, 3)
+        pytest.raises(nx.NetworkXError, R.arc, 2, 2)
+
+    def test_undirected(self):
+        G = nx.Graph()
+        G.add_edge("a", "b", capacity=2.5)
+        R = ArrayResidualNetwork(G)
+        assert R.capacity.tolist() == [2.5, 2.5]
+        assert "a" in R
+        assert "c" not in R
+        assert [] not in R
+
+    def test_boykov_kolmogorov_trees(self):
+        G = nx.DiGraph()
+        nx.add_path(G, "sabt", capacity=1)
+        nx.add_path(G, "scdt", capacity=2)
+        R = boykov_kolmogorov(G, "s", "t")
+        A = boykov_kolmogorov(G, "s", "t", residual=ArrayResidualNetwork(G))
+        assert A.graph["flow_value"] == R.graph["flow_value"] == 3
+        assert A.graph["trees"] == R.graph["trees"]
+
+    def test_cutoff(self):
+        G = nx.complete_graph(5)
+        nx.set_edge_attributes(G, 1, "capacity")
+        R = ArrayResidualNetwork(G)
+        for flow_func in [shortest_augmenting_path, edmonds_karp, dinitz]:
+            for cutoff in [3, 2, 1]:
+                result = nx.maximum_flow_value(
+                    G, 0, 4, flow_func=flow_func, residual=R, cutoff=cutoff
+                )
+                assert cutoff == result, f"cutoff error in {flow_func.__name__}"
+
+    def test_two_phase(self):
+        k = 5
+        p = 1000
+        G = nx.DiGraph()
+        for i in range(k):
+            G.add_edge("s", (i, 0), capacity=1)
+            nx.add_path(G, ((i, j) for j in range(p)), capacity=1)
+            G.add_edge((i, p - 1), "t", capacity=1)
+        R = ArrayResidualNetwork(G)
+        for two_phase in (True, False):
+            shortest_augmenting_path(G, "s", "t", residual=R, two_phase=two_phase)
+            assert R.graph["flow_value"] == k
+
+    def test_preflow_push_value_only(self):
+        G = nx.DiGraph()
+        nx.add_path(G, [0, 1, 3], capacity=1)
+        nx.add_path(G, [1, 2, 3], capacity=1)
+        G.add_edge(0, 4, capacity=3)
+        G.add_edge(4, 3, capacity=1)
+        R = ArrayResidualNetwork(G)
+        for freq in (None, 0.5, 1):
+            preflow_push(G, 0, 3, residual=R, global_relabel_freq=freq)
+            assert R.graph["flow_value"] == 2
+            validate_flows(G, 0, 3, build_flow_dict(G, R), 2, "capacity", preflow_push)
+            preflow_push(G, 0, 3, residual=R, value_only=True)
+            assert R.graph["flow_value"] == 2
+
+
+class TestFlowNetwork:
+    def setup_method(self):
+        G = nx.DiGraph()
+        G.add_edge("x", "a", capacity=3)
+        G.add_edge("x", "b", capacity=1)
+        G.add_edge("a", "c", capacity=3)
+        G.add_edge("b", "c", capacity=5)
+        G.add_edge("b", "d", capacity=4)
+        G.add_edge("d", "e", capacity=2)
+        G.add_edge("c", "y", capacity=2)
+        G.add_edge("e", "y", capacity=3)
+        self.G = G
+
+    def test_queries(self):
+        G = self.G
+        for flow_func in flow_funcs:
+            N = FlowNetwork(G, flow_func=flow_func)
+            for s, t in [("x", "y"), ("b", "e"), ("x", "y"), ("x", "c")]:
+                fv = nx.maximum_flow_value(G, s, t)
+                assert N.max_flow_value(s, t) == fv
+                assert N.min_cut_value(s, t) == fv
+                flow_value, flow_dict = N.max_flow(s, t)
+                assert flow_value == fv
+                validate_flows(G, s, t, flow_dict, fv, "capacity", flow_func)
+                cut_value, partition = N.min_cut(s, t)
+                assert cut_value == fv
+                validate_cuts(G, s, t, fv, partition, "capacity", flow_func)
+                cut_value, partition = N.min_cut(s, t, reachable=True)
+                assert cut_value == fv
+                validate_cuts(G, s, t, fv, partition, "capacity", flow_func)
+                assert len(partition[0]) <= len(N.min_cut(s, t)[1][0])
+
+    def test_set_capacity_unbounded(self):
+        G = nx.DiGraph()
+        G.add_edge(0, 1, capacity=1)
+        G.add_edge(0, 2, capacity=2)
+        G.add_edge(1, 0, capacity=5)
+        N = FlowNetwork(G)
+        assert N.max_flow_value(1, 0) == 5
+        N.set_capacity(1, 0, float("inf"))
+        pytest.raises(nx.NetworkXUnbounded, N.max_flow_value, 1, 0)
+        G[1][0]["capacity"] = float("inf")
+        pytest.raises(nx.NetworkXUnbounded, nx.maximum_flow_value, G, 1, 0)
+
+    def test_set_capacity(self):
+        G = self.G.copy()
+        N = FlowNetwork(G, flow_func=dinitz)
+        assert N.max_flow_value("x", "y") == 3
+        updates = [
+            ("c", "y", 5),
+            ("x", "b", 4),
+            ("e", "y", 0.5),
+            ("a", "y", 2),
+            ("x", "a", float("inf")),
+            ("a", "c", 1),
+        ]
+        for u, v, c in updates:
+            N.set_capacity(u, v, c)
+            G.add_edge(u, v, capacity=c)
+            assert N.graph["inf"] == build_residual_network(G, "capacity").graph["inf"]
+            fv = nx.maximum_flow_value(G, "x", "y")
+            assert N.max_flow_value("x", "y") == fv
+            flow_value, flow_dict = N.max_flow("x", "y")
+            validate_flows(G, "x", "y", flow_dict, fv, "capacity", dinitz)
+        N.set_capacity("a", "y", float("inf"))
+        pytest.raises(nx.NetworkXUnbounded, N.max_flow_value, "x", "y")
+
+    def test_warm_start(self):
+        G = self.G.copy()
+        N = FlowNetwork(G, flow_func=dinitz)
+        assert N.max_flow_value("x", "y") == 3
+        # Raising capacities keeps the current flow feasible.
+        for u, v in [("x", "b"), ("b", "c"), ("c", "y")]:
+            N.set_capacity(u, v, 10)
+            G.add_edge(u, v, capacity=10)
+        assert 4 <= N.max_flow_value("x", "y", cutoff=4) <= 12
+        assert N.max_flow_value("x", "y") == nx.maximum_flow_value(G, "x", "y") == 12
+        # Lowering a capacity below the flow forces a new computation.
+        N.set_capacity("c", "y", 1)
+        assert N.max_flow_value("x", "y") == 3
+
+    def test_undirected(self):
+        G = nx.Graph()
+        nx.add_path(G, [0, 1, 2, 3], capacity=2)
+        G.add_edge(0, 3, capacity=1)
+        N = FlowNetwork(G, flow_func=edmonds_karp)
+        assert N.max_flow_value(0, 3) == 3
+        assert N.max_flow_value(3, 0) == 3
+        N.set_capacity(2, 1, 5)
+        N.set_capacity(0, 2, 2)
+        assert N.max_flow_value(3, 0) == 3
+        N.set_capacity(3, 2, 5)
+        assert N.max_flow_value(3, 0) == 5
+        cut_value, (S, T) = N.min_cut(3, 0)
+        assert cut_value == 5
+        assert S == {1, 2, 3}
+
+    def test_residual_graph(self):
+        G = self.G
+        N = FlowNetwork(G, flow_func=preflow_push)
+        N.max_flow("x", "y")
+        R = N.residual_graph()
+        H = preflow_push(G, "x", "y")
+        assert set(R.edges) == set(H.edges)
+        assert R.graph["flow_value"] == H.graph["flow_value"] == 3
+        for u, v, d in R.edges(data=True):
+            assert d["flow"] == -R[v][u]["flow"]
+            assert d["capacity"] == H[u][v]["capacity"]
+
+    def test_errors(self):
+        G = self.G
+        pytest.raises(nx.NetworkXError, FlowNetwork, G, flow_func=lambda G, s, t: G)
+        N = FlowNetwork(G)
+        pytest.raises(nx.NetworkXError, N.max_flow_value, "x", "x")
+        pytest.raises(nx.NetworkXError, N.max_flow_value, "x", "z")
+        pytest.raises(nx.NetworkXError, N.min_cut, "x", "y", cutoff=1)
+        pytest.raises(nx.NetworkXError, N.set_capacity, "x", "z", 1)
+        pytest.raises(nx.NetworkXError, N.set_capacity, "x", "x", 1)
+        pytest.raises(nx.NetworkXError, N.set_capacity, "x", "y", -1)
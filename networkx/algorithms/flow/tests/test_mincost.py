@@ -465,3 +465,139 @@ class TestMinCostFlow:
         flowCost, flowDict = nx.capacity_scaling(G)
         assert 6749969302 == flowCost
         assert 6749969302 == nx.cost_of_flow(G, flowDict)
+
+
+class TestArrayNetworkSimplex:
+    def simple_digraph(self):
+        G = nx.DiGraph()
+        G.add_node("a", demand=-5)
+        G.add_node("d", demand=5)
+        G.add_edge("a", "b", weight=3, capacity=4)
+        G.add_edge("a", "c", weight=6, capacity=10)
+        G.add_edge("b", "d", weight=1, capacity=9)
+        G.add_edge("c", "d", weight=2, capacity=5)
+        return G
+
+    def test_simple_digraph(self):
+        G = self.simple_digraph()
+        flowCost, H = nx.array_network_simplex(G)
+        soln = {"a": {"b": 4, "c": 1}, "b": {"d": 4}, "c": {"d": 1}, "d": {}}
+        assert flowCost == 24
+        assert H == soln
+        assert nx.min_cost_flow_cost(G, method="array_network_simplex") == 24
+        assert nx.min_cost_flow(G, method="array_network_simplex") == soln
+        assert nx.min_cost_flow(G, method="capacity_scaling") == soln
+
+    def test_float_data(self):
+        G = self.simple_digraph()
+        G["a"]["b"]["weight"] = 2.5
+        flowCost, H = nx.array_network_simplex(G)
+        assert flowCost == pytest.approx(nx.network_simplex(G)[0])
+        assert isinstance(H["a"]["b"], float)
+
+    def test_float_termination(self):
+        # Roundoff errors in the reduced costs used to make the pivots cycle
+        # forever on these networks.
+        G = nx.DiGraph()
+        G.add_node(0, demand=0.0)
+        G.add_node(1, demand=-2.125)
+        G.add_node(2, demand=3.0)
+        G.add_node(3, demand=-0.875)
+        G.add_edge(0, 1, weight=0.48, capacity=0.7609624449125756)
+        G.add_edge(1, 0, weight=5.8, capacity=0.8933170425576352)
+        G.add_edge(1, 3, weight=1.0666666666666667, capacity=7.215400323407826)
+        G.add_edge(2, 3, weight=0.51, capacity=0.254458609934608)
+        G.add_edge(3, 0, weight=3.09, capacity=4.221165755827173)
+        G.add_edge(3, 2, weight=0.43300000000000005, capacity=3.457004147087525)
+        tree = nx.NetworkSimplexTree()
+        flowCost, H = nx.array_network_simplex(G, tree=tree)
+        assert flowCost == pytest.approx(3.565666666666667)
+        assert nx.cost_of_flow(G, H) == pytest.approx(flowCost)
+        G[3][2]["weight"] += 0.1
+        G[1][3]["weight"] -= 0.2
+        flowCost, H = nx.array_network_simplex(G, tree=tree)
+        assert flowCost == pytest.approx(nx.cost_of_flow(G, H))
+        assert flowCost == pytest.approx(3.440666666666667)
+
+        G = nx.DiGraph()
+        G.add_node(0, demand=-6.5)
+        G.add_node(1, demand=4.125)
+        G.add_node(2, demand=2.375)
+        G.add_edge(0, 2, weight=0.9333333333333332)
+        G.add_edge(2, 0, weight=0.742, capacity=9.47199521976729)
+        pytest.raises(nx.NetworkXUnfeasible, nx.array_network_simplex, G)
+
+    def test_unsupported_method(self):
+        G = self.simple_digraph()
+        pytest.raises(ValueError, nx.min_cost_flow, G, method="simplex")
+        pytest.raises(ValueError, nx.min_cost_flow_cost, G, method="simplex")
+
+    def test_infeasible_and_unbounded(self):
+        G = nx.DiGraph()
+        G.add_node("s", demand=-5)
+        G.add_node("t", demand=5)
+        G.add_edge("s", "a", weight=1, capacity=3)
+        G.add_edge("a", "b", weight=3)
+        G.add_edge("c", "a", weight=-6)
+        G.add_edge("b", "d", weight=1)
+        G.add_edge("d", "c", weight=-2)
+        G.add_edge("d", "t", weight=1, capacity=3)
+        pytest.raises(nx.NetworkXUnfeasible, nx.array_network_simplex, G)
+        G["s"]["a"]["capacity"] = 5
+        G["d"]["t"]["capacity"] = 5
+        pytest.raises(nx.NetworkXUnbounded, nx.array_network_simplex, G)
+        G.nodes["t"]["demand"] = 4
+        pytest.raises(nx.NetworkXUnfeasible, nx.array_network_simplex, G)
+        pytest.raises(nx.NetworkXNotImplemented, nx.array_network_simplex, nx.Graph())
+        pytest.raises(nx.NetworkXError, nx.array_network_simplex, nx.DiGraph())
+
+    def test_negative_selfloops(self):
+        G = nx.DiGraph()
+        G.add_edge(1, 1, weight=-1)
+        pytest.raises(nx.NetworkXUnbounded, nx.array_network_simplex, G)
+        G[1][1]["capacity"] = 2
+        flowCost, H = nx.array_network_simplex(G)
+        assert flowCost == -2
+        assert H == {1: {1: 2}}
+
+    def test_multidigraph(self):
+        G = nx.MultiDiGraph()
+        G.add_weighted_edges_from([(1, 2, 1), (2, 3, 2)], weight="capacity")
+        G.add_edge(1, 2, weight=3)
+        G.nodes[1]["demand"] = -2
+        G.nodes[3]["demand"] = 2
+        assert nx.array_network_simplex(G) == nx.network_simplex(G)
+
+    def test_warm_start(self):
+        G = nx.grid_2d_graph(6, 6).to_directed()
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]["weight"] = (7 * i) % 11
+            G[u][v]["capacity"] = 3 + i % 4
+        G.nodes[(0, 0)]["demand"] = -6
+        G.nodes[(5, 5)]["demand"] = 6
+        tree = nx.NetworkSimplexTree()
+        assert not tree
+        flowCost, H = nx.array_network_simplex(G, tree=tree)
+        assert tree
+        assert flowCost == nx.network_simplex(G)[0]
+        for i, (u, v) in enumerate(G.edges()):
+            if i % 5 == 0:
+                G[u][v]["weight"] += 1
+        G.nodes[(0, 5)]["demand"] = -2
+        G.nodes[(5, 0)]["demand"] = 2
+        flowCost, H = nx.array_network_simplex(G, tree=tree)
+        assert flowCost == nx.network_simplex(G)[0]
+        assert flowCost == nx.cost_of_flow(G, H)
+        # A tree for other edges is not used.
+        G.remove_edge((2, 2), (2, 3))
+        flowCost, H = nx.array_network_simplex(G, tree=tree)
+        assert flowCost == nx.network_simplex(G)[0]
+        tree.clear()
+        assert not tree
+
+    def test_large(self):
+        fname = os.path.join(os.path.dirname(__file__), "netgen-2.gpickle.bz2")
+        G = nx.read_gpickle(fname)
+        flowCost, flowDict = nx.array_network_simplex(G)
+        assert 6749969302 == flowCost
+        assert 6749969302 == nx.cost_of_flow(G, flowDict)
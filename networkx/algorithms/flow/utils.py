@@ -10,6 +10,8 @@ __all__ = [
     "Level",
     "GlobalRelabelThreshold",
     "build_residual_network",
+    "ArrayResidualNetwork",
+    "build_array_residual_network",
     "detect_unboundedness",
     "build_flow_dict",
 ]
@@ -152,8 +154,290 @@ def build_residual_network(G, capacity):
     return R
 
 
+class ArrayResidualNetwork:
+    """Residual network stored in flat arrays.
+
+    This is a compact alternative to the DiGraph returned by
+    :func:`build_residual_network`. Nodes are identified by integer ids
+    ``0, ..., n - 1`` following the order of :samp:`G`. Every pair of
+    residual edges :samp:`(u, v)` and :samp:`(v, u)` is stored as two
+    consecutive arcs, so that the reverse of arc ``e`` is always arc
+    ``e ^ 1``. Capacities and flows are kept in NumPy vectors indexed by
+    arc, and the arcs leaving each node are grouped in compressed sparse
+    row form.
+
+    The maximum flow functions :func:`edmonds_karp`,
+    :func:`shortest_augmenting_path`, :func:`preflow_push`,
+    :func:`dinitz` and :func:`boykov_kolmogorov` accept an instance of
+    this class as their ``residual`` argument. The flows are reset in place
+    at the beginning of every run, so the same instance can be used for any
+    number of calls to :func:`maximum_flow` or :func:`minimum_cut` without
+    copying or rebuilding it.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Edges of the graph are expected to have an attribute called
+        'capacity'. If this attribute is not present, the edge is
+        considered to have infinite capacity.
+
+    capacity : string
+        Name of the edge attribute holding the capacity of the edges.
+        Default value: 'capacity'.
+
+    Attributes
+    ----------
+    nodelist : list
+        The nodes of :samp:`G`; node ``i`` of the network is ``nodelist[i]``.
+
+    index : dict
+        Mapping from the nodes of :samp:`G` to their integer ids.
+
+    head, tail : NumPy arrays
+        Head and tail node ids of every arc.
+
+    indptr, arcs : NumPy arrays
+        The arcs leaving node ``u`` are ``arcs[indptr[u]:indptr[u + 1]]``.
+
+    capacity, flow : NumPy arrays
+        Capacity and flow of every arc. The flows satisfy
+        ``flow[e] == -flow[e ^ 1]``.
+
+    graph : dict
+        Same graph attributes as those of the residual DiGraph, that is
+        ``'inf'``, and ``'flow_value'`` and ``'algorithm'`` once a maximum
+        flow has been computed.
+
+    Raises
+    ------
+    NetworkXError
+        If :samp:`G` is a multigraph.
+
+    See also
+    --------
+    build_residual_network
+    build_array_residual_network
+
+    Examples
+    --------
+    >>> from networkx.algorithms.flow import ArrayResidualNetwork, dinitz
+    >>> G = nx.DiGraph()
+    >>> G.add_edge("x", "a", capacity=3)
+    >>> G.add_edge("a", "y", capacity=2)
+    >>> G.add_edge("x", "y", capacity=1)
+    >>> R = ArrayResidualNetwork(G)
+    >>> nx.maximum_flow_value(G, "x", "y", flow_func=dinitz, residual=R)
+    3
+    >>> cut_value, (S, T) = nx.minimum_cut(G, "x", "y", flow_func=dinitz, residual=R)
+    >>> cut_value, sorted(S), sorted(T)
+    (3, ['a', 'x'], ['y'])
+
+    """
+
+    def __init__(self, G, capacity="capacity"):
+        import numpy as np
+
+        if G.is_multigraph():
+            raise nx.NetworkXError("MultiGraph and MultiDiGraph not supported (yet).")
+
+        self.nodelist = list(G)
+        self.index = index = {u: i for i, u in enumerate(self.nodelist)}
+        n = len(self.nodelist)
+
+        inf = float("inf")
+        # Extract edges with positive capacities. Self loops excluded.
+        edge_list = [
+            (u, v, attr.get(capacity, inf))
+            for u, v, attr in G.edges(data=True)
+            if u != v and attr.get(capacity, inf) > 0
+        ]
+        # Simulate infinity exactly as build_residual_network does.
+        inf = 3 * sum(c for u, v, c in edge_list if c != inf) or 1
+
+        # One pair of arcs per adjacent pair of nodes: the forward arc is
+        # even and its reverse is the following odd arc. Pairs are numbered
+        # in the order their first edge appears in edge_list, and that edge
+        # gives the direction of the forward arc.
+        tails = np.array([index[u] for u, v, c in edge_list], dtype=np.intp)
+        heads = np.array([index[v] for u, v, c in edge_list], dtype=np.intp)
+        caps = np.array([min(c, inf) for u, v, c in edge_list])
+        if caps.dtype.kind not in "iuf":
+            caps = caps.astype(float)
+        key = np.minimum(tails, heads).astype(np.int64) * n + np.maximum(tails, heads)
+        _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind="stable")
+        first = first[order]
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        pair = rank[inverse.ravel()]
+        # The edges that are not the first of their pair are reverse arcs.
+        arc = 2 * pair + (tails != tails[first][pair])
+
+        self.head = np.empty(2 * len(first), dtype=np.intp)
+        self.head[0::2] = heads[first]
+        self.head[1::2] = tails[first]
+        self.tail = self.head.reshape(-1, 2)[:, ::-1].ravel()
+        self.arcs = np.argsort(self.tail, kind="stable").astype(np.intp)
+        self.indptr = np.zeros(n + 1, dtype=np.intp)
+        np.cumsum(np.bincount(self.tail, minlength=n), out=self.indptr[1:])
+        self.capacity = np.zeros(len(self.head), dtype=caps.dtype)
+        self.capacity[arc] = caps
+        if not G.is_directed():
+            self.capacity[arc ^ 1] = caps
+        self.flow = np.zeros_like(self.capacity)
+        self.graph = {"inf": inf}
+        self._arc_keys = None
+
+    def __len__(self):
+        return len(self.nodelist)
+
+    def __contains__(self, n):
+        try:
+            return n in self.index
+        except TypeError:
+            return False
+
+    def reset_flow(self):
+        """Set the flow of every arc to zero in place."""
+        self.flow[...] = 0
+
+    def residual_capacity(self):
+        """Returns the residual capacity ``capacity - flow`` of every arc."""
+        return self.capacity - self.flow
+
+    def arc(self, u, v):
+        """Returns the id of the arc from node `u` to node `v`."""
+        e = None
+        if u in self.index and v in self.index:
+            e = self._find_arc(self.index[u], self.index[v])
+        if e is None:
+            raise nx.NetworkXError(f"edge ({u}, {v}) not in residual network")
+        return e
+
+    def _find_arc(self, i, j):
+        """Returns the id of the arc from node id i to node id j, or None.
+
+        The arcs sorted by ``tail * n + head`` are computed at the first call
+        only, so networks that are never searched do not store them.
+        """
+        import numpy as np
+
+        if self._arc_keys is None:
+            keys = self.tail.astype(np.int64) * len(self) + self.head
+            ids = np.argsort(keys, kind="stable")
+            self._arc_keys = (keys[ids], ids)
+        keys, ids = self._arc_keys
+        key = i * len(self) + j
+        k = int(np.searchsorted(keys, key))
+        if k < len(keys) and keys[k] == key:
+            return int(ids[k])
+        return None
+
+    def _arc_lists(self):
+        """Returns the heads of the arcs and the arcs leaving each node as
+        Python lists, which are much faster than arrays to index one item
+        at a time. They are not kept, to save memory between runs.
+        """
+        head = self.head.tolist()
+        arcs = self.arcs.tolist()
+        indptr = self.indptr.tolist()
+        adj = [arcs[indptr[u] : indptr[u + 1]] for u in range(len(indptr) - 1)]
+        return head, adj
+
+    def _set_residual(self, res):
+        """Store the flows corresponding to the residual capacities `res`."""
+        import numpy as np
+
+        np.subtract(
+            self.capacity, np.array(res, dtype=self.capacity.dtype), out=self.flow
+        )
+
+
+def build_array_residual_network(G, capacity):
+    """Build an array-based residual network and initialize a zero flow.
+
+    The returned :class:`ArrayResidualNetwork` holds the same residual
+    network as :func:`build_residual_network`, with integer node ids,
+    paired forward and reverse arcs, and capacities and flows stored in
+    NumPy arrays. It can be passed as the ``residual`` argument of the
+    maximum flow functions in place of the DiGraph.
+
+    """
+    return ArrayResidualNetwork(G, capacity)
+
+
+def _array_reverse_bfs(head, adj, res, root):
+    """Returns the length of the shortest path from each node to `root` in
+    the residual network, or -1 if `root` is not reachable.
+
+    The reverse of the arc ``e`` leaving ``v`` is ``e ^ 1``, which enters
+    ``v``, so the arcs entering a node are found without a transposed
+    structure.
+    """
+    dist = [-1] * len(adj)
+    dist[root] = 0
+    q = deque([root])
+    while q:
+        v = q.popleft()
+        d = dist[v] + 1
+        for e in adj[v]:
+            u = head[e]
+            if dist[u] < 0 and res[e ^ 1] > 0:
+                dist[u] = d
+                q.append(u)
+    return dist
+
+
+def _array_sink_side(R, t):
+    """Returns the set of nodes that can reach `t` through arcs with positive
+    residual capacity in the :class:`ArrayResidualNetwork` `R`.
+    """
+    head, adj = R._arc_lists()
+    res = R.residual_capacity().tolist()
+    dist = _array_reverse_bfs(head, adj, res, R.index[t])
+    return {R.nodelist[i] for i, d in enumerate(dist) if d >= 0}
+
+
+def _array_source_side(R, s):
+    """Returns the set of nodes reachable from `s` through arcs with positive
+    residual capacity in the :class:`ArrayResidualNetwork` `R`.
+    """
+    head, adj = R._arc_lists()
+    res = R.residual_capacity().tolist()
+    s = R.index[s]
+    seen = {s}
+    q = deque([s])
+    while q:
+        for e in adj[q.popleft()]:
+            v = head[e]
+            if res[e] > 0 and v not in seen:
+                seen.add(v)
+                q.append(v)
+    return {R.nodelist[i] for i in seen}
+
+
 def detect_unboundedness(R, s, t):
     """Detect an infinite-capacity s-t path in R."""
+    if isinstance(R, ArrayResidualNetwork):
+        head, adj = R._arc_lists()
+        inf = R.graph["inf"]
+        capacity = R.capacity.tolist()
+        s = R.index[s]
+        t = R.index[t]
+        q = deque([s])
+        seen = {s}
+        while q:
+            u = q.popleft()
+            for e in adj[u]:
+                v = head[e]
+                if capacity[e] == inf and v not in seen:
+                    if v == t:
+                        raise nx.NetworkXUnbounded(
+                            "Infinite capacity path, flow unbounded above."
+                        )
+                    seen.add(v)
+                    q.append(v)
+        return
     q = deque([s])
     seen = {s}
     inf = R.graph["inf"]
@@ -172,6 +456,17 @@ def detect_unboundedness(R, s, t):
 def build_flow_dict(G, R):
     """Build a flow dictionary from a residual network."""
     flow_dict = {}
+    if isinstance(R, ArrayResidualNetwork):
+        nodelist = R.nodelist
+        for u in G:
+            flow_dict[u] = {v: 0 for v in G[u]}
+        # Only one of the arcs of each pair can carry a positive flow.
+        arcs = (R.flow > 0).nonzero()[0]
+        for i, j, f in zip(
+            R.tail[arcs].tolist(), R.head[arcs].tolist(), R.flow[arcs].tolist()
+        ):
+            flow_dict[nodelist[i]][nodelist[j]] = f
+        return flow_dict
     for u in G:
         flow_dict[u] = {v: 0 for v in G[u]}
         flow_dict[u].update(
@@ -7,11 +7,112 @@ For now, only Weisfeiler-Lehman hashing is implemented.
 from collections import Counter
 from hashlib import blake2b
 
-__all__ = ["weisfeiler_lehman_graph_hash"]
+__all__ = [
+    "weisfeiler_lehman_graph_hash",
+    "weisfeiler_lehman_graph_hashes",
+    "weisfeiler_lehman_subgraph_hashes",
+]
+
+
+def _hash_label(label, digest_size):
+    return blake2b(label.encode("ascii"), digest_size=digest_size).hexdigest()
+
+
+class _LabelCompressor:
+    """Compress Weisfeiler-Lehman labels to small integers.
+
+    Every distinct label string is assigned an integer id. Neighborhood
+    signatures are tuples of integer ids, so each relabelling step only
+    compares and sorts integers. The new label of a signature and its
+    blake2b digest are computed the first time the signature is seen and
+    reused afterwards, also across graphs when the compressor is shared.
+
+    By default the new label of a node is the sorted concatenation of its
+    own label and the labels of its neighbors, as in
+    :func:`weisfeiler_lehman_graph_hash`. If `hash_labels` is True, it is
+    the digest of that concatenation instead, which bounds the label length.
+    """
+
+    def __init__(self, digest_size, hash_labels=False):
+        self.digest_size = digest_size
+        self.hash_labels = hash_labels
+        # label string -> id, and id -> label string
+        self._ids = {}
+        self.labels = []
+        # id -> digest of the label string
+        self.digests = {}
+        # (own id, sorted neighbor ids) -> id
+        self._signatures = {}
+
+    def _id(self, label):
+        try:
+            return self._ids[label]
+        except KeyError:
+            idx = self._ids[label] = len(self.labels)
+            self.labels.append(label)
+            return idx
+
+    def initial(self, G, edge_attr, node_attr):
+        if node_attr:
+            return {u: self._id(str(dd[node_attr])) for u, dd in G.nodes(data=True)}
+        if edge_attr:
+            empty = self._id("")
+            return {u: empty for u in G}
+        return {u: self._id(str(d)) for u, d in G.degree()}
+
+    def step(self, G, ids, edge_attr):
+        signatures = self._signatures
+        new_ids = {}
+        for u, nbrs in G.adj.items():
+            if edge_attr is None:
+                nbr_ids = tuple(sorted(ids[v] for v in nbrs))
+            else:
+                nbr_ids = tuple(
+                    sorted((str(dd[edge_attr]), ids[v]) for v, dd in nbrs.items())
+                )
+            sig = (ids[u], nbr_ids)
+            try:
+                new_ids[u] = signatures[sig]
+            except KeyError:
+                new_ids[u] = signatures[sig] = self._relabel(sig, edge_attr)
+        return new_ids
+
+    def _relabel(self, sig, edge_attr):
+        labels = self.labels
+        own, nbr_ids = sig
+        if edge_attr is None:
+            nbr_labels = [labels[v] for v in nbr_ids]
+        else:
+            nbr_labels = [prefix + labels[v] for prefix, v in nbr_ids]
+        if self.hash_labels:
+            label = labels[own] + "".join(sorted(nbr_labels))
+            idx = self._id(_hash_label(label, self.digest_size))
+            self.digests[idx] = labels[idx]
+        else:
+            label = "".join(sorted(nbr_labels + [labels[own]]))
+            idx = self._id(label)
+            if idx not in self.digests:
+                self.digests[idx] = _hash_label(label, self.digest_size)
+        return idx
+
+    def graph_hash(self, G, edge_attr, node_attr, iterations, subgraph_hashes=None):
+        ids = self.initial(G, edge_attr, node_attr)
+        digests = self.digests
+        subgraph_hash_counts = []
+        for _ in range(iterations):
+            ids = self.step(G, ids, edge_attr)
+            counter = Counter(ids.values())
+            subgraph_hash_counts.extend(
+                sorted((digests[i], c) for i, c in counter.items())
+            )
+            if subgraph_hashes is not None:
+                for u, i in ids.items():
+                    subgraph_hashes[u].append(digests[i])
+        return _hash_label(str(tuple(subgraph_hash_counts)), self.digest_size)
 
 
 def weisfeiler_lehman_graph_hash(
-    G, edge_attr=None, node_attr=None, iterations=3, digest_size=16
+    G, edge_attr=None, node_attr=None, iterations=3, digest_size=16, hash_labels=False
 ):
     """Return Weisfeiler Lehman (WL) graph hash.
 
@@ -45,12 +146,24 @@ def weisfeiler_lehman_graph_hash(
         Should be larger for larger graphs.
     digest_size: int
         Size of blake2b hash digest to use for hashing node labels.
+    hash_labels: bool (default=False)
+        If True, node labels are replaced by their hash after every
+        iteration, so they stay `digest_size` bytes long instead of growing
+        with each iteration. This is much faster for many iterations or
+        dense graphs, but gives different hashes than the default.
 
     Returns
     -------
     h : string
         Hexadecimal string corresponding to hash of the input graph.
 
+    Notes
+    -----
+    Internally labels are compressed to integers and each distinct
+    neighborhood is relabelled and hashed only once. To hash many graphs,
+    use :func:`weisfeiler_lehman_graph_hashes`, which shares this work
+    across the whole batch.
+
     Examples
     --------
     Two graphs with edge attributes that are isomorphic, except for
@@ -96,56 +209,160 @@ def weisfeiler_lehman_graph_hash(
        Kurt Mehlhorn, and Karsten M. Borgwardt. Weisfeiler Lehman
        Graph Kernels. Journal of Machine Learning Research. 2011.
        http://www.jmlr.org/papers/volume12/shervashidze11a/shervashidze11a.pdf
+
+    See Also
+    --------
+    weisfeiler_lehman_graph_hashes
+    weisfeiler_lehman_subgraph_hashes
     """
+    compressor = _LabelCompressor(digest_size, hash_labels)
+    return compressor.graph_hash(G, edge_attr, node_attr, iterations)
 
-    def neighborhood_aggregate(G, node, node_labels, edge_attr=None):
-        """
-        Compute new labels for given node by aggregating
-        the labels of each node's neighbors.
-        """
-        label_list = [node_labels[node]]
-        for nei in G.neighbors(node):
-            prefix = "" if not edge_attr else G[node][nei][edge_attr]
-            label_list.append(prefix + node_labels[nei])
-        return "".join(sorted(label_list))
-
-    def weisfeiler_lehman_step(G, labels, edge_attr=None, node_attr=None):
-        """
-        Apply neighborhood aggregation to each node
-        in the graph.
-        Computes a dictionary with labels for each node.
-        """
-        new_labels = dict()
-        for node in G.nodes():
-            new_labels[node] = neighborhood_aggregate(
-                G, node, labels, edge_attr=edge_attr
-            )
-        return new_labels
-
-    items = []
-    node_labels = dict()
-    # set initial node labels
-    for node in G.nodes():
-        if (not node_attr) and (not edge_attr):
-            node_labels[node] = str(G.degree(node))
-        elif node_attr:
-            node_labels[node] = str(G.nodes[node][node_attr])
+
+def weisfeiler_lehman_subgraph_hashes(
+    G, edge_attr=None, node_attr=None, iterations=3, digest_size=16, hash_labels=False
+):
+    """
+    Return a dictionary of subgraph hashes by node.
+
+    The dictionary is keyed by node to a list of hashes, one per iteration.
+    The hash of the `i`-th entry of each list is the hash computed in the
+    `i`-th Weisfeiler-Lehman iteration, i.e. the label of the subtree of
+    depth `i + 1` rooted at the node. These are the same node labels that
+    are histogrammed by :func:`weisfeiler_lehman_graph_hash`, so two
+    nodes in (possibly different) graphs with equal hashes at some
+    iteration have isomorphic rooted subtrees up to that depth.
+
+    Parameters
+    ----------
+    G: graph
+        The graph to be hashed.
+        Can have node and/or edge attributes. Can also have no attributes.
+    edge_attr: string
+        The key in edge attribute dictionary to be used for hashing.
+        If None, edge labels are ignored.
+    node_attr: string
+        The key in node attribute dictionary to be used for hashing.
+        If None, and no edge_attr given, use
+        degree of node as label.
+    iterations: int
+        Number of neighbor aggregations to perform.
+        Should be larger for larger graphs.
+    digest_size: int
+        Size of blake2b hash digest to use for hashing node labels.
+    hash_labels: bool (default=False)
+        If True, node labels are replaced by their hash after every
+        iteration, so they stay `digest_size` bytes long instead of growing
+        with each iteration. This is much faster for many iterations or
+        dense graphs, but gives different hashes than the default.
+
+    Returns
+    -------
+    node_subgraph_hashes : dict
+        A dictionary with each key given by a node in G, and each value given
+        by the subgraph hashes in order of depth from the key node.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(3)
+    >>> hashes = nx.weisfeiler_lehman_subgraph_hashes(G, iterations=2)
+    >>> len(hashes[0])
+    2
+    >>> hashes[0] == hashes[2]
+    True
+    >>> hashes[0][0] == hashes[1][0]
+    False
+
+    See Also
+    --------
+    weisfeiler_lehman_graph_hash
+    weisfeiler_lehman_graph_hashes
+    """
+    subgraph_hashes = {u: [] for u in G}
+    compressor = _LabelCompressor(digest_size, hash_labels)
+    compressor.graph_hash(G, edge_attr, node_attr, iterations, subgraph_hashes)
+    return subgraph_hashes
+
+
+def weisfeiler_lehman_graph_hashes(
+    graphs,
+    edge_attr=None,
+    node_attr=None,
+    iterations=3,
+    digest_size=16,
+    hash_labels=False,
+    subgraph_hashes=False,
+):
+    """Generate Weisfeiler Lehman (WL) graph hashes for many graphs.
+
+    Each hash is identical to the one returned by
+    :func:`weisfeiler_lehman_graph_hash` for the same graph and parameters.
+    Node labels are compressed to integers which are shared across all
+    graphs of the batch, so a neighborhood seen in an earlier graph is
+    relabelled by a dictionary lookup instead of being rehashed. This
+    makes hashing large collections of small graphs with recurring local
+    structure much faster than calling `weisfeiler_lehman_graph_hash`
+    on each graph in turn.
+
+    Parameters
+    ----------
+    graphs: iterable of graphs
+        The graphs to be hashed. Graphs are consumed lazily.
+    edge_attr: string
+        The key in edge attribute dictionary to be used for hashing.
+        If None, edge labels are ignored.
+    node_attr: string
+        The key in node attribute dictionary to be used for hashing.
+        If None, and no edge_attr given, use
+        degree of node as label.
+    iterations: int
+        Number of neighbor aggregations to perform.
+        Should be larger for larger graphs.
+    digest_size: int
+        Size of blake2b hash digest to use for hashing node labels.
+    hash_labels: bool (default=False)
+        If True, node labels are replaced by their hash after every
+        iteration, so they stay `digest_size` bytes long instead of growing
+        with each iteration. This is much faster for many iterations or
+        dense graphs, but gives different hashes than the default.
+    subgraph_hashes: bool (default=False)
+        If True, generate pairs `(h, node_subgraph_hashes)` where the
+        second item is the dictionary returned by
+        :func:`weisfeiler_lehman_subgraph_hashes`.
+
+    Yields
+    ------
+    h : string
+        Hexadecimal string corresponding to hash of each input graph,
+        in input order.
+
+    Examples
+    --------
+    >>> graphs = [nx.cycle_graph(4), nx.path_graph(4), nx.cycle_graph(range(4, 8))]
+    >>> h = list(nx.weisfeiler_lehman_graph_hashes(graphs))
+    >>> h[0] == h[2]
+    True
+    >>> h[0] == h[1]
+    False
+    >>> h[1] == nx.weisfeiler_lehman_graph_hash(graphs[1])
+    True
+
+    Notes
+    -----
+    The table of compressed labels grows with the number of distinct
+    neighborhoods encountered in the batch. For unbounded streams of
+    graphs, hash the stream in batches to bound memory.
+
+    See Also
+    --------
+    weisfeiler_lehman_graph_hash
+    weisfeiler_lehman_subgraph_hashes
+    """
+    compressor = _LabelCompressor(digest_size, hash_labels)
+    for G in graphs:
+        if subgraph_hashes:
+            node_hashes = {u: [] for u in G}
+            h = compressor.graph_hash(G, edge_attr, node_attr, iterations, node_hashes)
+            yield h, node_hashes
         else:
-            node_labels[node] = ""
-
-    for k in range(iterations):
-        node_labels = weisfeiler_lehman_step(G, node_labels, edge_attr=edge_attr)
-        counter = Counter()
-        # count node labels
-        for node, d in node_labels.items():
-            h = blake2b(digest_size=digest_size)
-            h.update(d.encode("ascii"))
-            counter.update([h.hexdigest()])
-        # sort the counter, extend total counts
-        items.extend(sorted(counter.items(), key=lambda x: x[0]))
-
-    # hash the final counter
-    h = blake2b(digest_size=digest_size)
-    h.update(str(tuple(items)).encode("ascii"))
-    h = h.hexdigest()
-    return h
+            yield compressor.graph_hash(G, edge_attr, node_attr, iterations)
@@ -17,6 +17,9 @@ __all__ = [
     "ra_index_soundarajan_hopcroft",
     "within_inter_cluster",
     "common_neighbor_centrality",
+    "link_prediction_scores",
+    "link_prediction_top_k",
+    "LinkPredictionScorer",
 ]
 
 
@@ -577,3 +580,358 @@ def _community(G, u, community):
         return node_u[community]
     except KeyError as e:
         raise nx.NetworkXAlgorithmError("No community information") from e
+
+
+_ARRAY_METHODS = (
+    "resource_allocation_index",
+    "jaccard_coefficient",
+    "adamic_adar_index",
+    "preferential_attachment",
+)
+
+
+class LinkPredictionScorer:
+    """Scores node pairs of a graph with an array-based link predictor.
+
+    The sparse adjacency matrix of `G` and the degree and weight vectors
+    the scores need are computed once, when the scorer is created. The
+    scorer can then score any number of batches of pairs with
+    :meth:`scores`, or find the best candidates of nodes with
+    :meth:`top_k`, without converting the graph again. Changes made to `G`
+    afterwards are not seen by the scorer.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX undirected graph.
+
+    method : string, optional (default="jaccard_coefficient")
+        One of "resource_allocation_index", "jaccard_coefficient",
+        "adamic_adar_index" or "preferential_attachment".
+
+    nodelist : list, optional
+        The order of the nodes that positions refer to.
+        If None, the ordering is produced by G.nodes().
+
+    Attributes
+    ----------
+    nodelist : list
+        The nodes of `G`, in the order of their positions.
+
+    Raises
+    ------
+    ValueError
+        If `method` is unknown.
+
+    NetworkXNotImplemented
+        If `G` is directed or a multigraph.
+
+    Examples
+    --------
+    >>> G = nx.complete_graph(5)
+    >>> scorer = nx.LinkPredictionScorer(G, "resource_allocation_index")
+    >>> scorer.scores([(0, 1), (2, 3)])
+    array([0.75, 0.75])
+    >>> scorer.scores([[0, 1]], index=True)
+    array([0.75])
+
+    See Also
+    --------
+    link_prediction_scores
+    link_prediction_top_k
+    """
+
+    def __init__(self, G, method="jaccard_coefficient", nodelist=None):
+        import numpy as np
+        import scipy.sparse as sp
+
+        if G.is_directed():
+            raise nx.NetworkXNotImplemented("not implemented for directed type")
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented("not implemented for multigraph type")
+        if method not in _ARRAY_METHODS:
+            raise ValueError(f"Unknown method {method}")
+        self.method = method
+        self.nodelist = list(G) if nodelist is None else list(nodelist)
+        self._index = {u: i for i, u in enumerate(self.nodelist)}
+        # Products of rows count common neighbors, up to the number of nodes.
+        dtype = np.int32 if len(self.nodelist) < 2 ** 31 else np.int64
+        A = nx.to_scipy_sparse_matrix(
+            G, nodelist=self.nodelist, weight=None, dtype=dtype, format="csr"
+        )
+        # `A` is the adjacency matrix without self-loops, so that row
+        # products count common neighbors other than the pair itself, and
+        # `W` is `A` with each column scaled by the weight of the common
+        # neighbor it represents.
+        self._loops = A.diagonal().astype(bool)
+        A.setdiag(0)
+        A.eliminate_zeros()
+        self._A = A
+        self._num_nbrs = np.diff(A.indptr) + self._loops
+        self._degree = self._num_nbrs + self._loops
+        if method == "resource_allocation_index":
+            with np.errstate(divide="ignore"):
+                weight = np.where(self._degree > 0, 1 / self._degree, 0)
+        elif method == "adamic_adar_index":
+            with np.errstate(divide="ignore"):
+                weight = np.where(self._degree > 1, 1 / np.log(self._degree), 0)
+        else:
+            weight = None
+        self._W = A if weight is None else (A @ sp.diags(weight)).tocsr()
+
+    def scores(self, ebunch, index=False, chunk_size=65536):
+        """Returns the scores of an array of node pairs.
+
+        See :func:`link_prediction_scores` for the parameters.
+        """
+        import numpy as np
+
+        if index:
+            pairs = np.asarray(ebunch, dtype=np.intp).reshape(-1, 2)
+        else:
+            pairs = self._pair_indices(ebunch).reshape(-1, 2)
+        scores = np.empty(len(pairs))
+        for start in range(0, len(pairs), chunk_size):
+            chunk = pairs[start : start + chunk_size]
+            scores[start : start + chunk_size] = self._pair_scores(
+                chunk[:, 0], chunk[:, 1]
+            )
+        return scores
+
+    def top_k(self, k, nodes=None, batch_size=1024):
+        """Returns the `k` highest scoring non-edges of each node.
+
+        See :func:`link_prediction_top_k` for the parameters and the
+        returned arrays.
+        """
+        import numpy as np
+
+        A = self._A
+        degree = self._degree
+        if nodes is None:
+            rows = np.arange(len(self.nodelist), dtype=np.intp)
+        else:
+            rows = self._pair_indices((u, u) for u in nodes)[:, 0]
+
+        results = []
+        if self.method == "preferential_attachment":
+            order = np.argsort(-degree, kind="stable")
+            for u in rows:
+                excluded = np.append(A.indices[A.indptr[u] : A.indptr[u + 1]], u)
+                candidates = order[: k + len(excluded)]
+                candidates = candidates[~np.isin(candidates, excluded)][:k]
+                scores = (degree[u] * degree[candidates]).astype(float)
+                candidates = candidates[scores > 0]
+                results.append(
+                    (np.full(len(candidates), u), candidates, scores[scores > 0])
+                )
+        else:
+            for start in range(0, len(rows), batch_size):
+                block = rows[start : start + batch_size]
+                S = (self._W[block] @ A).tocoo()
+                u = block[S.row]
+                v = S.col
+                # drop the node itself and its neighbors
+                keep = (u != v) & ~self._adjacent(u, v)
+                u, v, row, scores = u[keep], v[keep], S.row[keep], S.data[keep]
+                if self.method == "jaccard_coefficient":
+                    cn = np.asarray(A[u].multiply(A[v]).sum(axis=1)).ravel()
+                    scores = self._jaccard(u, v, cn)
+                # sort by row, then decreasing score, and keep the first k
+                # per row
+                perm = np.lexsort((v, -scores, row))
+                u, v, row, scores = u[perm], v[perm], row[perm], scores[perm]
+                rank = np.arange(len(row)) - np.searchsorted(row, row)
+                keep = (rank < k) & (scores > 0)
+                results.append((u[keep], v[keep], scores[keep]))
+        if not results:
+            empty = np.array([], dtype=np.intp)
+            return empty, empty.copy(), np.array([])
+        u, v, scores = (np.concatenate(x) for x in zip(*results))
+        return u.astype(np.intp), v.astype(np.intp), scores.astype(float)
+
+    def _pair_indices(self, ebunch):
+        import numpy as np
+
+        index = self._index
+        try:
+            return np.array([(index[u], index[v]) for u, v in ebunch], dtype=np.intp)
+        except KeyError as e:
+            raise nx.NodeNotFound(f"Node {e.args[0]} is not in G") from e
+
+    def _adjacent(self, u, v):
+        import numpy as np
+
+        if len(u) == 0:
+            return np.zeros(0, dtype=bool)
+        return np.asarray(self._A[u, v]).ravel() != 0
+
+    def _pair_scores(self, u, v):
+        import numpy as np
+
+        if self.method == "preferential_attachment":
+            return (self._degree[u] * self._degree[v]).astype(float)
+        cn = np.asarray(self._A[u].multiply(self._W[v]).sum(axis=1)).ravel()
+        if self.method != "jaccard_coefficient":
+            return cn
+        return self._jaccard(u, v, cn)
+
+    def _jaccard(self, u, v, cn):
+        import numpy as np
+
+        # the union counts u and v themselves if they are neighbors
+        # of a self-loop node
+        inter = cn
+        if self._loops.any():
+            inter = cn + self._adjacent(u, v) * (
+                self._loops[u].astype(int) + self._loops[v]
+            )
+        union = self._num_nbrs[u] + self._num_nbrs[v] - inter
+        return np.divide(cn, union, out=np.zeros(len(cn)), where=union > 0)
+
+
+@not_implemented_for("directed")
+@not_implemented_for("multigraph")
+def link_prediction_scores(
+    G,
+    ebunch,
+    method="jaccard_coefficient",
+    nodelist=None,
+    index=False,
+    chunk_size=65536,
+):
+    """Compute link prediction scores for an array of node pairs.
+
+    This computes the same scores as :func:`resource_allocation_index`,
+    :func:`jaccard_coefficient`, :func:`adamic_adar_index` and
+    :func:`preferential_attachment`, but for many pairs at once. Degree
+    and weight vectors are computed once, and common neighbors are found
+    by intersecting the rows of the sparse adjacency matrix, one chunk of
+    pairs at a time.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX undirected graph.
+
+    ebunch : iterable of node pairs or array of shape (k, 2)
+        The pairs of nodes to score.
+
+    method : string, optional (default="jaccard_coefficient")
+        One of "resource_allocation_index", "jaccard_coefficient",
+        "adamic_adar_index" or "preferential_attachment".
+
+    nodelist : list, optional
+        The order of the nodes used when `index` is True.
+        If None, the ordering is produced by G.nodes().
+
+    index : bool, optional (default=False)
+        If True, `ebunch` is an integer array of positions in `nodelist`
+        instead of nodes. This avoids converting every node to its
+        position and is the fastest way to score large candidate sets.
+
+    chunk_size : int, optional (default=65536)
+        Number of pairs scored together. Memory use is proportional to
+        `chunk_size` times the average degree.
+
+    Returns
+    -------
+    scores : NumPy array
+        The score of each pair, in the order of `ebunch`.
+
+    Raises
+    ------
+    ValueError
+        If `method` is unknown.
+
+    NodeNotFound
+        If a node of `ebunch` is not in `G` (or in `nodelist`).
+
+    Examples
+    --------
+    >>> G = nx.complete_graph(5)
+    >>> nx.link_prediction_scores(G, [(0, 1), (2, 3)])
+    array([0.6, 0.6])
+    >>> nx.link_prediction_scores(G, [[0, 1]], "resource_allocation_index", index=True)
+    array([0.75])
+
+    See Also
+    --------
+    link_prediction_top_k, LinkPredictionScorer
+    """
+    scorer = LinkPredictionScorer(G, method, nodelist)
+    return scorer.scores(ebunch, index=index, chunk_size=chunk_size)
+
+
+@not_implemented_for("directed")
+@not_implemented_for("multigraph")
+def link_prediction_top_k(
+    G,
+    k,
+    method="jaccard_coefficient",
+    nodes=None,
+    nodelist=None,
+    batch_size=1024,
+):
+    """Find the `k` highest scoring non-edges of each node.
+
+    Candidates are generated without enumerating all non-edges of `G`.
+    For the scores based on common neighbors, only pairs of nodes at
+    distance two can have a positive score, so the candidates of a batch
+    of nodes are read off a sparse product of the adjacency matrix with
+    itself. For preferential attachment, the candidates are the nodes of
+    highest degree.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX undirected graph.
+
+    k : int
+        The maximum number of candidates per node.
+
+    method : string, optional (default="jaccard_coefficient")
+        One of "resource_allocation_index", "jaccard_coefficient",
+        "adamic_adar_index" or "preferential_attachment".
+
+    nodes : iterable of nodes, optional
+        The nodes to find candidates for. If None, all nodes of `G`.
+
+    nodelist : list, optional
+        The order of the nodes that the returned positions refer to.
+        If None, the ordering is produced by G.nodes().
+
+    batch_size : int, optional (default=1024)
+        Number of nodes processed together.
+
+    Returns
+    -------
+    u, v, scores : NumPy arrays
+        Positions in `nodelist` of the pairs `(u, v)` and their scores.
+        Pairs are grouped by `u`, following the order of `nodes`, and
+        sorted by decreasing score. Pairs with a score of zero and
+        existing edges are never returned.
+
+    Raises
+    ------
+    ValueError
+        If `method` is unknown.
+
+    NodeNotFound
+        If a node of `nodes` is not in `G` (or in `nodelist`).
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> u, v, scores = nx.link_prediction_top_k(G, 1, "resource_allocation_index")
+    >>> [(int(a), int(b)) for a, b in zip(u, v)]
+    [(0, 2), (1, 3), (2, 0), (3, 1)]
+    >>> scores
+    array([0.5, 0.5, 0.5, 0.5])
+
+    See Also
+    --------
+    link_prediction_scores, LinkPredictionScorer
+    """
+    scorer = LinkPredictionScorer(G, method, nodelist)
+    return scorer.top_k(k, nodes=nodes, batch_size=batch_size)
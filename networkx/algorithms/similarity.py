@@ -20,14 +20,20 @@ from operator import mul
 import time
 import warnings
 import networkx as nx
+from networkx.utils import not_implemented_for, py_random_state, random_state
 
 __all__ = [
     "graph_edit_distance",
     "optimal_edit_paths",
     "optimize_graph_edit_distance",
     "optimize_edit_paths",
+    "graph_edit_distance_bounds",
     "simrank_similarity",
     "simrank_similarity_numpy",
+    "simrank_similarity_sparse",
+    "simrank_similarity_sparse_batch",
+    "simrank_similarity_monte_carlo",
+    "SimRankIndex",
     "panther_similarity",
     "generate_random_paths",
 ]
@@ -781,9 +787,8 @@ def optimize_edit_paths(
                             for p, q in matched_uv
                         ):
                             continue
-                    if g == (u, u):
-                        continue
-                    if h == (v, v):
+                    # a self-loop can only be substituted by a self-loop
+                    if g == (u, u) and h == (v, v):
                         continue
                     C[k, l] = inf
 
@@ -1182,9 +1187,31 @@ def optimize_edit_paths(
     # Now go!
 
     done_uv = [] if roots is None else [roots]
+    done_gh = []
+    if roots:
+        # the self-loops of the roots are matched with the roots
+        xy, localCe = match_edges(root_u, root_v, pending_g, pending_h, Ce)
+        Ce = reduce_Ce(Ce, xy, len(pending_g), len(pending_h))
+        initial_cost += localCe.ls
+        done_x = {x for x, y in xy}
+        done_y = {y for x, y in xy}
+        for x, y in xy:
+            g = pending_g[x] if x < len(pending_g) else None
+            h = pending_h[y] if y < len(pending_h) else None
+            done_gh.append((g, h))
+        pending_g = [g for x, g in enumerate(pending_g) if x not in done_x]
+        pending_h = [h for y, h in enumerate(pending_h) if y not in done_y]
 
     for vertex_path, edge_path, cost in get_edit_paths(
-        done_uv, pending_u, pending_v, Cv, [], pending_g, pending_h, Ce, initial_cost
+        done_uv,
+        pending_u,
+        pending_v,
+        Cv,
+        done_gh,
+        pending_g,
+        pending_h,
+        Ce,
+        initial_cost,
     ):
         # assert sorted(G1.nodes) == sorted(u for u, v in vertex_path if u is not None)
         # assert sorted(G2.nodes) == sorted(v for u, v in vertex_path if v is not None)
@@ -1195,6 +1222,495 @@ def optimize_edit_paths(
         yield list(vertex_path), list(edge_path), cost
 
 
+def _edit_cost_functions(
+    node_match,
+    edge_match,
+    node_subst_cost,
+    node_del_cost,
+    node_ins_cost,
+    edge_subst_cost,
+    edge_del_cost,
+    edge_ins_cost,
+):
+    """Returns the six edit cost functions with the GED defaults filled in."""
+
+    def unit(d):
+        return 1
+
+    def zero(d1, d2):
+        return 0
+
+    def from_match(match):
+        def cost(d1, d2):
+            return 1 - int(match(d1, d2))
+
+        return cost
+
+    if node_subst_cost is None:
+        node_subst_cost = zero if node_match is None else from_match(node_match)
+    if edge_subst_cost is None:
+        edge_subst_cost = zero if edge_match is None else from_match(edge_match)
+    return (
+        node_subst_cost,
+        node_del_cost or unit,
+        node_ins_cost or unit,
+        edge_subst_cost,
+        edge_del_cost or unit,
+        edge_ins_cost or unit,
+    )
+
+
+def _assignment_cost_matrix(items1, items2, subst, delete, insert):
+    """Returns the square (m + n) cost matrix of an edit assignment.
+
+    Rows are the m items of the first graph followed by n insertion slots,
+    columns are the n items of the second graph followed by m deletion slots.
+    """
+    import numpy as np
+
+    m = len(items1)
+    n = len(items2)
+    C = np.zeros((m + n, m + n))
+    if m and n:
+        C[:m, :n] = [[subst(a, b) for b in items2] for a in items1]
+    del_costs = [delete(a) for a in items1]
+    ins_costs = [insert(b) for b in items2]
+    inf = C[:m, :n].sum() + sum(del_costs) + sum(ins_costs) + 1
+    C[:m, n:] = inf
+    C[m:, :n] = inf
+    C[range(m), range(n, n + m)] = del_costs
+    C[range(m, m + n), range(n)] = ins_costs
+    return C
+
+
+def _assignment_bound(items1, items2, subst, delete, insert):
+    """Returns the cost of the optimal edit assignment of two item lists."""
+    from scipy.optimize import linear_sum_assignment
+
+    C = _assignment_cost_matrix(items1, items2, subst, delete, insert)
+    row_ind, col_ind = linear_sum_assignment(C)
+    return float(C[row_ind, col_ind].sum())
+
+
+def _node_bound(G1, G2, costs):
+    nsubst, ndel, nins = costs[:3]
+    return _assignment_bound(
+        list(G1.nodes.values()), list(G2.nodes.values()), nsubst, ndel, nins
+    )
+
+
+def _edge_bound(G1, G2, costs):
+    esubst, edel, eins = costs[3:]
+    return _assignment_bound(
+        [d for u, v, d in G1.edges(data=True)],
+        [d for u, v, d in G2.edges(data=True)],
+        esubst,
+        edel,
+        eins,
+    )
+
+
+def _incident_edges(G, u):
+    """Yields (nbr, out, data) for the edges incident to u.
+
+    For directed graphs `out` tells if the edge is (u, nbr) or (nbr, u).
+    Self-loops are yielded once.
+    """
+    if G.is_directed():
+        for v, d in G._succ[u].items():
+            yield v, True, d
+        for v, d in G._pred[u].items():
+            if v != u:
+                yield v, False, d
+    else:
+        for v, d in G._adj[u].items():
+            yield v, True, d
+
+
+def _edge_data(G, u, v, out):
+    """Returns the data of edge (u, v) if `out` else (v, u), or None."""
+    if out:
+        return G._adj[u].get(v)
+    return G._adj[v].get(u)
+
+
+def _mapping_cost(G1, G2, mapping, costs):
+    """Returns the cost of the edit path induced by a node mapping.
+
+    `mapping` maps every node of G1 to a node of G2 or to None (deletion).
+    Nodes of G2 that are not mapped to are inserted. Edge edits follow
+    from the node mapping.
+    """
+    nsubst, ndel, nins, esubst, edel, eins = costs
+    cost = 0.0
+    for u, v in mapping.items():
+        if v is None:
+            cost += ndel(G1.nodes[u])
+        else:
+            cost += nsubst(G1.nodes[u], G2.nodes[v])
+    mapped = set(mapping.values())
+    cost += sum(nins(d) for v, d in G2.nodes(data=True) if v not in mapped)
+
+    matched = 0
+    for u1, u2, d in G1.edges(data=True):
+        v1 = mapping[u1]
+        v2 = mapping[u2]
+        if v1 is not None and v2 is not None and G2.has_edge(v1, v2):
+            cost += esubst(d, G2[v1][v2])
+            matched += 1
+        else:
+            cost += edel(d)
+    if matched < G2.number_of_edges():
+        inverse = {v: u for u, v in mapping.items() if v is not None}
+        for v1, v2, d in G2.edges(data=True):
+            u1 = inverse.get(v1)
+            u2 = inverse.get(v2)
+            if u1 is None or u2 is None or not G1.has_edge(u1, u2):
+                cost += eins(d)
+    return cost
+
+
+def _bipartite_mapping(G1, G2, costs):
+    """Returns a node mapping from the bipartite GED heuristic.
+
+    Each node substitution is priced together with the optimal assignment
+    of the edges incident to both nodes ("stars"), and a single linear
+    sum assignment of this matrix yields the node mapping [1]_.
+
+    References
+    ----------
+    .. [1] Kaspar Riesen and Horst Bunke. Approximate graph edit distance
+       computation by means of bipartite graph matching.
+       Image and Vision Computing 27(7), 950-959, 2009.
+    """
+    from scipy.optimize import linear_sum_assignment
+
+    nsubst, ndel, nins, esubst, edel, eins = costs
+    nodes1 = list(G1)
+    nodes2 = list(G2)
+    stars1 = [[d for v, out, d in _incident_edges(G1, u)] for u in nodes1]
+    stars2 = [[d for v, out, d in _incident_edges(G2, u)] for u in nodes2]
+
+    def subst(i, j):
+        star_cost = _assignment_bound(stars1[i], stars2[j], esubst, edel, eins)
+        return nsubst(G1.nodes[nodes1[i]], G2.nodes[nodes2[j]]) + star_cost
+
+    def delete(i):
+        return ndel(G1.nodes[nodes1[i]]) + sum(edel(d) for d in stars1[i])
+
+    def insert(j):
+        return nins(G2.nodes[nodes2[j]]) + sum(eins(d) for d in stars2[j])
+
+    m = len(nodes1)
+    n = len(nodes2)
+    C = _assignment_cost_matrix(range(m), range(n), subst, delete, insert)
+    row_ind, col_ind = linear_sum_assignment(C)
+    mapping = {}
+    for i, j in zip(row_ind, col_ind):
+        if i < m:
+            mapping[nodes1[i]] = nodes2[j] if j < n else None
+    return mapping
+
+
+def _beam_search_mapping(G1, G2, costs, beam_width, deadline=None):
+    """Returns the best node mapping found by beam search.
+
+    Nodes of G1 are assigned in order of decreasing degree. Partial
+    mappings are scored by the cost of the edits among assigned nodes
+    and only the `beam_width` cheapest partial mappings are extended.
+
+    Returns None if the (wall clock) deadline passes before the search
+    completes a mapping.
+    """
+    nsubst, ndel, nins, esubst, edel, eins = costs
+    order = sorted(G1, key=G1.degree, reverse=True)
+    nodes2 = list(G2)
+
+    def extension_cost(mapping, inverse, u, v):
+        if v is None:
+            cost = ndel(G1.nodes[u])
+        else:
+            cost = nsubst(G1.nodes[u], G2.nodes[v])
+        for w, out, d in _incident_edges(G1, u):
+            if w == u:
+                x = v
+            elif w in mapping:
+                x = mapping[w]
+            else:
+                continue
+            d2 = None if v is None or x is None else _edge_data(G2, v, x, out)
+            cost += edel(d) if d2 is None else esubst(d, d2)
+        if v is not None:
+            for x, out, d in _incident_edges(G2, v):
+                w = u if x == v else inverse.get(x)
+                if w is not None and _edge_data(G1, u, w, out) is None:
+                    cost += eins(d)
+        return cost
+
+    beam = [(0, {}, {})]
+    for u in order:
+        candidates = []
+        for cost, mapping, inverse in beam:
+            if deadline is not None and time.time() >= deadline:
+                return None
+            for v in nodes2:
+                if v not in inverse:
+                    c = cost + extension_cost(mapping, inverse, u, v)
+                    candidates.append((c, mapping, inverse, v))
+            c = cost + extension_cost(mapping, inverse, u, None)
+            candidates.append((c, mapping, inverse, None))
+        candidates.sort(key=lambda t: t[0])
+        beam = []
+        for c, mapping, inverse, v in candidates[:beam_width]:
+            mapping = {**mapping, u: v}
+            if v is not None:
+                inverse = {**inverse, v: u}
+            beam.append((c, mapping, inverse))
+    return min((m for c, m, i in beam), key=lambda m: _mapping_cost(G1, G2, m, costs))
+
+
+def _ged_branch(args):
+    """Solves one top-level branch of the exact GED search.
+
+    The branch either substitutes the branching node u of G1 with node v
+    of G2 (as roots of `optimize_edit_paths`), or deletes u together
+    with its incident edges when v is None.
+
+    Returns a tuple (lower, upper, optimal) of bounds on the best edit
+    path within the branch. `upper` is None if no path within the
+    initial upper bound was found before the (wall clock) deadline.
+    """
+    G1, G2, u, v, cost_args, upper_bound, deadline = args
+    costs = _edit_cost_functions(*cost_args)
+    nsubst, ndel, nins, esubst, edel, eins = costs
+    if v is None:
+        fixed = ndel(G1.nodes[u]) + sum(edel(d) for w, out, d in _incident_edges(G1, u))
+        G1 = G1.copy()
+        G1.remove_node(u)
+        roots = None
+        lower = fixed + _node_bound(G1, G2, costs) + _edge_bound(G1, G2, costs)
+    else:
+        fixed = 0
+        roots = (u, v)
+        # every edit path of the branch pays for the root substitution, an
+        # assignment of the remaining nodes and an assignment of all edges
+        lower = (
+            nsubst(G1.nodes[u], G2.nodes[v])
+            + _node_bound(G1.subgraph(set(G1) - {u}), G2.subgraph(set(G2) - {v}), costs)
+            + _edge_bound(G1, G2, costs)
+        )
+
+    if lower > upper_bound:
+        return lower, None, True
+    timeout = None
+    if deadline is not None:
+        timeout = deadline - time.time()
+        if timeout <= 0:
+            return lower, None, False
+    start = time.perf_counter()
+    best = None
+    for vertex_path, edge_path, cost in optimize_edit_paths(
+        G1,
+        G2,
+        *cost_args,
+        upper_bound=upper_bound - fixed,
+        roots=roots,
+        timeout=timeout,
+    ):
+        best = fixed + float(cost)
+    optimal = timeout is None or time.perf_counter() - start < timeout
+    if optimal:
+        lower = upper_bound if best is None else best
+    return lower, best, optimal
+
+
+@not_implemented_for("multigraph")
+def graph_edit_distance_bounds(
+    G1,
+    G2,
+    node_match=None,
+    edge_match=None,
+    node_subst_cost=None,
+    node_del_cost=None,
+    node_ins_cost=None,
+    edge_subst_cost=None,
+    edge_del_cost=None,
+    edge_ins_cost=None,
+    method="exact",
+    beam_width=10,
+    timeout=None,
+    processes=None,
+):
+    """Generates improving lower and upper bounds on the GED of G1 and G2.
+
+    This is an anytime interface to graph edit distance: the bounds are
+    yielded as soon as they improve, so the caller can stop iterating (or
+    set `timeout`) and keep the best bounds found so far. The last pair
+    yielded has equal lower and upper bounds if and only if the graph edit
+    distance has been proven.
+
+    The first pair is always available quickly. The lower bound is the sum
+    of the optimal assignments of nodes and of edges, and the upper bound
+    is the cost of the edit path found by the bipartite heuristic [1]_.
+
+    Parameters
+    ----------
+    G1, G2: graphs
+        The two graphs G1 and G2 must be of the same type.
+
+    node_match, edge_match : callable
+        See :func:`graph_edit_distance`.
+
+    node_subst_cost, node_del_cost, node_ins_cost : callable
+        See :func:`graph_edit_distance`.
+
+    edge_subst_cost, edge_del_cost, edge_ins_cost : callable
+        See :func:`graph_edit_distance`.
+
+    method : string, optional (default="exact")
+        How to improve on the initial bounds.
+
+        - "bipartite": stop after the bipartite approximation.
+        - "beam": try to improve the upper bound with a beam search over
+          node mappings that keeps `beam_width` partial mappings.
+        - "exact": after the beam search, run the branch-and-bound search
+          of :func:`optimize_edit_paths` pruned by the best upper bound.
+
+    beam_width : int, optional (default=10)
+        Number of partial node mappings kept by the beam search.
+
+    timeout : numeric, optional (default=None)
+        Maximum number of seconds to execute.
+        After timeout is met, no further bounds are generated.
+
+    processes : int, optional (default=None)
+        Number of worker processes used by the "exact" method. If None,
+        the search runs in the current process. Otherwise, the top-level
+        branches of the search (the choices for the node of highest
+        degree in G1) are explored in parallel by a pool of `processes`
+        workers. The cost functions must then be picklable, so lambdas
+        cannot be used.
+
+    Yields
+    ------
+    lower, upper : numeric
+        Lower and upper bound on the graph edit distance.
+        Each pair improves at least one of the previous bounds.
+
+    Raises
+    ------
+    ValueError
+        If `method` is not one of "bipartite", "beam" or "exact".
+
+    NetworkXError
+        If `timeout` is not positive.
+
+    Examples
+    --------
+    >>> G1 = nx.cycle_graph(6)
+    >>> G2 = nx.wheel_graph(7)
+    >>> for lower, upper in nx.graph_edit_distance_bounds(G1, G2):
+    ...     pass
+    >>> lower, upper
+    (7.0, 7.0)
+
+    The bipartite approximation alone is much faster on large graphs but
+    does not prove optimality.
+
+    >>> bounds = nx.graph_edit_distance_bounds(G1, G2, method="bipartite")
+    >>> lower, upper = next(bounds)
+    >>> lower <= 7 <= upper
+    True
+
+    See Also
+    --------
+    graph_edit_distance, optimize_graph_edit_distance
+
+    References
+    ----------
+    .. [1] Kaspar Riesen and Horst Bunke. Approximate graph edit distance
+       computation by means of bipartite graph matching.
+       Image and Vision Computing 27(7), 950-959, 2009.
+    .. [2] Kaspar Riesen, Stefan Fankhauser and Horst Bunke. Speeding up
+       graph edit distance computation with a bipartite heuristic.
+       Mining and Learning with Graphs, 2007.
+    """
+    if method not in ("bipartite", "beam", "exact"):
+        raise ValueError(f"Unknown method {method}")
+    deadline = None
+    if timeout is not None:
+        if timeout <= 0:
+            raise nx.NetworkXError("Timeout value must be greater than 0")
+        deadline = time.time() + timeout
+
+    cost_args = (
+        node_match,
+        edge_match,
+        node_subst_cost,
+        node_del_cost,
+        node_ins_cost,
+        edge_subst_cost,
+        edge_del_cost,
+        edge_ins_cost,
+    )
+    costs = _edit_cost_functions(*cost_args)
+    lower = _node_bound(G1, G2, costs) + _edge_bound(G1, G2, costs)
+    upper = _mapping_cost(G1, G2, _bipartite_mapping(G1, G2, costs), costs)
+    yield lower, upper
+    if lower >= upper or method == "bipartite":
+        return
+    if deadline is not None and time.time() >= deadline:
+        return
+
+    mapping = _beam_search_mapping(G1, G2, costs, beam_width, deadline)
+    if mapping is None:
+        return
+    beam_upper = _mapping_cost(G1, G2, mapping, costs)
+    if beam_upper < upper:
+        upper = beam_upper
+        yield lower, upper
+    if lower >= upper or method == "beam":
+        return
+
+    if processes is None or len(G1) == 0:
+        remaining = None if deadline is None else deadline - time.time()
+        if remaining is not None and remaining <= 0:
+            return
+        start = time.perf_counter()
+        for vertex_path, edge_path, cost in optimize_edit_paths(
+            G1, G2, *cost_args, upper_bound=upper, timeout=remaining
+        ):
+            if cost < upper:
+                upper = float(cost)
+                yield lower, upper
+        if remaining is None or time.perf_counter() - start < remaining:
+            yield upper, upper
+        return
+
+    from multiprocessing import Pool
+
+    u = max(G1, key=G1.degree)
+    branches = [(G1, G2, u, v, cost_args, upper, deadline) for v in [*G2.nodes, None]]
+    branch_lowers = []
+    with Pool(processes) as pool:
+        for branch_lower, branch_upper, optimal in pool.imap_unordered(
+            _ged_branch, branches
+        ):
+            branch_lowers.append(branch_lower)
+            new_lower = lower
+            if len(branch_lowers) == len(branches):
+                new_lower = max(lower, min(branch_lowers))
+            new_upper = upper
+            if branch_upper is not None:
+                new_upper = min(upper, branch_upper)
+            if new_lower > lower or new_upper < upper:
+                lower = min(new_lower, new_upper)
+                upper = new_upper
+                yield lower, upper
+            if lower >= upper:
+                return
+
+
 def _is_close(d1, d2, atolerance=0, rtolerance=0):
     """Determines whether two adjacency matrices are within
     a provided tolerance.
@@ -1449,6 +1965,631 @@ def simrank_similarity_numpy(
     return newsim
 
 
+def _simrank_transition_matrix(G, nodelist):
+    """Returns the column normalized in-adjacency matrix used by SimRank.
+
+    Column `j` holds ``1 / |In(j)|`` at the rows of the in-neighbors of
+    node `j`, so multiplying it with a distribution over nodes moves every
+    walker one step to a uniformly random in-neighbor.
+    """
+    import numpy as np
+    import scipy.sparse as sp
+
+    A = nx.to_scipy_sparse_matrix(
+        G, nodelist=nodelist, weight=None, dtype=float, format="csc"
+    )
+    in_degree = np.asarray(A.sum(axis=0)).ravel()
+    in_degree[in_degree == 0] = 1
+    return (A @ sp.diags(1 / in_degree)).tocsr()
+
+
+def _simrank_diagonal(WT, c, num_terms, sample_size, seed, iterations=10):
+    """Estimates the diagonal correction `D` of linearized SimRank.
+
+    `D` solves ``a @ D = 1`` where ``a[k, j] = sum_t c^t P_t(k, j)`` and
+    ``P_t(k, j)`` is the probability that two independent reverse random
+    walks from `k` are both at `j` after `t` steps. As in [1]_, `a` is
+    estimated from ``sample_size`` pairs of walks per node, and the system
+    is solved with a few damped Jacobi iterations starting from
+    ``(1 - c) * I``, the usual approximation of `D`.
+
+    ``WT`` is the transpose of the transition matrix in CSR format, so row
+    `k` holds the in-neighbors of node `k`.
+    """
+    import numpy as np
+    import scipy.sparse as sp
+
+    n = WT.shape[0]
+    indptr, indices = WT.indptr, WT.indices
+    degree = np.diff(indptr)
+    rows, cols, data = [np.arange(n)], [np.arange(n)], [np.ones(n)]
+    # walks of a block of nodes advance together, bounding memory
+    block = max(1, 2 ** 20 // max(1, sample_size))
+    for first in range(0, n, block):
+        owner = np.repeat(np.arange(first, min(n, first + block)), sample_size)
+        walks = np.stack([owner, owner])
+        weight = c / sample_size
+        for _ in range(num_terms - 1):
+            alive = (degree[walks] > 0).all(axis=0)
+            if not alive.all():
+                owner, walks = owner[alive], walks[:, alive]
+            if not owner.size:
+                break
+            offset = (seed.random_sample(walks.shape) * degree[walks]).astype(int)
+            walks = indices[indptr[walks] + offset]
+            met = walks[0] == walks[1]
+            rows.append(owner[met])
+            cols.append(walks[0, met])
+            data.append(np.full(met.sum(), weight))
+            weight *= c
+    a = sp.csr_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(n, n),
+    )
+    a_kk = a.diagonal()
+    D = np.full(n, 1 - c)
+    # plain Jacobi oscillates on bipartite graphs, so steps are halved
+    for _ in range(iterations):
+        D += 0.5 * (1 - a @ D) / a_kk
+    return D
+
+
+def _simrank_series(W, WT, D, x, c, num_terms):
+    """Returns ``sum_t c^t (W^T)^t D W^t x`` for the n x b matrix `x`.
+
+    The series is evaluated with the Horner scheme, which consumes the walk
+    vectors ``W^t x`` in reverse order. Instead of keeping all of them,
+    only every `step`-th is stored and the segments in between are
+    recomputed, so about ``2 * sqrt(num_terms)`` vectors are held at once.
+    Vectors stay sparse while walks only reached few nodes.
+    """
+    import numpy as np
+    import scipy.sparse as sp
+
+    def walk(y):
+        y = W @ y
+        if sp.issparse(y) and y.nnz > y.shape[0] * y.shape[1] // 8:
+            y = y.toarray()
+        return y
+
+    step = max(1, int(math.sqrt(num_terms)))
+    checkpoints = [x]
+    for t in range(1, num_terms):
+        x = walk(x)
+        if t % step == 0:
+            checkpoints.append(x)
+    scores = np.zeros(x.shape)
+    for i in reversed(range(len(checkpoints))):
+        segment = [checkpoints.pop()]
+        for _ in range(min(step, num_terms - i * step) - 1):
+            segment.append(walk(segment[-1]))
+        for y in reversed(segment):
+            if sp.issparse(y):
+                y = y.toarray()
+            scores = D[:, None] * y + c * (WT @ scores)
+    return scores
+
+
+def _simrank_result(nodelist, scores, i, k):
+    """Returns the similarity dict of node `nodelist[i]`.
+
+    If `k` is not None, only the `k` most similar nodes other than the
+    source itself are returned, in decreasing order of similarity.
+    """
+    import numpy as np
+
+    if k is None:
+        result = dict(zip(nodelist, scores.tolist()))
+        result[nodelist[i]] = 1.0
+        return result
+    k = min(k, len(nodelist) - 1)
+    if k <= 0:
+        return {}
+    scores = scores.copy()
+    scores[i] = -np.inf
+    top_k = np.argpartition(scores, -k)[-k:]
+    top_k = top_k[np.argsort(scores[top_k])[::-1]]
+    return {nodelist[j]: float(scores[j]) for j in top_k}
+
+
+class SimRankIndex:
+    """Answers repeated approximate SimRank queries on a fixed graph.
+
+    The transition matrix of `G` and the diagonal correction `D` of the
+    linearized SimRank formulation (see :func:`simrank_similarity_sparse`)
+    are computed once, when the index is created. Each query then costs
+    about ``3 * max_iterations`` sparse matrix-vector products, which makes
+    the index suitable for online lookups of single nodes. Changes made to
+    `G` afterwards are not seen by the index.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        A NetworkX graph
+
+    importance_factor : float
+        The relative importance of indirect neighbors with respect to
+        direct neighbors.
+
+    max_iterations : integer
+        Maximum number of terms of the series.
+
+    tolerance : float
+        The series is truncated once ``importance_factor ** t`` is below
+        this value.
+
+    sample_size : integer or None, optional (default=100)
+        The number of pairs of random walks per node used to estimate `D`.
+        If None, `D` is approximated by ``(1 - importance_factor) * I``,
+        which is free to compute but biases similarities down.
+
+    diagonal : array_like, optional (default=None)
+        A precomputed diagonal correction, one value per node in the order
+        of ``G.nodes``, such as the :attr:`diagonal` of another index of
+        `G`. If given, `sample_size` and `seed` are ignored.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Attributes
+    ----------
+    nodelist : list
+        The nodes of `G`, in the order of ``G.nodes``.
+
+    diagonal : NumPy array
+        The diagonal correction of each node of `nodelist`.
+
+    Raises
+    ------
+    NetworkXError
+        If `diagonal` does not hold one value per node.
+
+    Examples
+    --------
+    >>> G = nx.cycle_graph(6)
+    >>> index = nx.SimRankIndex(G, seed=42)
+    >>> sorted(index.similarity(0, k=2))
+    [2, 4]
+    >>> sim = nx.simrank_similarity_sparse(G, 3, diagonal=index.diagonal)
+    >>> sim == index.similarity(3)
+    True
+
+    See Also
+    --------
+    simrank_similarity_sparse
+    simrank_similarity_sparse_batch
+    """
+
+    @random_state(7)
+    def __init__(
+        self,
+        G,
+        importance_factor=0.9,
+        max_iterations=40,
+        tolerance=1e-4,
+        sample_size=100,
+        diagonal=None,
+        seed=None,
+    ):
+        import numpy as np
+
+        c = self.importance_factor = importance_factor
+        num_terms = max_iterations
+        if 0 < c < 1 and tolerance > 0:
+            num_terms = min(num_terms, max(1, math.ceil(math.log(tolerance, c))))
+        self._num_terms = num_terms
+        self.nodelist = list(G)
+        self._index = {u: i for i, u in enumerate(self.nodelist)}
+        self._W = _simrank_transition_matrix(G, self.nodelist)
+        self._WT = self._W.T.tocsr()
+        n = len(self.nodelist)
+        if diagonal is not None:
+            diagonal = np.array(diagonal, dtype=float).ravel()
+            if diagonal.shape != (n,):
+                raise nx.NetworkXError(
+                    f"diagonal has {diagonal.size} values, expected one per node"
+                )
+            self.diagonal = diagonal
+        elif sample_size is None:
+            self.diagonal = np.full(n, 1 - c)
+        else:
+            self.diagonal = _simrank_diagonal(self._WT, c, num_terms, sample_size, seed)
+
+    def similarity(self, source, k=None):
+        """Returns the approximate SimRank similarities of `source`.
+
+        See :func:`simrank_similarity_sparse` for the parameters and the
+        returned dictionary.
+        """
+        return next(self.similarities([source], k))[1]
+
+    def similarities(self, sources, k=None, batch_size=16):
+        """Generates the approximate SimRank similarities of many sources.
+
+        See :func:`simrank_similarity_sparse_batch` for the parameters and
+        the generated pairs.
+        """
+        import scipy.sparse as sp
+
+        nodelist = self.nodelist
+        index = self._index
+        sources = iter(sources)
+        while True:
+            batch = [u for _, u in zip(range(batch_size), sources)]
+            if not batch:
+                return
+            for u in batch:
+                if u not in index:
+                    raise nx.NodeNotFound(f"Source node {u} is not in G")
+            x = sp.csr_matrix(
+                ([1.0] * len(batch), ([index[u] for u in batch], range(len(batch)))),
+                shape=(len(nodelist), len(batch)),
+            )
+            scores = _simrank_series(
+                self._W,
+                self._WT,
+                self.diagonal,
+                x,
+                self.importance_factor,
+                self._num_terms,
+            )
+            for j, u in enumerate(batch):
+                yield u, _simrank_result(nodelist, scores[:, j], index[u], k)
+
+
+def simrank_similarity_sparse(
+    G,
+    source,
+    importance_factor=0.9,
+    max_iterations=40,
+    tolerance=1e-4,
+    k=None,
+    diagonal=None,
+):
+    """Returns approximate SimRank similarities of ``source`` using sparse
+    matrices.
+
+    Unlike :func:`simrank_similarity` and :func:`simrank_similarity_numpy`,
+    this function never computes the similarity of all pairs of nodes. It
+    uses the linearized formulation of SimRank [1]_,
+
+    .. math::
+
+        S = \\sum_{t \\ge 0} c^t (W^T)^t D W^t,
+
+    where `W` is the column normalized adjacency matrix, `c` the importance
+    factor and `D` a diagonal correction matrix chosen so that the diagonal
+    of `S` is one. The column of `S` for ``source`` is obtained with about
+    ``3 * max_iterations`` sparse matrix-vector products, so time and
+    memory are linear in the size of the graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        A NetworkX graph
+
+    source : node
+        The node whose similarities to all other nodes are computed.
+
+    importance_factor : float
+        The relative importance of indirect neighbors with respect to
+        direct neighbors.
+
+    max_iterations : integer
+        Maximum number of terms of the series.
+
+    tolerance : float
+        The series is truncated once ``importance_factor ** t`` is below
+        this value.
+
+    k : integer, optional (default=None)
+        If not None, only the ``k`` nodes most similar to ``source`` are
+        returned (``source`` itself excluded).
+
+    diagonal : array_like, optional (default=None)
+        The diagonal correction `D`, one value per node in the order of
+        ``G.nodes``, usually the ``diagonal`` attribute of a
+        :class:`SimRankIndex` of `G`. If None, `D` is approximated by
+        ``(1 - importance_factor) * I``.
+
+    Returns
+    -------
+    similarity : dictionary
+        Dictionary keyed by node to the similarity of ``source`` and that
+        node. If ``k`` is not None, the dictionary only holds the ``k`` most
+        similar nodes in decreasing order of similarity.
+
+    Raises
+    ------
+    NodeNotFound
+        If ``source`` is not in ``G``.
+
+    NetworkXError
+        If ``diagonal`` does not hold one value per node.
+
+    Examples
+    --------
+    >>> G = nx.cycle_graph(6)
+    >>> sim = nx.simrank_similarity_sparse(G, 0, k=2)
+    >>> sorted(sim)
+    [2, 4]
+
+    Notes
+    -----
+    The result approximates :func:`simrank_similarity` with the same
+    ``importance_factor``. The truncation of the series after
+    ``max_iterations`` terms biases similarities down by up to about
+    ``importance_factor ** max_iterations``. The approximation of `D` by
+    ``(1 - importance_factor) * I`` biases them down further; estimating
+    `D` from random walks [1]_ removes most of this bias, but visits every
+    node of `G`. Estimate it once with :class:`SimRankIndex` and pass its
+    ``diagonal``, or query the index directly, which also keeps the
+    transition matrix between queries.
+
+    See Also
+    --------
+    SimRankIndex
+    simrank_similarity_sparse_batch
+    simrank_similarity_monte_carlo
+
+    References
+    ----------
+    .. [1] M. Kusumoto, T. Maehara and K. Kawarabayashi.
+           "Scalable similarity search for SimRank",
+           In SIGMOD'14: Proceedings of the 2014 ACM SIGMOD International
+           Conference on Management of Data, pp. 325--336. ACM Press, 2014.
+    """
+    index = SimRankIndex(
+        G,
+        importance_factor,
+        max_iterations,
+        tolerance,
+        sample_size=None,
+        diagonal=diagonal,
+    )
+    return index.similarity(source, k)
+
+
+@random_state(9)
+def simrank_similarity_sparse_batch(
+    G,
+    sources,
+    importance_factor=0.9,
+    max_iterations=40,
+    tolerance=1e-4,
+    k=None,
+    batch_size=16,
+    sample_size=100,
+    diagonal=None,
+    seed=None,
+):
+    """Generates approximate SimRank similarities for many source nodes.
+
+    This is the batch version of :func:`simrank_similarity_sparse`. The
+    transition matrix and the diagonal correction are computed once, and
+    sources are processed in blocks of ``batch_size`` so each sparse
+    product serves the whole block.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        A NetworkX graph
+
+    sources : iterable of nodes
+        The nodes whose similarities are computed.
+
+    importance_factor : float
+        The relative importance of indirect neighbors with respect to
+        direct neighbors.
+
+    max_iterations : integer
+        Maximum number of terms of the series.
+
+    tolerance : float
+        The series is truncated once ``importance_factor ** t`` is below
+        this value.
+
+    k : integer, optional (default=None)
+        If not None, only the ``k`` nodes most similar to each source are
+        returned (the source itself excluded).
+
+    batch_size : integer, optional (default=16)
+        Number of sources processed together. At most about
+        ``2 * sqrt(max_iterations) + 1`` arrays of ``len(G) * batch_size``
+        floats are held at once; walk vectors that reached few nodes are
+        kept sparse.
+
+    sample_size : integer or None, optional (default=100)
+        The number of pairs of random walks per node used to estimate the
+        diagonal correction. If None, it is approximated by
+        ``(1 - importance_factor) * I``.
+
+    diagonal : array_like, optional (default=None)
+        A precomputed diagonal correction, as for
+        :func:`simrank_similarity_sparse`. If given, `sample_size` and
+        `seed` are ignored.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Yields
+    ------
+    source, similarity : node, dictionary
+        Each source in input order, with the dictionary that
+        :func:`simrank_similarity_sparse` returns for it.
+
+    Raises
+    ------
+    NodeNotFound
+        If a source is not in ``G``.
+
+    NetworkXError
+        If ``diagonal`` does not hold one value per node.
+
+    Examples
+    --------
+    >>> G = nx.star_graph(3)
+    >>> for source, sim in nx.simrank_similarity_sparse_batch(G, [1, 2], k=1):
+    ...     print(source, len(sim))
+    1 1
+    2 1
+
+    See Also
+    --------
+    SimRankIndex
+    simrank_similarity_sparse
+    """
+    index = SimRankIndex(
+        G, importance_factor, max_iterations, tolerance, sample_size, diagonal, seed
+    )
+    yield from index.similarities(sources, k, batch_size)
+
+
+@py_random_state(6)
+def simrank_similarity_monte_carlo(
+    G,
+    source,
+    importance_factor=0.9,
+    path_length=10,
+    sample_size=1000,
+    k=None,
+    seed=None,
+):
+    """Estimates the SimRank similarities of ``source`` by random walks.
+
+    SimRank ``s(u, v)`` is the expected value of ``c ** tau`` where `c` is
+    the importance factor and `tau` the first step at which two random
+    walks from `u` and `v` following in-edges backwards meet [1]_. Like
+    :func:`generate_random_paths`, this samples ``sample_size`` walks of
+    ``path_length`` steps, but the walks start at ``source`` and are coupled:
+    within a sample, every walker at a node moves to the same random
+    in-neighbor. For each step of the walk from ``source`` the nodes whose
+    walk first meets it at that step are found by probing backwards, so
+    only nodes that can meet the walk are ever visited [2]_.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        A NetworkX graph
+
+    source : node
+        The node whose similarities are estimated.
+
+    importance_factor : float
+        The relative importance of indirect neighbors with respect to
+        direct neighbors.
+
+    path_length : integer (default = 10)
+        The number of steps of each random walk. Meetings after this
+        many steps are ignored.
+
+    sample_size : integer (default = 1000)
+        The number of random walks sampled from ``source``.
+
+    k : integer, optional (default=None)
+        If not None, only the ``k`` nodes most similar to ``source`` are
+        returned (``source`` itself excluded).
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Returns
+    -------
+    similarity : dictionary
+        Dictionary keyed by node to the estimated similarity of ``source``
+        and that node. Nodes whose estimate is zero are omitted. If ``k`` is
+        not None, the dictionary only holds the ``k`` most similar nodes in
+        decreasing order of similarity.
+
+    Raises
+    ------
+    NodeNotFound
+        If ``source`` is not in ``G``.
+
+    Examples
+    --------
+    >>> G = nx.star_graph(3)
+    >>> sim = nx.simrank_similarity_monte_carlo(G, 1, sample_size=100, seed=42)
+    >>> round(sim[2], 3)
+    0.9
+
+    See Also
+    --------
+    simrank_similarity
+    simrank_similarity_sparse
+    generate_random_paths
+
+    References
+    ----------
+    .. [1] D. Fogaras and B. Racz.
+           "Scaling link-based similarity search",
+           In WWW'05: Proceedings of the 14th International Conference
+           on World Wide Web, pp. 641--650. ACM Press, 2005.
+    .. [2] Y. Liu, B. Zheng, X. He, Z. Wei, X. Xiao, K. Zheng and J. Lu.
+           "ProbeSim: Scalable single-source and top-k SimRank computations
+           on dynamic graphs", Proceedings of the VLDB Endowment 11(1),
+           pp. 14--26, 2017.
+    """
+    if source not in G:
+        raise nx.NodeNotFound(f"Source node {source} is not in G")
+    if G.is_directed():
+        pred, succ = G._pred, G._succ
+    else:
+        pred = succ = G._adj
+    in_nbrs = {}
+    scores = {}
+
+    for _ in range(sample_size):
+        # moves[t][x] is the node a walker at x moves to in step t
+        moves = [{} for _ in range(path_length + 1)]
+
+        def move(t, x):
+            try:
+                return moves[t][x]
+            except KeyError:
+                try:
+                    nbrs = in_nbrs[x]
+                except KeyError:
+                    nbrs = in_nbrs[x] = list(pred[x])
+                y = moves[t][x] = seed.choice(nbrs) if nbrs else None
+                return y
+
+        walk = [source]
+        for t in range(1, path_length + 1):
+            y = move(t, walk[-1])
+            if y is None:
+                break
+            walk.append(y)
+
+        for i in range(1, len(walk)):
+            # walkers at time j - 1 that move into `level` at time j and
+            # have not met the walk from source before
+            level = {walk[i]}
+            for j in range(i, 0, -1):
+                level = {
+                    x
+                    for y in level
+                    for x in succ[y]
+                    if x != walk[j - 1] and move(j, x) == y
+                }
+                if not level:
+                    break
+            weight = importance_factor ** i
+            for v in level:
+                scores[v] = scores.get(v, 0) + weight
+
+    scores = {v: s / sample_size for v, s in scores.items()}
+    if k is None:
+        scores[source] = 1.0
+        return scores
+    scores.pop(source, None)
+    top_k = sorted(scores, key=scores.get, reverse=True)[:k]
+    return {v: scores[v] for v in top_k}
+
+
 # TODO replace w/ math.comb(n, k) for Python 3.8+
 def _n_choose_k(n, k):
     """Pure Python implementation of the binomial coefficient
@@ -16,12 +16,49 @@ For more information, see the Wikipedia article on small-world network [1]_.
 """
 import networkx as nx
 from networkx.utils import not_implemented_for
-from networkx.utils import py_random_state
+from networkx.utils import np_random_state
+from networkx.algorithms.swap import _edge_swaps
 
 __all__ = ["random_reference", "lattice_reference", "sigma", "omega"]
 
 
-@py_random_state(3)
+def _edge_arrays(G):
+    """Returns the nodes of `G` and its edges as arrays of node indices."""
+    import numpy as np
+
+    nodes = list(G)
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array(
+        [(index[a], index[b]) for a, b in G.edges()], dtype=np.int64
+    ).reshape(-1, 2)
+    return nodes, edges[:, 0], edges[:, 1]
+
+
+def _swap_counts(G, niter):
+    """Returns the number of swaps and of attempts for `niter` rewirings of
+    each edge, with as many attempts per swap as the average degree."""
+    nnodes = len(G)
+    nedges = nx.number_of_edges(G)
+    ntries = int(nnodes * nedges / (nnodes * (nnodes - 1) / 2))
+    return niter * nedges, niter * nedges * max(ntries, 1)
+
+
+def _swapped_graph(G, nodes, u, v):
+    """Returns a copy of `G` with the edges `u`, `v` given as node indices.
+
+    The attributes of the edges that are also in `G` are kept.
+    """
+    H = G.__class__()
+    H.graph.update(G.graph)
+    H.add_nodes_from(G.nodes(data=True))
+    H.add_edges_from(
+        (nodes[a], nodes[b], G.adj[nodes[a]].get(nodes[b], {}))
+        for a, b in zip(u.tolist(), v.tolist())
+    )
+    return H
+
+
+@np_random_state(3)
 @not_implemented_for("directed")
 @not_implemented_for("multigraph")
 def random_reference(G, niter=1, connectivity=True, seed=None):
@@ -50,7 +87,9 @@ def random_reference(G, niter=1, connectivity=True, seed=None):
     Notes
     -----
     The implementation is adapted from the algorithm by Maslov and Sneppen
-    (2002) [1]_.
+    (2002) [1]_. The edges are swapped in batches, as in
+    :func:`~networkx.algorithms.swap.double_edge_swap_arrays`, and with
+    `connectivity` the swaps that would split the graph are undone.
 
     References
     ----------
@@ -64,59 +103,13 @@ def random_reference(G, niter=1, connectivity=True, seed=None):
     if len(G) < 4:
         raise nx.NetworkXError("Graph has less than four nodes.")
 
-    from networkx.utils import cumulative_distribution, discrete_sequence
+    nodes, u, v = _edge_arrays(G)
+    nswap, max_tries = _swap_counts(G, niter)
+    u, v, _ = _edge_swaps(u, v, len(G), nswap, max_tries, False, connectivity, seed)
+    return _swapped_graph(G, nodes, u, v)
 
-    local_conn = nx.connectivity.local_edge_connectivity
 
-    G = G.copy()
-    keys, degrees = zip(*G.degree())  # keys, degree
-    cdf = cumulative_distribution(degrees)  # cdf of degree
-    nnodes = len(G)
-    nedges = nx.number_of_edges(G)
-    niter = niter * nedges
-    ntries = int(nnodes * nedges / (nnodes * (nnodes - 1) / 2))
-    swapcount = 0
-
-    for i in range(niter):
-        n = 0
-        while n < ntries:
-            # pick two random edges without creating edge list
-            # choose source node indices from discrete distribution
-            (ai, ci) = discrete_sequence(2, cdistribution=cdf, seed=seed)
-            if ai == ci:
-                continue  # same source, skip
-            a = keys[ai]  # convert index to label
-            c = keys[ci]
-            # choose target uniformly from neighbors
-            b = seed.choice(list(G.neighbors(a)))
-            d = seed.choice(list(G.neighbors(c)))
-            bi = keys.index(b)
-            di = keys.index(d)
-            if b in [a, c, d] or d in [a, b, c]:
-                continue  # all vertices should be different
-
-            # don't create parallel edges
-            if (d not in G[a]) and (b not in G[c]):
-                G.add_edge(a, d)
-                G.add_edge(c, b)
-                G.remove_edge(a, b)
-                G.remove_edge(c, d)
-
-                # Check if the graph is still connected
-                if connectivity and local_conn(G, a, b) == 0:
-                    # Not connected, revert the swap
-                    G.remove_edge(a, d)
-                    G.remove_edge(c, b)
-                    G.add_edge(a, b)
-                    G.add_edge(c, d)
-                else:
-                    swapcount += 1
-                    break
-            n += 1
-    return G
-
-
-@py_random_state(4)
+@np_random_state(4)
 @not_implemented_for("directed")
 @not_implemented_for("multigraph")
 def lattice_reference(G, niter=1, D=None, connectivity=True, seed=None):
@@ -149,6 +142,9 @@ def lattice_reference(G, niter=1, D=None, connectivity=True, seed=None):
     -----
     The implementation is adapted from the algorithm by Sporns et al. [1]_.
     which is inspired from the original work by Maslov and Sneppen(2002) [2]_.
+    A swap of the edges a-b and c-d for a-d and c-b is only performed if
+    ``D[a, b] + D[c, d] >= D[a, d] + D[c, b]``, and the edges are swapped
+    in batches, as in :func:`~networkx.algorithms.swap.double_edge_swap_arrays`.
 
     References
     ----------
@@ -160,24 +156,13 @@ def lattice_reference(G, niter=1, D=None, connectivity=True, seed=None):
        Science 296.5569 (2002): 910-913.
     """
     import numpy as np
-    from networkx.utils import cumulative_distribution, discrete_sequence
-
-    local_conn = nx.connectivity.local_edge_connectivity
 
     if G.is_directed():
         msg = "lattice_reference() not defined for directed graphs."
         raise nx.NetworkXError(msg)
     if len(G) < 4:
         raise nx.NetworkXError("Graph has less than four nodes.")
-    # Instead of choosing uniformly at random from a generated edge list,
-    # this algorithm chooses nonuniformly from the set of nodes with
-    # probability weighted by degree.
-    G = G.copy()
-    keys, degrees = zip(*G.degree())  # keys, degree
-    cdf = cumulative_distribution(degrees)  # cdf of degree
-
     nnodes = len(G)
-    nedges = nx.number_of_edges(G)
     if D is None:
         D = np.zeros((nnodes, nnodes))
         un = np.arange(1, nnodes)
@@ -188,54 +173,19 @@ def lattice_reference(G, niter=1, D=None, connectivity=True, seed=None):
             D[nnodes - v - 1, :] = np.append(u[v + 1 :], u[: v + 1])
             D[v, :] = D[nnodes - v - 1, :][::-1]
 
-    niter = niter * nedges
-    ntries = int(nnodes * nedges / (nnodes * (nnodes - 1) / 2))
-    swapcount = 0
-
-    for i in range(niter):
-        n = 0
-        while n < ntries:
-            # pick two random edges without creating edge list
-            # choose source node indices from discrete distribution
-            (ai, ci) = discrete_sequence(2, cdistribution=cdf, seed=seed)
-            if ai == ci:
-                continue  # same source, skip
-            a = keys[ai]  # convert index to label
-            c = keys[ci]
-            # choose target uniformly from neighbors
-            b = seed.choice(list(G.neighbors(a)))
-            d = seed.choice(list(G.neighbors(c)))
-            bi = keys.index(b)
-            di = keys.index(d)
-
-            if b in [a, c, d] or d in [a, b, c]:
-                continue  # all vertices should be different
-
-            # don't create parallel edges
-            if (d not in G[a]) and (b not in G[c]):
-                if D[ai, bi] + D[ci, di] >= D[ai, ci] + D[bi, di]:
-                    # only swap if we get closer to the diagonal
-                    G.add_edge(a, d)
-                    G.add_edge(c, b)
-                    G.remove_edge(a, b)
-                    G.remove_edge(c, d)
-
-                    # Check if the graph is still connected
-                    if connectivity and local_conn(G, a, b) == 0:
-                        # Not connected, revert the swap
-                        G.remove_edge(a, d)
-                        G.remove_edge(c, b)
-                        G.add_edge(a, b)
-                        G.add_edge(c, d)
-                    else:
-                        swapcount += 1
-                        break
-            n += 1
-
-    return G
-
-
-@py_random_state(3)
+    def closer(a, b, c, d):
+        # only swap if we get closer to the diagonal
+        return D[a, b] + D[c, d] >= D[a, d] + D[c, b]
+
+    nodes, u, v = _edge_arrays(G)
+    nswap, max_tries = _swap_counts(G, niter)
+    u, v, _ = _edge_swaps(
+        u, v, nnodes, nswap, max_tries, False, connectivity, seed, accept=closer
+    )
+    return _swapped_graph(G, nodes, u, v)
+
+
+@np_random_state(3)
 @not_implemented_for("directed")
 @not_implemented_for("multigraph")
 def sigma(G, niter=100, nrand=10, seed=None):
@@ -303,7 +253,7 @@ def sigma(G, niter=100, nrand=10, seed=None):
     return sigma
 
 
-@py_random_state(3)
+@np_random_state(3)
 @not_implemented_for("directed")
 @not_implemented_for("multigraph")
 def omega(G, niter=100, nrand=10, seed=None):
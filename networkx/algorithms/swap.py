@@ -2,11 +2,15 @@
 """
 
 import math
-from networkx.utils import py_random_state
+from networkx.utils import py_random_state, np_random_state
 
 import networkx as nx
 
-__all__ = ["double_edge_swap", "connected_double_edge_swap"]
+__all__ = [
+    "double_edge_swap",
+    "connected_double_edge_swap",
+    "double_edge_swap_arrays",
+]
 
 
 @py_random_state(3)
@@ -267,3 +271,260 @@ def connected_double_edge_swap(G, nswap=1, _window_threshold=3, seed=None):
                     swapcount -= 1
                 window = int(math.ceil(window / 2))
     return swapcount
+
+
+def _edge_keys(u, v, n, directed):
+    """Returns an integer key for each edge, the same for both orientations
+    of an undirected edge."""
+    import numpy as np
+
+    if directed:
+        return u * n + v
+    return np.minimum(u, v) * n + np.maximum(u, v)
+
+
+def _unique_uses(x, y):
+    """Returns a mask of the pairs ``(x[k], y[k])`` whose values occur only
+    once in `x` and `y`."""
+    import numpy as np
+
+    values = np.concatenate((x, y))
+    ordered = np.sort(values)
+    repeated = ordered[1:][ordered[1:] == ordered[:-1]]
+    used = np.isin(values, repeated)
+    return ~(used[: len(x)] | used[len(x) :])
+
+
+# Markers of the free slots of a hash index.
+_EMPTY = -1
+_DELETED = -2
+
+
+def _hash_slots(keys, size):
+    """Returns the first slot probed for each key in a hash index."""
+    import numpy as np
+
+    bits = size.bit_length() - 1
+    hashed = keys.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    return (hashed >> np.uint64(64 - bits)).astype(np.int64)
+
+
+def _hash_index(keys):
+    """Returns an open addressing hash index of the distinct `keys`, a table
+    of size a power of two at most a quarter full."""
+    import numpy as np
+
+    size = 1 << max(3, (4 * len(keys) - 1).bit_length())
+    table = np.full(size, _EMPTY, dtype=np.int64)
+    _hash_insert(table, keys)
+    return table
+
+
+def _hash_find(table, keys):
+    """Returns the slot of each key in the hash index, or -1."""
+    import numpy as np
+
+    slots = _hash_slots(keys, len(table))
+    found = np.full(len(keys), -1, dtype=np.int64)
+    todo = np.arange(len(keys))
+    while len(todo):
+        probed = table[slots[todo]]
+        hit = probed == keys[todo]
+        found[todo[hit]] = slots[todo[hit]]
+        todo = todo[~hit & (probed != _EMPTY)]
+        slots[todo] = (slots[todo] + 1) & (len(table) - 1)
+    return found
+
+
+def _hash_insert(table, keys):
+    """Inserts the distinct `keys`, which are not in the hash index, and
+    returns the number of deleted slots reused."""
+    import numpy as np
+
+    slots = _hash_slots(keys, len(table))
+    reused = 0
+    todo = np.arange(len(keys))
+    while len(todo):
+        free = table[slots[todo]] < 0
+        candidates = todo[free]
+        previous = table[slots[candidates]]
+        # Candidates for the same slot overwrite each other, and one wins.
+        table[slots[candidates]] = keys[candidates]
+        won = table[slots[candidates]] == keys[candidates]
+        reused += np.count_nonzero(previous[won] == _DELETED)
+        todo = np.concatenate((todo[~free], candidates[~won]))
+        slots[todo] = (slots[todo] + 1) & (len(table) - 1)
+    return reused
+
+
+def _edge_swaps(u, v, n, nswap, max_tries, directed, connected, seed, accept=None):
+    """Performs double-edge swaps on the edge arrays `u` and `v`.
+
+    Each swap replaces two edges ``(a, b)`` and ``(c, d)`` by ``(a, d)`` and
+    ``(c, b)``; undirected edges are picked in a random orientation. Swaps
+    are proposed in batches, and a proposal is kept if it creates no
+    self-loop or parallel edge, `accept` (called on the arrays ``a, b, c,
+    d``) allows it, and no other proposal of the batch uses one of its
+    edges or new edges. The existing edges are looked up in a hash index.
+
+    If `connected`, each batch is checked with one connected components
+    computation, and the swaps that separated the endpoints of an edge they
+    removed are undone, so that components are never split.
+
+    Returns the new edge arrays and the number of swaps performed.
+    """
+    import numpy as np
+
+    u = np.array(u, dtype=np.int64)
+    v = np.array(v, dtype=np.int64)
+    m = len(u)
+    keys = np.sort(_edge_keys(u, v, n, directed))
+    if np.any(keys[1:] == keys[:-1]):
+        raise nx.NetworkXError("The edges contain parallel edges.")
+    table = _hash_index(keys)
+    deleted = 0
+    if connected:
+        import scipy.sparse
+        from scipy.sparse.csgraph import connected_components
+
+        data = np.ones(m, dtype=np.int8)
+    count = tries = 0
+    largest = max(1, m // 8)
+    batch = largest
+    while count < nswap and tries < max_tries and m >= 2:
+        size = min(batch, max_tries - tries, 2 * (nswap - count) + 16)
+        tries += size
+        i = (seed.random(size) * m).astype(np.int64)
+        j = (seed.random(size) * m).astype(np.int64)
+        a, b, c, d = u[i], v[i], u[j], v[j]
+        if not directed:
+            flip = seed.random(size) < 0.5
+            c, d = np.where(flip, d, c), np.where(flip, c, d)
+        ok = (i != j) & (a != c) & (b != d) & (a != d) & (c != b)
+        if accept is not None:
+            ok &= accept(a, b, c, d)
+        p = np.flatnonzero(ok)
+        ad = _edge_keys(a[p], d[p], n, directed)
+        cb = _edge_keys(c[p], b[p], n, directed)
+        found = _hash_find(table, np.concatenate((ad, cb))) >= 0
+        ok = ~(found[: len(p)] | found[len(p) :])
+        # Swaps sharing an edge or a new edge are all dropped.
+        uses = np.bincount(np.concatenate((i[p], j[p])), minlength=m)
+        ok &= (uses[i[p]] == 1) & (uses[j[p]] == 1) & _unique_uses(ad, cb)
+        keep = np.flatnonzero(ok)[: nswap - count]
+        p, ad, cb = p[keep], ad[keep], cb[keep]
+        u[i[p]], v[i[p]], u[j[p]], v[j[p]] = a[p], d[p], c[p], b[p]
+        if connected:
+            while len(p):
+                graph = scipy.sparse.coo_matrix((data, (u, v)), shape=(n, n))
+                labels = connected_components(graph, directed=False)[1]
+                split = labels[a[p]] != labels[b[p]]
+                split |= labels[c[p]] != labels[d[p]]
+                if not split.any():
+                    batch = min(2 * batch, largest)
+                    break
+                q = p[split]
+                u[i[q]], v[i[q]], u[j[q]], v[j[q]] = a[q], b[q], c[q], d[q]
+                p, ad, cb = p[~split], ad[~split], cb[~split]
+                batch = max(1, batch // 2)
+        ab = _edge_keys(a[p], b[p], n, directed)
+        cd = _edge_keys(c[p], d[p], n, directed)
+        table[_hash_find(table, np.concatenate((ab, cd)))] = _DELETED
+        deleted += 2 * len(p) - _hash_insert(table, np.concatenate((ad, cb)))
+        if deleted > len(table) // 4:
+            table = _hash_index(_edge_keys(u, v, n, directed))
+            deleted = 0
+        count += len(p)
+    return u, v, count
+
+
+@np_random_state(4, allow_generator=True)
+def double_edge_swap_arrays(
+    u, v, nswap=1, max_tries=None, seed=None, directed=False, connected=False
+):
+    """Swaps pairs of edges of a graph given as edge arrays.
+
+    A double-edge swap removes two randomly chosen edges u-v and x-y
+    and creates the new edges u-y and x-v, which keeps the (in- and
+    out-)degrees of all nodes fixed. Unlike :func:`double_edge_swap`, this
+    works on NumPy arrays of node indices and performs the swaps in
+    batches, which is much faster for large graphs.
+
+    Parameters
+    ----------
+    u, v : array-like of nonnegative integers
+       The endpoints of the edges, or the tails and heads of the edges if
+       `directed`. The edges must not contain parallel edges.
+
+    nswap : integer (optional, default=1)
+       Number of double-edge swaps to perform
+
+    max_tries : integer (optional)
+       Maximum number of attempts to swap edges. The default is
+       ``100 * nswap``.
+
+    seed : integer, numpy.random.Generator, numpy.random.RandomState or None
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    directed : bool (optional, default=False)
+       If True, the edges are directed and the swaps replace u->v and x->y
+       by u->y and x->v.
+
+    connected : bool (optional, default=False)
+       If True, swaps that would split a (weakly) connected component are
+       not performed. This requires SciPy.
+
+    Returns
+    -------
+    (u, v) : tuple of NumPy int64 arrays
+       The edges after the swaps. The input arrays are not modified.
+
+    nswaps : int
+       The number of swaps performed, which is less than `nswap` if
+       `max_tries` attempts were not enough.
+
+    Raises
+    ------
+    NetworkXError
+       If `nswap` is larger than `max_tries`, the node indices are
+       negative, or the edges contain parallel edges.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> u, v = nx.gnm_random_edges(100, 300, seed=np.random.default_rng(1))
+    >>> (su, sv), nswaps = nx.double_edge_swap_arrays(u, v, nswap=200, seed=1)
+    >>> nswaps
+    200
+    >>> degrees = np.bincount(np.concatenate((u, v)), minlength=100)
+    >>> swapped = np.bincount(np.concatenate((su, sv)), minlength=100)
+    >>> np.array_equal(swapped, degrees)
+    True
+
+    Notes
+    -----
+    The edges swapped at once are disjoint and create distinct new edges,
+    so each batch is equivalent to performing its swaps one at a time.
+    Self-loops and parallel edges are never created. With `connected`,
+    each batch is checked for connectivity as a whole, as in
+    :func:`connected_double_edge_swap`, but only the swaps that split a
+    component are undone.
+
+    See Also
+    --------
+    double_edge_swap, connected_double_edge_swap
+    """
+    import numpy as np
+
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    if max_tries is None:
+        max_tries = 100 * nswap
+    if nswap > max_tries:
+        raise nx.NetworkXError("Number of swaps > number of tries allowed.")
+    if len(u) and min(u.min(), v.min()) < 0:
+        raise nx.NetworkXError("Node indices must be nonnegative.")
+    n = int(max(u.max(), v.max())) + 1 if len(u) else 0
+    u, v, nswaps = _edge_swaps(u, v, n, nswap, max_tries, directed, connected, seed)
+    return (u, v), nswaps
@@ -1,4 +1,5 @@
-from itertools import combinations, permutations
+import random
+from itertools import combinations, permutations, product
 
 import pytest
 
@@ -631,3 +632,103 @@ class TestDagToBranching:
     def test_multidigraph(self):
         with pytest.raises(nx.NetworkXNotImplemented):
             nx.dag_to_branching(nx.MultiDiGraph())
+
+
+class TestDynamicTopologicalOrder:
+    @staticmethod
+    def assert_valid(order):
+        G = order.G
+        assert sorted(order) == sorted(G)
+        assert len(order) == len(G)
+        for u, v in G.edges():
+            assert order.index(u) < order.index(v)
+        for i, n in enumerate(order):
+            assert order[i] == n
+            assert order.index(n) == i
+
+    def test_random_insertions(self):
+        G = nx.DiGraph()
+        G.add_nodes_from(range(50))
+        order = nx.DynamicTopologicalOrder(G)
+        rng = random.Random(42)
+        rejected = 0
+        for _ in range(400):
+            u, v = rng.randrange(55), rng.randrange(55)
+            if u == v or (u in G and v in G and nx.has_path(G, v, u)):
+                with pytest.raises(nx.NetworkXUnfeasible):
+                    order.add_edge(u, v)
+                assert not G.has_edge(u, v)
+                rejected += 1
+            else:
+                order.add_edge(u, v, weight=1)
+            self.assert_valid(order)
+        assert rejected > 0
+        assert all(d == {"weight": 1} for u, v, d in G.edges(data=True))
+
+    def test_init(self):
+        G = nx.DiGraph([(3, 2), (2, 1)])
+        order = nx.DynamicTopologicalOrder(G)
+        assert list(order) == [3, 2, 1]
+        assert 3 in order
+        assert 0 not in order
+        pytest.raises(ValueError, order.index, 0)
+        with pytest.raises(nx.NetworkXUnfeasible):
+            nx.DynamicTopologicalOrder(nx.cycle_graph(3, nx.DiGraph))
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.DynamicTopologicalOrder(nx.Graph())
+
+    def test_updates(self):
+        G = nx.MultiDiGraph()
+        order = nx.DynamicTopologicalOrder(G)
+        order.add_edges_from([(1, 2), (2, 3, {"weight": 2}), (3, 4)], color="red")
+        assert G[2][3][0] == {"color": "red", "weight": 2}
+        assert order.add_edge(1, 2) == 1
+        order.add_node(0)
+        order.add_edge(4, 0)
+        self.assert_valid(order)
+        pytest.raises(nx.NetworkXUnfeasible, order.add_edges_from, [(5, 1), (0, 1)])
+        assert G.has_edge(5, 1)
+        assert not G.has_edge(0, 1)
+        order.remove_edge(1, 2, 0)
+        order.remove_node(3)
+        self.assert_valid(order)
+        assert list(order) == [5, 1, 2, 4, 0]
+
+
+class TestReachabilityIndex:
+    @classmethod
+    def setup_class(cls):
+        pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("method", ["bitset", "interval", "2hop"])
+    def test_random_graphs(self, method):
+        for seed in range(5):
+            G = nx.gnp_random_graph(30, 0.06, seed=seed, directed=True)
+            G.add_node("isolated")
+            index = nx.ReachabilityIndex(G, method)
+            pairs = list(product(G, G))
+            expected = [nx.has_path(G, u, v) for u, v in pairs]
+            assert [index.reachable(u, v) for u, v in pairs] == expected
+            sources, targets = zip(*pairs)
+            assert index.reachable_many(sources, targets).tolist() == expected
+            for u in G:
+                assert index.descendants(u) == nx.descendants(G, u)
+
+    @pytest.mark.parametrize("method", ["bitset", "interval", "2hop"])
+    def test_small_graphs(self, method):
+        index = nx.ReachabilityIndex(nx.DiGraph(), method)
+        assert len(index.reachable_many([], [])) == 0
+        G = nx.DiGraph([(0, 0), (1, 2)])
+        index = nx.ReachabilityIndex(G, method)
+        assert index.reachable(0, 0)
+        assert index.reachable(2, 2)
+        assert index.descendants(0) == set()
+        assert index.descendants(1) == {2}
+        pytest.raises(nx.NodeNotFound, index.reachable, 0, 3)
+        pytest.raises(nx.NodeNotFound, index.descendants, 3)
+
+    def test_arguments(self):
+        with pytest.raises(ValueError):
+            nx.ReachabilityIndex(nx.DiGraph(), method="closure")
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.ReachabilityIndex(nx.Graph())
@@ -40,3 +40,69 @@ def test_directed():
     h_undirected = nx.weisfeiler_lehman_graph_hash(G2)
 
     assert h_directed != h_undirected
+
+
+def test_batch_matches_single_hash():
+    graphs = [
+        nx.path_graph(5),
+        nx.cycle_graph(6),
+        nx.star_graph(4),
+        nx.complete_graph(4),
+        nx.relabel_nodes(nx.cycle_graph(6), {i: -i for i in range(6)}),
+    ]
+    for G in graphs:
+        nx.set_edge_attributes(G, "A", "label")
+        nx.set_node_attributes(G, "C", "atom")
+    for kwargs in (
+        {},
+        {"edge_attr": "label"},
+        {"node_attr": "atom"},
+        {"hash_labels": True},
+        {"edge_attr": "label", "hash_labels": True},
+    ):
+        expected = [nx.weisfeiler_lehman_graph_hash(G, **kwargs) for G in graphs]
+        assert list(nx.weisfeiler_lehman_graph_hashes(graphs, **kwargs)) == expected
+    hashes = list(nx.weisfeiler_lehman_graph_hashes(graphs))
+    assert hashes[1] == hashes[4]
+    assert len(set(hashes)) == 4
+
+
+def test_batch_subgraph_hashes():
+    graphs = [nx.path_graph(3), nx.path_graph(4)]
+    results = list(nx.weisfeiler_lehman_graph_hashes(graphs, subgraph_hashes=True))
+    for G, (h, node_hashes) in zip(graphs, results):
+        assert h == nx.weisfeiler_lehman_graph_hash(G)
+        assert node_hashes == nx.weisfeiler_lehman_subgraph_hashes(G)
+
+
+def test_subgraph_hashes():
+    G = nx.path_graph(5)
+    hashes = nx.weisfeiler_lehman_subgraph_hashes(G, iterations=3)
+    assert set(hashes) == set(G)
+    assert all(len(h) == 3 for h in hashes.values())
+    # symmetric nodes of the path get identical subtree hashes
+    assert hashes[0] == hashes[4]
+    assert hashes[1] == hashes[3]
+    # node 1 and node 2 both have degree 2, but differ after one iteration
+    assert hashes[1][0] != hashes[2][0]
+    # the same rooted subtree in another graph gets the same hash
+    other = nx.weisfeiler_lehman_subgraph_hashes(nx.path_graph(7), iterations=3)
+    assert other[0][:3] == hashes[0]
+
+
+def test_subgraph_hashes_digest_size():
+    G = nx.cycle_graph(4)
+    hashes = nx.weisfeiler_lehman_subgraph_hashes(G, digest_size=8)
+    assert all(len(h) == 16 for hs in hashes.values() for h in hs)
+
+
+def test_hash_labels():
+    G1 = nx.Graph([(1, 2), (2, 3), (3, 1), (1, 4)])
+    G2 = nx.relabel_nodes(G1, {1: 7, 2: 5, 3: 6, 4: 8})
+    h1 = nx.weisfeiler_lehman_graph_hash(G1, hash_labels=True)
+    assert h1 == nx.weisfeiler_lehman_graph_hash(G2, hash_labels=True)
+    assert h1 != nx.weisfeiler_lehman_graph_hash(G1)
+    hashes = nx.weisfeiler_lehman_subgraph_hashes(G1, hash_labels=True)
+    assert hashes[2] == hashes[3]
+    assert hashes[1] != hashes[2]
+    assert hashes[1] != nx.weisfeiler_lehman_subgraph_hashes(G1)[1]
@@ -540,3 +540,112 @@ class TestWithinInterCluster:
         G.nodes[2]["community"] = 0
         G.nodes[3]["community"] = 0
         self.test(G, None, [(0, 3, 1 / self.delta), (1, 2, 0), (1, 3, 0)])
+
+
+class TestLinkPredictionArrays:
+    @classmethod
+    def setup_class(cls):
+        global np
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("scipy")
+
+    methods = [
+        "resource_allocation_index",
+        "jaccard_coefficient",
+        "adamic_adar_index",
+        "preferential_attachment",
+    ]
+
+    @pytest.mark.parametrize("method", methods)
+    def test_scores_match_generators(self, method):
+        G = nx.gnp_random_graph(30, 0.2, seed=42)
+        G.add_edges_from([(0, 0), (0, 1), (1, 1)])
+        G.add_node(30)
+        pairs = [(u, v) for u in G for v in G if u < v]
+        expected = [p for u, v, p in getattr(nx, method)(G, pairs)]
+        scores = nx.link_prediction_scores(G, pairs, method, chunk_size=50)
+        np.testing.assert_allclose(scores, expected)
+
+    def test_index_input(self):
+        G = nx.path_graph(["a", "b", "c", "d"])
+        scores = nx.link_prediction_scores(
+            G, np.array([[0, 2], [1, 3]]), "resource_allocation_index", index=True
+        )
+        np.testing.assert_allclose(scores, [0.5, 0.5])
+        scores = nx.link_prediction_scores(
+            G, [[0, 2]], nodelist=["d", "c", "b", "a"], index=True
+        )
+        np.testing.assert_allclose(scores, [0.5])
+        assert len(nx.link_prediction_scores(G, [])) == 0
+
+    def test_errors(self):
+        G = nx.path_graph(3)
+        pytest.raises(ValueError, nx.link_prediction_scores, G, [(0, 1)], "katz")
+        pytest.raises(nx.NodeNotFound, nx.link_prediction_scores, G, [(0, 5)])
+        pytest.raises(nx.NodeNotFound, nx.link_prediction_top_k, G, 1, nodes=[7])
+        pytest.raises(
+            nx.NetworkXNotImplemented, nx.link_prediction_scores, nx.DiGraph(), []
+        )
+
+    @pytest.mark.parametrize("method", methods)
+    def test_top_k(self, method):
+        G = nx.karate_club_graph()
+        k = 3
+        u, v, scores = nx.link_prediction_top_k(G, k, method, batch_size=5)
+        assert len(u) == len(v) == len(scores)
+        for node in G:
+            mask = u == node
+            assert mask.sum() <= k
+            assert list(scores[mask]) == sorted(scores[mask], reverse=True)
+            assert all(not G.has_edge(node, w) and w != node for w in v[mask])
+            candidates = [(node, w) for w in nx.non_neighbors(G, node)]
+            best = sorted((p for _, _, p in getattr(nx, method)(G, candidates)))
+            best = [p for p in best[::-1] if p > 0][:k]
+            np.testing.assert_allclose(scores[mask], best)
+            np.testing.assert_allclose(
+                scores[mask],
+                nx.link_prediction_scores(G, zip(u[mask], v[mask]), method),
+            )
+
+    def test_top_k_nodes(self):
+        G = nx.path_graph(5)
+        u, v, scores = nx.link_prediction_top_k(G, 2, nodes=[4, 0], nodelist=range(5))
+        assert list(u) == [4, 0]
+        assert list(v) == [2, 2]
+        u, v, scores = nx.link_prediction_top_k(nx.empty_graph(3), 2)
+        assert len(u) == len(v) == len(scores) == 0
+
+    @pytest.mark.parametrize("num_common", [255, 256, 300])
+    @pytest.mark.parametrize("method", methods)
+    def test_high_degree(self, method, num_common):
+        # Common neighbor counts must not overflow the adjacency dtype.
+        G = nx.complete_bipartite_graph(2, num_common)
+        u, v, scores = nx.link_prediction_top_k(G, 1, method, nodes=[0])
+        assert list(u) == [0]
+        assert list(v) == [1]
+        expected = [p for _, _, p in getattr(nx, method)(G, [(0, 1)])]
+        np.testing.assert_allclose(scores, expected)
+        np.testing.assert_allclose(
+            nx.link_prediction_scores(G, [(0, 1)], method), expected
+        )
+
+    def test_scorer_reuse(self):
+        G = nx.karate_club_graph()
+        scorer = nx.LinkPredictionScorer(G, "adamic_adar_index")
+        pairs = list(nx.non_edges(G))
+        for start in range(0, len(pairs), 100):
+            batch = pairs[start : start + 100]
+            np.testing.assert_allclose(
+                scorer.scores(batch),
+                nx.link_prediction_scores(G, batch, "adamic_adar_index"),
+            )
+        for a, b in zip(
+            scorer.top_k(2, nodes=[0, 33]),
+            nx.link_prediction_top_k(G, 2, "adamic_adar_index", nodes=[0, 33]),
+        ):
+            np.testing.assert_array_equal(a, b)
+        pytest.raises(ValueError, nx.LinkPredictionScorer, G, "katz")
+        pytest.raises(nx.NetworkXNotImplemented, nx.LinkPredictionScorer, nx.DiGraph())
+        pytest.raises(
+            nx.NetworkXNotImplemented, nx.LinkPredictionScorer, nx.MultiGraph()
+        )
@@ -309,3 +309,63 @@ class TestDAGLCA:
         G = nx.DiGraph()
         G.add_node(3)
         assert nx.lowest_common_ancestor(G, 3, 3) == 3
+
+
+class TestLowestCommonAncestorIndex:
+    @classmethod
+    def setup_class(cls):
+        pytest.importorskip("numpy")
+
+    @staticmethod
+    def assert_lowest(G, index):
+        for u, v in product(G, G):
+            lca = index.lca(u, v)
+            common = (nx.ancestors(G, u) | {u}) & (nx.ancestors(G, v) | {v})
+            if not common:
+                assert lca is None
+            else:
+                assert lca in common
+                assert not nx.descendants(G, lca) & common
+
+    def test_tree(self):
+        G = nx.bfs_tree(nx.random_tree(30, seed=42), 0)
+        G.add_edges_from([("a", "b"), ("a", "c")])
+        index = nx.LowestCommonAncestorIndex(G)
+        assert index.is_tree
+        self.assert_lowest(G, index)
+        G = nx.balanced_tree(2, 2, create_using=nx.DiGraph)
+        index = nx.LowestCommonAncestorIndex(G)
+        expected = dict(tree_all_pairs_lca(G))
+        pairs = list(expected)
+        assert index.lca_many(pairs) == [expected[p] for p in pairs]
+
+    def test_dag(self):
+        G = nx.gnp_random_graph(25, 0.15, seed=42, directed=True)
+        G = nx.DiGraph([(u, v) for u, v in G.edges() if u < v])
+        G.add_nodes_from(range(25))
+        index = nx.LowestCommonAncestorIndex(G)
+        assert not index.is_tree
+        self.assert_lowest(G, index)
+
+    def test_index_input(self):
+        G = nx.DiGraph([(0, 1), (0, 2), (3, 2), (4, 5)])
+        for H in (G, nx.DiGraph([(0, 1), (0, 2), (4, 5)])):
+            index = nx.LowestCommonAncestorIndex(H)
+            position = index.nodelist.index
+            pairs = [[position(1), position(2)], [position(0), position(5)]]
+            lcas = index.lca_many(pairs, index=True)
+            assert lcas.tolist() == [position(0), -1]
+            assert index.lca_many([(1, 5)], default="x") == ["x"]
+            assert len(index.lca_many([])) == 0
+
+    def test_errors(self):
+        for G in (nx.cycle_graph(3, nx.DiGraph), nx.DiGraph([(0, 1), (1, 2), (2, 1)])):
+            pytest.raises(nx.NetworkXError, nx.LowestCommonAncestorIndex, G)
+        with pytest.raises(nx.NetworkXPointlessConcept):
+            nx.LowestCommonAncestorIndex(nx.DiGraph())
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.LowestCommonAncestorIndex(nx.Graph([(0, 1)]))
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.LowestCommonAncestorIndex(nx.MultiDiGraph([(0, 1)]))
+        index = nx.LowestCommonAncestorIndex(nx.DiGraph([(0, 1)]))
+        pytest.raises(nx.NodeNotFound, index.lca, 0, 2)
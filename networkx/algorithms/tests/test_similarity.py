@@ -1,8 +1,11 @@
+import time
+
 import pytest
 
 import networkx as nx
 from networkx.algorithms.similarity import (
     graph_edit_distance,
+    graph_edit_distance_bounds,
     optimal_edit_paths,
     optimize_graph_edit_distance,
     _n_choose_k,
@@ -246,6 +249,101 @@ class TestSimilarity:
             bestcost = cost
         assert bestcost == 22
 
+    @pytest.mark.parametrize("method", ["bipartite", "beam", "exact"])
+    def test_graph_edit_distance_bounds(self, method):
+        pairs = [
+            (cycle_graph(6), wheel_graph(7)),
+            (circular_ladder_graph(2), circular_ladder_graph(4)),
+            (path_graph(4), nx.star_graph(4)),
+            (nx.DiGraph([(0, 1), (1, 2)]), nx.DiGraph([(1, 0), (1, 2), (2, 0)])),
+            (nx.empty_graph(0), path_graph(3)),
+        ]
+        for G1, G2 in pairs:
+            ged = graph_edit_distance(G1, G2)
+            bounds = list(graph_edit_distance_bounds(G1, G2, method=method))
+            for (lower, upper), (next_lower, next_upper) in zip(bounds, bounds[1:]):
+                assert lower <= next_lower
+                assert upper >= next_upper
+                assert (lower, upper) != (next_lower, next_upper)
+            for lower, upper in bounds:
+                assert lower <= ged <= upper
+            if method == "exact":
+                assert bounds[-1] == (ged, ged)
+
+    def test_graph_edit_distance_bounds_costs(self):
+        G1 = getCanonical()
+        G2 = getCanonical()
+        G2.nodes["D"]["label"] = "X"
+        G2.edges["B", "D"]["label"] = "b-x"
+        bounds = list(
+            graph_edit_distance_bounds(G1, G2, node_match=nmatch, edge_match=ematch)
+        )
+        assert bounds[-1] == (2, 2)
+        bounds = list(
+            graph_edit_distance_bounds(
+                G1,
+                G2,
+                node_subst_cost=lambda n1, n2: 0 if n1 == n2 else 3,
+                edge_del_cost=lambda e: 2,
+                edge_ins_cost=lambda e: 2,
+            )
+        )
+        assert bounds[-1] == (3, 3)
+
+    def test_graph_edit_distance_bounds_parallel(self):
+        G1 = cycle_graph(6)
+        G2 = wheel_graph(7)
+        bounds = list(graph_edit_distance_bounds(G1, G2, processes=2))
+        assert bounds[-1] == (7, 7)
+        bounds = list(
+            graph_edit_distance_bounds(
+                getCanonical(), getCanonical(), node_match=nmatch, processes=2
+            )
+        )
+        assert bounds[-1] == (0, 0)
+
+    def test_graph_edit_distance_bounds_selfloops(self):
+        for create_using, expected in ((nx.Graph, 3), (nx.DiGraph, 3)):
+            G1 = nx.Graph([(0, 0), (0, 1), (1, 2)], create_using=create_using)
+            G2 = nx.Graph([(0, 1), (1, 1), (2, 3)], create_using=create_using)
+            assert graph_edit_distance(G1, G2) == expected
+            for processes in (None, 2):
+                bounds = graph_edit_distance_bounds(G1, G2, processes=processes)
+                assert list(bounds)[-1] == (expected, expected)
+        # loops are only substituted by loops, also at the roots
+        G1 = nx.Graph([(0, 0), (0, 1)])
+        G2 = nx.Graph([(0, 1), (1, 2)])
+        assert graph_edit_distance(G1, G2) == 3
+        assert graph_edit_distance(G1, G2, roots=(0, 1)) == 3
+        assert graph_edit_distance(G1, G2, roots=(0, 0)) == 3
+        assert graph_edit_distance(G2, G1, roots=(1, 0)) == 3
+
+    def test_graph_edit_distance_bounds_timeout(self):
+        G1 = circular_ladder_graph(6)
+        G2 = circular_ladder_graph(8)
+        for lower, upper in graph_edit_distance_bounds(G1, G2, timeout=0.01):
+            assert lower <= upper
+        # the beam search stops at the deadline too
+        G1 = circular_ladder_graph(40)
+        G2 = circular_ladder_graph(50)
+        start = time.time()
+        bounds = graph_edit_distance_bounds(G1, G2, beam_width=1000, timeout=0.5)
+        for lower, upper in bounds:
+            assert lower <= upper
+        assert time.time() - start < 5
+        pytest.raises(
+            nx.NetworkXError, next, graph_edit_distance_bounds(G1, G2, timeout=0)
+        )
+        pytest.raises(
+            ValueError, next, graph_edit_distance_bounds(G1, G2, method="greedy")
+        )
+        pytest.raises(
+            nx.NetworkXNotImplemented,
+            graph_edit_distance_bounds,
+            nx.MultiGraph(),
+            nx.MultiGraph(),
+        )
+
     # def test_graph_edit_distance_bigger(self):
     #     G1 = circular_ladder_graph(12)
     #     G2 = circular_ladder_graph(16)
@@ -715,6 +813,81 @@ class TestSimilarity:
         actual = nx.simrank_similarity_numpy(G, source=0, target=0)
         numpy.testing.assert_allclose(expected, actual, atol=1e-7)
 
+    def test_simrank_sparse_matches_simrank(self):
+        G = nx.karate_club_graph()
+        expected = nx.simrank_similarity(G, 5, importance_factor=0.8)
+        index = nx.SimRankIndex(G, importance_factor=0.8, sample_size=1000, seed=42)
+        sim = index.similarity(5)
+        assert sim[5] == 1
+        for v in G:
+            assert sim[v] == pytest.approx(expected[v], abs=0.02)
+        sim = nx.simrank_similarity_sparse(
+            G, 5, importance_factor=0.8, diagonal=index.diagonal
+        )
+        assert sim == pytest.approx(index.similarity(5))
+        # without a diagonal correction, (1 - c) * I biases scores down
+        approx = nx.simrank_similarity_sparse(G, 5, importance_factor=0.8)
+        assert all(approx[v] <= sim[v] + 1e-12 for v in G)
+        assert approx == pytest.approx(
+            nx.SimRankIndex(G, importance_factor=0.8, sample_size=None).similarity(5)
+        )
+
+    def test_simrank_sparse_top_k(self):
+        G = nx.cycle_graph(6)
+        sim = nx.simrank_similarity_sparse(G, 0, k=2)
+        assert list(sim) in ([2, 4], [4, 2])
+        full = nx.simrank_similarity_sparse(G, 0)
+        assert sim == {v: full[v] for v in (2, 4)}
+        assert nx.simrank_similarity_sparse(G, 0, k=10).keys() == set(G) - {0}
+        assert nx.simrank_similarity_sparse(G, 0, k=0) == {}
+        pytest.raises(nx.NodeNotFound, nx.simrank_similarity_sparse, G, 9)
+        pytest.raises(
+            nx.NetworkXError, nx.simrank_similarity_sparse, G, 0, diagonal=[0.1] * 5
+        )
+
+    def test_simrank_sparse_batch(self):
+        G = nx.gnp_random_graph(30, 0.1, seed=42, directed=True)
+        batch = nx.simrank_similarity_sparse_batch(G, G, k=3, batch_size=7, seed=42)
+        batch = dict(batch)
+        assert list(batch) == list(G)
+        index = nx.SimRankIndex(G, seed=42)
+        for u in G:
+            sim = nx.simrank_similarity_sparse(G, u, k=3, diagonal=index.diagonal)
+            assert batch[u] == pytest.approx(sim)
+            assert index.similarity(u, k=3) == pytest.approx(sim)
+        batch = nx.simrank_similarity_sparse_batch(G, [0, 1], diagonal=index.diagonal)
+        assert dict(batch) == dict(index.similarities([0, 1]))
+
+    def test_simrank_monte_carlo(self):
+        G = nx.star_graph(3)
+        sim = nx.simrank_similarity_monte_carlo(G, 1, sample_size=50, seed=42)
+        assert sim[1] == 1
+        assert sim[2] == pytest.approx(0.9)
+        assert sim[3] == pytest.approx(0.9)
+        assert 0 not in sim
+
+        G = nx.karate_club_graph()
+        expected = nx.simrank_similarity(G, 0, tolerance=1e-6)
+        sim = nx.simrank_similarity_monte_carlo(
+            G, 0, path_length=20, sample_size=2000, seed=42
+        )
+        for v in G:
+            assert sim.get(v, 0) == pytest.approx(expected[v], abs=0.05)
+        top = nx.simrank_similarity_monte_carlo(
+            G, 0, path_length=20, sample_size=2000, k=3, seed=42
+        )
+        assert len(top) == 3
+        assert 0 not in top
+        pytest.raises(nx.NodeNotFound, nx.simrank_similarity_monte_carlo, G, 99)
+
+    def test_simrank_monte_carlo_directed(self):
+        G = nx.DiGraph([(0, 1), (0, 2), (3, 2)])
+        sim = nx.simrank_similarity_monte_carlo(G, 1, sample_size=200, seed=1)
+        # 1 and 2 meet at 0 with probability 1/2
+        assert sim[2] == pytest.approx(0.45, abs=0.1)
+        assert sim[1] == 1
+        assert set(sim) == {1, 2}
+
     def test_n_choose_k_small_k(self):
         assert _n_choose_k(10, 4) == 210
 
@@ -39,6 +39,21 @@ def test_lattice_reference():
     Hl = lattice_reference(H, niter=1)
 
 
+def test_reference_graph_data():
+    G = nx.connected_watts_strogatz_graph(50, 6, 0.1, seed=rng)
+    G.graph["name"] = "ws"
+    nx.set_node_attributes(G, "x", "label")
+    nx.set_edge_attributes(G, 2, "weight")
+    degrees = sorted(d for n, d in G.degree())
+    for Gref in [random_reference(G, seed=rng), lattice_reference(G, seed=rng)]:
+        assert Gref.graph["name"] == "ws"
+        assert all(label == "x" for n, label in Gref.nodes(data="label"))
+        assert nx.is_connected(Gref)
+        assert sorted(d for n, d in Gref.degree()) == degrees
+        for u, v, w in Gref.edges(data="weight"):
+            assert w == (2 if G.has_edge(u, v) else None)
+
+
 def test_sigma():
     Gs = nx.connected_watts_strogatz_graph(50, 6, 0.1, seed=rng)
     Gr = nx.connected_watts_strogatz_graph(50, 6, 1, seed=rng)
@@ -54,3 +54,67 @@ def test_degree_seq_c4():
     degrees = sorted(d for n, d in G.degree())
     G = nx.double_edge_swap(G, 1, 100)
     assert degrees == sorted(d for n, d in G.degree())
+
+
+def _edge_set(u, v, directed):
+    if directed:
+        return set(zip(u.tolist(), v.tolist()))
+    return {frozenset(e) for e in zip(u.tolist(), v.tolist())}
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_double_edge_swap_arrays(directed):
+    np = pytest.importorskip("numpy")
+    u, v = nx.gnm_random_edges(100, 400, seed=42, directed=directed)
+    u0, v0 = u.copy(), v.copy()
+    for seed in [42, np.random.default_rng(42), np.random.RandomState(42)]:
+        (su, sv), nswaps = nx.double_edge_swap_arrays(
+            u, v, nswap=300, seed=seed, directed=directed
+        )
+        assert nswaps == 300
+        assert (u == u0).all() and (v == v0).all()
+        assert (su != sv).all()
+        assert len(_edge_set(su, sv, directed)) == 400
+        assert _edge_set(su, sv, directed) != _edge_set(u, v, directed)
+        if directed:
+            assert (np.bincount(su) == np.bincount(u)).all()
+            assert (np.bincount(sv) == np.bincount(v)).all()
+        else:
+            degrees = np.bincount(np.concatenate((u, v)), minlength=100)
+            swapped = np.bincount(np.concatenate((su, sv)), minlength=100)
+            assert (degrees == swapped).all()
+
+
+def test_double_edge_swap_arrays_connected():
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    G = nx.barabasi_albert_graph(200, 1, seed=42)
+    u, v = np.array(list(G.edges())).T
+    (su, sv), nswaps = nx.double_edge_swap_arrays(
+        u, v, nswap=100, max_tries=10 ** 5, seed=42, connected=True
+    )
+    assert nswaps == 100
+    H = nx.Graph(zip(su.tolist(), sv.tolist()))
+    assert nx.is_connected(H)
+    assert sorted(d for n, d in G.degree()) == sorted(d for n, d in H.degree())
+    # Swapping two disjoint edges separates the endpoints of both.
+    (su, sv), nswaps = nx.double_edge_swap_arrays(
+        [0, 2], [1, 3], nswap=5, seed=42, connected=True
+    )
+    assert nswaps == 0
+    assert _edge_set(su, sv, False) == {frozenset((0, 1)), frozenset((2, 3))}
+
+
+def test_double_edge_swap_arrays_errors():
+    pytest.importorskip("numpy")
+    with pytest.raises(nx.NetworkXError):
+        nx.double_edge_swap_arrays([0, 2], [1, 3], nswap=2, max_tries=1)
+    with pytest.raises(nx.NetworkXError):
+        nx.double_edge_swap_arrays([0, 1, 2], [1, 0, 3])
+    with pytest.raises(nx.NetworkXError):
+        nx.double_edge_swap_arrays([0, -2], [1, 3])
+    # A star has no possible swap.
+    (u, v), nswaps = nx.double_edge_swap_arrays([0, 0, 0], [1, 2, 3], nswap=5)
+    assert nswaps == 0
+    (u, v), nswaps = nx.double_edge_swap_arrays([], [], nswap=5)
+    assert nswaps == 0 and len(u) == 0
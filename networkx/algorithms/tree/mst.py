@@ -4,17 +4,19 @@ Algorithms for calculating min/max spanning trees/forests.
 """
 from heapq import heappop, heappush
 from operator import itemgetter
-from itertools import count
+from itertools import count, islice
 from math import isnan
 
 import networkx as nx
-from networkx.utils import UnionFind, not_implemented_for
+from networkx.utils import ArrayUnionFind, UnionFind, not_implemented_for
 
 __all__ = [
     "minimum_spanning_edges",
     "maximum_spanning_edges",
     "minimum_spanning_tree",
     "maximum_spanning_tree",
+    "array_spanning_forest",
+    "streaming_spanning_forest",
 ]
 
 
@@ -296,11 +298,291 @@ def prim_mst_edges(G, minimum, weight="weight", keys=True, data=True, ignore_nan
                     push(frontier, (new_weight, next(c), v, w, d2))
 
 
+def _kruskal_forest(u, v, order, n, block_size):
+    """Returns the edges selected by Kruskal's algorithm.
+
+    The edges are scanned in `order`, one block at a time, and each block
+    is merged into an array-backed union-find with a single bulk union.
+    """
+    import numpy as np
+
+    subtrees = ArrayUnionFind(n)
+    selected = []
+    num_selected = 0
+    for start in range(0, len(order), block_size):
+        if num_selected == n - 1:
+            break
+        block = order[start : start + block_size]
+        block = block[subtrees.union_many(u[block], v[block])]
+        selected.append(block)
+        num_selected += len(block)
+    if not selected:
+        return np.zeros(0, dtype=np.intp)
+    return np.concatenate(selected)
+
+
+def array_spanning_forest(
+    u,
+    v,
+    weight=None,
+    num_nodes=None,
+    minimum=True,
+    algorithm="kruskal",
+    ignore_nan=False,
+    block_size=65536,
+):
+    """Returns the edges of a minimum or maximum spanning forest of an
+    edge array.
+
+    The graph is given by arrays of integer endpoints, so the spanning
+    forest can be computed without building a NetworkX graph. The edges
+    are sorted with NumPy and the trees of the forest are tracked in an
+    :class:`~networkx.utils.union_find.ArrayUnionFind`.
+
+    Parameters
+    ----------
+    u, v : array_like of integers
+        The endpoints of the edges, integers from 0 to ``num_nodes - 1``.
+        Parallel edges and self-loops are allowed.
+
+    weight : array_like, optional (default=None)
+        The weight of each edge. If None, all edges have the same weight.
+
+    num_nodes : integer, optional (default=None)
+        The number of nodes. If None, it is one more than the largest
+        endpoint.
+
+    minimum : bool (default: True)
+        Find the minimum (True) or maximum (False) spanning forest.
+
+    algorithm : string (default: 'kruskal')
+        Either 'kruskal', which scans the sorted edges in blocks and stops
+        once the forest is a spanning tree, or 'boruvka', which merges all
+        trees along their cheapest edges in each round, with vectorized
+        reductions over all edges. Kruskal's algorithm runs Borůvka rounds
+        within each block, on the trees that the block joins.
+
+    ignore_nan : bool (default: False)
+        If a NaN is found as an edge weight normally an exception is raised.
+        If `ignore_nan is True` then that edge is ignored instead.
+
+    block_size : integer, optional (default=65536)
+        The number of edges scanned together by Kruskal's algorithm.
+
+    Returns
+    -------
+    edges : NumPy array
+        The indices of the edges of the spanning forest, in the order of
+        increasing (or decreasing, if `minimum` is False) weight.
+
+    Raises
+    ------
+    ValueError
+        If `algorithm` is unknown, or if a weight is NaN and `ignore_nan`
+        is False.
+
+    Examples
+    --------
+    >>> u = [0, 1, 2, 0]
+    >>> v = [1, 2, 3, 3]
+    >>> nx.array_spanning_forest(u, v, weight=[1, 1, 1, 2])
+    array([0, 1, 2])
+    >>> nx.array_spanning_forest(u, v, weight=[1, 1, 1, 2], minimum=False)
+    array([3, 0, 1])
+
+    Notes
+    -----
+    Ties between edges of equal weight are broken by their position in the
+    arrays, so both algorithms return the same forest, and Kruskal's
+    algorithm selects the same edges as :func:`minimum_spanning_edges`
+    with ``algorithm='kruskal'`` for the edges of a graph in the order of
+    ``G.edges``.
+
+    See Also
+    --------
+    minimum_spanning_edges
+    streaming_spanning_forest
+    """
+    import numpy as np
+
+    if algorithm not in ("kruskal", "boruvka", "borůvka"):
+        raise ValueError(f"{algorithm} is not a valid choice for an algorithm.")
+    u = np.asarray(u, dtype=np.intp)
+    v = np.asarray(v, dtype=np.intp)
+    if num_nodes is None:
+        num_nodes = int(max(u.max(), v.max())) + 1 if len(u) else 0
+    if weight is None:
+        order = np.arange(len(u))
+    else:
+        weight = np.asarray(weight, dtype=float)
+        order = np.flatnonzero(~np.isnan(weight))
+        if len(order) < len(weight) and not ignore_nan:
+            e = np.flatnonzero(np.isnan(weight))[0]
+            msg = f"NaN found as an edge weight. Edge {(u[e], v[e], weight[e])}"
+            raise ValueError(msg)
+        wt = weight[order] if minimum else -weight[order]
+        order = order[np.argsort(wt, kind="stable")]
+    if algorithm != "kruskal":
+        block_size = max(1, len(order))
+    return _kruskal_forest(u, v, order, num_nodes, block_size)
+
+
+def _array_mst_edges(G, minimum, weight, keys, data, ignore_nan, algorithm):
+    """Iterate over the edges of a spanning tree of `G` found by
+    :func:`array_spanning_forest`.
+    """
+    import numpy as np
+
+    is_multigraph = G.is_multigraph()
+    if is_multigraph:
+        edges = list(G.edges(keys=True, data=True))
+    else:
+        edges = list(G.edges(data=True))
+    index = {n: i for i, n in enumerate(G)}
+    u = np.fromiter((index[e[0]] for e in edges), np.intp, len(edges))
+    v = np.fromiter((index[e[1]] for e in edges), np.intp, len(edges))
+    wt = np.fromiter((e[-1].get(weight, 1) for e in edges), float, len(edges))
+    nan = np.flatnonzero(np.isnan(wt))
+    if len(nan) and not ignore_nan:
+        msg = f"NaN found as an edge weight. Edge {edges[nan[0]]}"
+        raise ValueError(msg)
+    forest = array_spanning_forest(
+        u, v, wt, len(index), minimum, algorithm, ignore_nan=True
+    )
+    for i in forest.tolist():
+        if is_multigraph:
+            u, v, k, d = edges[i]
+        else:
+            u, v, d = edges[i]
+        if is_multigraph and keys:
+            if data:
+                yield u, v, k, d
+            else:
+                yield u, v, k
+        else:
+            if data:
+                yield u, v, d
+            else:
+                yield u, v
+
+
+def array_kruskal_mst_edges(
+    G, minimum, weight="weight", keys=True, data=True, ignore_nan=False
+):
+    """Iterate over edges of a Kruskal's algorithm min/max spanning tree
+    computed on edge arrays.
+
+    The parameters are the same as for :func:`kruskal_mst_edges`, which
+    selects the same edges. See :func:`array_spanning_forest`.
+
+    """
+    return _array_mst_edges(G, minimum, weight, keys, data, ignore_nan, "kruskal")
+
+
+def array_boruvka_mst_edges(
+    G, minimum, weight="weight", keys=True, data=True, ignore_nan=False
+):
+    """Iterate over edges of a Borůvka's algorithm min/max spanning tree
+    computed on edge arrays.
+
+    The parameters are the same as for :func:`kruskal_mst_edges`. Unlike
+    :func:`boruvka_mst_edges`, edge weights need not be distinct and
+    multigraphs are supported. See :func:`array_spanning_forest`.
+
+    """
+    return _array_mst_edges(G, minimum, weight, keys, data, ignore_nan, "boruvka")
+
+
+def streaming_spanning_forest(
+    edges, minimum=True, algorithm="kruskal", ignore_nan=False, chunk_size=2 ** 22
+):
+    """Generate the edges of a minimum or maximum spanning forest of a
+    stream of weighted edges.
+
+    The edges are read in chunks of `chunk_size`. Each chunk is merged with
+    the spanning forest of the edges read so far, and only the spanning
+    forest of the union is kept. An edge that is not in the spanning forest
+    of some of the edges is not in the spanning forest of all of them, so
+    memory is bounded by the number of nodes plus `chunk_size`, however
+    many edges the stream holds.
+
+    Parameters
+    ----------
+    edges : iterable
+        The weighted edges `(u, v, w)`. Nodes can be any hashable objects.
+
+    minimum : bool (default: True)
+        Find the minimum (True) or maximum (False) spanning forest.
+
+    algorithm : string (default: 'kruskal')
+        The algorithm used for each chunk, 'kruskal' or 'boruvka'.
+        See :func:`array_spanning_forest`.
+
+    ignore_nan : bool (default: False)
+        If a NaN is found as an edge weight normally an exception is raised.
+        If `ignore_nan is True` then that edge is ignored instead.
+
+    chunk_size : integer, optional (default=2**22)
+        The number of edges read at once.
+
+    Returns
+    -------
+    edges : iterator
+        The edges `(u, v, w)` of the spanning forest. The whole stream is
+        read before the first edge is generated.
+
+    Raises
+    ------
+    ValueError
+        If `algorithm` is unknown, or if a weight is NaN and `ignore_nan`
+        is False.
+
+    Examples
+    --------
+    >>> edges = ((i, j, abs(i - j)) for i in range(4) for j in range(i + 1, 4))
+    >>> sorted(nx.streaming_spanning_forest(edges, chunk_size=2))
+    [(0, 1, 1.0), (1, 2, 1.0), (2, 3, 1.0)]
+
+    See Also
+    --------
+    array_spanning_forest
+    """
+    import numpy as np
+
+    index = {}
+    fu = fv = np.zeros(0, dtype=np.intp)
+    fw = np.zeros(0)
+    edges = iter(edges)
+    while True:
+        chunk = list(islice(edges, chunk_size))
+        if not chunk:
+            break
+        u = np.fromiter(
+            (index.setdefault(e[0], len(index)) for e in chunk), np.intp, len(chunk)
+        )
+        v = np.fromiter(
+            (index.setdefault(e[1], len(index)) for e in chunk), np.intp, len(chunk)
+        )
+        w = np.fromiter((e[2] for e in chunk), float, len(chunk))
+        u = np.concatenate((fu, u))
+        v = np.concatenate((fv, v))
+        w = np.concatenate((fw, w))
+        forest = array_spanning_forest(
+            u, v, w, len(index), minimum, algorithm, ignore_nan
+        )
+        fu, fv, fw = u[forest], v[forest], w[forest]
+    nodes = list(index)
+    for a, b, w in zip(fu.tolist(), fv.tolist(), fw.tolist()):
+        yield nodes[a], nodes[b], w
+
+
 ALGORITHMS = {
     "boruvka": boruvka_mst_edges,
     "borůvka": boruvka_mst_edges,
     "kruskal": kruskal_mst_edges,
     "prim": prim_mst_edges,
+    "array_kruskal": array_kruskal_mst_edges,
+    "array_boruvka": array_boruvka_mst_edges,
 }
 
 
@@ -323,7 +605,8 @@ def minimum_spanning_edges(
 
     algorithm : string
        The algorithm to use when finding a minimum spanning tree. Valid
-       choices are 'kruskal', 'prim', or 'boruvka'. The default is 'kruskal'.
+       choices are 'kruskal', 'prim', 'boruvka', 'array_kruskal' or
+       'array_boruvka'. The default is 'kruskal'.
 
     weight : string
        Edge data key to use for weight (default 'weight').
@@ -383,6 +666,10 @@ def minimum_spanning_edges(
     For the other algorithms, if the graph edges do not have a weight
     attribute a default weight of 1 will be used.
 
+    The 'array_kruskal' and 'array_boruvka' algorithms copy the edges of
+    `G` to NumPy arrays and run :func:`array_spanning_forest`. They are
+    much faster on large graphs, but the weights must be numbers.
+
     Modified code from David Eppstein, April 2006
     http://www.ics.uci.edu/~eppstein/PADS/
 
@@ -417,7 +704,8 @@ def maximum_spanning_edges(
 
     algorithm : string
        The algorithm to use when finding a maximum spanning tree. Valid
-       choices are 'kruskal', 'prim', or 'boruvka'. The default is 'kruskal'.
+       choices are 'kruskal', 'prim', 'boruvka', 'array_kruskal' or
+       'array_boruvka'. The default is 'kruskal'.
 
     weight : string
        Edge data key to use for weight (default 'weight').
@@ -477,6 +765,10 @@ def maximum_spanning_edges(
     For the other algorithms, if the graph edges do not have a weight
     attribute a default weight of 1 will be used.
 
+    The 'array_kruskal' and 'array_boruvka' algorithms copy the edges of
+    `G` to NumPy arrays and run :func:`array_spanning_forest`. They are
+    much faster on large graphs, but the weights must be numbers.
+
     Modified code from David Eppstein, April 2006
     http://www.ics.uci.edu/~eppstein/PADS/
     """
@@ -505,8 +797,8 @@ def minimum_spanning_tree(G, weight="weight", algorithm="kruskal", ignore_nan=Fa
 
     algorithm : string
        The algorithm to use when finding a minimum spanning tree. Valid
-       choices are 'kruskal', 'prim', or 'boruvka'. The default is
-       'kruskal'.
+       choices are 'kruskal', 'prim', 'boruvka', 'array_kruskal' or
+       'array_boruvka'. The default is 'kruskal'.
 
     ignore_nan : bool (default: False)
         If a NaN is found as an edge weight normally an exception is raised.
@@ -534,6 +826,10 @@ def minimum_spanning_tree(G, weight="weight", algorithm="kruskal", ignore_nan=Fa
     For the other algorithms, if the graph edges do not have a weight
     attribute a default weight of 1 will be used.
 
+    The 'array_kruskal' and 'array_boruvka' algorithms copy the edges of
+    `G` to NumPy arrays and run :func:`array_spanning_forest`. They are
+    much faster on large graphs, but the weights must be numbers.
+
     There may be more than one tree with the same minimum or maximum weight.
     See :mod:`networkx.tree.recognition` for more detailed definitions.
 
@@ -564,8 +860,8 @@ def maximum_spanning_tree(G, weight="weight", algorithm="kruskal", ignore_nan=Fa
 
     algorithm : string
        The algorithm to use when finding a maximum spanning tree. Valid
-       choices are 'kruskal', 'prim', or 'boruvka'. The default is
-       'kruskal'.
+       choices are 'kruskal', 'prim', 'boruvka', 'array_kruskal' or
+       'array_boruvka'. The default is 'kruskal'.
 
     ignore_nan : bool (default: False)
         If a NaN is found as an edge weight normally an exception is raised.
@@ -595,6 +891,10 @@ def maximum_spanning_tree(G, weight="weight", algorithm="kruskal", ignore_nan=Fa
     For the other algorithms, if the graph edges do not have a weight
     attribute a default weight of 1 will be used.
 
+    The 'array_kruskal' and 'array_boruvka' algorithms copy the edges of
+    `G` to NumPy arrays and run :func:`array_spanning_forest`. They are
+    much faster on large graphs, but the weights must be numbers.
+
     There may be more than one tree with the same minimum or maximum weight.
     See :mod:`networkx.tree.recognition` for more detailed definitions.
 
@@ -283,3 +283,103 @@ class TestPrim(MultigraphMSTTestBase):
         G.add_edge(0, 1, key="b", weight=1)
         T = nx.maximum_spanning_tree(G)
         assert_edges_equal([(0, 1, 2)], list(T.edges(data="weight")))
+
+
+class TestArrayKruskal(MultigraphMSTTestBase):
+    """Unit tests for computing a minimum (or maximum) spanning tree
+    using Kruskal's algorithm on edge arrays.
+
+    """
+
+    algorithm = "array_kruskal"
+
+    @classmethod
+    def setup_class(cls):
+        pytest.importorskip("numpy")
+
+    def test_same_edges_as_kruskal(self):
+        G = nx.gnm_random_graph(60, 300, seed=42)
+        for u, v in G.edges():
+            G[u][v]["weight"] = (u * v) % 7
+        for minimum_spanning_edges in (
+            nx.minimum_spanning_edges,
+            nx.maximum_spanning_edges,
+        ):
+            expected = minimum_spanning_edges(G, algorithm="kruskal", data=False)
+            actual = minimum_spanning_edges(G, algorithm=self.algo, data=False)
+            assert list(actual) == list(expected)
+
+
+class TestArrayBoruvka(MultigraphMSTTestBase):
+    """Unit tests for computing a minimum (or maximum) spanning tree
+    using Borůvka's algorithm on edge arrays.
+
+    """
+
+    algorithm = "array_boruvka"
+
+    @classmethod
+    def setup_class(cls):
+        pytest.importorskip("numpy")
+
+    def test_equal_weights(self):
+        G = nx.grid_2d_graph(6, 6)
+        T = nx.minimum_spanning_tree(G, algorithm=self.algo)
+        assert nx.is_tree(T)
+        assert_nodes_equal(T, G)
+
+
+class TestArraySpanningForest:
+    @classmethod
+    def setup_class(cls):
+        global np
+        np = pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("minimum", [True, False])
+    def test_random_weights(self, minimum):
+        rng = np.random.default_rng(42)
+        u = rng.integers(0, 100, 500)
+        v = rng.integers(0, 100, 500)
+        weight = rng.integers(0, 10, 500)
+        G = nx.MultiGraph()
+        G.add_nodes_from(range(100))
+        G.add_weighted_edges_from(zip(u.tolist(), v.tolist(), weight.tolist()))
+        kruskal = nx.array_spanning_forest(u, v, weight, minimum=minimum, block_size=16)
+        boruvka = nx.array_spanning_forest(
+            u, v, weight, minimum=minimum, algorithm="boruvka"
+        )
+        assert sorted(kruskal) == sorted(boruvka)
+        T = nx.Graph(list(zip(u[kruskal], v[kruskal])))
+        assert nx.is_forest(T)
+        assert T.size() == 100 - nx.number_connected_components(G)
+        mst = nx.minimum_spanning_tree if minimum else nx.maximum_spanning_tree
+        assert weight[kruskal].sum() == mst(G).size(weight="weight")
+
+    def test_arguments(self):
+        assert len(nx.array_spanning_forest([], [])) == 0
+        forest = nx.array_spanning_forest([0, 0, 1], [1, 1, 1], num_nodes=3)
+        assert forest.tolist() == [0]
+        with pytest.raises(ValueError):
+            nx.array_spanning_forest([0, 1], [1, 2], [np.nan, 1])
+        forest = nx.array_spanning_forest([0, 1], [1, 2], [np.nan, 1], ignore_nan=True)
+        assert forest.tolist() == [1]
+        pytest.raises(ValueError, nx.array_spanning_forest, [0], [1], algorithm="x")
+
+    @pytest.mark.parametrize("algorithm", ["kruskal", "boruvka"])
+    def test_streaming(self, algorithm):
+        G = nx.gnm_random_graph(50, 400, seed=42)
+        edges = [(u, v, (u + 3 * v) % 11) for u, v in G.edges()]
+        G.add_weighted_edges_from(edges)
+        G.add_edge(50, 50, weight=0)
+        for minimum, mst in [
+            (True, nx.minimum_spanning_tree),
+            (False, nx.maximum_spanning_tree),
+        ]:
+            forest = nx.streaming_spanning_forest(
+                iter(edges + [(50, 50, 0)]), minimum, algorithm, chunk_size=30
+            )
+            T = nx.Graph()
+            T.add_weighted_edges_from(forest)
+            assert nx.is_forest(T)
+            assert T.size(weight="weight") == mst(G).size(weight="weight")
+            assert nx.number_connected_components(T) == 1
@@ -37,8 +37,10 @@ __all__ = [
     "to_numpy_recarray",
     "from_scipy_sparse_matrix",
     "to_scipy_sparse_matrix",
+    "to_scipy_sparse_matrix_chunked",
     "from_numpy_array",
     "to_numpy_array",
+    "to_numpy_array_chunked",
 ]
 
 
@@ -904,6 +906,361 @@ def to_scipy_sparse_matrix(G, nodelist=None, dtype=None, weight="weight", format
         raise nx.NetworkXError(f"Unknown sparse matrix format: {format}") from e
 
 
+def _validated_nodelist(G, nodelist):
+    """Returns `nodelist` (or the nodes of G) as a list after validation."""
+    if nodelist is None:
+        return list(G)
+    nodelist = list(nodelist)
+    if len(nodelist) == 0:
+        raise nx.NetworkXError("nodelist has no nodes")
+    nodeset = set(G.nbunch_iter(nodelist))
+    if len(nodelist) != len(nodeset):
+        for n in nodelist:
+            if n not in G:
+                raise nx.NetworkXError(f"Node {n} in nodelist is not in G")
+        raise nx.NetworkXError("nodelist contains duplicates.")
+    return nodelist
+
+
+def _adjacency_row_chunks(
+    G, nodelist, index, weight, combine, chunk_size, index_dtype, dtype, adj
+):
+    """Generates the rows of the adjacency matrix in chunks.
+
+    Yields tuples `(start, stop, counts, cols, data)` for the rows
+    `nodelist[start:stop]`, where `counts` holds the number of entries of
+    each row and `cols` and `data` the column indices and values of all
+    entries of the chunk. Only one chunk is held in memory at a time.
+
+    `adj` is the adjacency used for the rows: the successors give the
+    rows of the matrix and the predecessors the rows of its transpose.
+    Parallel edges are combined with `combine`.
+    """
+    import numpy as np
+
+    if weight is None:
+
+        def value(d):
+            return 1
+
+    else:
+
+        def value(d):
+            return d.get(weight, 1)
+
+    if G.is_multigraph():
+        single_value = value
+
+        def value(keydict):
+            return combine(single_value(d) for d in keydict.values())
+
+    full = len(nodelist) == len(G)
+    for start in range(0, len(nodelist), chunk_size):
+        stop = min(start + chunk_size, len(nodelist))
+        if full:
+            rows = [adj[u] for u in nodelist[start:stop]]
+        else:
+            rows = [
+                {v: d for v, d in adj[u].items() if v in index}
+                for u in nodelist[start:stop]
+            ]
+        counts = np.fromiter(map(len, rows), dtype=index_dtype, count=len(rows))
+        nnz = int(counts.sum())
+        cols = np.fromiter(
+            (index[v] for row in rows for v in row), dtype=index_dtype, count=nnz
+        )
+        data = np.fromiter(
+            (value(d) for row in rows for d in row.values()), dtype=dtype, count=nnz
+        )
+        yield start, stop, counts, cols, data
+
+
+def to_scipy_sparse_matrix_chunked(
+    G,
+    nodelist=None,
+    dtype=None,
+    weight="weight",
+    format="csr",
+    index_dtype=None,
+    chunk_size=65536,
+    path=None,
+    return_index=False,
+):
+    """Returns the graph adjacency matrix as a SciPy sparse matrix, built
+    with bounded memory.
+
+    The result equals :func:`to_scipy_sparse_matrix` with the same
+    arguments, but the matrix is filled directly from the adjacency of `G`.
+    The index and data arrays are allocated once at their final size and
+    filled one chunk of rows at a time, so no list of edges is ever built.
+    Peak memory is the size of the result plus one chunk.
+
+    Parameters
+    ----------
+    G : graph
+        The NetworkX graph used to construct the sparse matrix.
+
+    nodelist : list, optional
+       The rows and columns are ordered according to the nodes in `nodelist`.
+       If `nodelist` is None, then the ordering is produced by G.nodes().
+
+    dtype : NumPy data-type, optional
+        A valid NumPy dtype used for the matrix values. If None, then
+        float64 is used.
+
+    weight : string or None   optional (default='weight')
+        The edge attribute that holds the numerical value used for
+        the edge weight.  If None then all edge weights are 1.
+
+    format : str in {'bsr', 'csr', 'csc', 'coo', 'lil', 'dia', 'dok'}
+        The type of the matrix to be returned (default 'csr').  The 'csr'
+        and 'csc' formats are built directly; other formats are converted
+        from 'csr', which needs additional memory.
+
+    index_dtype : NumPy integer data-type, optional
+        The dtype of the index arrays, e.g. int32 or int64. If None, then
+        int32 is used when it can hold the number of entries and int64
+        otherwise.
+
+    chunk_size : int, optional (default=65536)
+        Number of rows filled at a time.
+
+    path : str, optional
+        If given, a directory in which the index and value arrays are
+        created as memory-mapped ``indptr.npy``, ``indices.npy`` and
+        ``data.npy`` files instead of in memory. The files can be loaded
+        later with ``numpy.load(..., mmap_mode="r")``. Only supported for
+        the 'csr' and 'csc' formats.
+
+    return_index : bool, optional (default=False)
+        If True, also return the dictionary mapping each node to its row
+        and column in the matrix.
+
+    Returns
+    -------
+    M : SciPy sparse matrix
+       Graph adjacency matrix.
+
+    index : dict
+       Mapping of nodes to matrix indices, only returned if `return_index`
+       is True.
+
+    Raises
+    ------
+    NetworkXError
+        If `G` has no nodes, `nodelist` is invalid or `format` is unknown.
+
+    Examples
+    --------
+    >>> G = nx.MultiDiGraph()
+    >>> G.add_edge(0, 1, weight=2)
+    0
+    >>> G.add_edge(1, 0)
+    0
+    >>> G.add_edge(2, 2, weight=3)
+    0
+    >>> G.add_edge(2, 2)
+    1
+    >>> S, index = nx.to_scipy_sparse_matrix_chunked(
+    ...     G, nodelist=[0, 1, 2], index_dtype="int32", return_index=True
+    ... )
+    >>> print(S.todense())
+    [[0. 2. 0.]
+     [1. 0. 0.]
+     [0. 0. 4.]]
+    >>> S.indices.dtype
+    dtype('int32')
+    >>> index
+    {0: 0, 1: 1, 2: 2}
+
+    See Also
+    --------
+    to_scipy_sparse_matrix
+    to_numpy_array_chunked
+    """
+    import os
+    import numpy as np
+    from scipy import sparse
+
+    if len(G) == 0:
+        raise nx.NetworkXError("Graph has no nodes or edges")
+    nodelist = _validated_nodelist(G, nodelist)
+    nlen = len(nodelist)
+    index = dict(zip(nodelist, range(nlen)))
+    if format not in {"bsr", "csr", "csc", "coo", "lil", "dia", "dok"}:
+        raise nx.NetworkXError(f"Unknown sparse matrix format: {format}")
+    if path is not None and format not in ("csr", "csc"):
+        raise nx.NetworkXError("path is only supported for csr and csc formats")
+    dtype = np.dtype(np.float64 if dtype is None else dtype)
+    adj = G._pred if format == "csc" and G.is_directed() else G._adj
+
+    # first pass: the number of entries in each row
+    if nlen == len(G):
+        counts = (len(adj[u]) for u in nodelist)
+    else:
+        counts = (sum(1 for v in adj[u] if v in index) for u in nodelist)
+    counts = np.fromiter(counts, dtype=np.int64, count=nlen)
+    nnz = int(counts.sum())
+    if index_dtype is None:
+        index_dtype = np.int32 if max(nnz, nlen) < 2 ** 31 else np.int64
+    index_dtype = np.dtype(index_dtype)
+    if max(nnz, nlen) >= np.iinfo(index_dtype).max:
+        raise nx.NetworkXError(f"index_dtype {index_dtype} is too small")
+
+    def empty(name, size, dtype):
+        if path is None:
+            return np.empty(size, dtype=dtype)
+        filename = os.path.join(path, f"{name}.npy")
+        return np.lib.format.open_memmap(filename, "w+", dtype, (size,))
+
+    indptr = empty("indptr", nlen + 1, index_dtype)
+    indptr[0] = 0
+    np.cumsum(counts, out=indptr[1:])
+    del counts
+    indices = empty("indices", nnz, index_dtype)
+    data = empty("data", nnz, dtype)
+
+    # second pass: fill the preallocated arrays chunk by chunk
+    for start, stop, counts, cols, values in _adjacency_row_chunks(
+        G, nodelist, index, weight, sum, chunk_size, index_dtype, dtype, adj
+    ):
+        a, b = indptr[start], indptr[stop]
+        indices[a:b] = cols
+        data[a:b] = values
+
+    matrix_class = sparse.csc_matrix if format == "csc" else sparse.csr_matrix
+    # assign the arrays directly, the constructor may copy them to
+    # downcast the index arrays
+    M = matrix_class((nlen, nlen), dtype=dtype)
+    M.indptr, M.indices, M.data = indptr, indices, data
+    M.check_format(full_check=False)
+    M.sort_indices()
+    if format not in ("csr", "csc"):
+        M = M.asformat(format)
+    if return_index:
+        return M, index
+    return M
+
+
+def to_numpy_array_chunked(
+    G,
+    nodelist=None,
+    dtype=None,
+    order=None,
+    multigraph_weight=sum,
+    weight="weight",
+    nonedge=0.0,
+    out=None,
+    chunk_size=65536,
+):
+    """Returns the graph adjacency matrix as a NumPy array, built with
+    bounded memory.
+
+    The result equals :func:`to_numpy_array` with the same arguments, but
+    the array is allocated once with its final dtype and filled from the
+    adjacency of `G` one chunk of rows at a time, without temporary arrays
+    of the size of the result. The array can also be supplied with `out`,
+    for instance a :class:`numpy.memmap` to write a matrix that does not
+    fit in memory.
+
+    Parameters
+    ----------
+    G : graph
+        The NetworkX graph used to construct the NumPy array.
+
+    nodelist : list, optional
+        The rows and columns are ordered according to the nodes in `nodelist`.
+        If `nodelist` is None, then the ordering is produced by G.nodes().
+
+    dtype : NumPy data-type, optional
+        A valid single NumPy data type used to initialize the array. If None,
+        then float64 is used. Ignored if `out` is given.
+
+    order : {'C', 'F'}, optional
+        Whether to store the array in row-major (C-style) or column-major
+        (Fortran-style) order in memory. Ignored if `out` is given.
+
+    multigraph_weight : {sum, min, max}, optional
+        An operator that determines how weights in multigraphs are handled.
+        The default is to sum the weights of the multiple edges.
+
+    weight : string or None optional (default = 'weight')
+        The edge attribute that holds the numerical value used for
+        the edge weight. If an edge does not have that attribute, then the
+        value 1 is used instead.
+
+    nonedge : float (default = 0.0)
+        The array values corresponding to nonedges are typically set to zero.
+        However, this could be undesirable if there are array values
+        corresponding to actual edges that also have the value zero. If so,
+        one might prefer nonedges to have some other value, such as nan.
+
+    out : NumPy array, optional
+        A square array of size ``len(nodelist)`` to write the result into.
+
+    chunk_size : int, optional (default=65536)
+        Number of rows filled at a time.
+
+    Returns
+    -------
+    A : NumPy ndarray
+        Graph adjacency matrix. This is `out` if it was given.
+
+    Raises
+    ------
+    NetworkXError
+        If `nodelist` is invalid or `out` has the wrong shape.
+
+    Examples
+    --------
+    >>> G = nx.MultiDiGraph()
+    >>> G.add_edge(0, 1, weight=2)
+    0
+    >>> G.add_edge(1, 0)
+    0
+    >>> G.add_edge(2, 2, weight=3)
+    0
+    >>> G.add_edge(2, 2)
+    1
+    >>> nx.to_numpy_array_chunked(G, nodelist=[0, 1, 2])
+    array([[0., 2., 0.],
+           [1., 0., 0.],
+           [0., 0., 4.]])
+
+    See Also
+    --------
+    to_numpy_array
+    to_scipy_sparse_matrix_chunked
+    """
+    import numpy as np
+
+    nodelist = _validated_nodelist(G, nodelist)
+    nlen = len(nodelist)
+    index = dict(zip(nodelist, range(nlen)))
+    if out is None:
+        A = np.full((nlen, nlen), nonedge, dtype=dtype, order=order)
+    else:
+        if out.shape != (nlen, nlen):
+            raise nx.NetworkXError(f"out must have shape {(nlen, nlen)}")
+        A = out
+        A[...] = nonedge
+    index_dtype = np.int32 if nlen < 2 ** 31 else np.int64
+    for start, stop, counts, cols, values in _adjacency_row_chunks(
+        G,
+        nodelist,
+        index,
+        weight,
+        multigraph_weight,
+        chunk_size,
+        index_dtype,
+        A.dtype,
+        G._adj,
+    ):
+        rows = np.repeat(np.arange(start, stop, dtype=index_dtype), counts)
+        A[rows, cols] = values
+    return A
+
+
 def _csr_gen_triples(A):
     """Converts a SciPy sparse matrix in **Compressed Sparse Row** format to
     an iterable of weighted edge triples.
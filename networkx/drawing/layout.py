@@ -22,6 +22,7 @@ __all__ = [
     "bipartite_layout",
     "circular_layout",
     "kamada_kawai_layout",
+    "sparse_stress_layout",
     "random_layout",
     "rescale_layout",
     "rescale_layout_dict",
@@ -30,6 +31,7 @@ __all__ = [
     "spectral_layout",
     "planar_layout",
     "fruchterman_reingold_layout",
+    "barnes_hut_layout",
     "spiral_layout",
     "multipartite_layout",
 ]
@@ -646,6 +648,295 @@ def _sparse_fruchterman_reingold(
     return pos
 
 
+@random_state(10)
+def barnes_hut_layout(
+    G,
+    k=None,
+    pos=None,
+    fixed=None,
+    iterations=50,
+    threshold=1e-4,
+    weight="weight",
+    scale=1,
+    center=None,
+    dim=2,
+    seed=None,
+    theta=0.8,
+):
+    """Position nodes using Fruchterman-Reingold force-directed algorithm
+    with the Barnes-Hut approximation of the repulsive forces.
+
+    This computes the same forces as :func:`fruchterman_reingold_layout`,
+    but instead of summing the repulsion of every pair of nodes, the nodes
+    are stored in a quadtree (an octree in 3 dimensions, and so on) and
+    distant groups of nodes repel as a single node at their center of mass
+    [1]_. Each iteration takes O(n log n) time instead of O(n^2), and the
+    attraction along edges is computed from edge arrays, so the layout
+    scales to graphs with hundreds of thousands of nodes.
+
+    Parameters
+    ----------
+    G : NetworkX graph or list of nodes
+        A position will be assigned to every node in G.
+
+    k : float (default=None)
+        Optimal distance between nodes.  If None the distance is set to
+        1/sqrt(n) where n is the number of nodes.  Increase this value
+        to move nodes farther apart.
+
+    pos : dict or None  optional (default=None)
+        Initial positions for nodes as a dictionary with node as keys
+        and values as a coordinate list or tuple.  If None, then use
+        random initial positions. Pass a previous layout to warm start.
+
+    fixed : list or None  optional (default=None)
+        Nodes to keep fixed at initial position.
+        ValueError raised if `fixed` specified and `pos` not.
+
+    iterations : int  optional (default=50)
+        Maximum number of iterations taken
+
+    threshold: float optional (default = 1e-4)
+        Threshold for relative error in node position changes.
+        The iteration stops if the error is below this threshold.
+
+    weight : string or None   optional (default='weight')
+        The edge attribute that holds the numerical value used for
+        the edge weight.  If None, then all edge weights are 1.
+
+    scale : number or None (default: 1)
+        Scale factor for positions. Not used unless `fixed is None`.
+        If scale is None, no rescaling is performed.
+
+    center : array-like or None
+        Coordinate pair around which to center the layout.
+        Not used unless `fixed is None`.
+
+    dim : int
+        Dimension of layout.
+
+    seed : int, RandomState instance or None  optional (default=None)
+        Set the random state for deterministic node layouts.
+        If int, `seed` is the seed used by the random number generator,
+        if numpy.random.RandomState instance, `seed` is the random
+        number generator,
+        if None, the random number generator is the RandomState instance used
+        by numpy.random.
+
+    theta : float optional (default=0.8)
+        The accuracy of the approximation. A group of nodes is treated as a
+        single node if the width of its cell divided by its distance is less
+        than `theta`. With `theta` equal to 0 the forces are exact.
+
+    Returns
+    -------
+    pos : dict
+        A dictionary of positions keyed by node
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> pos = nx.barnes_hut_layout(G)
+
+    Refine a previous layout:
+
+    >>> pos = nx.barnes_hut_layout(G, pos=pos, iterations=10)
+
+    References
+    ----------
+    .. [1] J. Barnes and P. Hut,
+       A hierarchical O(N log N) force-calculation algorithm.
+       Nature 324: 446-449, (1986).
+    """
+    import numpy as np
+
+    G, center = _process_params(G, center, dim)
+
+    if fixed is not None:
+        if pos is None:
+            raise ValueError("nodes are fixed without positions given")
+        for node in fixed:
+            if node not in pos:
+                raise ValueError("nodes are fixed without positions given")
+        nfixed = {node: i for i, node in enumerate(G)}
+        fixed = np.asarray([nfixed[node] for node in fixed])
+
+    if pos is not None:
+        # Determine size of existing domain to adjust initial positions
+        dom_size = max(coord for pos_tup in pos.values() for coord in pos_tup)
+        if dom_size == 0:
+            dom_size = 1
+        pos_arr = seed.rand(len(G), dim) * dom_size + center
+
+        for i, n in enumerate(G):
+            if n in pos:
+                pos_arr[i] = np.asarray(pos[n])
+    else:
+        pos_arr = seed.rand(len(G), dim)
+        dom_size = 1
+
+    if len(G) == 0:
+        return {}
+    if len(G) == 1:
+        return {nx.utils.arbitrary_element(G.nodes()): center}
+
+    if k is None:
+        # We must adjust k by domain size for layouts not near 1x1
+        k = (dom_size if fixed is not None else 1) / np.sqrt(len(G))
+    index = {n: i for i, n in enumerate(G)}
+    if weight is None:
+        edges = ((index[u], index[v], 1) for u, v in G.edges())
+    else:
+        edges = ((index[u], index[v], w) for u, v, w in G.edges(data=weight, default=1))
+    u, v, w = np.array(list(edges), dtype=float).reshape(-1, 3).T
+    pos = _barnes_hut_fruchterman_reingold(
+        u.astype(np.intp),
+        v.astype(np.intp),
+        w,
+        G.is_directed(),
+        k,
+        pos_arr,
+        fixed,
+        iterations,
+        threshold,
+        theta,
+    )
+    if fixed is None and scale is not None:
+        pos = rescale_layout(pos, scale=scale) + center
+    pos = dict(zip(G, pos))
+    return pos
+
+
+def _barnes_hut_fruchterman_reingold(
+    u, v, w, directed, k, pos, fixed, iterations, threshold, theta
+):
+    # Position nodes using Fruchterman-Reingold with Barnes-Hut repulsion.
+    # Entry point for NetworkX graph is barnes_hut_layout()
+    # The edge (u[i], v[i]) with weight w[i] pulls u[i] towards v[i], and v[i]
+    # towards u[i] unless the graph is directed, as in the adjacency matrix
+    # of _fruchterman_reingold().
+    import numpy as np
+
+    nnodes, dim = pos.shape
+    pos = pos.astype(float)
+    loops = u == v
+    u, v, w = u[~loops], v[~loops], w[~loops]
+    # the initial "temperature"  is about .1 of domain area (=1x1)
+    # this is the largest step allowed in the dynamics.
+    t = max(pos[:, :2].max(axis=0) - pos[:, :2].min(axis=0)) * 0.1
+    # simple cooling scheme.
+    # linearly step down by dt on each iteration so last iteration is size dt.
+    dt = t / float(iterations + 1)
+    for iteration in range(iterations):
+        displacement = _barnes_hut_repulsion(pos, k, theta)
+        # attraction along the edges
+        delta = pos[u] - pos[v]
+        distance = np.sqrt((delta ** 2).sum(axis=1))
+        attraction = delta * (w * distance / k)[:, np.newaxis]
+        for d in range(dim):
+            displacement[:, d] -= np.bincount(u, attraction[:, d], nnodes)
+            if not directed:
+                displacement[:, d] += np.bincount(v, attraction[:, d], nnodes)
+        # update positions
+        length = np.sqrt((displacement ** 2).sum(axis=1))
+        length = np.where(length < 0.01, 0.1, length)
+        delta_pos = displacement * (t / length)[:, np.newaxis]
+        if fixed is not None:
+            # don't change positions of fixed nodes
+            delta_pos[fixed] = 0.0
+        pos += delta_pos
+        # cool temperature
+        t -= dt
+        err = np.linalg.norm(delta_pos) / nnodes
+        if err < threshold:
+            break
+    return pos
+
+
+def _barnes_hut_repulsion(pos, k, theta):
+    # Returns the repulsive displacement of every node, summed over all
+    # other nodes, with the Barnes-Hut approximation.
+    #
+    # The tree is implicit: the nodes are sorted by their Morton code, so the
+    # nodes of every cell are contiguous, and the cells of a level are the
+    # runs of equal code prefixes.  The tree is walked one level at a time
+    # for all pairs of cells at once, keeping only the pairs (a, b) with
+    # a <= b.  A pair of distinct cells is resolved if the cells are far
+    # apart compared to their width, or if both hold a single node; its force
+    # then acts on every node of both cells, in opposite directions.
+    # Otherwise the pair is replaced by the pairs of their children.
+    import numpy as np
+
+    nnodes, dim = pos.shape
+    levels = min(62 // dim, 20)
+    low = pos.min(axis=0)
+    width = (pos.max(axis=0) - low).max() * (1 + 1e-9) or 1.0
+    cells = ((pos - low) * ((1 << levels) / width)).astype(np.int64)
+    np.clip(cells, 0, (1 << levels) - 1, out=cells)
+    code = np.zeros(nnodes, dtype=np.int64)
+    for b in range(levels):
+        for d in range(dim):
+            code |= ((cells[:, d] >> b) & 1) << (b * dim + d)
+    order = np.argsort(code, kind="stable")
+    code = code[order]
+    spos = pos[order]
+
+    tree = []
+    for level in range(levels + 1):
+        prefix = code >> (dim * (levels - level))
+        starts = np.flatnonzero(np.r_[True, prefix[1:] != prefix[:-1]])
+        counts = np.diff(np.r_[starts, nnodes])
+        com = np.add.reduceat(spos, starts, axis=0) / counts[:, np.newaxis]
+        tree.append((starts, counts, com))
+        if counts.max() == 1:
+            break
+
+    force = np.zeros((nnodes, dim))
+    a = b = np.zeros(1, dtype=np.intp)
+    for level, (starts, counts, com) in enumerate(tree):
+        size = width / (1 << level)
+        delta = com[a] - com[b]
+        distance2 = (delta ** 2).sum(axis=1)
+        distinct = a != b
+        if level == len(tree) - 1:
+            # nodes sharing a cell of the last level are at the same point
+            resolved = distinct
+        else:
+            resolved = distinct & (size * size < theta * theta * distance2)
+            resolved |= distinct & (counts[a] == 1) & (counts[b] == 1)
+        ra, rb = a[resolved], b[resolved]
+        # enforce minimum distance of 0.01
+        f = delta[resolved] * (k * k / np.maximum(distance2[resolved], 1e-4))[
+            :, np.newaxis
+        ]
+        cell_force = np.empty((len(starts), dim))
+        for d in range(dim):
+            cell_force[:, d] = np.bincount(
+                ra, f[:, d] * counts[rb], len(starts)
+            ) - np.bincount(rb, f[:, d] * counts[ra], len(starts))
+        force += np.repeat(cell_force, counts, axis=0)
+        a, b = a[~resolved], b[~resolved]
+        if not len(a) or level == len(tree) - 1:
+            break
+        # expand the remaining pairs into the pairs of their children
+        child_starts = tree[level + 1][0]
+        first = np.searchsorted(child_starts, starts)
+        num_children = np.diff(np.r_[first, len(child_starts)])
+        na, nb = num_children[a], num_children[b]
+        num_pairs = na * nb
+        offsets = np.arange(num_pairs.sum()) - np.repeat(
+            np.cumsum(num_pairs) - num_pairs, num_pairs
+        )
+        nb = np.repeat(nb, num_pairs)
+        a = np.repeat(first[a], num_pairs) + offsets // nb
+        b = np.repeat(first[b], num_pairs) + offsets % nb
+        keep = a <= b
+        a, b = a[keep], b[keep]
+    result = np.empty_like(force)
+    result[order] = force
+    return result
+
+
 def kamada_kawai_layout(
     G, dist=None, pos=None, weight="weight", scale=1, center=None, dim=2
 ):
@@ -770,6 +1061,243 @@ def _kamada_kawai_costfn(pos_vec, np, invdist, meanweight, dim):
     return (cost, grad.ravel())
 
 
+@random_state(9)
+def sparse_stress_layout(
+    G,
+    pivots=50,
+    pos=None,
+    weight="weight",
+    iterations=100,
+    threshold=1e-4,
+    scale=1,
+    center=None,
+    dim=2,
+    seed=None,
+):
+    """Position nodes by minimizing a sparse approximation of the stress.
+
+    Like :func:`kamada_kawai_layout`, this places nodes so that their
+    distances in the layout match their shortest path lengths in the graph.
+    Instead of the stress over all pairs of nodes, it uses the sparse stress
+    model of [1]_: the terms for the edges, and the terms between every node
+    and a set of `pivots` nodes, weighted by the number of nodes they stand
+    for.  The initial layout is computed by pivot MDS [2]_ from the same
+    shortest path lengths.  Time and memory are O(n k) for n nodes and k
+    pivots, plus the time of k single source shortest path computations.
+
+    Parameters
+    ----------
+    G : NetworkX graph or list of nodes
+        A position will be assigned to every node in G. The direction of
+        the edges is ignored.
+
+    pivots : int (default=50)
+        Number of pivot nodes. They are chosen by max-min sampling, each
+        new pivot being the node farthest from the previous ones.
+
+    pos : dict or None  optional (default=None)
+        Initial positions for nodes as a dictionary with node as keys
+        and values as a coordinate list or tuple.  If None, then use
+        pivot MDS.  Nodes missing from `pos` also use pivot MDS.
+
+    weight : string or None   optional (default='weight')
+        The edge attribute that holds the length of the edges.
+        If None, then all edge lengths are 1.
+
+    iterations : int  optional (default=100)
+        Maximum number of stress majorization iterations.
+
+    threshold: float optional (default = 1e-4)
+        Threshold for the change of the positions, relative to the size of
+        the layout. The iteration stops if the change is below this threshold.
+
+    scale : number or None (default: 1)
+        Scale factor for positions. If scale is None, no rescaling is
+        performed and the distances of the layout are path lengths.
+
+    center : array-like or None
+        Coordinate pair around which to center the layout.
+
+    dim : int
+        Dimension of layout.
+
+    seed : int, RandomState instance or None  optional (default=None)
+        Set the random state for the choice of the first pivot.
+        If int, `seed` is the seed used by the random number generator,
+        if numpy.random.RandomState instance, `seed` is the random
+        number generator,
+        if None, the random number generator is the RandomState instance used
+        by numpy.random.
+
+    Returns
+    -------
+    pos : dict
+        A dictionary of positions keyed by node
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(10, 10)
+    >>> pos = nx.sparse_stress_layout(G, pivots=10, seed=42)
+
+    Notes
+    -----
+    Nodes in different connected components are treated as if they were
+    at the largest finite distance of the graph from each other.
+
+    References
+    ----------
+    .. [1] M. Ortmann, M. Klimenta and U. Brandes,
+       A Sparse Stress Model.
+       Journal of Graph Algorithms and Applications 21(5): 791-821, (2017).
+    .. [2] U. Brandes and C. Pich,
+       Eigensolver Methods for Progressive Multidimensional Scaling of
+       Large Data.
+       Graph Drawing, LNCS 4372: 42-53, (2007).
+    """
+    import numpy as np
+
+    G, center = _process_params(G, center, dim)
+    nnodes = len(G)
+    if nnodes == 0:
+        return {}
+    if nnodes == 1:
+        return {nx.utils.arbitrary_element(G.nodes()): center}
+
+    index = {n: i for i, n in enumerate(G)}
+    if weight is None:
+        edges = ((index[u], index[v], 1) for u, v in G.edges())
+    else:
+        edges = ((index[u], index[v], w) for u, v, w in G.edges(data=weight, default=1))
+    u, v, w = np.array(list(edges), dtype=float).reshape(-1, 3).T
+    # keep the shortest of parallel edges, ignoring their direction
+    u, v = np.minimum(u, v).astype(np.intp), np.maximum(u, v).astype(np.intp)
+    order = np.lexsort((w, v, u))
+    u, v, w = u[order], v[order], w[order]
+    first = np.r_[True, (u[1:] != u[:-1]) | (v[1:] != v[:-1])] & (u != v)
+    u, v, w = u[first], v[first], w[first]
+
+    dist, pivot = _pivot_distances(u, v, w, nnodes, min(pivots, nnodes), seed)
+    finite = np.isfinite(dist)
+    if not finite.all():
+        dist[~finite] = dist[finite].max() if np.any(dist[finite]) else 1.0
+
+    init = _pivot_mds(dist, dim)
+    if pos is not None:
+        for i, n in enumerate(G):
+            if n in pos:
+                init[i] = np.asarray(pos[n])
+    pos = _sparse_stress(u, v, w, dist, pivot, init, iterations, threshold)
+    if scale is not None:
+        pos = rescale_layout(pos, scale=scale)
+    return dict(zip(G, pos + center))
+
+
+def _pivot_distances(u, v, w, nnodes, pivots, seed):
+    # Returns the shortest path lengths from the pivots to all nodes, as a
+    # pivots x nnodes array, and the pivots. The edges (u[i], v[i]) with
+    # length w[i] are undirected and distinct. The first pivot is random and
+    # each next pivot is the node farthest from those chosen so far.
+    import numpy as np
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import dijkstra
+
+    A = coo_matrix((np.r_[w, w], (np.r_[u, v], np.r_[v, u])), shape=(nnodes, nnodes))
+    A = A.tocsr()
+    dist = np.empty((pivots, nnodes))
+    pivot = np.empty(pivots, dtype=np.intp)
+    nearest = np.full(nnodes, np.inf)
+    p = seed.randint(nnodes)
+    for i in range(pivots):
+        pivot[i] = p
+        dist[i] = dijkstra(A, indices=p)
+        np.minimum(nearest, dist[i], out=nearest)
+        p = np.argmax(nearest)
+    return dist, pivot
+
+
+def _pivot_mds(dist, dim):
+    # Pivot MDS: the positions are the projections of the double centered
+    # squared pivot distances on their principal components.
+    import numpy as np
+
+    C = dist ** 2
+    C -= C.mean(axis=0)
+    C -= C.mean(axis=1)[:, np.newaxis]
+    C *= -0.5
+    eigenvalues, eigenvectors = np.linalg.eigh(C @ C.T)
+    pos = C.T @ eigenvectors[:, ::-1][:, :dim]
+    if pos.shape[1] < dim:
+        pos = np.hstack([pos, np.zeros((len(pos), dim - pos.shape[1]))])
+    # Match the size of the layout to the distances
+    norm = np.sqrt((pos ** 2).sum(axis=1)).max()
+    if norm > 0:
+        pos *= dist.max() / (2 * norm)
+    return pos
+
+
+def _sparse_stress(u, v, w, dist, pivot, pos, iterations, threshold):
+    # Localized stress majorization of the sparse stress model.
+    # Every node is moved to the weighted mean of its targets: for each
+    # edge (u, v) of length d the point at distance d from the other end in
+    # the direction of the node, and likewise for each pivot with the path
+    # length to the pivot. A term between a node i and a pivot p has weight
+    # s / d(i, p)^2, where s is the number of nodes closer to p than to the
+    # other pivots and within distance d(i, p) / 2 of p.
+    import numpy as np
+
+    npivots, nnodes = dist.shape
+    keep = w > 0
+    u, v, w = u[keep], v[keep], w[keep]
+    edge_weight = 1 / w ** 2
+
+    region = np.argmin(dist, axis=0)
+    pivot_weight = np.zeros_like(dist)
+    for i in range(npivots):
+        nearby = np.sort(dist[i, region == i])
+        pivot_weight[i] = np.searchsorted(nearby, dist[i] / 2, side="right")
+    with np.errstate(divide="ignore"):
+        pivot_weight /= dist ** 2
+    pivot_weight[dist == 0] = 0
+    pivot_target = pivot_weight * dist
+
+    total_weight = (
+        np.bincount(u, edge_weight, nnodes)
+        + np.bincount(v, edge_weight, nnodes)
+        + pivot_weight.sum(axis=0)
+    )
+    total_weight[total_weight == 0] = 1
+    pos = pos.astype(float)
+    for iteration in range(iterations):
+        target = np.zeros_like(pos)
+        # targets of the edge terms
+        delta = pos[u] - pos[v]
+        length = np.sqrt((delta ** 2).sum(axis=1))
+        length[length == 0] = 1
+        delta *= (w / length)[:, np.newaxis]
+        for d in range(pos.shape[1]):
+            target[:, d] += np.bincount(
+                u, edge_weight * (pos[v, d] + delta[:, d]), nnodes
+            )
+            target[:, d] += np.bincount(
+                v, edge_weight * (pos[u, d] - delta[:, d]), nnodes
+            )
+        # targets of the pivot terms, with the pivots in the rows
+        length = np.zeros_like(dist)
+        for d in range(pos.shape[1]):
+            length += np.subtract.outer(pos[pivot, d], pos[:, d]) ** 2
+        np.sqrt(length, out=length)
+        length[length == 0] = np.inf
+        scaled = pivot_target / length
+        target += (pivot_weight - scaled).T @ pos[pivot]
+        target += pos * scaled.sum(axis=0)[:, np.newaxis]
+        target /= total_weight[:, np.newaxis]
+        change = np.linalg.norm(target - pos)
+        pos = target
+        if change < threshold * np.linalg.norm(pos - pos.mean(axis=0)):
+            break
+    return pos
+
+
 def spectral_layout(G, weight="weight", scale=1, center=None, dim=2):
     """Position nodes using the eigenvectors of the graph Laplacian.
 
@@ -198,6 +198,81 @@ class TestLayout:
         for axis in range(2):
             assert almost_equal(pos[(0, 0)][axis], npos[(0, 0)][axis])
 
+    def test_barnes_hut_layout(self):
+        G = self.bigG
+        pos = nx.barnes_hut_layout(G, seed=42)
+        assert set(pos) == set(G)
+        pos = np.array(list(pos.values()))
+        assert np.allclose(abs(pos).max(), 1)
+        pos = nx.barnes_hut_layout(G, dim=3, center=(1, 1, 1), seed=42)
+        assert np.array(list(pos.values())).shape == (len(G), 3)
+        pos = nx.barnes_hut_layout(nx.DiGraph(G), weight=None, seed=42)
+        assert len(pos) == len(G)
+
+    def test_barnes_hut_repulsion(self):
+        # with theta=0 the forces are exact, even for coincident nodes
+        pos = np.random.RandomState(42).rand(100, 2)
+        pos = np.vstack([pos, pos[:5]])
+        delta = pos[:, np.newaxis, :] - pos[np.newaxis, :, :]
+        distance2 = np.maximum((delta ** 2).sum(axis=2), 1e-4)
+        exact = np.einsum("ijk,ij->ik", delta, 0.01 / distance2)
+        force = nx.drawing.layout._barnes_hut_repulsion(pos, 0.1, 0)
+        assert np.allclose(force, exact)
+        force = nx.drawing.layout._barnes_hut_repulsion(pos, 0.1, 0.8)
+        assert np.linalg.norm(force - exact) < 0.2 * np.linalg.norm(exact)
+
+    def test_barnes_hut_matches_fruchterman_reingold(self):
+        A = nx.to_numpy_array(self.Gs)
+        u, v = np.nonzero(A)
+        pos = np.random.RandomState(42).rand(len(A), 2)
+        expected = nx.drawing.layout._fruchterman_reingold(
+            A, k=0.5, pos=pos, iterations=5
+        )
+        pos = nx.drawing.layout._barnes_hut_fruchterman_reingold(
+            u, v, A[u, v], True, 0.5, pos, None, 5, 1e-4, 0
+        )
+        assert np.allclose(pos, expected)
+
+    def test_fixed_node_barnes_hut(self):
+        pos = nx.circular_layout(self.bigG)
+        npos = nx.barnes_hut_layout(self.bigG, pos=pos, fixed=[(0, 0)])
+        assert tuple(pos[(0, 0)]) == tuple(npos[(0, 0)])
+        # warm start
+        npos = nx.barnes_hut_layout(self.bigG, pos=pos, iterations=0, scale=None)
+        assert all(np.allclose(npos[n], pos[n]) for n in pos)
+        pytest.raises(ValueError, nx.barnes_hut_layout, self.bigG, fixed=[(0, 0)])
+
+    def test_sparse_stress_layout(self):
+        G = nx.grid_2d_graph(6, 6)
+        pos = nx.sparse_stress_layout(G, pivots=10, scale=None, seed=42)
+        nodes = list(G)
+        pos = np.array([pos[n] for n in nodes])
+        length = dict(nx.shortest_path_length(G))
+        expected = np.array([[length[a][b] for b in nodes] for a in nodes])
+        distance = np.linalg.norm(pos[:, np.newaxis] - pos[np.newaxis], axis=-1)
+        mask = expected > 0
+        error = (distance[mask] - expected[mask]) / expected[mask]
+        assert np.mean(error ** 2) < 0.05
+        # a path is laid out on a line
+        pos = nx.sparse_stress_layout(nx.path_graph(5), scale=None, seed=42)
+        for i in range(4):
+            assert almost_equal(np.linalg.norm(pos[i + 1] - pos[i]), 1)
+        assert almost_equal(np.linalg.norm(pos[4] - pos[0]), 4)
+
+    def test_sparse_stress_layout_options(self):
+        G = nx.MultiDiGraph([(0, 1, {"weight": 3}), (1, 0), (1, 2), (2, 2)])
+        pos = nx.sparse_stress_layout(G, scale=None, seed=42)
+        assert almost_equal(np.linalg.norm(pos[2] - pos[0]), 2)
+        pos = nx.sparse_stress_layout(G, weight=None, dim=3, center=(1, 1, 1))
+        assert np.array(list(pos.values())).shape == (3, 3)
+        # disconnected graphs and warm starts
+        G = nx.Graph([(0, 1), (2, 3), (3, 4)])
+        G.add_node(5)
+        pos = nx.sparse_stress_layout(G, seed=42)
+        assert set(pos) == set(G)
+        npos = nx.sparse_stress_layout(G, pos=pos, iterations=0, scale=None)
+        assert all(np.allclose(npos[n], pos[n]) for n in G)
+
     def test_center_parameter(self):
         G = nx.path_graph(1)
         nx.random_layout(G, center=(1, 1))
@@ -209,6 +284,10 @@ class TestLayout:
         assert tuple(vpos[0]) == (1, 1)
         vpos = nx.fruchterman_reingold_layout(G, center=(1, 1))
         assert tuple(vpos[0]) == (1, 1)
+        vpos = nx.barnes_hut_layout(G, center=(1, 1))
+        assert tuple(vpos[0]) == (1, 1)
+        vpos = nx.sparse_stress_layout(G, center=(1, 1))
+        assert tuple(vpos[0]) == (1, 1)
         vpos = nx.spectral_layout(G, center=(1, 1))
         assert tuple(vpos[0]) == (1, 1)
         vpos = nx.shell_layout(G, center=(1, 1))
@@ -244,6 +323,10 @@ class TestLayout:
         assert vpos == {}
         vpos = nx.fruchterman_reingold_layout(G, center=(1, 1))
         assert vpos == {}
+        vpos = nx.barnes_hut_layout(G, center=(1, 1))
+        assert vpos == {}
+        vpos = nx.sparse_stress_layout(G, center=(1, 1))
+        assert vpos == {}
         vpos = nx.spectral_layout(G, center=(1, 1))
         assert vpos == {}
         vpos = nx.shell_layout(G, center=(1, 1))
@@ -9,12 +9,15 @@ import math
 from operator import itemgetter
 
 import networkx as nx
-from networkx.utils import random_weighted_sample, py_random_state
+from networkx.utils import random_weighted_sample, py_random_state, np_random_state
 
 __all__ = [
     "configuration_model",
+    "configuration_model_edges",
     "directed_configuration_model",
+    "directed_configuration_model_edges",
     "expected_degree_graph",
+    "expected_degree_edges",
     "havel_hakimi_graph",
     "directed_havel_hakimi_graph",
     "degree_sequence_tree",
@@ -125,6 +128,35 @@ def _configuration_model(
     return G
 
 
+def _edge_arrays_result(u, v, n, directed, sparse, multigraph=False, simple=False):
+    """Returns the edge arrays, or the adjacency matrix if `sparse`.
+
+    If `multigraph`, the arrays may hold self-loops and parallel edges. With
+    `simple` they are removed in bulk, otherwise parallel edges are summed
+    in the adjacency matrix. Undirected self-loops are counted once.
+    """
+    import numpy as np
+
+    if simple:
+        keep = u != v
+        u, v = u[keep], v[keep]
+        if not directed:
+            u, v = np.minimum(u, v), np.maximum(u, v)
+        keys = np.sort(u * n + v)
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+        u, v = np.divmod(keys, n)
+    if not sparse:
+        return u, v
+    import scipy.sparse
+
+    if not directed:
+        loop = u == v
+        u, v = np.concatenate((u, v[~loop])), np.concatenate((v, u[~loop]))
+    dtype = np.int64 if multigraph and not simple else np.int8
+    data = np.ones(len(u), dtype=dtype)
+    return scipy.sparse.coo_matrix((data, (u, v)), shape=(n, n)).tocsr()
+
+
 @py_random_state(2)
 def configuration_model(deg_sequence, create_using=None, seed=None):
     """Returns a random graph with the given degree sequence.
@@ -227,6 +259,69 @@ def configuration_model(deg_sequence, create_using=None, seed=None):
     return G
 
 
+@np_random_state(1, allow_generator=True)
+def configuration_model_edges(deg_sequence, seed=None, simple=False, sparse=False):
+    """Returns the edges of a configuration model graph as arrays.
+
+    This generates the same model as :func:`configuration_model`, by
+    shuffling an array of stubs with NumPy, and does not build a graph.
+
+    Parameters
+    ----------
+    deg_sequence :  list or array of nonnegative integers
+        Each entry corresponds to the degree of a node.
+    seed : integer, numpy.random.Generator, numpy.random.RandomState or None
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+    simple : bool, optional (default=False)
+        If True, remove the self-loops and merge the parallel edges, which
+        gives the erased configuration model. The degrees of the nodes
+        involved are then smaller than in `deg_sequence`.
+    sparse : bool, optional (default=False)
+        If True, return the adjacency matrix as a SciPy CSR matrix instead,
+        in which parallel edges are summed.
+
+    Returns
+    -------
+    (u, v) : tuple of NumPy int64 arrays
+        The endpoints of the edges on nodes ``range(len(deg_sequence))``.
+        If `simple`, ``u < v`` and the edges are sorted.
+
+    M : SciPy sparse matrix
+        The adjacency matrix, if `sparse` is True.
+
+    Raises
+    ------
+    NetworkXError
+        If the degree sequence does not have an even sum.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> sequence = [3, 2, 2, 1, 1, 1]
+    >>> u, v = nx.configuration_model_edges(sequence, seed=np.random.default_rng(1))
+    >>> np.bincount(np.concatenate((u, v))).tolist()
+    [3, 2, 2, 1, 1, 1]
+
+    See Also
+    --------
+    configuration_model, expected_degree_edges
+    """
+    import numpy as np
+
+    deg_sequence = np.asarray(deg_sequence, dtype=np.int64)
+    if deg_sequence.sum() % 2 != 0:
+        msg = "Invalid degree sequence: sum of degrees must be even, not odd"
+        raise nx.NetworkXError(msg)
+    n = len(deg_sequence)
+    stubs = np.repeat(np.arange(n), deg_sequence)
+    seed.shuffle(stubs)
+    half = len(stubs) // 2
+    return _edge_arrays_result(
+        stubs[:half], stubs[half:], n, False, sparse, multigraph=True, simple=simple
+    )
+
+
 @py_random_state(3)
 def directed_configuration_model(
     in_degree_sequence, out_degree_sequence, create_using=None, seed=None
@@ -329,6 +424,71 @@ def directed_configuration_model(
     return G
 
 
+@np_random_state(2, allow_generator=True)
+def directed_configuration_model_edges(
+    in_degree_sequence, out_degree_sequence, seed=None, simple=False, sparse=False
+):
+    """Returns the edges of a directed configuration model graph as arrays.
+
+    This generates the same model as :func:`directed_configuration_model`,
+    by shuffling arrays of stubs with NumPy, and does not build a graph.
+
+    Parameters
+    ----------
+    in_degree_sequence :  list or array of nonnegative integers
+       Each entry corresponds to the in-degree of a node.
+    out_degree_sequence :  list or array of nonnegative integers
+       Each entry corresponds to the out-degree of a node.
+    seed : integer, numpy.random.Generator, numpy.random.RandomState or None
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+    simple : bool, optional (default=False)
+        If True, remove the self-loops and merge the parallel edges.
+    sparse : bool, optional (default=False)
+        If True, return the adjacency matrix as a SciPy CSR matrix instead,
+        in which parallel edges are summed.
+
+    Returns
+    -------
+    (u, v) : tuple of NumPy int64 arrays
+        The tails and heads of the edges, on as many nodes as the longer
+        sequence. If `simple`, the edges are sorted.
+
+    M : SciPy sparse matrix
+        The adjacency matrix, if `sparse` is True.
+
+    Raises
+    ------
+    NetworkXError
+        If the degree sequences do not have the same sum.
+
+    Examples
+    --------
+    >>> u, v = nx.directed_configuration_model_edges([1, 2, 0], [2, 0, 1], seed=1)
+    >>> sorted(u.tolist()), sorted(v.tolist())
+    ([0, 0, 2], [0, 1, 1])
+
+    See Also
+    --------
+    directed_configuration_model, configuration_model_edges
+    """
+    import numpy as np
+
+    in_deg = np.asarray(in_degree_sequence, dtype=np.int64)
+    out_deg = np.asarray(out_degree_sequence, dtype=np.int64)
+    if in_deg.sum() != out_deg.sum():
+        msg = "Invalid degree sequences: sequences must have equal sums"
+        raise nx.NetworkXError(msg)
+    n = max(len(in_deg), len(out_deg))
+    out_stubs = np.repeat(np.arange(len(out_deg)), out_deg)
+    in_stubs = np.repeat(np.arange(len(in_deg)), in_deg)
+    seed.shuffle(out_stubs)
+    seed.shuffle(in_stubs)
+    return _edge_arrays_result(
+        out_stubs, in_stubs, n, True, sparse, multigraph=True, simple=simple
+    )
+
+
 @py_random_state(1)
 def expected_degree_graph(w, seed=None, selfloops=True):
     r"""Returns a random graph with given expected degrees.
@@ -438,6 +598,96 @@ def expected_degree_graph(w, seed=None, selfloops=True):
     return G
 
 
+@np_random_state(1, allow_generator=True)
+def expected_degree_edges(w, seed=None, selfloops=True, sparse=False):
+    r"""Returns the edges of a random graph with given expected degrees.
+
+    This generates the same Chung–Lu model as :func:`expected_degree_graph`,
+    with NumPy, and does not build a graph.
+
+    Parameters
+    ----------
+    w : list or array
+        The list of expected degrees.
+    seed : integer, numpy.random.Generator, numpy.random.RandomState or None
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+    selfloops: bool (default=True)
+        Set to False to remove the possibility of self-loop edges.
+    sparse : bool, optional (default=False)
+        If True, return the adjacency matrix as a SciPy CSR matrix instead.
+
+    Returns
+    -------
+    (u, v) : tuple of NumPy int64 arrays
+        The endpoints of the edges on nodes ``range(len(w))``, with
+        ``u <= v``.
+
+    M : SciPy sparse matrix
+        The adjacency matrix, if `sparse` is True.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> w = np.full(100, 10)
+    >>> u, v = nx.expected_degree_edges(w, seed=np.random.default_rng(1))
+
+    Notes
+    -----
+    Like :func:`expected_degree_graph`, this follows [1]_ and, for each
+    node in order of decreasing weight, skips over the candidate
+    neighbors geometrically. All the nodes advance together, one candidate
+    per step, so the number of NumPy steps is the largest number of
+    candidates of a node rather than the number of edges.
+
+    References
+    ----------
+    .. [1] Joel Miller and Aric Hagberg,
+       Efficient generation of networks with given expected degrees,
+       in Algorithms and Models for the Web-Graph (WAW 2011),
+       Alan Frieze, Paul Horn, and Paweł Prałat (Eds), LNCS 6732,
+       pp. 115-126, 2011.
+
+    See Also
+    --------
+    expected_degree_graph, configuration_model_edges
+    """
+    import numpy as np
+
+    w = np.asarray(w, dtype=np.float64)
+    n = len(w)
+    edges_u, edges_v = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+    if n > 0 and w.max() > 0:
+        rho = 1 / w.sum()
+        order = np.argsort(-w, kind="stable")
+        seq = w[order]
+        # The current candidate v and probability p of each node u.
+        u = np.arange(n if selfloops else n - 1)
+        v = u.copy() if selfloops else u + 1
+        p = np.minimum(seq[v] * (seq[u] * rho), 1)
+        active = p > 0
+        u, v, p = u[active], v[active], p[active]
+        while len(u):
+            skip = p != 1
+            r = seed.random(np.count_nonzero(skip))
+            with np.errstate(divide="ignore"):
+                jump = np.floor(np.log(r) / np.log(1 - p[skip]))
+            v[skip] += np.minimum(jump, n).astype(np.int64)
+            inside = v < n
+            u, v, p = u[inside], v[inside], p[inside]
+            q = np.minimum(seq[v] * (seq[u] * rho), 1)
+            accept = seed.random(len(u)) < q / p
+            edges_u.append(order[u[accept]])
+            edges_v.append(order[v[accept]])
+            v = v + 1
+            p = q
+            active = (v < n) & (p > 0)
+            u, v, p = u[active], v[active], p[active]
+    u, v = np.concatenate(edges_u), np.concatenate(edges_v)
+    u, v = np.minimum(u, v), np.maximum(u, v)
+    return _edge_arrays_result(u, v, n, False, sparse)
+
+
 def havel_hakimi_graph(deg_sequence, create_using=None):
     """Returns a simple graph with given degree sequence constructed
     using the Havel-Hakimi algorithm.
@@ -7,9 +7,10 @@ import itertools
 import math
 
 import networkx as nx
-from networkx.utils import py_random_state
+from networkx.utils import py_random_state, np_random_state
+from networkx.utils.misc import _triangular_pairs
 from .classic import empty_graph, path_graph, complete_graph
-from .degree_seq import degree_sequence_tree
+from .degree_seq import degree_sequence_tree, _edge_arrays_result
 from collections import defaultdict
 
 __all__ = [
@@ -17,6 +18,9 @@ __all__ = [
     "gnp_random_graph",
     "dense_gnm_random_graph",
     "gnm_random_graph",
+    "gnp_random_edges",
+    "gnp_random_edge_chunks",
+    "gnm_random_edges",
     "erdos_renyi_graph",
     "binomial_graph",
     "newman_watts_strogatz_graph",
@@ -25,6 +29,9 @@ __all__ = [
     "random_regular_graph",
     "barabasi_albert_graph",
     "dual_barabasi_albert_graph",
+    "barabasi_albert_edges",
+    "dual_barabasi_albert_edges",
+    "independent_edge_arrays",
     "extended_barabasi_albert_graph",
     "powerlaw_cluster_graph",
     "random_lobster",
@@ -290,6 +297,221 @@ def gnm_random_graph(n, m, seed=None, directed=False):
     return G
 
 
+def _pairs_from_index(k, n, directed):
+    """Returns the node pairs with the given indices, as arrays (u, v).
+
+    Undirected pairs ``u < v`` are numbered ``k = v * (v - 1) // 2 + u`` and
+    directed pairs ``u != v`` are numbered ``k = u * (n - 1) + v - (v > u)``.
+    """
+    import numpy as np
+
+    if directed:
+        u, w = np.divmod(k, n - 1)
+        return u, w + (w >= u)
+    return _triangular_pairs(k)
+
+
+@np_random_state(2, allow_generator=True)
+def gnp_random_edge_chunks(n, p, seed=None, directed=False, chunk_size=2 ** 20):
+    """Yields the edges of a $G_{n,p}$ random graph in chunks of arrays.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    p : float
+        Probability for edge creation.
+    seed : integer, numpy.random.Generator, numpy.random.RandomState or None
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+    directed : bool, optional (default=False)
+        If True, generate the edges of a directed graph.
+    chunk_size : int, optional (default=2 ** 20)
+        The number of random draws per chunk. Each chunk has at most this
+        many edges.
+
+    Yields
+    ------
+    (u, v) : tuple of NumPy int64 arrays
+        The endpoints of the edges of a chunk, with ``u < v`` if the graph
+        is undirected.
+
+    Examples
+    --------
+    The chunks hold the same edges as :func:`gnp_random_edges` with the
+    same seed
+
+    >>> chunks = nx.gnp_random_edge_chunks(1000, 0.01, seed=42, chunk_size=1000)
+    >>> u, v = nx.gnp_random_edges(1000, 0.01, seed=42)
+    >>> sum(len(cu) for cu, cv in chunks) == len(u)
+    True
+
+    Notes
+    -----
+    The node pairs are numbered and the gaps between the chosen pairs are
+    drawn from a geometric distribution, as in :func:`fast_gnp_random_graph`
+    [1]_, but `chunk_size` gaps at a time with NumPy. Memory is bounded by
+    the chunk size, whatever the number of edges.
+
+    See Also
+    --------
+    gnp_random_edges, fast_gnp_random_graph
+
+    References
+    ----------
+    .. [1] Vladimir Batagelj and Ulrik Brandes,
+       "Efficient generation of large random networks",
+       Phys. Rev. E, 71, 036113, 2005.
+    """
+    import numpy as np
+
+    num_pairs = n * (n - 1) if directed else n * (n - 1) // 2
+    if p <= 0 or num_pairs == 0:
+        return
+    last = -1
+    while True:
+        if p >= 1:
+            k = np.arange(last + 1, min(last + 1 + chunk_size, num_pairs))
+        else:
+            k = last + np.cumsum(seed.geometric(p, size=chunk_size))
+            k = k[: np.searchsorted(k, num_pairs)]
+        if len(k):
+            yield _pairs_from_index(k, n, directed)
+        if len(k) < chunk_size:
+            return
+        last = k[-1]
+
+
+@np_random_state(2, allow_generator=True)
+def gnp_random_edges(n, p, seed=None, directed=False, sparse=False):
+    """Returns the edges of a $G_{n,p}$ random graph as arrays.
+
+    This generates the same model as :func:`fast_gnp_random_graph` and
+    :func:`gnp_random_graph`, with NumPy instead of one edge at a time, and
+    does not build a graph.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    p : float
+        Probability for edge creation.
+    seed : integer, numpy.random.Generator, numpy.random.RandomState or None
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+    directed : bool, optional (default=False)
+        If True, generate the edges of a directed graph.
+    sparse : bool, optional (default=False)
+        If True, return the adjacency matrix as a SciPy CSR matrix instead.
+
+    Returns
+    -------
+    (u, v) : tuple of NumPy int64 arrays
+        The endpoints of the edges on nodes ``range(n)``, with ``u < v`` if
+        the graph is undirected.
+
+    M : SciPy sparse matrix
+        The adjacency matrix, if `sparse` is True.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> u, v = nx.gnp_random_edges(5, 0.5, seed=np.random.default_rng(1))
+    >>> G = nx.empty_graph(5)
+    >>> G.add_edges_from(zip(u.tolist(), v.tolist()))
+
+    See Also
+    --------
+    gnp_random_edge_chunks, gnm_random_edges, fast_gnp_random_graph
+    """
+    import numpy as np
+
+    num_pairs = n * (n - 1) if directed else n * (n - 1) // 2
+    # a chunk size that is not exceeded with overwhelming probability
+    mean = num_pairs * min(max(p, 0), 1)
+    chunk_size = int(mean + 10 * math.sqrt(mean) + 100)
+    chunks = list(gnp_random_edge_chunks(n, p, seed, directed, chunk_size))
+    if chunks:
+        u = np.concatenate([u for u, v in chunks])
+        v = np.concatenate([v for u, v in chunks])
+    else:
+        u = v = np.zeros(0, dtype=np.int64)
+    return _edge_arrays_result(u, v, n, directed, sparse)
+
+
+@np_random_state(2, allow_generator=True)
+def gnm_random_edges(n, m, seed=None, directed=False, sparse=False):
+    """Returns the edges of a $G_{n,m}$ random graph as arrays.
+
+    The $m$ edges are chosen uniformly at random among all node pairs,
+    like in :func:`gnm_random_graph`, with NumPy instead of one edge at a
+    time, and no graph is built.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    m : int
+        The number of edges.
+    seed : integer, numpy.random.Generator, numpy.random.RandomState or None
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+    directed : bool, optional (default=False)
+        If True, generate the edges of a directed graph.
+    sparse : bool, optional (default=False)
+        If True, return the adjacency matrix as a SciPy CSR matrix instead.
+
+    Returns
+    -------
+    (u, v) : tuple of NumPy int64 arrays
+        The endpoints of the edges on nodes ``range(n)``, sorted by `v` and
+        then `u`, with ``u < v`` if the graph is undirected.
+
+    M : SciPy sparse matrix
+        The adjacency matrix, if `sparse` is True.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> u, v = nx.gnm_random_edges(10, 20, seed=np.random.default_rng(1))
+    >>> len(u)
+    20
+
+    Notes
+    -----
+    Random pair indices are drawn in bulk until `m` distinct ones are found,
+    and `m` of them are kept at random. If `m` is more than half of the
+    pairs, the pairs that are not edges are drawn instead. If `m` is at
+    least the number of pairs, all pairs are edges.
+
+    See Also
+    --------
+    gnm_random_graph, gnp_random_edges
+    """
+    import numpy as np
+
+    num_pairs = n * (n - 1) if directed else n * (n - 1) // 2
+    m = max(min(m, num_pairs), 0)
+    draw = seed.integers if hasattr(seed, "integers") else seed.randint
+    complement = m > num_pairs // 2
+    size = num_pairs - m if complement else m
+    k = np.zeros(0, dtype=np.int64)
+    while len(k) < size:
+        more = size - len(k)
+        more += int(more * size / max(num_pairs - size, 1)) + 16
+        k = np.concatenate((k, draw(0, num_pairs, size=more, dtype=np.int64)))
+        k.sort()
+        k = k[np.concatenate(([True], k[1:] != k[:-1]))]
+    if len(k) > size:
+        k = np.sort(k[seed.permutation(len(k))[:size]])
+    if complement:
+        mask = np.ones(num_pairs, dtype=bool)
+        mask[k] = False
+        k = np.flatnonzero(mask)
+    u, v = _pairs_from_index(k, n, directed)
+    return _edge_arrays_result(u, v, n, directed, sparse)
+
+
 @py_random_state(3)
 def newman_watts_strogatz_graph(n, k, p, seed=None):
     """Returns a Newman–Watts–Strogatz small-world graph.
@@ -762,6 +984,321 @@ def dual_barabasi_albert_graph(n, m1, m2, p, seed=None):
     return G
 
 
+def _preferential_attachment_targets(initial, ms, rng):
+    """Returns the targets of new nodes attached by preferential attachment.
+
+    `initial` lists the existing endpoints, each node repeated once per
+    adjacent edge, and the ``i``-th new node picks ``ms[i]`` distinct targets
+    uniformly from the endpoints of all edges created before it, as
+    :func:`_random_subset` does. The targets are returned grouped by node.
+
+    The endpoints are kept in one array in which each new node owns its
+    target slots followed by its source slots. A node only draws slots
+    created before its own, so the nodes of a batch draw all their slots at
+    once, and a draw that hits the target slot of an earlier node of the
+    batch is resolved as soon as that node has picked its targets.
+    """
+    import numpy as np
+
+    ms = np.asarray(ms, dtype=np.int64)
+    num = len(ms)
+    if not num:
+        return np.zeros(0, dtype=np.int64)
+    first = initial.max() + 1
+    # base[i] is the first slot owned by new node i.
+    base = len(initial) + np.concatenate(([0], np.cumsum(2 * ms)))
+    slots = np.empty(base[-1], dtype=np.int64)
+    slots[: len(initial)] = initial
+    # Offsets of the targets of each node within its slots.
+    offsets = np.arange(ms.sum()) - np.repeat(np.cumsum(ms) - ms, ms)
+    target_slots = np.repeat(base[:-1], ms) + offsets
+    slots[target_slots + np.repeat(ms, ms)] = np.repeat(first + np.arange(num), ms)
+
+    # Rows draw two extra slots, and fall back to drawing one slot at a time
+    # in the rare case that fewer than m of them are distinct.
+    width = ms.max() + 2
+    columns = np.arange(width)
+    resolved = np.zeros(num, dtype=bool)
+    start = 0
+    while start < num:
+        stop = min(num, start + max(256, start // 32))
+        rows = np.arange(stop - start)
+        m = ms[start:stop]
+        valid = columns < m[:, None] + 2
+        r = (rng.random((len(rows), width)) * base[start:stop, None]).astype(np.int64)
+        r[~valid] = 0
+        # The new node owning each slot drawn, if it is a target slot of
+        # the batch, and -1 otherwise.
+        owner = np.full(r.shape, -1, dtype=np.int64)
+        batch = r >= base[start]
+        found = np.searchsorted(base[start:stop], r[batch], side="right") - 1 + start
+        found[r[batch] - base[found] >= ms[found]] = -1
+        owner[batch] = found
+        values = slots[r]
+        deferred = []
+        while len(rows):
+            pending = owner[rows]
+            done = pending >= 0
+            done[done] = resolved[pending[done]]
+            if done.any():
+                row_values = values[rows]
+                row_values[done] = slots[r[rows][done]]
+                values[rows] = row_values
+                pending[done] = -1
+                owner[rows] = pending
+            ready = (pending < 0).all(axis=1)
+            picked, rows = rows[ready], rows[~ready]
+            # Rows usually draw m distinct values first. The others keep the
+            # first occurrence of each value, in the order drawn.
+            picked_values = values[picked]
+            keep = columns < m[picked, None]
+            head = np.sort(np.where(keep, picked_values, -1 - columns), axis=1)
+            odd = (head[:, 1:] == head[:, :-1]).any(axis=1)
+            if odd.any():
+                odd_valid = valid[picked[odd]]
+                odd_values = np.where(odd_valid, picked_values[odd], -1 - columns)
+                order = np.argsort(odd_values, axis=1, kind="stable")
+                ordered = np.take_along_axis(odd_values, order, axis=1)
+                repeated = np.zeros(ordered.shape, dtype=bool)
+                repeated[:, 1:] = ordered[:, 1:] == ordered[:, :-1]
+                unique = np.empty_like(repeated)
+                np.put_along_axis(unique, order, ~repeated, axis=1)
+                keep[odd] = unique & odd_valid
+            rank = np.cumsum(keep, axis=1)
+            enough = rank[:, -1] >= m[picked]
+            deferred.extend(picked[~enough].tolist())
+            picked = picked[enough]
+            row, col = np.nonzero(keep[enough] & (rank[enough] <= m[picked, None]))
+            slots[base[start + picked[row]] + rank[enough][row, col] - 1] = values[
+                picked[row], col
+            ]
+            resolved[start + picked] = True
+            # Deferred rows draw more slots once all earlier rows are done.
+            deferred.sort()
+            while deferred and (not len(rows) or deferred[0] < rows.min()):
+                i = deferred.pop(0)
+                node = start + i
+                chosen = list(dict.fromkeys(values[i, : m[i] + 2].tolist()))
+                while len(chosen) < m[i]:
+                    x = int(slots[int(rng.random() * base[node])])
+                    if x not in chosen:
+                        chosen.append(x)
+                slots[base[node] : base[node] + m[i]] = chosen
+                resolved[node] = True
+        start = stop
+    return slots[target_slots]
+
+
+@np_random_state(2, allow_generator=True)
+def barabasi_albert_edges(n, m, seed=None, sparse=False):
+    """Returns the edges of a Barabási–Albert random graph as arrays.
+
+    This generates the same model as :func:`barabasi_albert_graph`, with
+    NumPy instead of one node at a time, and does not build a graph.
+
+    Parameters
+    ----------
+    n : int
+        Number of nodes
+    m : int
+        Number of edges to attach from a new node to existing nodes
+    seed : integer, numpy.random.Generator, numpy.random.RandomState or None
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+    sparse : bool, optional (default=False)
+        If True, return the adjacency matrix as a SciPy CSR matrix instead.
+
+    Returns
+    -------
+    (u, v) : tuple of NumPy int64 arrays
+        The endpoints of the edges on nodes ``range(n)``, with ``u < v``.
+        Node ``v`` attached to ``u``, and the edges are ordered by ``v``.
+
+    M : SciPy sparse matrix
+        The adjacency matrix, if `sparse` is True.
+
+    Raises
+    ------
+    NetworkXError
+        If `m` does not satisfy ``1 <= m < n``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> u, v = nx.barabasi_albert_edges(100, 3, seed=np.random.default_rng(1))
+    >>> len(u)
+    291
+    >>> G = nx.empty_graph(100)
+    >>> G.add_edges_from(zip(u.tolist(), v.tolist()))
+
+    Notes
+    -----
+    Each new node draws uniformly from the endpoints of the edges created
+    before it, as in :func:`barabasi_albert_graph`, but the nodes draw in
+    batches and only wait on each other when a draw hits an edge of the
+    same batch.
+
+    See Also
+    --------
+    barabasi_albert_graph, dual_barabasi_albert_edges, independent_edge_arrays
+    """
+    import numpy as np
+
+    if m < 1 or m >= n:
+        raise nx.NetworkXError(
+            f"Barabási–Albert network must have m >= 1 and m < n, m = {m}, n = {n}"
+        )
+    ms = np.full(n - m - 1, m, dtype=np.int64)
+    initial = np.concatenate((np.arange(m), np.full(m, m)))
+    u = np.concatenate(
+        (np.arange(m), _preferential_attachment_targets(initial, ms, seed))
+    )
+    v = np.repeat(np.arange(m, n), m)
+    return _edge_arrays_result(u, v, n, False, sparse)
+
+
+@np_random_state(4, allow_generator=True)
+def dual_barabasi_albert_edges(n, m1, m2, p, seed=None, sparse=False):
+    """Returns the edges of a dual Barabási–Albert random graph as arrays.
+
+    This generates the same model as :func:`dual_barabasi_albert_graph`,
+    with NumPy instead of one node at a time, and does not build a graph.
+
+    Parameters
+    ----------
+    n : int
+        Number of nodes
+    m1 : int
+        Number of edges to attach from a new node to existing nodes with probability $p$
+    m2 : int
+        Number of edges to attach from a new node to existing nodes with probability $1-p$
+    p : float
+        The probability of attaching $m1$ edges (as opposed to $m2$ edges)
+    seed : integer, numpy.random.Generator, numpy.random.RandomState or None
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+    sparse : bool, optional (default=False)
+        If True, return the adjacency matrix as a SciPy CSR matrix instead.
+
+    Returns
+    -------
+    (u, v) : tuple of NumPy int64 arrays
+        The endpoints of the edges on nodes ``range(n)``, with ``u < v``.
+        Node ``v`` attached to ``u``, and the edges are ordered by ``v``.
+
+    M : SciPy sparse matrix
+        The adjacency matrix, if `sparse` is True.
+
+    Raises
+    ------
+    NetworkXError
+        If `m1` and `m2` do not satisfy ``1 <= m1,m2 < n`` or `p` does not
+        satisfy ``0 <= p <= 1``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> rng = np.random.default_rng(1)
+    >>> u, v = nx.dual_barabasi_albert_edges(100, 1, 3, 0.5, seed=rng)
+
+    See Also
+    --------
+    dual_barabasi_albert_graph, barabasi_albert_edges
+    """
+    import numpy as np
+
+    if m1 < 1 or m1 >= n:
+        raise nx.NetworkXError(
+            f"Dual Barabási–Albert network must have m1 >= 1 and m1 < n, m1 = {m1}, n = {n}"
+        )
+    if m2 < 1 or m2 >= n:
+        raise nx.NetworkXError(
+            f"Dual Barabási–Albert network must have m2 >= 1 and m2 < n, m2 = {m2}, n = {n}"
+        )
+    if p < 0 or p > 1:
+        raise nx.NetworkXError(
+            f"Dual Barabási–Albert network must have 0 <= p <= 1, p = {p}"
+        )
+
+    m0 = max(m1, m2)
+    ms = np.where(seed.random(n - m0) < p, m1, m2)
+    # As in dual_barabasi_albert_graph, all the initial nodes are endpoints
+    # for the second node even though the first node attaches to ms[0] of them.
+    initial = np.concatenate((np.arange(m0), np.full(ms[0], m0)))
+    u = np.concatenate(
+        (np.arange(ms[0]), _preferential_attachment_targets(initial, ms[1:], seed))
+    )
+    v = np.repeat(np.arange(m0, n), ms)
+    return _edge_arrays_result(u, v, n, False, sparse)
+
+
+def _edge_arrays_instance(generator, args, kwargs, seed):
+    """Calls `generator` with a new NumPy Generator for the seed sequence."""
+    import numpy as np
+
+    return generator(*args, seed=np.random.default_rng(seed), **kwargs)
+
+
+def independent_edge_arrays(
+    generator, count, *args, seed=None, processes=None, **kwargs
+):
+    """Returns the edge arrays of independent random graphs.
+
+    The `count` graphs are generated by ``generator(*args, **kwargs)`` with
+    statistically independent random streams, spawned from `seed` by
+    :class:`numpy.random.SeedSequence`, so the result is reproducible and
+    does not depend on the number of worker processes.
+
+    Parameters
+    ----------
+    generator : function
+        An array generator with a `seed` argument, such as
+        :func:`barabasi_albert_edges` or :func:`gnp_random_edges`.
+    count : int
+        The number of graphs.
+    *args, **kwargs
+        The arguments of `generator`.
+    seed : integer, numpy.random.SeedSequence, numpy.random.Generator, numpy.random.RandomState or None
+        The entropy of the random streams, or a random number generator
+        that draws it.
+        See :ref:`Randomness<randomness>`.
+    processes : int, optional (default=None)
+        Number of worker processes generating graphs. If None, the graphs
+        are generated in the calling process.
+
+    Returns
+    -------
+    list
+        The result of `generator` for each graph.
+
+    Examples
+    --------
+    >>> graphs = nx.independent_edge_arrays(nx.barabasi_albert_edges, 3, 100, 2, seed=1)
+    >>> len(graphs)
+    3
+
+    To generate the graphs in four worker processes::
+
+        >>> graphs = nx.independent_edge_arrays(  # doctest: +SKIP
+        ...     nx.gnp_random_edges, 100, 10 ** 5, 1e-4, seed=1, processes=4
+        ... )
+    """
+    import numpy as np
+
+    if isinstance(seed, (np.random.Generator, np.random.RandomState)):
+        seed = [int(x * 2 ** 32) for x in seed.random(4)]
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    tasks = [(generator, args, kwargs, child) for child in seed.spawn(count)]
+    if processes is None:
+        return [_edge_arrays_instance(*task) for task in tasks]
+
+    from multiprocessing import Pool
+
+    with Pool(processes) as pool:
+        return pool.starmap(_edge_arrays_instance, tasks)
+
+
 @py_random_state(4)
 def extended_barabasi_albert_graph(n, m, p, q, seed=None):
     """Returns an extended Barabási–Albert model graph.
@@ -87,6 +87,36 @@ class TestConfigurationModel:
             nx.configuration_model([1, 2])
 
 
+def test_configuration_model_edges():
+    np = pytest.importorskip("numpy")
+    u, v = nx.configuration_model_edges([])
+    assert len(u) == len(v) == 0
+    pytest.raises(nx.NetworkXError, nx.configuration_model_edges, [1, 2])
+    z = [5, 3, 3, 3, 3, 2, 2, 2, 1, 1, 1]
+    for seed in [42, np.random.default_rng(42), np.random.RandomState(42)]:
+        u, v = nx.configuration_model_edges(z, seed=seed)
+        assert np.bincount(np.concatenate((u, v)), minlength=len(z)).tolist() == z
+    u, v = nx.configuration_model_edges(z, seed=42)
+    su, sv = nx.configuration_model_edges(z, seed=42, simple=True)
+    G = nx.Graph(zip(u.tolist(), v.tolist()))
+    G.remove_edges_from(nx.selfloop_edges(G))
+    assert (su < sv).all()
+    assert sorted(zip(su.tolist(), sv.tolist())) == sorted(
+        (min(e), max(e)) for e in G.edges()
+    )
+
+
+def test_configuration_model_edges_sparse():
+    pytest.importorskip("scipy")
+    z = [4, 4, 3, 3, 2, 2, 2]
+    u, v = nx.configuration_model_edges(z, seed=3)
+    M = nx.configuration_model_edges(z, seed=3, sparse=True)
+    G = nx.MultiGraph()
+    G.add_nodes_from(range(len(z)))
+    G.add_edges_from(zip(u.tolist(), v.tolist()))
+    assert (M != nx.to_scipy_sparse_matrix(G, nodelist=range(len(z)))).nnz == 0
+
+
 def test_directed_configuation_raise_unequal():
     with pytest.raises(nx.NetworkXError):
         zin = [5, 3, 3, 3, 3, 2, 2, 2, 1, 1]
@@ -104,6 +134,18 @@ def test_simple_directed_configuation_model():
     assert len(G) == 2
 
 
+def test_directed_configuration_model_edges():
+    np = pytest.importorskip("numpy")
+    din, dout = [2, 0, 1, 3], [1, 2, 1, 1, 1]
+    u, v = nx.directed_configuration_model_edges(din, dout, seed=42)
+    assert np.bincount(u, minlength=5).tolist() == dout
+    assert np.bincount(v, minlength=5).tolist() == din + [0]
+    u, v = nx.directed_configuration_model_edges(din, dout, seed=42, simple=True)
+    assert (u != v).all()
+    assert len(set(zip(u.tolist(), v.tolist()))) == len(u)
+    pytest.raises(nx.NetworkXError, nx.directed_configuration_model_edges, [1, 1], [1])
+
+
 def test_expected_degree_graph_empty():
     # empty graph has empty degree sequence
     deg_seq = []
@@ -141,6 +183,27 @@ def test_expected_degree_graph_skew():
     assert len(G1) == 5
 
 
+def test_expected_degree_edges():
+    np = pytest.importorskip("numpy")
+    for w in [[], [0, 0, 0]]:
+        u, v = nx.expected_degree_edges(w)
+        assert len(u) == len(v) == 0
+    w = [10, 2, 2, 2, 2, 1, 0, 5]
+    for seed in [42, np.random.default_rng(42), np.random.RandomState(42)]:
+        u, v = nx.expected_degree_edges(w, seed=seed, selfloops=False)
+        assert (u < v).all()
+        assert len(set(zip(u.tolist(), v.tolist()))) == len(u)
+        assert 6 not in u and 6 not in v
+    u1, v1 = nx.expected_degree_edges(w, seed=42)
+    u2, v2 = nx.expected_degree_edges(w, seed=42)
+    assert (u1 == u2).all() and (v1 == v2).all()
+    # The expected number of edges is sum(w) / 2 with self-loops.
+    w = np.random.default_rng(42).random(1000) * 20
+    u, v = nx.expected_degree_edges(w, seed=42)
+    assert abs(len(u) - w.sum() / 2) < 5 * np.sqrt(w.sum() / 2)
+    assert (u <= v).all()
+
+
 def test_havel_hakimi_construction():
     G = nx.havel_hakimi_graph([])
     assert len(G) == 0
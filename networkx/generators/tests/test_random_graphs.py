@@ -3,9 +3,13 @@
 """
 import pytest
 
+import networkx as nx
+
 from networkx.exception import NetworkXError
 from networkx.generators.random_graphs import barabasi_albert_graph
+from networkx.generators.random_graphs import barabasi_albert_edges
 from networkx.generators.random_graphs import dual_barabasi_albert_graph
+from networkx.generators.random_graphs import dual_barabasi_albert_edges
 from networkx.generators.random_graphs import extended_barabasi_albert_graph
 from networkx.generators.random_graphs import binomial_graph
 from networkx.generators.random_graphs import connected_watts_strogatz_graph
@@ -14,6 +18,10 @@ from networkx.generators.random_graphs import erdos_renyi_graph
 from networkx.generators.random_graphs import fast_gnp_random_graph
 from networkx.generators.random_graphs import gnm_random_graph
 from networkx.generators.random_graphs import gnp_random_graph
+from networkx.generators.random_graphs import gnp_random_edges
+from networkx.generators.random_graphs import gnp_random_edge_chunks
+from networkx.generators.random_graphs import gnm_random_edges
+from networkx.generators.random_graphs import independent_edge_arrays
 from networkx.generators.random_graphs import newman_watts_strogatz_graph
 from networkx.generators.random_graphs import powerlaw_cluster_graph
 from networkx.generators.random_graphs import random_kernel_graph
@@ -273,6 +281,113 @@ class TestGeneratorsRandom:
         assert len(G) == 10
         assert sum(1 for _ in G.edges()) == 0
 
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_gnp_random_edges(self, directed):
+        np = pytest.importorskip("numpy")
+        num_pairs = 90 if directed else 45
+        for p, m in [(-1.1, 0), (0, 0), (1, num_pairs), (1.1, num_pairs)]:
+            u, v = gnp_random_edges(10, p, directed=directed)
+            assert len(u) == len(v) == m
+        for seed in [42, np.random.default_rng(42), np.random.RandomState(42)]:
+            u, v = gnp_random_edges(100, 0.1, seed=seed, directed=directed)
+            assert ((u < v) | directed).all()
+            assert (u != v).all()
+            assert ((0 <= u) & (u < 100) & (0 <= v) & (v < 100)).all()
+            assert len(set(zip(u.tolist(), v.tolist()))) == len(u)
+            assert abs(len(u) - 0.1 * 100 * num_pairs) < 400
+        u, v = gnp_random_edges(100, 0.1, seed=np.random.default_rng(42))
+        chunks = gnp_random_edge_chunks(
+            100, 0.1, seed=np.random.default_rng(42), chunk_size=7
+        )
+        cu, cv = map(np.concatenate, zip(*chunks))
+        assert (u == cu).all() and (v == cv).all()
+        assert list(gnp_random_edge_chunks(0, 0.5)) == []
+        assert len(list(gnp_random_edge_chunks(10, 1, chunk_size=10))) == 5
+
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_gnm_random_edges(self, directed):
+        np = pytest.importorskip("numpy")
+        num_pairs = 90 if directed else 45
+        for m in [-1, 0, 3, 44, 45, 46, 89, 90, 100]:
+            u, v = gnm_random_edges(
+                10, m, seed=np.random.default_rng(m + 1), directed=directed
+            )
+            assert len(u) == max(min(m, num_pairs), 0)
+            assert ((u < v) | directed).all()
+            assert (u != v).all()
+            assert len(set(zip(u.tolist(), v.tolist()))) == len(u)
+        u, v = gnm_random_edges(1, 5)
+        assert len(u) == 0
+
+    def test_random_edges_sparse(self):
+        pytest.importorskip("scipy")
+        M = gnm_random_edges(10, 20, seed=42, sparse=True)
+        u, v = gnm_random_edges(10, 20, seed=42)
+        G = nx.empty_graph(10)
+        G.add_edges_from(zip(u.tolist(), v.tolist()))
+        assert (M != nx.to_scipy_sparse_matrix(G, nodelist=range(10))).nnz == 0
+        M = gnp_random_edges(10, 0.3, seed=42, directed=True, sparse=True)
+        u, v = gnp_random_edges(10, 0.3, seed=42, directed=True)
+        assert M.nnz == len(u)
+        assert M[u, v].all()
+
+    def test_barabasi_albert_edges(self):
+        np = pytest.importorskip("numpy")
+        for n, m in [(4, 3), (10, 1), (100, 3), (3000, 5)]:
+            for seed in [42, np.random.default_rng(42), np.random.RandomState(42)]:
+                u, v = barabasi_albert_edges(n, m, seed=seed)
+                assert len(u) == len(v) == m * (n - m)
+                assert (u < v).all()
+                assert (v == np.repeat(np.arange(m, n), m)).all()
+                assert len(set(zip(u.tolist(), v.tolist()))) == len(u)
+        assert (barabasi_albert_edges(4, 3)[0] == [0, 1, 2]).all()
+        pytest.raises(NetworkXError, barabasi_albert_edges, 5, 0)
+        pytest.raises(NetworkXError, barabasi_albert_edges, 5, 5)
+
+    def test_barabasi_albert_edges_distribution(self):
+        np = pytest.importorskip("numpy")
+        # Node 3 draws from the endpoints [0, 1, 2, 2] until it has two
+        # distinct targets, so it attaches to node 0 with probability 7/12.
+        rng = np.random.default_rng(42)
+        hits = sum(
+            (barabasi_albert_edges(4, 2, seed=rng)[0][2:] == 0).any()
+            for _ in range(2000)
+        )
+        assert abs(hits - 2000 * 7 / 12) < 100
+
+    def test_dual_barabasi_albert_edges(self):
+        np = pytest.importorskip("numpy")
+        for p in [0, 0.5, 1]:
+            u, v = dual_barabasi_albert_edges(200, 1, 4, p, seed=42)
+            assert (u < v).all()
+            assert len(set(zip(u.tolist(), v.tolist()))) == len(u)
+            counts = np.bincount(v, minlength=200)
+            assert (counts[:4] == 0).all()
+            assert set(counts[4:].tolist()) <= {1, 4}
+        assert len(u) == 196
+        u, v = dual_barabasi_albert_edges(200, 1, 4, 0, seed=42)
+        assert len(u) == 4 * 196
+        pytest.raises(NetworkXError, dual_barabasi_albert_edges, 5, 0, 1, 0.5)
+        pytest.raises(NetworkXError, dual_barabasi_albert_edges, 5, 1, 5, 0.5)
+        pytest.raises(NetworkXError, dual_barabasi_albert_edges, 5, 1, 2, 1.5)
+
+    def test_independent_edge_arrays(self):
+        np = pytest.importorskip("numpy")
+        graphs = independent_edge_arrays(barabasi_albert_edges, 3, 50, 2, seed=42)
+        assert len(graphs) == 3
+        assert len({tuple(u.tolist()) for u, v in graphs}) == 3
+        for seed in [np.random.SeedSequence(42), np.random.default_rng(42)]:
+            graphs = independent_edge_arrays(gnm_random_edges, 2, 10, 5, seed=seed)
+            assert len(graphs) == 2
+        serial = independent_edge_arrays(gnp_random_edges, 2, 50, 0.1, seed=42)
+        pooled = independent_edge_arrays(
+            gnp_random_edges, 2, 50, 0.1, seed=42, processes=2
+        )
+        for (u1, v1), (u2, v2) in zip(serial, pooled):
+            assert (u1 == u2).all() and (v1 == v2).all()
+        M = independent_edge_arrays(gnp_random_edges, 1, 10, 0.5, sparse=True)[0]
+        assert M.shape == (10, 10)
+
     def test_watts_strogatz_big_k(self):
         # Test to make sure than n <= k
         pytest.raises(NetworkXError, watts_strogatz_graph, 10, 11, 0.25)
@@ -22,7 +22,13 @@ adjacency list (anything following the # in a line is a comment)::
      d e
 """
 
-__all__ = ["generate_adjlist", "write_adjlist", "parse_adjlist", "read_adjlist"]
+__all__ = [
+    "generate_adjlist",
+    "write_adjlist",
+    "parse_adjlist",
+    "read_adjlist",
+    "read_adjlist_chunked",
+]
 
 from networkx.utils import open_file
 import networkx as nx
@@ -294,3 +300,242 @@ def read_adjlist(
         create_using=create_using,
         nodetype=nodetype,
     )
+
+
+def _adjlist_blocks(f, chunk_size):
+    """Yields the chunks of an adjlist file, split at line boundaries.
+
+    If `f` is a regular file on disk, yields ``(filename, start, stop)``
+    byte ranges that each reader opens and reads by itself. Otherwise, such
+    as for compressed files, reads and yields the chunks as bytes.
+    """
+    import io
+    import os
+
+    filename = getattr(f, "name", None)
+    if isinstance(f, io.BufferedReader) and isinstance(filename, str):
+        if os.path.isfile(filename):
+            start = f.tell()
+            size = os.path.getsize(filename)
+            while start < size:
+                # end the chunk after the line containing its last byte
+                f.seek(min(start + chunk_size, size) - 1)
+                f.readline()
+                stop = f.tell()
+                yield filename, start, stop
+                start = stop
+            return
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            return
+        if not block.endswith(b"\n"):
+            block += f.readline()
+        yield block
+
+
+def _parse_adjlist_block(block, comments, delimiter, nodetype, encoding):
+    """Parses a chunk of an adjlist file into arrays of node indices.
+
+    Returns ``(nodes, src, dst)``: the list of nodes in the order they
+    first appear in the chunk, and NumPy arrays with the positions in
+    `nodes` of the source and target of each edge.
+    """
+    import numpy as np
+
+    if isinstance(block, tuple):
+        filename, start, stop = block
+        with open(filename, "rb") as f:
+            f.seek(start)
+            block = f.read(stop - start)
+    tokens = []
+    heads = []
+    for line in block.decode(encoding).split("\n"):
+        p = line.find(comments)
+        if p >= 0:
+            line = line[:p]
+        line = line.strip()
+        if not line:
+            continue
+        heads.append(len(tokens))
+        tokens.extend(line.split(delimiter))
+    # convert each distinct label once
+    labels = dict.fromkeys(tokens)
+    if nodetype is None:
+        nodes = list(labels)
+    else:
+        nodes = []
+        for u in labels:
+            try:
+                nodes.append(nodetype(u))
+            except BaseException as e:
+                raise TypeError(
+                    f"Failed to convert node ({u}) to type " f"{nodetype}"
+                ) from e
+    position = dict(zip(labels, range(len(labels))))
+    ids = np.fromiter(map(position.__getitem__, tokens), np.int64, len(tokens))
+    heads = np.array(heads, dtype=np.int64)
+    degrees = np.diff(np.append(heads, len(tokens))) - 1
+    is_target = np.ones(len(tokens), dtype=bool)
+    is_target[heads] = False
+    return nodes, np.repeat(ids[heads], degrees), ids[is_target]
+
+
+@open_file(0, mode="rb")
+def read_adjlist_chunked(
+    path,
+    comments="#",
+    delimiter=None,
+    create_using=None,
+    nodetype=None,
+    encoding="utf-8",
+    processes=None,
+    chunk_size=2 ** 26,
+    sparse=False,
+):
+    """Read graph in adjacency list format from path, in parallel chunks.
+
+    The file is split into chunks of about `chunk_size` bytes at line
+    boundaries. Each chunk is parsed into arrays of edges, converting each
+    distinct node label once, and the chunks can be parsed in parallel by a
+    pool of worker processes. The edges are then added to the graph chunk
+    by chunk, or gathered into a SciPy sparse matrix.
+
+    Parameters
+    ----------
+    path : string or file
+       Filename or file handle to read.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+
+    comments : string, optional
+       Marker for comment lines
+
+    delimiter : string, optional
+       Separator for node labels.  The default is whitespace.
+
+    create_using : NetworkX graph constructor, optional (default=nx.Graph)
+       Graph type to create. If graph instance, then cleared before populated.
+
+    nodetype : Python type, optional
+       Convert nodes to this type.
+
+    encoding : string, optional (default="utf-8")
+       Text encoding of the file. It must encode newlines as the byte ``\\n``.
+
+    processes : int, optional (default=None)
+       Number of worker processes parsing chunks. If None, the chunks are
+       parsed in the calling process.
+
+    chunk_size : int, optional (default=2 ** 26)
+       Approximate number of bytes in a chunk.
+
+    sparse : bool, optional (default=False)
+       If True, return the adjacency matrix of the graph as a SciPy CSR
+       matrix, and the list of nodes in the order of its rows and columns,
+       instead of the graph.
+
+    Returns
+    -------
+    G : NetworkX graph
+        The graph corresponding to the lines in adjacency list format.
+
+    (M, nodelist) : SciPy sparse matrix and list
+        If `sparse` is True, the same matrix as
+        ``to_scipy_sparse_matrix(G, nodelist, weight=None)``, built without
+        the graph `G`.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_adjlist(G, "test.adjlist")
+    >>> H = nx.read_adjlist_chunked("test.adjlist", nodetype=int)
+    >>> list(H.edges())
+    [(0, 1), (1, 2), (2, 3)]
+    >>> M, nodelist = nx.read_adjlist_chunked(
+    ...     "test.adjlist", nodetype=int, sparse=True
+    ... )
+    >>> nodelist
+    [0, 1, 2, 3]
+    >>> print(M.todense())
+    [[0 1 0 0]
+     [1 0 1 0]
+     [0 1 0 1]
+     [0 0 1 0]]
+
+    To read a large file in eight worker processes::
+
+        >>> G = nx.read_adjlist_chunked(
+        ...     "large.adjlist", nodetype=int, processes=8
+        ... )  # doctest: +SKIP
+
+    Notes
+    -----
+    The graph is the same as the one returned by :func:`read_adjlist`, with
+    the nodes and edges in the same order. Uncompressed files are split by
+    byte range and each worker reads its chunks directly from the file;
+    chunks of other files are read by the calling process and sent to the
+    workers.
+
+    See Also
+    --------
+    read_adjlist, to_scipy_sparse_matrix
+    """
+    from functools import partial
+
+    import numpy as np
+
+    G = nx.empty_graph(0, create_using)
+    parse = partial(
+        _parse_adjlist_block,
+        comments=comments,
+        delimiter=delimiter,
+        nodetype=nodetype,
+        encoding=encoding,
+    )
+    blocks = _adjlist_blocks(path, chunk_size)
+    if processes is None:
+        chunks = map(parse, blocks)
+    else:
+        from multiprocessing import Pool
+
+        pool = Pool(processes)
+        chunks = pool.imap(parse, blocks)
+    try:
+        if not sparse:
+            for nodes, src, dst in chunks:
+                G.add_nodes_from(nodes)
+                G.add_edges_from(
+                    zip(
+                        map(nodes.__getitem__, src.tolist()),
+                        map(nodes.__getitem__, dst.tolist()),
+                    )
+                )
+            return G
+        index = {}
+        rows = []
+        cols = []
+        for nodes, src, dst in chunks:
+            ids = np.fromiter(
+                (index.setdefault(v, len(index)) for v in nodes), np.int64, len(nodes)
+            )
+            rows.append(ids[src])
+            cols.append(ids[dst])
+    finally:
+        if processes is not None:
+            pool.terminate()
+
+    from scipy import sparse
+
+    rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+    cols = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64)
+    if not G.is_directed():
+        loops = rows == cols
+        rows, cols = np.concatenate((rows, cols[~loops])), np.concatenate(
+            (cols, rows[~loops])
+        )
+    n = len(index)
+    data = np.ones(len(rows), dtype=np.int64)
+    M = sparse.coo_matrix((data, (rows, cols)), shape=(n, n)).tocsr()
+    if not G.is_multigraph():
+        M.data[:] = 1
+    return M, list(index)
@@ -25,7 +25,14 @@ from xml.etree.ElementTree import (
     register_namespace,
 )
 
-__all__ = ["write_gexf", "read_gexf", "relabel_gexf_graph", "generate_gexf"]
+__all__ = [
+    "write_gexf",
+    "read_gexf",
+    "relabel_gexf_graph",
+    "generate_gexf",
+    "write_gexf_stream",
+    "read_gexf_stream",
+]
 
 
 @open_file(1, mode="wb")
@@ -170,6 +177,101 @@ def read_gexf(path, node_type=None, relabel=False, version="1.2draft"):
     return G
 
 
+@open_file(1, mode="wb")
+def write_gexf_stream(G, path, encoding="utf-8", prettyprint=True, version="1.2draft"):
+    """Write G in GEXF format to path, one element at a time.
+
+    The output is the same as the output of :func:`write_gexf`, but the
+    nodes and edges are serialized and written one by one instead of
+    building the whole XML document in memory, so the memory used does not
+    grow with the size of the graph.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph
+    path : file or string
+       File or file name to write.
+       File names ending in .gz or .bz2 will be compressed.
+    encoding : string (optional, default: 'utf-8')
+       Encoding for text data.
+    prettyprint : bool (optional, default: True)
+       If True use line breaks and indenting in output XML.
+    version : string (default: 1.2draft)
+       Version of GEFX File Format (see https://gephi.org/gexf/format/schema.html)
+       Supported values: "1.1draft", "1.2draft"
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_gexf_stream(G, "test.gexf")
+
+    Notes
+    -----
+    The attribute declarations and the mode of the graph precede the nodes
+    in the document, so the graph is read twice: once to find them and
+    once to write it.
+
+    This implementation does not support mixed graphs (directed and undirected
+    edges together).
+    """
+    writer = GEXFStreamWriter(
+        path, encoding=encoding, prettyprint=prettyprint, version=version
+    )
+    writer.dump(G)
+
+
+@open_file(0, mode="rb")
+def read_gexf_stream(path, node_type=None, relabel=False, version="1.2draft"):
+    """Read graph in GEXF format from path, one element at a time.
+
+    The graph is the same as the graph returned by :func:`read_gexf`, but
+    the document is parsed incrementally and every node and edge element is
+    discarded once it is added to the graph, so the memory used is the
+    memory of the graph instead of the memory of the XML tree.
+
+    Parameters
+    ----------
+    path : file or string
+       File or file name to read.
+       File names ending in .gz or .bz2 will be decompressed.
+    node_type: Python type (default: None)
+       Convert node ids to this type if not None.
+    relabel : bool (default: False)
+       If True relabel the nodes to use the GEXF node "label" attribute
+       instead of the node "id" attribute as the NetworkX node label.
+    version : string (default: 1.2draft)
+       Version of GEFX File Format (see https://gephi.org/gexf/format/schema.html)
+       Supported values: "1.1draft", "1.2draft"
+
+    Returns
+    -------
+    graph: NetworkX graph
+        If no parallel edges are found a Graph or DiGraph is returned.
+        Otherwise a MultiGraph or MultiDiGraph is returned.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_gexf_stream(G, "test.gexf")
+    >>> H = nx.read_gexf_stream("test.gexf", node_type=int)
+
+    Notes
+    -----
+    The attributes elements of the graph must precede its nodes and edges,
+    as the GEXF schema requires.
+
+    This implementation does not support mixed graphs (directed and undirected
+    edges together).
+    """
+    reader = GEXFStreamReader(node_type=node_type, version=version)
+    if relabel:
+        G = relabel_gexf_graph(reader(path))
+    else:
+        G = reader(path)
+    return G
+
+
 class GEXF:
     versions = {}
     d = {
@@ -313,6 +415,12 @@ class GEXFWriter(GEXF):
         return s
 
     def add_graph(self, G):
+        self.start_graph(G)
+        self.add_nodes(G, self.graph_element)
+        self.add_edges(G, self.graph_element)
+        self.xml.append(self.graph_element)
+
+    def start_graph(self, G):
         # first pass through G collecting edge ids
         for u, v, dd in G.edges(data=True):
             eid = dd.get("id")
@@ -331,12 +439,15 @@ class GEXFWriter(GEXF):
         name = G.graph.get("name", "")
         graph_element = Element("graph", defaultedgetype=default, mode=mode, name=name)
         self.graph_element = graph_element
-        self.add_nodes(G, graph_element)
-        self.add_edges(G, graph_element)
-        self.xml.append(graph_element)
 
     def add_nodes(self, G, graph_element):
         nodes_element = Element("nodes")
+        for node_element in self.node_elements(G):
+            nodes_element.append(node_element)
+        graph_element.append(nodes_element)
+
+    def node_elements(self, G):
+        # generate the node elements of G
         for node, data in G.nodes(data=True):
             node_data = data.copy()
             node_id = str(node_data.pop("id", node))
@@ -371,10 +482,16 @@ class GEXFWriter(GEXF):
                 node_data = self.add_spells(node_element, node_data)
             node_data = self.add_viz(node_element, node_data)
             node_data = self.add_attributes("node", node_element, node_data, default)
-            nodes_element.append(node_element)
-        graph_element.append(nodes_element)
+            yield node_element
 
     def add_edges(self, G, graph_element):
+        edges_element = Element("edges")
+        for edge_element in self.edge_elements(G):
+            edges_element.append(edge_element)
+        graph_element.append(edges_element)
+
+    def edge_elements(self, G):
+        # generate the edge elements of G
         def edge_key_data(G):
             # helper function to unify multigraph and graph edge iterator
             if G.is_multigraph():
@@ -399,7 +516,6 @@ class GEXFWriter(GEXF):
                         self.all_edge_ids.add(str(edge_id))
                     yield u, v, edge_id, edge_data
 
-        edges_element = Element("edges")
         for u, v, key, edge_data in edge_key_data(G):
             kw = {"id": str(key)}
             try:
@@ -439,8 +555,7 @@ class GEXFWriter(GEXF):
                 edge_data = self.add_spells(edge_element, edge_data)
             edge_data = self.add_viz(edge_element, edge_data)
             edge_data = self.add_attributes("edge", edge_element, edge_data, default)
-            edges_element.append(edge_element)
-        graph_element.append(edges_element)
+            yield edge_element
 
     def add_attributes(self, node_or_edge, xml_obj, data, default):
         # Add attrvalues to node or edge
@@ -672,6 +787,79 @@ class GEXFWriter(GEXF):
                 elem.tail = i
 
 
+class GEXFStreamWriter(GEXFWriter):
+    # class for writing GEXF format files one element at a time
+    # use write_gexf_stream() function
+    def __init__(self, stream, encoding="utf-8", prettyprint=True, version="1.2draft"):
+        super().__init__(encoding=encoding, prettyprint=prettyprint, version=version)
+        self.stream = stream
+
+    def write(self, text):
+        self.stream.write(text.encode(self.encoding, "xmlcharrefreplace"))
+
+    def write_indent(self, level):
+        if self.prettyprint:
+            self.write("\n" + "  " * level)
+
+    def write_element(self, element, level):
+        if self.prettyprint:
+            self.indent(element, level)
+            element.tail = None
+        self.write_indent(level)
+        text = tostring(element, encoding="unicode")
+        # the viz namespace is declared by the root element
+        self.write(text.replace(f' xmlns:viz="{self.NS_VIZ}"', "", 1))
+
+    def start_tag(self, element, uses_viz=False):
+        # serialize the element with a single child and keep its start tag
+        copy = Element(element.tag, element.attrib)
+        SubElement(copy, f"{{{self.NS_VIZ}}}size" if uses_viz else "size")
+        text = tostring(copy, encoding="unicode")
+        return text[: text.index(">") + 1]
+
+    def dump(self, G):
+        # Serialize graph G in GEXF to the stream
+        self.start_graph(G)
+        all_edge_ids = set(self.all_edge_ids)
+        # first pass: find the attributes, mode and timeformat of the graph
+        uses_viz = False
+        for element in itertools.chain(self.node_elements(G), self.edge_elements(G)):
+            for child in element:
+                uses_viz = uses_viz or child.tag.startswith(f"{{{self.NS_VIZ}}}")
+        self.edge_id = itertools.count()
+        self.all_edge_ids = all_edge_ids
+
+        self.write(f"<?xml version='1.0' encoding='{self.encoding}'?>\n")
+        self.write(self.start_tag(self.xml, uses_viz))
+        for element in self.xml:
+            self.write_element(element, 1)
+        self.write_indent(1)
+        self.write(self.start_tag(self.graph_element))
+        for element in self.graph_element:
+            self.write_element(element, 2)
+        for tag, elements in [
+            ("nodes", self.node_elements(G)),
+            ("edges", self.edge_elements(G)),
+        ]:
+            element = next(elements, None)
+            if element is None:
+                self.write_element(Element(tag), 2)
+                continue
+            self.write_indent(2)
+            self.write(f"<{tag}>")
+            self.write_element(element, 3)
+            for element in elements:
+                self.write_element(element, 3)
+            self.write_indent(2)
+            self.write(f"</{tag}>")
+        self.write_indent(1)
+        self.write("</graph>")
+        self.write_indent(0)
+        self.write("</gexf>")
+        if self.prettyprint:
+            self.write("\n")
+
+
 class GEXFReader(GEXF):
     # Class to read GEXF format files
     # use read_gexf() function
@@ -696,6 +884,24 @@ class GEXFReader(GEXF):
         raise nx.NetworkXError("No <graph> element in GEXF file.")
 
     def make_graph(self, graph_xml):
+        G, node_attr, edge_attr = self.start_graph(graph_xml)
+
+        # add nodes
+        nodes_element = graph_xml.find(f"{{{self.NS_GEXF}}}nodes")
+        if nodes_element is not None:
+            for node_xml in nodes_element.findall(f"{{{self.NS_GEXF}}}node"):
+                self.add_node(G, node_xml, node_attr)
+
+        # add edges
+        edges_element = graph_xml.find(f"{{{self.NS_GEXF}}}edges")
+        if edges_element is not None:
+            for edge_xml in edges_element.findall(f"{{{self.NS_GEXF}}}edge"):
+                self.add_edge(G, edge_xml, edge_attr)
+
+        return self.finish_graph(G)
+
+    def start_graph(self, graph_xml):
+        # make the graph from the graph element and its attributes elements
         # start with empty DiGraph or MultiDiGraph
         edgedefault = graph_xml.get("defaultedgetype", None)
         if edgedefault == "directed":
@@ -753,19 +959,9 @@ class GEXFReader(GEXF):
         edge_attr.update(ea)
         edge_default.update(ed)
         G.graph["edge_default"] = edge_default
+        return G, node_attr, edge_attr
 
-        # add nodes
-        nodes_element = graph_xml.find(f"{{{self.NS_GEXF}}}nodes")
-        if nodes_element is not None:
-            for node_xml in nodes_element.findall(f"{{{self.NS_GEXF}}}node"):
-                self.add_node(G, node_xml, node_attr)
-
-        # add edges
-        edges_element = graph_xml.find(f"{{{self.NS_GEXF}}}edges")
-        if edges_element is not None:
-            for edge_xml in edges_element.findall(f"{{{self.NS_GEXF}}}edge"):
-                self.add_edge(G, edge_xml, edge_attr)
-
+    def finish_graph(self, G):
         # switch to Graph or DiGraph if no parallel edges were found.
         if self.simple_graph:
             if G.is_directed():
@@ -1002,6 +1198,47 @@ class GEXFReader(GEXF):
         return attrs, defaults
 
 
+class GEXFStreamReader(GEXFReader):
+    # Class to read GEXF format files one element at a time
+    # use read_gexf_stream() function
+    def __call__(self, stream):
+        from xml.etree.ElementTree import iterparse
+
+        G = None
+        # the open elements, from the root element
+        stack = []
+        for event, element in iterparse(stream, events=("start", "end")):
+            if event == "start":
+                stack.append(element)
+                if len(stack) == 1:
+                    # find the version from the namespace of the root element
+                    for version, d in self.versions.items():
+                        if element.tag == f"{{{d['NS_GEXF']}}}gexf":
+                            self.set_version(version)
+                elif len(stack) == 3 and stack[1].tag == f"{{{self.NS_GEXF}}}graph":
+                    if G is None and element.tag in (
+                        f"{{{self.NS_GEXF}}}nodes",
+                        f"{{{self.NS_GEXF}}}edges",
+                    ):
+                        # the attributes elements are complete
+                        G, node_attr, edge_attr = self.start_graph(stack[1])
+                continue
+            stack.pop()
+            if len(stack) == 1 and element.tag == f"{{{self.NS_GEXF}}}graph":
+                if G is None:
+                    G, node_attr, edge_attr = self.start_graph(element)
+                return self.finish_graph(G)
+            if len(stack) == 3 and stack[1].tag == f"{{{self.NS_GEXF}}}graph":
+                if element.tag == f"{{{self.NS_GEXF}}}node":
+                    self.add_node(G, element, node_attr)
+                elif element.tag == f"{{{self.NS_GEXF}}}edge":
+                    self.add_edge(G, element, edge_attr)
+                else:
+                    continue
+                stack[2].remove(element)
+        raise nx.NetworkXError("No <graph> element in GEXF file.")
+
+
 def relabel_gexf_graph(G):
     """Relabel graph using "label" node keyword for node label.
 
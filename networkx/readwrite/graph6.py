@@ -10,13 +10,57 @@ For more information, see the `graph6`_ homepage.
 .. _graph6: http://users.cecs.anu.edu.au/~bdm/data/formats.html
 
 """
-from itertools import islice
+from itertools import chain, groupby, islice
 
 import networkx as nx
 from networkx.exception import NetworkXError
 from networkx.utils import open_file, not_implemented_for
+from networkx.utils.misc import _triangular_pairs
 
-__all__ = ["from_graph6_bytes", "read_graph6", "to_graph6_bytes", "write_graph6"]
+__all__ = [
+    "from_graph6_bytes",
+    "read_graph6",
+    "to_graph6_bytes",
+    "write_graph6",
+    "iter_graph6",
+]
+
+# Below this many adjacency bits the per-call overhead of NumPy outweighs
+# the Python bit loop when decoding a single graph.
+_NUMPY_MIN_BITS = 64
+
+
+def _graph6_data(n, u, v):
+    """Returns the graph6 data characters of a graph on nodes ``range(n)``.
+
+    `u` and `v` are NumPy integer arrays of edge endpoints with ``u < v``.
+    Bit ``v * (v - 1) // 2 + u`` of the upper triangle in column-major
+    order is set for each edge and the bits are packed six per character.
+    """
+    import numpy as np
+
+    k = v * (v - 1) // 2 + u
+    data = np.zeros((n * (n - 1) // 2 + 5) // 6, dtype=np.uint8)
+    np.bitwise_or.at(data, k // 6, (32 >> (k % 6)).astype(np.uint8))
+    data += 63
+    return data.tobytes()
+
+
+def _graph6_edges(n, data):
+    """Returns arrays `u`, `v` with ``u < v`` of the edges in graph6 `data`.
+
+    `data` is a NumPy uint8 array of the six-bit values after the number of
+    nodes. Only the nonzero values are unpacked, and the column-major bit
+    index ``k`` of each edge is inverted to the pair ``(u, v)``.
+    """
+    import numpy as np
+
+    nz = np.flatnonzero(data)
+    bits = np.unpackbits(data[nz, None], axis=1)[:, 2:]
+    r, c = np.nonzero(bits)
+    k = nz[r] * 6 + c
+    k = k[k < n * (n - 1) // 2]
+    return _triangular_pairs(k)
 
 
 def _generate_graph6_bytes(G, nodes, header):
@@ -32,8 +76,8 @@ def _generate_graph6_bytes(G, nodes, header):
 
     1. the header (if requested),
     2. the encoding of the number of nodes,
-    3. each character, one-at-a-time, in the encoding of the requested
-       node-induced subgraph,
+    3. the encoding of the requested node-induced subgraph, packed with
+       NumPy if it is available, otherwise one character at a time,
     4. a newline character.
 
     This function raises :exc:`ValueError` if the graph is too large for
@@ -49,14 +93,30 @@ def _generate_graph6_bytes(G, nodes, header):
         yield b">>graph6<<"
     for d in n_to_data(n):
         yield str.encode(chr(d + 63))
-    # This generates the same as `(v in G[u] for u, v in combinations(G, 2))`,
-    # but in "column-major" order instead of "row-major" order.
-    bits = (nodes[j] in G[nodes[i]] for j in range(1, n) for i in range(j))
-    chunk = list(islice(bits, 6))
-    while chunk:
-        d = sum(b << 5 - i for i, b in enumerate(chunk))
-        yield str.encode(chr(d + 63))
+    try:
+        import numpy as np
+    except ImportError:
+        # This generates the same as `(v in G[u] for u, v in combinations(G, 2))`,
+        # but in "column-major" order instead of "row-major" order.
+        bits = (nodes[j] in G[nodes[i]] for j in range(1, n) for i in range(j))
         chunk = list(islice(bits, 6))
+        while chunk:
+            d = sum(b << 5 - i for i, b in enumerate(chunk))
+            yield str.encode(chr(d + 63))
+            chunk = list(islice(bits, 6))
+    else:
+        index = {v: i for i, v in enumerate(nodes)}
+        edges = np.fromiter(
+            chain.from_iterable(
+                (index[u], index[v])
+                for u, v in G.edges()
+                if u != v and u in index and v in index
+            ),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        u = edges.min(axis=1)
+        v = edges.max(axis=1)
+        yield _graph6_data(n, u, v)
     yield b"\n"
 
 
@@ -121,6 +181,15 @@ def from_graph6_bytes(bytes_in):
 
     G = nx.Graph()
     G.add_nodes_from(range(n))
+    if n * (n - 1) // 2 >= _NUMPY_MIN_BITS:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            u, v = _graph6_edges(n, np.array(data, dtype=np.uint8))
+            G.add_edges_from(zip(u.tolist(), v.tolist()))
+            return G
     for (i, j), b in zip([(i, j) for j in range(1, n) for i in range(j)], bits()):
         if b:
             G.add_edge(i, j)
@@ -243,6 +312,142 @@ def read_graph6(path):
         return glist
 
 
+def _graph6_lines_to_graphs(lines, as_array=False):
+    """Decodes a list of graph6 lines, batching lines of the same size.
+
+    Lines encoding graphs with the same number of nodes are stacked into one
+    NumPy array and unpacked together. Returns the list of graphs, or of
+    adjacency arrays if `as_array` is True, in the order of `lines`.
+    """
+    import numpy as np
+
+    keyed = []
+    for i, line in enumerate(lines):
+        if line.startswith(b">>graph6<<"):
+            line = line[10:]
+        if not line:
+            raise NetworkXError("Expected graph6 data after the header")
+        if any(c < 63 or c > 126 for c in line[:8]):
+            raise ValueError("each input character must be in range(63, 127)")
+        head = [c - 63 for c in line[:8]]
+        n, rest = data_to_n(head)
+        keyed.append(((n, len(line)), len(head) - len(rest), i, line))
+    result = [None] * len(keyed)
+    keyed.sort(key=lambda item: item[0])
+    for (n, length), group in groupby(keyed, key=lambda item: item[0]):
+        group = list(group)
+        start = group[0][1]
+        m = n * (n - 1) // 2
+        if length - start != (m + 5) // 6:
+            raise NetworkXError(
+                f"Expected {m} bits but got {(length - start) * 6} in graph6"
+            )
+        data = np.frombuffer(b"".join(item[3] for item in group), dtype=np.uint8)
+        data = data.reshape(len(group), length)[:, start:] - 63
+        if (data > 63).any():
+            raise ValueError("each input character must be in range(63, 127)")
+        bits = np.unpackbits(data[..., None], axis=2)[..., 2:]
+        bits = bits.reshape(len(group), -1)[:, :m]
+        # Bit k of the column-major upper triangle is the pair (c[k], r[k]).
+        r, c = np.tril_indices(n, -1)
+        if as_array:
+            A = np.zeros((len(group), n, n), dtype=np.uint8)
+            A[:, c, r] = bits
+            A[:, r, c] = bits
+            for item, a in zip(group, A):
+                result[item[2]] = a
+            continue
+        graph, k = np.nonzero(bits)
+        splits = np.cumsum(np.bincount(graph, minlength=len(group)))[:-1]
+        for item, u, v in zip(group, np.split(c[k], splits), np.split(r[k], splits)):
+            G = nx.Graph()
+            G.add_nodes_from(range(n))
+            G.add_edges_from(zip(u.tolist(), v.tolist()))
+            result[item[2]] = G
+    return result
+
+
+def iter_graph6(lines, as_array=False, processes=None, chunksize=1000):
+    """Yields the graphs, or their adjacency arrays, in graph6 lines.
+
+    This reads files with one graph per line, such as enumerations of a
+    graph family, in chunks of `chunksize` lines. The graphs of each chunk
+    with the same number of nodes are unpacked together with NumPy, and
+    the chunks can be decoded in parallel by a pool of worker processes.
+
+    Parameters
+    ----------
+    lines : iterable of bytes
+       The graph6 lines, for example a file opened in binary mode. Empty
+       lines are skipped and a ``>>graph6<<`` header is allowed on any line.
+
+    as_array : bool (default=False)
+       If True, yield the adjacency matrix of each graph as a NumPy uint8
+       array instead of a Graph.
+
+    processes : int, optional (default=None)
+       Number of worker processes decoding chunks. If None, the chunks are
+       decoded in the calling process.
+
+    chunksize : int (default=1000)
+       Number of lines decoded at once, and sent to a worker at a time.
+
+    Yields
+    ------
+    G : Graph or NumPy array
+       The graph of each line, in the order of `lines`.
+
+    Raises
+    ------
+    NetworkXError
+        If a line is unable to be parsed in graph6 format
+
+    ValueError
+        If any character ``c`` in a line does not satisfy
+        ``63 <= ord(c) < 127``.
+
+    Examples
+    --------
+    >>> lines = [b">>graph6<<A_", b"B?", b"Bw"]
+    >>> [sorted(G.edges()) for G in nx.iter_graph6(lines)]
+    [[(0, 1)], [], [(0, 1), (0, 2), (1, 2)]]
+    >>> for A in nx.iter_graph6(lines, as_array=True):
+    ...     print(A.tolist())
+    [[0, 1], [1, 0]]
+    [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+    [[0, 1, 1], [1, 0, 1], [1, 1, 0]]
+
+    To decode a file in four worker processes::
+
+        >>> with open("graphs.g6", "rb") as f:  # doctest: +SKIP
+        ...     for G in nx.iter_graph6(f, processes=4):
+        ...         pass
+
+    Notes
+    -----
+    Unlike :func:`read_graph6`, this is a generator, so only the lines and
+    graphs of the chunks being decoded are held in memory. It requires NumPy.
+
+    See Also
+    --------
+    read_graph6, from_graph6_bytes
+    """
+    lines = (line for line in (line.strip() for line in lines) if line)
+    chunks = iter(lambda: list(islice(lines, chunksize)), [])
+    if processes is None:
+        for chunk in chunks:
+            yield from _graph6_lines_to_graphs(chunk, as_array)
+        return
+
+    from functools import partial
+    from multiprocessing import Pool
+
+    decode = partial(_graph6_lines_to_graphs, as_array=as_array)
+    with Pool(processes) as pool:
+        for graphs in pool.imap(decode, chunks):
+            yield from graphs
+
+
 @not_implemented_for("directed")
 @not_implemented_for("multigraph")
 @open_file(1, mode="wb")
@@ -48,8 +48,12 @@ __all__ = [
     "write_graphml_xml",
     "write_graphml_lxml",
     "parse_graphml",
+    "write_graphml_stream",
+    "read_graphml_stream",
     "GraphMLWriter",
     "GraphMLReader",
+    "GraphMLStreamWriter",
+    "GraphMLStreamReader",
 ]
 
 
@@ -162,6 +166,63 @@ def write_graphml_lxml(
     writer.dump()
 
 
+@open_file(1, mode="wb")
+def write_graphml_stream(
+    G,
+    path,
+    encoding="utf-8",
+    prettyprint=True,
+    infer_numeric_types=False,
+    named_key_ids=False,
+):
+    """Write G in GraphML XML format to path, one element at a time.
+
+    The output is the same as the output of :func:`write_graphml_xml`, but
+    the nodes and edges are serialized and written one by one instead of
+    building the whole XML document in memory, so the memory used does not
+    grow with the size of the graph.
+
+    Parameters
+    ----------
+    G : graph
+       A networkx graph
+    path : file or string
+       File or filename to write.
+       Filenames ending in .gz or .bz2 will be compressed.
+    encoding : string (optional)
+       Encoding for text data.
+    prettyprint : bool (optional)
+       If True use line breaks and indenting in output XML.
+    infer_numeric_types : boolean
+       Determine if numeric types should be generalized.
+       For example, if edges have both int and float 'weight' attributes,
+       we infer in GraphML that both are floats.
+    named_key_ids : bool (optional)
+       If True use attr.name as value for key elements' id attribute.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_graphml_stream(G, "test.graphml")
+
+    Notes
+    -----
+    The keys of the attributes must precede the graph in the document, so
+    the graph is read twice: once to find the keys and once to write it.
+
+    This implementation does not support mixed graphs (directed
+    and unidirected edges together) hyperedges, nested graphs, or ports.
+    """
+    writer = GraphMLStreamWriter(
+        path,
+        encoding=encoding,
+        prettyprint=prettyprint,
+        infer_numeric_types=infer_numeric_types,
+        named_key_ids=named_key_ids,
+    )
+    writer.dump(G)
+
+
 def generate_graphml(G, encoding="utf-8", prettyprint=True, named_key_ids=False):
     """Generate GraphML lines for G
 
@@ -269,6 +330,65 @@ def read_graphml(path, node_type=str, edge_key_type=int, force_multigraph=False)
     return glist[0]
 
 
+@open_file(0, mode="rb")
+def read_graphml_stream(path, node_type=str, edge_key_type=int, force_multigraph=False):
+    """Read graph in GraphML format from path, one element at a time.
+
+    The graph is the same as the graph returned by :func:`read_graphml`,
+    but the document is parsed incrementally and every node and edge
+    element is discarded once it is added to the graph, so the memory used
+    is the memory of the graph instead of the memory of the XML tree.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+
+    node_type: Python type (default: str)
+       Convert node ids to this type
+
+    edge_key_type: Python type (default: int)
+       Convert graphml edge ids to this type. Multigraphs use id as edge key.
+       Non-multigraphs add to edge attribute dict with name "id".
+
+    force_multigraph : bool (default: False)
+       If True, return a multigraph with edge keys. If False (the default)
+       return a multigraph when multiedges are in the graph.
+
+    Returns
+    -------
+    graph: NetworkX graph
+        If parallel edges are present or `force_multigraph=True` then
+        a MultiGraph or MultiDiGraph is returned. Otherwise a Graph/DiGraph.
+        The returned graph is directed if the file indicates it should be.
+
+    Raises
+    ------
+    NetworkXError
+        If the document has no graph in the GraphML namespace.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_graphml_stream(G, "test.graphml")
+    >>> H = nx.read_graphml_stream("test.graphml", node_type=int)
+
+    Notes
+    -----
+    Unlike :func:`read_graphml`, documents without the GraphML namespace
+    declaration are not supported, and the key elements must precede the
+    graph, as the GraphML schema requires.
+
+    This implementation does not support mixed graphs (directed and unidirected
+    edges together), hypergraphs, nested graphs, or ports.
+    """
+    reader = GraphMLStreamReader(node_type, edge_key_type, force_multigraph)
+    for G in reader(path=path):
+        return G
+    raise nx.NetworkXError("file not successfully read as graphml")
+
+
 def parse_graphml(
     graphml_string, node_type=str, edge_key_type=int, force_multigraph=False
 ):
@@ -617,6 +737,136 @@ class GraphMLWriter(GraphML):
                 elem.tail = i
 
 
+class GraphMLStreamWriter(GraphMLWriter):
+    """Write a graph as a GraphML document, one element at a time.
+
+    The document is the same as the one written by GraphMLWriter, but only
+    the key elements are kept in memory.  Each node and edge element is
+    built, serialized and written to the stream before the next one.
+    """
+
+    def __init__(
+        self,
+        stream,
+        encoding="utf-8",
+        prettyprint=True,
+        infer_numeric_types=False,
+        named_key_ids=False,
+    ):
+        super().__init__(
+            encoding=encoding,
+            prettyprint=prettyprint,
+            infer_numeric_types=infer_numeric_types,
+            named_key_ids=named_key_ids,
+        )
+        self.stream = stream
+
+    def graph_data(self, G):
+        return {
+            k: v
+            for (k, v) in G.graph.items()
+            if k not in ["node_default", "edge_default", "id"]
+        }
+
+    def iter_data(self, G):
+        # Yields the (tag, attributes, data, scope, default) of the elements
+        # of G in document order, the graph data last.
+        node_default = G.graph.get("node_default", {})
+        edge_default = G.graph.get("edge_default", {})
+        for node, data in G.nodes(data=True):
+            yield "node", {"id": str(node)}, data, "node", node_default
+        if G.is_multigraph():
+            for u, v, key, data in G.edges(data=True, keys=True):
+                attrib = {"source": str(u), "target": str(v), "id": str(key)}
+                yield "edge", attrib, data, "edge", edge_default
+        else:
+            for u, v, data in G.edges(data=True):
+                attrib = {"source": str(u), "target": str(v)}
+                yield "edge", attrib, data, "edge", edge_default
+        yield None, None, self.graph_data(G), "graph", {}
+
+    def add_keys(self, G):
+        """Find the keys of G in the order GraphMLWriter creates them."""
+        for _, _, data, scope, _ in self.iter_data(G):
+            for k, v in data.items():
+                self.attribute_types[(str(k), scope)].add(type(v))
+        # the keys of the graph data come first
+        for k, v in self.graph_data(G).items():
+            self.add_data(str(k), self.attr_type(k, "graph", v), str(v), "graph")
+        for tag, _, data, scope, default in self.iter_data(G):
+            if tag is None:
+                break
+            for k, v in data.items():
+                T = self.attr_type(k, scope, v)
+                self.add_data(str(k), T, str(v), scope, default.get(k))
+
+    def write(self, text):
+        self.stream.write(text.encode(self.encoding, "xmlcharrefreplace"))
+
+    def write_element(self, element, level):
+        from xml.etree.ElementTree import tostring
+
+        if self.prettyprint:
+            self.indent(element, level)
+            element.tail = None
+            self.write("\n" + level * "  ")
+        self.write(tostring(element, encoding="unicode"))
+
+    def start_tag(self, tag, attrib):
+        from xml.etree.ElementTree import tostring
+
+        # serialize the empty element and open it
+        return tostring(self.myElement(tag, attrib), encoding="unicode")[:-3] + ">"
+
+    def dump(self, G):
+        """Write the GraphML document of G to the stream."""
+        self.add_keys(G)
+        self.write(f"<?xml version='1.0' encoding='{self.encoding}'?>\n")
+        self.write(self.start_tag(self.xml.tag, self.xml.attrib))
+        for key_element in self.xml:
+            self.write_element(key_element, 1)
+
+        if G.is_directed():
+            attrib = {"edgedefault": "directed"}
+        else:
+            attrib = {"edgedefault": "undirected"}
+        graphid = G.graph.get("id")
+        if graphid is not None:
+            attrib["id"] = graphid
+        if len(G) == 0 and not self.graph_data(G):
+            self.write_element(self.myElement("graph", attrib), 1)
+        else:
+            if self.prettyprint:
+                self.write("\n  ")
+            self.write(self.start_tag("graph", attrib))
+            for tag, attrib, data, scope, default in self.iter_data(G):
+                data_elements = [
+                    self.add_data(
+                        str(k),
+                        self.attr_type(k, scope, v),
+                        str(v),
+                        scope,
+                        default.get(k),
+                    )
+                    for k, v in data.items()
+                ]
+                if tag is None:
+                    # the graph data follows the nodes and edges
+                    for data_element in data_elements:
+                        self.write_element(data_element, 2)
+                else:
+                    element = self.myElement(tag, attrib)
+                    element.extend(data_elements)
+                    self.write_element(element, 2)
+            if self.prettyprint:
+                self.write("\n  ")
+            self.write("</graph>")
+        if self.prettyprint:
+            self.write(f"\n</{self.xml.tag}>\n")
+        else:
+            self.write(f"</{self.xml.tag}>")
+
+
 class IncrementalElement:
     """Wrapper for _IncrementalWriter providing an Element like interface.
 
@@ -791,6 +1041,24 @@ class GraphMLReader(GraphML):
             yield self.make_graph(g, keys, defaults)
 
     def make_graph(self, graph_xml, graphml_keys, defaults, G=None):
+        G = self.start_graph(graph_xml, graphml_keys, defaults, G)
+        # hyperedges are not supported
+        hyperedge = graph_xml.find(f"{{{self.NS_GRAPHML}}}hyperedge")
+        if hyperedge is not None:
+            raise nx.NetworkXError("GraphML reader doesn't support hyperedges")
+        # add nodes
+        for node_xml in graph_xml.findall(f"{{{self.NS_GRAPHML}}}node"):
+            self.add_node(G, node_xml, graphml_keys, defaults)
+        # add edges
+        for edge_xml in graph_xml.findall(f"{{{self.NS_GRAPHML}}}edge"):
+            self.add_edge(G, edge_xml, graphml_keys)
+        # add graph data
+        data = self.decode_data_elements(graphml_keys, graph_xml)
+        G.graph.update(data)
+        return self.finish_graph(G)
+
+    def start_graph(self, graph_xml, graphml_keys, defaults, G=None):
+        """Create the graph and set the default attributes."""
         # set default graph type
         edgedefault = graph_xml.get("edgedefault", None)
         if G is None:
@@ -809,20 +1077,10 @@ class GraphMLReader(GraphML):
                 G.graph["node_default"].update({name: python_type(value)})
             if key_for == "edge":
                 G.graph["edge_default"].update({name: python_type(value)})
-        # hyperedges are not supported
-        hyperedge = graph_xml.find(f"{{{self.NS_GRAPHML}}}hyperedge")
-        if hyperedge is not None:
-            raise nx.NetworkXError("GraphML reader doesn't support hyperedges")
-        # add nodes
-        for node_xml in graph_xml.findall(f"{{{self.NS_GRAPHML}}}node"):
-            self.add_node(G, node_xml, graphml_keys, defaults)
-        # add edges
-        for edge_xml in graph_xml.findall(f"{{{self.NS_GRAPHML}}}edge"):
-            self.add_edge(G, edge_xml, graphml_keys)
-        # add graph data
-        data = self.decode_data_elements(graphml_keys, graph_xml)
-        G.graph.update(data)
+        return G
 
+    def finish_graph(self, G):
+        """Return the graph as a Graph or DiGraph if it has no multiedges."""
         # switch to Graph or DiGraph if no parallel edges were found
         if self.multigraph:
             return G
@@ -945,25 +1203,83 @@ class GraphMLReader(GraphML):
         graphml_keys = {}
         graphml_key_defaults = {}
         for k in graph_element.findall(f"{{{self.NS_GRAPHML}}}key"):
-            attr_id = k.get("id")
-            attr_type = k.get("attr.type")
-            attr_name = k.get("attr.name")
-            yfiles_type = k.get("yfiles.type")
-            if yfiles_type is not None:
-                attr_name = yfiles_type
-                attr_type = "yfiles"
-            if attr_type is None:
-                attr_type = "string"
-                warnings.warn(f"No key type for id {attr_id}. Using string")
-            if attr_name is None:
-                raise nx.NetworkXError(f"Unknown key for id {attr_id}.")
-            graphml_keys[attr_id] = {
-                "name": attr_name,
-                "type": self.python_type[attr_type],
-                "for": k.get("for"),
-            }
-            # check for "default" subelement of key element
-            default = k.find(f"{{{self.NS_GRAPHML}}}default")
-            if default is not None:
-                graphml_key_defaults[attr_id] = default.text
+            self.add_key(k, graphml_keys, graphml_key_defaults)
         return graphml_keys, graphml_key_defaults
+
+    def add_key(self, k, graphml_keys, graphml_key_defaults):
+        """Add the key and key default of a key element."""
+        attr_id = k.get("id")
+        attr_type = k.get("attr.type")
+        attr_name = k.get("attr.name")
+        yfiles_type = k.get("yfiles.type")
+        if yfiles_type is not None:
+            attr_name = yfiles_type
+            attr_type = "yfiles"
+        if attr_type is None:
+            attr_type = "string"
+            warnings.warn(f"No key type for id {attr_id}. Using string")
+        if attr_name is None:
+            raise nx.NetworkXError(f"Unknown key for id {attr_id}.")
+        graphml_keys[attr_id] = {
+            "name": attr_name,
+            "type": self.python_type[attr_type],
+            "for": k.get("for"),
+        }
+        # check for "default" subelement of key element
+        default = k.find(f"{{{self.NS_GRAPHML}}}default")
+        if default is not None:
+            graphml_key_defaults[attr_id] = default.text
+
+
+class GraphMLStreamReader(GraphMLReader):
+    """Read a GraphML document incrementally.  Produces NetworkX graph objects.
+
+    The document is parsed with ``iterparse`` and every node and edge element
+    of a graph is removed from the document once it is added to the graph.
+    """
+
+    def __call__(self, path=None, string=None):
+        from io import BytesIO, StringIO
+        from xml.etree.ElementTree import iterparse
+
+        if path is not None:
+            source = path
+        elif isinstance(string, str):
+            source = StringIO(string)
+        elif string is not None:
+            source = BytesIO(string)
+        else:
+            raise ValueError("Must specify either 'path' or 'string' as kwarg")
+
+        graph_tag = f"{{{self.NS_GRAPHML}}}graph"
+        node_tag = f"{{{self.NS_GRAPHML}}}node"
+        edge_tag = f"{{{self.NS_GRAPHML}}}edge"
+        keys, defaults = {}, {}
+        # the open elements, from the root element
+        stack = []
+        for event, element in iterparse(source, events=("start", "end")):
+            if event == "start":
+                stack.append(element)
+                if len(stack) == 2 and element.tag == graph_tag:
+                    G = self.start_graph(element, keys, defaults)
+                continue
+            stack.pop()
+            if len(stack) == 1:
+                # children of the root element
+                if element.tag == f"{{{self.NS_GRAPHML}}}key":
+                    self.add_key(element, keys, defaults)
+                elif element.tag == graph_tag:
+                    G.graph.update(self.decode_data_elements(keys, element))
+                    yield self.finish_graph(G)
+                stack[0].remove(element)
+            elif len(stack) == 2 and stack[1].tag == graph_tag:
+                # children of a graph element
+                if element.tag == node_tag:
+                    self.add_node(G, element, keys, defaults)
+                elif element.tag == edge_tag:
+                    self.add_edge(G, element, keys)
+                elif element.tag == f"{{{self.NS_GRAPHML}}}hyperedge":
+                    raise nx.NetworkXError("GraphML reader doesn't support hyperedges")
+                else:
+                    continue
+                stack[1].remove(element)
@@ -1,13 +1,64 @@
-from itertools import chain, count
+import re
+import json
+import codecs
+from itertools import chain, count, islice
 import networkx as nx
 from networkx.utils import to_tuple
 
-__all__ = ["node_link_data", "node_link_graph"]
+__all__ = [
+    "node_link_data",
+    "node_link_graph",
+    "node_link_stream",
+    "node_link_graph_stream",
+]
 
 
 _attrs = dict(source="source", target="target", name="id", key="key", link="links")
 
 
+def _update_attrs(attrs):
+    # Allow 'attrs' to keep default values.
+    if attrs is None:
+        return _attrs
+    attrs.update({k: v for (k, v) in _attrs.items() if k not in attrs})
+    return attrs
+
+
+def _node_link_records(G, attrs):
+    """Returns the header, links key and node and link record generators.
+
+    The records are the dictionaries that :func:`node_link_data` stores in
+    its "nodes" and links lists, generated one at a time.
+    """
+    multigraph = G.is_multigraph()
+    attrs = _update_attrs(attrs)
+    name = attrs["name"]
+    source = attrs["source"]
+    target = attrs["target"]
+    links = attrs["link"]
+    # Allow 'key' to be omitted from attrs if the graph is not a multigraph.
+    key = None if not multigraph else attrs["key"]
+    if len({source, target, key}) < 3:
+        raise nx.NetworkXError("Attribute names are not unique.")
+    header = {
+        "directed": G.is_directed(),
+        "multigraph": multigraph,
+        "graph": G.graph,
+    }
+    nodes = (dict(chain(G.nodes[n].items(), [(name, n)])) for n in G)
+    if multigraph:
+        edges = (
+            dict(chain(d.items(), [(source, u), (target, v), (key, k)]))
+            for u, v, k, d in G.edges(keys=True, data=True)
+        )
+    else:
+        edges = (
+            dict(chain(d.items(), [(source, u), (target, v)]))
+            for u, v, d in G.edges(data=True)
+        )
+    return header, links, nodes, edges
+
+
 def node_link_data(G, attrs=None):
     """Returns data in node-link format that is suitable for JSON serialization
     and use in Javascript documents.
@@ -67,36 +118,10 @@ def node_link_data(G, attrs=None):
     --------
     node_link_graph, adjacency_data, tree_data
     """
-    multigraph = G.is_multigraph()
-    # Allow 'attrs' to keep default values.
-    if attrs is None:
-        attrs = _attrs
-    else:
-        attrs.update({k: v for (k, v) in _attrs.items() if k not in attrs})
-    name = attrs["name"]
-    source = attrs["source"]
-    target = attrs["target"]
-    links = attrs["link"]
-    # Allow 'key' to be omitted from attrs if the graph is not a multigraph.
-    key = None if not multigraph else attrs["key"]
-    if len({source, target, key}) < 3:
-        raise nx.NetworkXError("Attribute names are not unique.")
-    data = {
-        "directed": G.is_directed(),
-        "multigraph": multigraph,
-        "graph": G.graph,
-        "nodes": [dict(chain(G.nodes[n].items(), [(name, n)])) for n in G],
-    }
-    if multigraph:
-        data[links] = [
-            dict(chain(d.items(), [(source, u), (target, v), (key, k)]))
-            for u, v, k, d in G.edges(keys=True, data=True)
-        ]
-    else:
-        data[links] = [
-            dict(chain(d.items(), [(source, u), (target, v)]))
-            for u, v, d in G.edges(data=True)
-        ]
+    header, links, nodes, edges = _node_link_records(G, attrs)
+    data = dict(header)
+    data["nodes"] = list(nodes)
+    data[links] = list(edges)
     return data
 
 
@@ -142,11 +167,7 @@ def node_link_graph(data, directed=False, multigraph=True, attrs=None):
     --------
     node_link_data, adjacency_data, tree_data
     """
-    # Allow 'attrs' to keep default values.
-    if attrs is None:
-        attrs = _attrs
-    else:
-        attrs.update({k: v for k, v in _attrs.items() if k not in attrs})
+    attrs = _update_attrs(attrs)
     multigraph = data.get("multigraph", multigraph)
     directed = data.get("directed", directed)
     if multigraph:
@@ -182,3 +203,365 @@ def node_link_graph(data, directed=False, multigraph=True, attrs=None):
             }
             graph.add_edge(src, tgt, ky, **edgedata)
     return graph
+
+
+def _batches(iterable, batch_size):
+    it = iter(iterable)
+    batch = list(islice(it, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(it, batch_size))
+
+
+def node_link_stream(G, fp, attrs=None, jsonl=False, batch_size=1000, **kwargs):
+    """Writes G in node-link format to a file without building the data.
+
+    Nodes and links are encoded one at a time and written to `fp` in
+    batches, so memory use does not grow with the size of the graph.
+    The output is the same as ``json.dump(node_link_data(G, attrs), fp)``.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    fp : file-like object
+        A text file, or any object with a ``write`` method that accepts
+        strings, such as ``socket.makefile("w")``.
+
+    attrs : dict
+        A dictionary that contains five keys 'source', 'target', 'name',
+        'key' and 'link'.  See :func:`node_link_data`.
+
+    jsonl : bool (default=False)
+        If True, write newline-delimited JSON instead: a header line with
+        the "directed", "multigraph" and "graph" values and the number of
+        nodes and links, then one line per node and one line per link.
+
+    batch_size : int (default=1000)
+        The number of nodes or links encoded per write to `fp`.
+
+    kwargs :
+        Keyword arguments passed to :class:`json.JSONEncoder`, such as
+        `ensure_ascii` or `default`.  `indent` is not supported.
+
+    Raises
+    ------
+    NetworkXError
+        If values in attrs are not unique.
+
+    Examples
+    --------
+    >>> import io
+    >>> from networkx.readwrite import json_graph
+    >>> G = nx.path_graph(3)
+    >>> fp = io.StringIO()
+    >>> json_graph.node_link_stream(G, fp)
+    >>> H = json_graph.node_link_graph_stream(io.StringIO(fp.getvalue()))
+
+    The JSONL variant stores each node and link on its own line
+
+    >>> fp = io.StringIO()
+    >>> json_graph.node_link_stream(G, fp, jsonl=True)
+    >>> print(fp.getvalue())
+    {"directed": false, "multigraph": false, "graph": {}, "nodes": 3, "links": 2}
+    {"id": 0}
+    {"id": 1}
+    {"id": 2}
+    {"source": 0, "target": 1}
+    {"source": 1, "target": 2}
+    <BLANKLINE>
+
+    Notes
+    -----
+    In the JSONL variant the header gives the number of node lines, so the
+    node and link lines can be split up and loaded in parallel.
+
+    See Also
+    --------
+    node_link_data, node_link_graph_stream
+    """
+    if kwargs.get("indent") is not None:
+        raise ValueError("node_link_stream does not support indent.")
+    header, links, nodes, edges = _node_link_records(G, attrs)
+    encoder = json.JSONEncoder(**kwargs)
+    encode = encoder.encode
+    if jsonl:
+        header = dict(header)
+        header["nodes"] = G.number_of_nodes()
+        header[links] = G.number_of_edges()
+        fp.write(encode(header) + "\n")
+        for records in (nodes, edges):
+            for batch in _batches(records, batch_size):
+                fp.write("".join([encode(r) + "\n" for r in batch]))
+        return
+    item_sep = encoder.item_separator
+    key_sep = encoder.key_separator
+    # Open the header object and write each list of records into it.
+    prefix = encode(header)[:-1] + item_sep
+    for name, records in (("nodes", nodes), (links, edges)):
+        fp.write(prefix + encode(name) + key_sep + "[")
+        sep = ""
+        for batch in _batches(records, batch_size):
+            fp.write(sep + item_sep.join([encode(r) for r in batch]))
+            sep = item_sep
+        prefix = "]" + item_sep
+    fp.write("]}")
+
+
+_WS = re.compile(r"[ \t\n\r]*")
+
+
+class _JSONStreamParser:
+    """Incremental parser for the structure of a node-link JSON document.
+
+    Reads `fp` in chunks and decodes one JSON value at a time, so only the
+    value being decoded is held in memory.
+    """
+
+    def __init__(self, fp, chunk_size=1 << 16):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+        self.bytes_decoder = None
+
+    def fill(self):
+        """Reads the next chunk into the buffer. Returns False at EOF."""
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        self.eof = not chunk
+        if isinstance(chunk, bytes):
+            if self.bytes_decoder is None:
+                self.bytes_decoder = codecs.getincrementaldecoder("utf-8")()
+            chunk = self.bytes_decoder.decode(chunk, final=self.eof)
+        if self.eof:
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Skips whitespace and returns the next character, "" at EOF."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars):
+        c = self.peek()
+        if not c or c not in chars:
+            found = repr(c) if c else "end of file"
+            expected = " or ".join(repr(ch) for ch in chars)
+            raise nx.NetworkXError(f"Invalid JSON: expected {expected}, found {found}")
+        self.pos += 1
+        return c
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as err:
+                if not self.fill():
+                    raise nx.NetworkXError(f"Invalid JSON: {err}") from err
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self.buf) and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def _json_events(fp, links):
+    """Yields (kind, value) pairs from a node-link JSON document.
+
+    `kind` is "nodes" or "links" for each record of those lists, and None
+    for a (key, value) pair of any other top-level entry.
+    """
+    parser = _JSONStreamParser(fp)
+    parser.expect("{")
+    if parser.peek() == "}":
+        parser.pos += 1
+        return
+    while True:
+        key = parser.value()
+        parser.expect(":")
+        kind = {"nodes": "nodes", links: "links"}.get(key)
+        if kind is not None and parser.peek() == "[":
+            parser.pos += 1
+            if parser.peek() == "]":
+                parser.pos += 1
+            else:
+                while True:
+                    yield kind, parser.value()
+                    if parser.expect(",]") == "]":
+                        break
+        else:
+            yield None, (key, parser.value())
+        if parser.expect(",}") == "}":
+            break
+    if parser.peek():
+        raise nx.NetworkXError("Invalid JSON: extra data after the graph.")
+
+
+def _jsonl_events(fp, links):
+    """Yields (kind, value) pairs from a node-link JSONL document."""
+    lines = (line for line in fp if line.strip())
+    try:
+        header = json.loads(next(lines))
+    except StopIteration as err:
+        raise nx.NetworkXError("Invalid JSONL: missing header line.") from err
+    num_nodes = header.pop("nodes", 0)
+    header.pop(links, None)
+    for item in header.items():
+        yield None, item
+    for line in islice(lines, num_nodes):
+        yield "nodes", json.loads(line)
+    for line in lines:
+        yield "links", json.loads(line)
+
+
+def node_link_graph_stream(
+    fp, directed=False, multigraph=True, attrs=None, jsonl=False, batch_size=1000
+):
+    """Returns graph from a node-link JSON file, read incrementally.
+
+    The file is parsed one node or link at a time, and nodes and edges are
+    added to the graph in batches, so the node-link data is never held in
+    memory as a whole.
+
+    Parameters
+    ----------
+    fp : file-like object
+        A text or binary (UTF-8) file, or any object with a ``read`` method
+        such as ``socket.makefile("rb")``.
+
+    directed : bool
+        If True, and direction not specified in data, return a directed graph.
+
+    multigraph : bool
+        If True, and multigraph not specified in data, return a multigraph.
+
+    attrs : dict
+        A dictionary that contains five keys 'source', 'target', 'name',
+        'key' and 'link'.  See :func:`node_link_graph`.
+
+    jsonl : bool (default=False)
+        If True, read the newline-delimited JSON variant written by
+        ``node_link_stream(G, fp, jsonl=True)``.
+
+    batch_size : int (default=1000)
+        The number of nodes or edges added to the graph at a time.
+
+    Returns
+    -------
+    G : NetworkX graph
+        A NetworkX graph object
+
+    Raises
+    ------
+    NetworkXError
+        If the file is not valid JSON, or if "directed" or "multigraph"
+        follows the nodes or links and does not match the graph type.
+
+    Examples
+    --------
+    >>> import io
+    >>> from networkx.readwrite import json_graph
+    >>> fp = io.StringIO('{"nodes": [{"id": "A"}], "links": []}')
+    >>> G = json_graph.node_link_graph_stream(fp, multigraph=False)
+    >>> list(G)
+    ['A']
+
+    Notes
+    -----
+    The graph type is decided when the first node or link is read, so
+    "directed" and "multigraph" should come before "nodes" and "links", as
+    they do in files written by :func:`node_link_stream` and by
+    ``json.dump(node_link_data(G), fp)``.
+
+    See Also
+    --------
+    node_link_stream, node_link_graph
+    """
+    attrs = _update_attrs(attrs)
+    name = attrs["name"]
+    source = attrs["source"]
+    target = attrs["target"]
+    links = attrs["link"]
+    events = _jsonl_events(fp, links) if jsonl else _json_events(fp, links)
+    data = {}
+    graph = None
+    c = count()
+
+    def new_graph():
+        is_multigraph = data.get("multigraph", multigraph)
+        graph = nx.MultiGraph() if is_multigraph else nx.Graph()
+        if data.get("directed", directed):
+            graph = graph.to_directed()
+        return graph
+
+    def add_nodes(records):
+        graph.add_nodes_from(
+            (
+                to_tuple(d.get(name, next(c))),
+                {str(k): v for k, v in d.items() if k != name},
+            )
+            for d in records
+        )
+
+    def add_links(records):
+        edges = []
+        for d in records:
+            src = tuple(d[source]) if isinstance(d[source], list) else d[source]
+            tgt = tuple(d[target]) if isinstance(d[target], list) else d[target]
+            if not is_multigraph:
+                edgedata = {
+                    str(k): v for k, v in d.items() if k != source and k != target
+                }
+                edges.append((src, tgt, edgedata))
+            else:
+                edgedata = {
+                    str(k): v
+                    for k, v in d.items()
+                    if k != source and k != target and k != key
+                }
+                edges.append((src, tgt, d.get(key, None), edgedata))
+        graph.add_edges_from(edges)
+
+    batch = []
+    add = None
+    for kind, value in events:
+        if kind is None:
+            k, v = value
+            if graph is not None and k in ("directed", "multigraph"):
+                is_type = graph.is_directed() if k == "directed" else is_multigraph
+                if v != is_type:
+                    raise nx.NetworkXError(
+                        f'"{k}" must come before the nodes and links.'
+                    )
+            data[k] = v
+            continue
+        if graph is None:
+            graph = new_graph()
+            is_multigraph = graph.is_multigraph()
+            # Allow 'key' to be omitted from attrs if the graph is not a multigraph.
+            key = None if not is_multigraph else attrs["key"]
+        records = add_nodes if kind == "nodes" else add_links
+        if records is not add or len(batch) >= batch_size:
+            if batch:
+                add(batch)
+            batch = []
+            add = records
+        batch.append(value)
+    if batch:
+        add(batch)
+    if graph is None:
+        graph = new_graph()
+    graph.graph = data.get("graph", {})
+    return graph
@@ -1,7 +1,14 @@
+import io
 import json
 import pytest
 import networkx as nx
-from networkx.readwrite.json_graph import node_link_data, node_link_graph
+from networkx.testing import assert_nodes_equal, assert_edges_equal
+from networkx.readwrite.json_graph import (
+    node_link_data,
+    node_link_graph,
+    node_link_stream,
+    node_link_graph_stream,
+)
 
 
 class TestNodeLink:
@@ -102,3 +109,102 @@ class TestNodeLink:
         assert H.graph["foo"] == "bar"
         assert H.nodes[1]["color"] == "red"
         assert H[1][2]["width"] == 7
+
+
+class TestNodeLinkStream:
+    def graphs(self):
+        G = nx.path_graph(5)
+        G.add_node(1, color="red")
+        G.add_edge(1, 2, width=7)
+        G.graph["foo"] = "bar"
+        M = nx.MultiDiGraph()
+        M.add_edge((0, 0), (1, 0), key="first")
+        M.add_edge((0, 0), (1, 0), key="second", color="blue")
+        M.add_node("qualité", size=[1, 2])
+        return [G, M, nx.DiGraph(), nx.MultiGraph()]
+
+    def roundtrip(self, G, **kwargs):
+        fp = io.StringIO()
+        node_link_stream(G, fp, **kwargs)
+        return fp.getvalue(), node_link_graph_stream(
+            io.StringIO(fp.getvalue()), **kwargs
+        )
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 1000])
+    def test_matches_node_link_data(self, batch_size):
+        for G in self.graphs():
+            s, H = self.roundtrip(G, batch_size=batch_size)
+            assert s == json.dumps(node_link_data(G))
+            assert_nodes_equal(H.nodes(data=True), G.nodes(data=True))
+            assert_edges_equal(H.edges(data=True), G.edges(data=True))
+            assert H.is_directed() == G.is_directed()
+            assert H.is_multigraph() == G.is_multigraph()
+            assert H.graph == G.graph
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 1000])
+    def test_jsonl(self, batch_size):
+        for G in self.graphs():
+            s, H = self.roundtrip(G, jsonl=True, batch_size=batch_size)
+            lines = s.splitlines()
+            assert len(lines) == 1 + len(G) + G.number_of_edges()
+            assert json.loads(lines[0])["nodes"] == len(G)
+            assert_nodes_equal(H.nodes(data=True), G.nodes(data=True))
+            assert_edges_equal(H.edges(data=True), G.edges(data=True))
+            assert H.is_multigraph() == G.is_multigraph()
+            assert H.graph == G.graph
+
+    def test_encoder_kwargs(self):
+        G = nx.Graph()
+        G.add_node(1, **{"qualité": "qualité"})
+        fp = io.StringIO()
+        node_link_stream(G, fp, ensure_ascii=False, separators=(",", ":"))
+        assert fp.getvalue() == json.dumps(
+            node_link_data(G), ensure_ascii=False, separators=(",", ":")
+        )
+        with pytest.raises(ValueError):
+            node_link_stream(G, io.StringIO(), indent=2)
+
+    def test_custom_attrs(self):
+        G = nx.path_graph(4)
+        attrs = dict(source="c_source", target="c_target", name="c_id", link="c_links")
+        fp = io.StringIO()
+        node_link_stream(G, fp, attrs=attrs)
+        assert fp.getvalue() == json.dumps(node_link_data(G, attrs=attrs))
+        H = node_link_graph_stream(io.StringIO(fp.getvalue()), attrs=attrs)
+        assert nx.is_isomorphic(G, H)
+
+    def test_read_small_chunks(self):
+        G = nx.MultiGraph()
+        G.add_edge("qualité", 12345, key=6789, weight=1.5e-7)
+        G.add_edge(12345, 12345)
+        data = json.dumps(node_link_data(G), indent=2, ensure_ascii=False)
+
+        class Chunked(io.BytesIO):
+            def read(self, size=-1):
+                return super().read(1)
+
+        H = node_link_graph_stream(Chunked(data.encode("utf-8")))
+        assert_nodes_equal(H.nodes(data=True), G.nodes(data=True))
+        assert_edges_equal(H.edges(keys=True, data=True), G.edges(keys=True, data=True))
+
+    def test_read_defaults(self):
+        data = '{"nodes": [{"id": 1}, {}], "links": [{"source": 1, "target": 0}]}'
+        H = node_link_graph_stream(io.StringIO(data), directed=True)
+        assert H.is_directed() and H.is_multigraph()
+        assert sorted(H.edges()) == [(1, 0)]
+        H = node_link_graph_stream(io.StringIO("{}"), multigraph=False)
+        assert type(H) is nx.Graph and len(H) == 0
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            "",
+            "[]",
+            '{"nodes": [{"id": 1}',
+            '{"nodes": [{"id": 1}]} {}',
+            '{"nodes": [{"id": 1}], "directed": true}',
+        ],
+    )
+    def test_read_invalid(self, data):
+        with pytest.raises(nx.NetworkXError):
+            node_link_graph_stream(io.StringIO(data), multigraph=False)
@@ -11,14 +11,76 @@ For more information, see the `sparse6`_ homepage.
 .. _sparse6: http://users.cecs.anu.edu.au/~bdm/data/formats.html
 
 """
+from itertools import chain
+
 import networkx as nx
 from networkx.exception import NetworkXError
 from networkx.utils import open_file, not_implemented_for
-from networkx.readwrite.graph6 import data_to_n, n_to_data
+from networkx.readwrite.graph6 import data_to_n, n_to_data, _NUMPY_MIN_BITS
 
 __all__ = ["from_sparse6_bytes", "read_sparse6", "to_sparse6_bytes", "write_sparse6"]
 
 
+def _sparse6_data(n, k, u, v):
+    """Returns the sparse6 data characters for the edges `u`, `v`.
+
+    `u` and `v` are NumPy integer arrays with ``u <= v``, sorted by `v` and
+    then `u`. Each edge is the record ``(b, u)`` of one bit `b` and `k` bits
+    of `u`, preceded by the record ``(1, v)`` if `v` is more than one past
+    the vertex of the previous edge.
+    """
+    import numpy as np
+
+    prev = np.concatenate(([0], v))[:-1]
+    skip = v - prev > 1
+    pos = np.arange(len(v)) + np.cumsum(skip)
+    b = np.ones(len(v) + skip.sum(), dtype=np.uint8)
+    x = np.empty(len(b), dtype=np.int64)
+    b[pos] = v - prev == 1
+    x[pos] = u
+    x[pos[skip] - 1] = v[skip]
+    bits = np.empty((len(b), k + 1), dtype=np.uint8)
+    bits[:, 0] = b
+    bits[:, 1:] = (x[:, None] >> np.arange(k - 1, -1, -1)) & 1
+    bits = bits.ravel()
+    curv = v[-1] if len(v) else 0
+    if k < 6 and n == (1 << k) and ((-len(bits)) % 6) >= k and curv < (n - 1):
+        # Padding special case, see _generate_sparse6_bytes
+        padding = [0] + [1] * ((-len(bits) - 1) % 6)
+    else:
+        padding = [1] * ((-len(bits)) % 6)
+    bits = np.concatenate((bits, np.array(padding, dtype=np.uint8)))
+    data = bits.reshape(-1, 6) @ np.array([32, 16, 8, 4, 2, 1]) + 63
+    return data.astype(np.uint8).tobytes()
+
+
+def _sparse6_edges(n, k, data):
+    """Returns arrays `u`, `v` with ``u <= v`` of the edges in sparse6 `data`.
+
+    `data` is a NumPy array of the six-bit values after the number of nodes.
+    The current vertex after record ``(b[i], x[i])`` is
+    ``v[i] = max(v[i - 1] + b[i], x[i])``, which is computed for all records
+    at once as ``c + maximum.accumulate(maximum(x - c, 0))`` with ``c`` the
+    cumulative sum of ``b``.
+    """
+    import numpy as np
+
+    bits = np.unpackbits(data.astype(np.uint8)[:, None], axis=1)[:, 2:].ravel()
+    records = bits[: len(bits) // (k + 1) * (k + 1)].reshape(-1, k + 1)
+    b = records[:, 0].astype(np.int64)
+    x = records[:, 1:].astype(np.int64) @ (1 << np.arange(k - 1, -1, -1))
+    c = np.cumsum(b)
+    v = c + np.maximum.accumulate(np.maximum(x - c, 0))
+    cur = np.concatenate(([0], v))[:-1] + b
+    # padding with ones can cause overlarge number here
+    stop = np.flatnonzero((x >= n) | (cur >= n))
+    if len(stop):
+        x = x[: stop[0]]
+        cur = cur[: stop[0]]
+    edge = x <= cur
+    return x[edge], cur[edge]
+
+
 def _generate_sparse6_bytes(G, nodes, header):
     """Yield bytes in the sparse6 encoding of a graph.
 
@@ -55,6 +117,21 @@ def _generate_sparse6_bytes(G, nodes, header):
     while 1 << k < n:
         k += 1
 
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        edges = np.fromiter(
+            chain.from_iterable(G.edges()), dtype=np.int64, count=2 * G.size()
+        ).reshape(-1, 2)
+        u = edges.min(axis=1)
+        v = edges.max(axis=1)
+        order = np.lexsort((u, v))
+        yield _sparse6_data(n, k, u[order], v[order])
+        yield b"\n"
+        return
+
     def enc(x):
         """Big endian k-bit encoding of x"""
         return [1 if (x & 1 << (k - 1 - i)) else 0 for i in range(k)]
@@ -62,7 +139,7 @@ def _generate_sparse6_bytes(G, nodes, header):
     edges = sorted((max(u, v), min(u, v)) for u, v in G.edges())
     bits = []
     curv = 0
-    for (v, u) in edges:
+    for v, u in edges:
         if v == curv:  # current vertex edge
             bits.append(0)
             bits.extend(enc(u))
@@ -175,6 +252,24 @@ def from_sparse6_bytes(string):
             dLen = xLen - k
             yield b, x
 
+    if len(data) * 6 >= _NUMPY_MIN_BITS:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            u, v = _sparse6_edges(n, k, np.array(data))
+            order = np.lexsort((u, v))
+            multigraph = bool(
+                np.any(
+                    (u[order][1:] == u[order][:-1]) & (v[order][1:] == v[order][:-1])
+                )
+            )
+            G = nx.MultiGraph() if multigraph else nx.Graph()
+            G.add_nodes_from(range(n))
+            G.add_edges_from(zip(u.tolist(), v.tolist()))
+            return G
+
     v = 0
 
     G = nx.MultiGraph()
@@ -148,6 +148,70 @@ class TestAdjlist:
         assert_nodes_equal(list(H), list(G))
         assert_edges_equal(list(H.edges()), list(G.edges()))
 
+    @pytest.mark.parametrize("chunk_size", [1, 10, 2 ** 26])
+    def test_read_adjlist_chunked(self, chunk_size):
+        pytest.importorskip("numpy")
+        for G, create_using in [
+            (self.G, nx.Graph),
+            (self.DG, nx.DiGraph),
+            (self.XG, nx.MultiGraph),
+            (self.XDG, nx.MultiDiGraph),
+        ]:
+            G = nx.convert_node_labels_to_integers(G)
+            fd, fname = tempfile.mkstemp()
+            nx.write_adjlist(G, fname)
+            H = nx.read_adjlist(fname, nodetype=int, create_using=create_using)
+            for path in [fname, io.BytesIO(open(fname, "rb").read())]:
+                H2 = nx.read_adjlist_chunked(
+                    path, nodetype=int, create_using=create_using, chunk_size=chunk_size
+                )
+                assert type(H2) is create_using
+                assert list(H2) == list(H)
+                assert list(H2.edges()) == list(H.edges())
+            os.close(fd)
+            os.unlink(fname)
+
+    def test_read_adjlist_chunked_comments(self):
+        pytest.importorskip("numpy")
+        fh = io.BytesIO(b"# comment\na:b:c # a b c\n\nb:d\ne\n")
+        H = nx.read_adjlist_chunked(fh, delimiter=":", chunk_size=5)
+        assert list(H) == ["a", "b", "c", "d", "e"]
+        assert list(H.edges()) == [("a", "b"), ("a", "c"), ("b", "d")]
+        with pytest.raises(TypeError):
+            nx.read_adjlist_chunked(io.BytesIO(b"1 a\n"), nodetype=int)
+
+    def test_read_adjlist_chunked_processes(self):
+        pytest.importorskip("numpy")
+        G = nx.gnm_random_graph(30, 60, seed=1)
+        fd, fname = tempfile.mkstemp()
+        nx.write_adjlist(G, fname)
+        H = nx.read_adjlist_chunked(fname, nodetype=int, processes=2, chunk_size=50)
+        assert list(H) == list(nx.read_adjlist(fname, nodetype=int))
+        assert_edges_equal(H.edges(), G.edges())
+        os.close(fd)
+        os.unlink(fname)
+
+    @pytest.mark.parametrize(
+        "create_using", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+    )
+    def test_read_adjlist_chunked_sparse(self, create_using):
+        pytest.importorskip("scipy")
+        G = create_using()
+        G.add_edges_from([(0, 1), (1, 0), (1, 2), (1, 2), (3, 3), (3, 3)])
+        G.add_node(4)
+        fh = io.BytesIO()
+        nx.write_adjlist(G, fh)
+        fh.seek(0)
+        M, nodelist = nx.read_adjlist_chunked(
+            fh, nodetype=int, create_using=create_using, sparse=True, chunk_size=4
+        )
+        H = nx.read_adjlist(
+            io.BytesIO(fh.getvalue()), nodetype=int, create_using=create_using
+        )
+        assert nodelist == list(H)
+        expected = nx.to_scipy_sparse_matrix(H, nodelist=nodelist, weight=None)
+        assert (M != expected).nnz == 0
+
 
 class TestMultilineAdjlist:
     @classmethod
@@ -651,3 +651,43 @@ gexf.net/1.2draft http://www.gexf.net/1.2draft/gexf.xsd" version="1.2">
         assert sorted(sorted(e) for e in G.edges()) == sorted(
             sorted(e) for e in H.edges()
         )
+
+    def test_read_gexf_stream(self):
+        for fh in [
+            self.simple_directed_fh,
+            self.attribute_fh,
+            self.simple_undirected_fh,
+        ]:
+            G = nx.read_gexf(fh)
+            fh.seek(0)
+            H = nx.read_gexf_stream(fh)
+            fh.seek(0)
+            assert type(G) == type(H)
+            assert G.graph == H.graph
+            assert list(G.nodes(data=True)) == list(H.nodes(data=True))
+            assert list(G.edges(data=True)) == list(H.edges(data=True))
+        fh = io.BytesIO(b"<gexf><meta/></gexf>")
+        pytest.raises(nx.NetworkXError, nx.read_gexf_stream, fh)
+
+    def test_write_gexf_stream(self):
+        G = nx.MultiDiGraph(name="G", node_default={"color": "blue"})
+        G.add_edge(1, 2, weight=3.0, label="<&>")
+        G.add_edge(1, 2, id="e1", color="red")
+        G.add_node(3, flag=True, viz={"size": 3, "position": {"x": 0, "y": 1, "z": 0}})
+        G.add_node("é", start=1, end=3)
+        for prettyprint in [True, False]:
+            for version in ["1.1draft", "1.2draft"]:
+                fh = io.BytesIO()
+                nx.write_gexf(G, fh, prettyprint=prettyprint, version=version)
+                sfh = io.BytesIO()
+                nx.write_gexf_stream(G, sfh, prettyprint=prettyprint, version=version)
+                assert fh.getvalue() == sfh.getvalue()
+        for G in [nx.Graph(), nx.path_graph(3)]:
+            fh = io.BytesIO()
+            nx.write_gexf(G, fh, encoding="latin-1")
+            sfh = io.BytesIO()
+            nx.write_gexf_stream(G, sfh, encoding="latin-1")
+            assert fh.getvalue() == sfh.getvalue()
+            sfh.seek(0)
+            H = nx.read_gexf_stream(sfh, node_type=int)
+            assert sorted(G.edges()) == sorted(H.edges())
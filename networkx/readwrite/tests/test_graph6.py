@@ -1,4 +1,5 @@
 from io import BytesIO
+import sys
 import tempfile
 import pytest
 
@@ -116,3 +117,57 @@ class TestWriteGraph6:
         assert g6.to_graph6_bytes(G) == b">>graph6<<A_\n"
         G = nx.Graph([(1, 42)])
         assert g6.to_graph6_bytes(G) == b">>graph6<<A_\n"
+
+    def test_without_numpy(self, monkeypatch):
+        graphs = [nx.gnm_random_graph(i, i * i // 4, seed=i) for i in [5, 13, 64]]
+        encoded = [g6.to_graph6_bytes(G) for G in graphs]
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        for G, data in zip(graphs, encoded):
+            assert g6.to_graph6_bytes(G) == data
+            H = g6.from_graph6_bytes(data.strip())
+            assert_nodes_equal(G.nodes(), H.nodes())
+            assert_edges_equal(G.edges(), H.edges())
+
+
+class TestIterGraph6:
+    @classmethod
+    def setup_class(cls):
+        cls.np = pytest.importorskip("numpy")
+        cls.graphs = [
+            nx.gnm_random_graph(i, i * i // 4, seed=i)
+            for i in [0, 1, 5, 13, 5, 64, 13, 70, 5]
+        ]
+        cls.lines = [g6.to_graph6_bytes(G, header=False) for G in cls.graphs]
+
+    @pytest.mark.parametrize("chunksize", [1, 4, 1000])
+    def test_iter_graph6(self, chunksize):
+        lines = [b">>graph6<<" + self.lines[0], b"\n"] + self.lines[1:]
+        graphs = list(g6.iter_graph6(lines, chunksize=chunksize))
+        assert len(graphs) == len(self.graphs)
+        for G, H in zip(self.graphs, graphs):
+            assert_nodes_equal(G.nodes(), H.nodes())
+            assert_edges_equal(G.edges(), H.edges())
+
+    def test_as_array(self):
+        for G, A in zip(self.graphs, g6.iter_graph6(self.lines, as_array=True)):
+            expected = nx.to_numpy_array(G, nodelist=range(len(G)), dtype=int)
+            self.np.testing.assert_array_equal(A, expected)
+
+    def test_processes(self):
+        arrays = g6.iter_graph6(self.lines, as_array=True, processes=2, chunksize=2)
+        for G, A in zip(self.graphs, arrays):
+            expected = nx.to_numpy_array(G, nodelist=range(len(G)), dtype=int)
+            self.np.testing.assert_array_equal(A, expected)
+
+    def test_read_file(self):
+        fh = BytesIO(b"".join(self.lines))
+        for G, H in zip(self.graphs, g6.iter_graph6(fh)):
+            assert_edges_equal(G.edges(), H.edges())
+
+    def test_invalid(self):
+        with pytest.raises(nx.NetworkXError):
+            list(g6.iter_graph6([b"DF{", b"DF"]))
+        with pytest.raises(ValueError):
+            list(g6.iter_graph6([b"DF\x7f"]))
+        with pytest.raises(ValueError):
+            list(g6.iter_graph6([b"D \x7f"]))
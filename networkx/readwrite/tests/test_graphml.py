@@ -291,6 +291,29 @@ class TestReadGraphML(BaseGraphML):
         assert sorted(G.edges()) == sorted(PG.edges())
         assert sorted(G.edges(data=True)) == sorted(PG.edges(data=True))
 
+    def test_read_graphml_stream(self):
+        for name in [
+            "simple_directed",
+            "attribute",
+            "attribute_named_key_ids",
+            "simple_undirected",
+            "undirected_multigraph",
+            "undirected_multigraph_no_multiedge",
+            "multigraph_only_ids_for_multiedges",
+        ]:
+            fh = getattr(self, f"{name}_fh")
+            G = nx.read_graphml(fh)
+            fh.seek(0)
+            H = nx.read_graphml_stream(fh)
+            fh.seek(0)
+            assert type(G) == type(H)
+            assert G.graph == H.graph
+            assert list(G.nodes(data=True)) == list(H.nodes(data=True))
+            assert list(G.edges(data=True)) == list(H.edges(data=True))
+        # documents without the namespace are not supported
+        fh = io.BytesIO(b"<graphml><graph/></graphml>")
+        pytest.raises(nx.NetworkXError, nx.read_graphml_stream, fh)
+
     def test_read_simple_undirected_graphml(self):
         G = self.simple_undirected_graph
         H = nx.read_graphml(self.simple_undirected_fh)
@@ -1325,3 +1348,41 @@ class TestXMLGraphML(TestWriteGraphML):
     @classmethod
     def setup_class(cls):
         TestWriteGraphML.setup_class()
+
+
+class TestStreamGraphML(TestWriteGraphML):
+    writer = staticmethod(nx.write_graphml_stream)
+
+    @classmethod
+    def setup_class(cls):
+        BaseGraphML.setup_class()
+
+    def test_write_interface(self):
+        assert nx.write_graphml_stream is not nx.write_graphml
+
+    def test_same_as_xml_writer(self):
+        G = nx.MultiDiGraph()
+        G.add_edge(1, 2, weight=3.0, label="<&>")
+        G.add_edge(1, 2, weight=2)
+        G.add_node(3, color="red", flag=True)
+        G.add_node("\u00e9")
+        G.graph.update(name="G", id="g0", node_default={"color": "blue"})
+        for prettyprint in [True, False]:
+            for infer_numeric_types in [True, False]:
+                for named_key_ids in [True, False]:
+                    kwargs = dict(
+                        prettyprint=prettyprint,
+                        infer_numeric_types=infer_numeric_types,
+                        named_key_ids=named_key_ids,
+                    )
+                    fh = io.BytesIO()
+                    nx.write_graphml_xml(G.copy(), fh, **kwargs)
+                    sfh = io.BytesIO()
+                    nx.write_graphml_stream(G, sfh, **kwargs)
+                    assert fh.getvalue() == sfh.getvalue()
+        for G in [nx.Graph(), nx.Graph(name="empty"), nx.path_graph(3)]:
+            fh = io.BytesIO()
+            nx.write_graphml_xml(G, fh, encoding="latin-1")
+            sfh = io.BytesIO()
+            nx.write_graphml_stream(G, sfh, encoding="latin-1")
+            assert fh.getvalue() == sfh.getvalue()
@@ -1,4 +1,5 @@
 from io import BytesIO
+import sys
 import tempfile
 import pytest
 
@@ -171,3 +172,15 @@ class TestWriteSparse6:
         import os
 
         os.remove(fullfilename)
+
+    def test_without_numpy(self, monkeypatch):
+        graphs = [nx.gnm_random_graph(i, 2 * i, seed=i) for i in [5, 16, 64]]
+        graphs.append(nx.MultiGraph([(0, 1), (0, 1), (2, 2), (3, 4), (3, 4)]))
+        encoded = [nx.to_sparse6_bytes(G) for G in graphs]
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        for G, data in zip(graphs, encoded):
+            assert nx.to_sparse6_bytes(G) == data
+            H = nx.from_sparse6_bytes(data.strip())
+            assert H.is_multigraph() == G.is_multigraph()
+            assert_nodes_equal(G.nodes(), H.nodes())
+            assert_edges_equal(G.edges(), H.edges())
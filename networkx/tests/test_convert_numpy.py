@@ -537,3 +537,30 @@ def test_to_numpy_array_multigraph_nodelist(multigraph_test_graph):
     A = nx.to_numpy_array(G, nodelist=[1, 2])
     assert A.shape == (2, 2)
     assert A[1, 0] == 77
+
+
+@pytest.mark.parametrize("operator", (sum, min, max))
+@pytest.mark.parametrize("nodelist", (None, [2, 1], [1, 0, 2]))
+def test_to_numpy_array_chunked(multigraph_test_graph, operator, nodelist):
+    G = multigraph_test_graph
+    G.add_edges_from([(0, 1, {"weight": 3}), (0, 0)])
+    for H in (G, nx.MultiDiGraph(G), nx.Graph(G), nx.DiGraph(G)):
+        expected = nx.to_numpy_array(
+            H, nodelist=nodelist, multigraph_weight=operator, nonedge=np.nan
+        )
+        A = nx.to_numpy_array_chunked(
+            H, nodelist=nodelist, multigraph_weight=operator, nonedge=np.nan
+        )
+        npt.assert_array_equal(A, expected)
+
+
+def test_to_numpy_array_chunked_out(tmp_path):
+    G = nx.barbell_graph(10, 3)
+    out = np.lib.format.open_memmap(
+        tmp_path / "A.npy", "w+", dtype=np.float32, shape=(len(G), len(G))
+    )
+    A = nx.to_numpy_array_chunked(G, out=out, chunk_size=4)
+    assert A is out
+    npt.assert_array_equal(np.load(tmp_path / "A.npy"), nx.to_numpy_array(G))
+    pytest.raises(nx.NetworkXError, nx.to_numpy_array_chunked, G, out=np.zeros((2, 2)))
+    assert nx.to_numpy_array_chunked(nx.Graph()).shape == (0, 0)
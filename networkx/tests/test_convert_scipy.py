@@ -277,3 +277,70 @@ def test_from_scipy_sparse_matrix_formats(sparse_format):
     )
     A = sp_sparse.coo_matrix([[0, 3, 2], [3, 0, 1], [2, 1, 0]]).asformat(sparse_format)
     assert_graphs_equal(expected, nx.from_scipy_sparse_matrix(A))
+
+
+def _chunked_test_graphs():
+    G = nx.gnm_random_graph(40, 120, seed=42)
+    for i, (u, v) in enumerate(G.edges):
+        G[u][v]["weight"] = i
+    G.add_edges_from([(3, 3), (7, 7, {"weight": 5})])
+    D = nx.gnm_random_graph(40, 120, seed=42, directed=True)
+    D.add_edge(1, 1, weight=2)
+    M = nx.MultiGraph(G)
+    M.add_edges_from([(0, 1, {"weight": 3}), (3, 3)])
+    MD = nx.MultiDiGraph(D)
+    MD.add_edges_from([(0, 1), (0, 1, {"weight": -2})])
+    return [G, D, M, MD]
+
+
+@pytest.mark.parametrize("G", _chunked_test_graphs())
+@pytest.mark.parametrize("format", ("csr", "csc", "coo"))
+@pytest.mark.parametrize("nodelist", (None, list(range(39, -1, -2))))
+def test_to_scipy_sparse_matrix_chunked(G, format, nodelist):
+    for weight in ("weight", None):
+        expected = nx.to_scipy_sparse_matrix(
+            G, nodelist=nodelist, weight=weight, format=format
+        )
+        M = nx.to_scipy_sparse_matrix_chunked(
+            G, nodelist=nodelist, weight=weight, format=format, chunk_size=7
+        )
+        assert M.format == format
+        npt.assert_array_equal(M.toarray(), expected.toarray())
+
+
+def test_to_scipy_sparse_matrix_chunked_index(tmp_path):
+    G = nx.path_graph(["a", "b", "c"])
+    M, index = nx.to_scipy_sparse_matrix_chunked(
+        G, index_dtype=np.int64, dtype=np.int8, return_index=True
+    )
+    assert index == {"a": 0, "b": 1, "c": 2}
+    assert M.indices.dtype == np.int64
+    assert M.indptr.dtype == np.int64
+    assert M.dtype == np.int8
+    M = nx.to_scipy_sparse_matrix_chunked(G, path=tmp_path)
+    npt.assert_array_equal(np.load(tmp_path / "data.npy"), M.data)
+    npt.assert_array_equal(np.load(tmp_path / "indices.npy"), [1, 0, 2, 1])
+    npt.assert_array_equal(np.load(tmp_path / "indptr.npy"), [0, 1, 3, 4])
+    npt.assert_array_equal(M.toarray(), nx.to_numpy_array(G))
+
+
+def test_to_scipy_sparse_matrix_chunked_raise(tmp_path):
+    G = nx.path_graph(3)
+    pytest.raises(nx.NetworkXError, nx.to_scipy_sparse_matrix_chunked, nx.Graph())
+    pytest.raises(nx.NetworkXError, nx.to_scipy_sparse_matrix_chunked, G, [])
+    pytest.raises(nx.NetworkXError, nx.to_scipy_sparse_matrix_chunked, G, [0, 5])
+    pytest.raises(nx.NetworkXError, nx.to_scipy_sparse_matrix_chunked, G, [0, 0])
+    pytest.raises(nx.NetworkXError, nx.to_scipy_sparse_matrix_chunked, G, format="csx")
+    pytest.raises(
+        nx.NetworkXError,
+        nx.to_scipy_sparse_matrix_chunked,
+        G,
+        format="coo",
+        path=tmp_path,
+    )
+    pytest.raises(
+        nx.NetworkXError,
+        nx.to_scipy_sparse_matrix_chunked,
+        nx.path_graph(100),
+        index_dtype=np.int8,
+    )
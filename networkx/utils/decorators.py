@@ -353,7 +353,7 @@ def preserve_random_state(func):
         return func
 
 
-def random_state(random_state_index):
+def random_state(random_state_index, allow_generator=False):
     """Decorator to generate a numpy.random.RandomState instance.
 
     Argument position `random_state_index` is processed by create_random_state.
@@ -367,6 +367,11 @@ def random_state(random_state_index):
         a named positional argument (with a default value), you must specify
         its index as a positional argument.
 
+    allow_generator : bool, optional (default=False)
+        If True, a numpy.random.Generator argument is passed to the function
+        unchanged. Only use it for functions that call methods which both
+        RandomState and Generator provide.
+
     Returns
     -------
     _random_state : function
@@ -400,7 +405,7 @@ def random_state(random_state_index):
             raise nx.NetworkXError("random_state_index is incorrect") from e
 
         # Create a numpy.random.RandomState instance
-        random_state = create_random_state(random_state_arg)
+        random_state = create_random_state(random_state_arg, allow_generator)
 
         # args is a tuple, so we must convert to list before modifying it.
         new_args = list(args)
@@ -305,7 +305,7 @@ def to_tuple(x):
     return tuple(map(to_tuple, x))
 
 
-def create_random_state(random_state=None):
+def create_random_state(random_state=None, allow_generator=False):
     """Returns a numpy.random.RandomState instance depending on input.
 
     Parameters
@@ -315,6 +315,10 @@ def create_random_state(random_state=None):
         if numpy.random.RandomState instance, return it.
         if None or numpy.random, return the global random number generator used
         by numpy.random.
+    allow_generator : bool  optional (default=False)
+        If True, a numpy.random.Generator instance is returned as is.
+        Otherwise it raises a ValueError, since most functions call methods
+        that only numpy.random.RandomState has.
     """
     import numpy as np
 
@@ -322,6 +326,14 @@ def create_random_state(random_state=None):
         return np.random.mtrand._rand
     if isinstance(random_state, np.random.RandomState):
         return random_state
+    if isinstance(random_state, np.random.Generator):
+        if allow_generator:
+            return random_state
+        msg = (
+            "numpy.random.Generator is not supported here, "
+            "use an int or a numpy.random.RandomState instance"
+        )
+        raise ValueError(msg)
     if isinstance(random_state, int):
         return np.random.RandomState(random_state)
     msg = (
@@ -428,3 +440,19 @@ def create_py_random_state(random_state=None):
         return random.Random(random_state)
     msg = f"{random_state} cannot be used to generate a random.Random instance"
     raise ValueError(msg)
+
+
+def _triangular_pairs(k):
+    """Returns arrays `u`, `v` with ``u < v`` of the pairs with indices `k`.
+
+    The pairs ``u < v`` of nodes are numbered ``k = v * (v - 1) // 2 + u``,
+    the column-major order of the upper triangle of the adjacency matrix,
+    so ``v = floor((1 + sqrt(8k + 1)) / 2)`` and ``u = k - v * (v - 1) // 2``.
+    """
+    import numpy as np
+
+    v = ((1 + np.sqrt(8 * k.astype(np.float64) + 1)) // 2).astype(np.int64)
+    # Correct for rounding in the square root.
+    v[v * (v - 1) // 2 > k] -= 1
+    v[v * (v + 1) // 2 <= k] += 1
+    return k - v * (v - 1) // 2, v
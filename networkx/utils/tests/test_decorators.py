@@ -250,6 +250,22 @@ class TestRandomState:
         # test that global seed wasn't changed in function
         assert np_rv == np.random.random_sample()
 
+    def test_random_state_np_random_Generator(self):
+        rng = np.random.default_rng(1)
+        with pytest.raises(ValueError, match="Generator"):
+            self.instantiate_np_random_state(rng)
+
+        @np_random_state(0, allow_generator=True)
+        def instantiate_generator(random_state):
+            return random_state
+
+        assert instantiate_generator(rng) is rng
+        assert isinstance(instantiate_generator(1), np.random.RandomState)
+        # existing functions still reject a Generator with a clear error
+        G = nx.path_graph(3)
+        with pytest.raises(ValueError, match="Generator"):
+            nx.random_layout(G, seed=rng)
+
     def test_random_state_py_random(self):
         seed = 1
         rng = random.Random(seed)
@@ -21,6 +21,7 @@ from networkx.utils import (
     PythonRandomInterface,
     to_tuple,
 )
+from networkx.utils.misc import _triangular_pairs
 
 nested_depth = (
     1,
@@ -236,6 +237,23 @@ def test_create_random_state():
     pytest.raises(ValueError, create_random_state, "a")
 
     assert np.all(rs(1).rand(10) == create_random_state(1).rand(10))
+    rng = np.random.default_rng(1)
+    pytest.raises(ValueError, create_random_state, rng)
+    assert create_random_state(rng, allow_generator=True) is rng
+
+
+def test_triangular_pairs():
+    np = pytest.importorskip("numpy")
+    u, v = _triangular_pairs(np.arange(10))
+    assert list(zip(u.tolist(), v.tolist())) == [
+        (u, v) for v in range(5) for u in range(v)
+    ]
+    # large indices, where the square root is inexact
+    v = np.array([2 ** 31 - 1, 2 ** 31, 3 * 10 ** 9], dtype=np.int64)
+    k = np.concatenate((v * (v - 1) // 2, v * (v - 1) // 2 + v - 1))
+    u, w = _triangular_pairs(k)
+    assert u.tolist() == [0, 0, 0] + (v - 1).tolist()
+    assert w.tolist() == 2 * v.tolist()
 
 
 def test_create_py_random_state():
@@ -1,3 +1,5 @@
+import pytest
+
 import networkx as nx
 
 
@@ -53,3 +55,38 @@ def test_empty_union():
     uf.union()
     assert uf[0] == 0
     assert uf[1] == 1
+
+
+def test_array_unionfind():
+    pytest.importorskip("numpy")
+    uf = nx.utils.ArrayUnionFind("abcdef")
+    uf.union("a", "b")
+    uf.union("c", "d", "e")
+    assert uf["a"] == uf["b"]
+    assert uf["c"] == uf["e"]
+    assert uf["a"] != uf["c"]
+    assert sorted(map(sorted, uf.to_sets())) == [["a", "b"], ["c", "d", "e"], ["f"]]
+    assert uf.weights[uf.positions(uf["c"])] == 3
+    assert list(uf) == list("abcdef")
+
+
+def test_array_unionfind_union_many():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(42)
+    a = rng.integers(0, 200, 300)
+    b = rng.integers(0, 200, 300)
+    uf = nx.utils.ArrayUnionFind(200)
+    merged = uf.union_many(a[:150], b[:150])
+    merged = np.concatenate((merged, uf.union_many(a[150:], b[150:])))
+    # the same pairs merged one at a time with the dict-based structure
+    expected = []
+    subtrees = nx.utils.UnionFind(range(200))
+    for x, y in zip(a.tolist(), b.tolist()):
+        expected.append(subtrees[x] != subtrees[y])
+        subtrees.union(x, y)
+    assert merged.tolist() == expected
+    roots = uf.find_many(np.arange(200))
+    assert all(roots[i] == roots[j] for i, j in zip(a, b))
+    assert sorted(map(sorted, uf.to_sets())) == sorted(map(sorted, subtrees.to_sets()))
+    assert uf.weights[roots].tolist() == [np.sum(roots == r) for r in roots]
+    assert len(uf.union_many([], [])) == 0
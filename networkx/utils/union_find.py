@@ -1,6 +1,7 @@
 """
 Union-find data structure.
 """
+from numbers import Integral
 
 from networkx.utils import groups
 
@@ -103,3 +104,205 @@ class UnionFind:
         for r in roots:
             self.weights[root] += self.weights[r]
             self.parents[r] = root
+
+
+class ArrayUnionFind:
+    """Union-find data structure stored in NumPy arrays.
+
+    The elements are given once, when the structure is created, and are
+    identified by their positions ``0, ..., n - 1``. Parent pointers and
+    set weights are kept in the integer arrays `parents` and `weights`,
+    so that finds and unions of many elements at once run as vectorized
+    array operations.
+
+    - X[item] returns a name for the set containing the given item, as
+      for :class:`UnionFind`.
+
+    - X.union(item1, item2, ...) merges the sets containing each item.
+
+    - X.find_many(positions) and X.union_many(a, b) work on arrays of
+      positions. Use X.positions(items) to get the positions of labelled
+      elements.
+
+    Parameters
+    ----------
+    elements : integer or iterable
+        If an integer `n`, the elements are the integers ``0, ..., n - 1``
+        and are their own positions. Otherwise the elements are the items
+        of the iterable, in order, and are mapped to their positions with
+        the dict `index`.
+
+    Examples
+    --------
+    >>> uf = ArrayUnionFind("abcde")
+    >>> uf.union_many(uf.positions("abd"), uf.positions("bce"))
+    array([ True,  True,  True])
+    >>> sorted(map(sorted, uf.to_sets()))
+    [['a', 'b', 'c'], ['d', 'e']]
+    >>> uf["a"] == uf["c"]
+    True
+    """
+
+    def __init__(self, elements=0):
+        import numpy as np
+
+        if isinstance(elements, Integral):
+            self.elements = range(elements)
+            self.index = None
+        else:
+            self.elements = list(dict.fromkeys(elements))
+            self.index = {x: i for i, x in enumerate(self.elements)}
+        self.parents = np.arange(len(self.elements))
+        self.weights = np.ones(len(self.elements), dtype=np.intp)
+
+    def __len__(self):
+        return len(self.elements)
+
+    def __iter__(self):
+        """Iterate through all items of this structure."""
+        return iter(self.elements)
+
+    def __getitem__(self, object):
+        """Find and return the name of the set containing the object."""
+        i = object if self.index is None else self.index[object]
+        return self.elements[int(self.find_many([i])[0])]
+
+    def positions(self, items):
+        """Returns the positions of `items` as an integer array."""
+        import numpy as np
+
+        if self.index is None:
+            return np.asarray(items, dtype=np.intp)
+        index = self.index
+        return np.fromiter((index[x] for x in items), np.intp)
+
+    def find_many(self, positions):
+        """Returns the positions of the roots of the sets containing the
+        elements at `positions`.
+
+        The parent pointers of these elements are set to their roots.
+        """
+        import numpy as np
+
+        positions = np.asarray(positions, dtype=np.intp)
+        parents = self.parents
+        root = parents[positions]
+        while True:
+            up = parents[root]
+            if np.array_equal(up, root):
+                break
+            root = up
+        parents[positions] = root
+        return root
+
+    def union(self, *objects):
+        """Find the sets containing the objects and merge them all."""
+        positions = self.positions(objects)
+        self.union_many(positions[:-1], positions[1:])
+
+    def union_many(self, a, b):
+        """Merges the sets containing ``a[i]`` and ``b[i]`` for every `i`.
+
+        Parameters
+        ----------
+        a, b : array_like of integers
+            The positions of the elements to merge.
+
+        Returns
+        -------
+        merged : NumPy array of bools
+            True for the pairs that join two different sets if the pairs
+            are merged one by one in order. These pairs form a spanning
+            forest of the pairs, the one Kruskal's algorithm finds if the
+            pairs are sorted by weight.
+        """
+        import numpy as np
+
+        ra = self.find_many(a)
+        rb = self.find_many(b)
+        merged = ra != rb
+        pairs = np.flatnonzero(merged)
+        if not len(pairs):
+            return merged
+        roots, inverse = np.unique(
+            np.concatenate((ra[pairs], rb[pairs])), return_inverse=True
+        )
+        k = len(pairs)
+        forest, group = _ordered_spanning_forest(inverse[:k], inverse[k:], len(roots))
+        merged[pairs[~forest]] = False
+        # Hang the roots of each group below its heaviest root, so that
+        # trees stay shallow.
+        weights = self.weights[roots]
+        order = np.lexsort((-weights, group))
+        roots, group, weights = roots[order], group[order], weights[order]
+        first = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+        new_roots = roots[first]
+        self.parents[roots] = np.repeat(new_roots, np.diff(np.r_[first, len(roots)]))
+        self.weights[new_roots] = np.add.reduceat(weights, first)
+        return merged
+
+    def to_sets(self):
+        """Iterates over the sets stored in this structure.
+
+        For example::
+
+            >>> partition = ArrayUnionFind("xyz")
+            >>> sorted(map(sorted, partition.to_sets()))
+            [['x'], ['y'], ['z']]
+            >>> partition.union("x", "y")
+            >>> sorted(map(sorted, partition.to_sets()))
+            [['x', 'y'], ['z']]
+
+        """
+        import numpy as np
+
+        roots = self.find_many(np.arange(len(self.elements)))
+        order = np.argsort(roots, kind="stable")
+        bounds = np.flatnonzero(np.diff(roots[order])) + 1
+        elements = self.elements
+        for block in np.split(order, bounds):
+            if len(block):
+                yield {elements[i] for i in block.tolist()}
+
+
+def _ordered_spanning_forest(a, b, n):
+    """Returns the spanning forest of the pairs `(a[i], b[i])` that picks
+    the earliest pairs, and the root of each of the `n` elements.
+
+    This runs Borůvka's algorithm with the positions of the pairs as
+    weights: in each round, every tree finds its earliest outgoing pair
+    with a vectorized minimum, and all trees are merged along these pairs
+    at once.
+    """
+    import numpy as np
+
+    m = len(a)
+    parent = np.arange(n)
+    forest = np.zeros(m, dtype=bool)
+    pairs = np.arange(m)
+    while len(pairs):
+        ra, rb = parent[a[pairs]], parent[b[pairs]]
+        crossing = ra != rb
+        pairs, ra, rb = pairs[crossing], ra[crossing], rb[crossing]
+        if not len(pairs):
+            break
+        best = np.full(n, m)
+        np.minimum.at(best, ra, pairs)
+        np.minimum.at(best, rb, pairs)
+        trees = np.flatnonzero(best < m)
+        earliest = best[trees]
+        ra, rb = parent[a[earliest]], parent[b[earliest]]
+        # Hook every tree onto the tree at the other end of its earliest
+        # pair. Two trees sharing their earliest pair would point at each
+        # other, so the smaller one becomes the root.
+        hook = np.where(ra == trees, rb, ra)
+        mutual = best[hook] == earliest
+        parent[trees] = np.where(mutual & (trees < hook), trees, hook)
+        forest[earliest] = True
+        # Pointer jumping, so that every element points at its root again.
+        while True:
+            up = parent[parent]
+            if np.array_equal(up, parent):
+                break
+            parent = up
+    return forest, parent